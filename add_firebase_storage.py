@@ -4,30 +4,30 @@ Adds Firebase Storage initialization to src/firebase/config.js
 Run from: C:\\Users\\Sherae's Computer\\loanbeacons-app
 """
 
-path = "src/firebase/config.js"
+from patchkit import Edit, PatchSet
 
-with open(path, "r", encoding="utf-8") as f:
-    c = f.read()
+changed = PatchSet("src/firebase/config.js", [
+    # Add storage import
+    Edit(
+        'import { getFirestore } from "firebase/firestore";',
+        'import { getFirestore } from "firebase/firestore";\nimport { getStorage } from "firebase/storage";',
+        "Add getStorage import",
+    ),
+    # Add storage initialization
+    Edit(
+        'const db = getFirestore(app);',
+        'const db = getFirestore(app);\nconst storage = getStorage(app);',
+        "Initialize storage",
+    ),
+    # Add storage to exports — optional: later versions of config.js
+    # rewrote this line (storage + auth) by hand.
+    Edit(
+        'export { app, analytics, db };',
+        'export { app, analytics, db, storage };',
+        "Export storage",
+        optional=True,
+    ),
+], patch_id="add-firebase-storage").run()
 
-# Add storage import
-c = c.replace(
-    'import { getFirestore } from "firebase/firestore";',
-    'import { getFirestore } from "firebase/firestore";\nimport { getStorage } from "firebase/storage";'
-)
-
-# Add storage initialization
-c = c.replace(
-    'const db = getFirestore(app);',
-    'const db = getFirestore(app);\nconst storage = getStorage(app);'
-)
-
-# Add storage to exports
-c = c.replace(
-    'export { app, analytics, db };',
-    'export { app, analytics, db, storage };'
-)
-
-with open(path, "w", encoding="utf-8") as f:
-    f.write(c)
-
-print("firebase/config.js updated — storage initialized and exported.")
+if changed:
+    print("firebase/config.js updated — storage initialized and exported.")
@@ -4,17 +4,15 @@ Fixes the hardMoneyLenderMatrix import path in LenderMatchEngine_hardMoney.js
 Run from: C:\\Users\\Sherae's Computer\\loanbeacons-app
 """
 
-path = "src/engines/LenderMatchEngine_hardMoney.js"
+from patchkit import Edit, PatchSet
 
-with open(path, "r", encoding="utf-8") as f:
-    c = f.read()
+changed = PatchSet("src/engines/LenderMatchEngine_hardMoney.js", [
+    Edit(
+        'from "./hardMoneyLenderMatrix"',
+        'from "../data/hardMoneyLenderMatrix"',
+        "hardMoneyLenderMatrix import → ../data/",
+    ),
+], patch_id="fix-engine-import").run()
 
-c = c.replace(
-    'from "./hardMoneyLenderMatrix"',
-    'from "../data/hardMoneyLenderMatrix"'
-)
-
-with open(path, "w", encoding="utf-8") as f:
-    f.write(c)
-
-print("Engine import path fixed.")
+if changed:
+    print("Engine import path fixed.")
@@ -4,17 +4,15 @@ Fixes firebase import path in LenderIntakeForm.jsx
 Run from: C:\\Users\\Sherae's Computer\\loanbeacons-app
 """
 
-path = "src/modules/LenderIntakeForm.jsx"
+from patchkit import Edit, PatchSet
 
-with open(path, "r", encoding="utf-8") as f:
-    c = f.read()
+changed = PatchSet("src/modules/LenderIntakeForm.jsx", [
+    Edit(
+        'from "../firebase"',
+        'from "../firebase/config"',
+        "firebase import → ../firebase/config",
+    ),
+], patch_id="fix-intake-imports").run()
 
-c = c.replace(
-    'from "../firebase"',
-    'from "../firebase/config"'
-)
-
-with open(path, "w", encoding="utf-8") as f:
-    f.write(c)
-
-print("LenderIntakeForm.jsx firebase import fixed.")
+if changed:
+    print("LenderIntakeForm.jsx firebase import fixed.")
@@ -1,20 +1,66 @@
-with open("src/pages/ScenarioCreator.jsx", "r", encoding="utf-8") as f:
-    c = f.read()
-
-# Remove any leftover runAddressValidation function definition
-import re
-c = re.sub(
-    r'async function runAddressValidation\(addressData\).*?setValidating\(false\);\s*\}',
-    '',
-    c,
-    flags=re.DOTALL
-)
+"""
+fix_scenario_validation.py
+Removes leftover runAddressValidation code from ScenarioCreator.jsx
+Run from: C:\\Users\\Sherae's Computer\\loanbeacons-app
+Command:  python fix_scenario_validation.py [--dry-run]
+"""
+
+import re, sys
+
+from patchkit import atomic_write, unified_diff
+
+path = "src/pages/ScenarioCreator.jsx"
+dry_run = "--dry-run" in sys.argv[1:]
+
+with open(path, "r", encoding="utf-8") as f:
+    original = f.read()
+
+c = original
+
+# Remove any leftover runAddressValidation function definition: from the
+# signature to the first `setValidating(false);` followed by a closing brace.
+# Done with str.find rather than a lazy DOTALL regex, which rescanned to the
+# end of the file from every signature that had no such ending.
+START = "async function runAddressValidation(addressData)"
+END = "setValidating(false);"
+CLOSE = re.compile(r"\s*\}")
+
+def strip_definitions(text):
+    out, cursor = [], 0
+    while True:
+        start = text.find(START, cursor)
+        if start == -1:
+            break
+        pos, stop = start + len(START), None
+        while stop is None:
+            hit = text.find(END, pos)
+            if hit == -1:
+                break
+            m = CLOSE.match(text, hit + len(END))
+            if m:
+                stop = m.end()
+            pos = hit + 1
+        if stop is None:
+            break
+        out.append(text[cursor:start])
+        cursor = stop
+    out.append(text[cursor:])
+    return "".join(out)
+
+c = strip_definitions(c)
 
 # Remove any leftover runAddressValidation call
 c = c.replace('runAddressValidation(addr);', '')
 c = c.replace('runAddressValidation(addr)', '')
 
-with open("src/pages/ScenarioCreator.jsx", "w", encoding="utf-8") as f:
-    f.write(c)
+if c == original:
+    print("Nothing to clean.")
+    sys.exit(0)
+
+if dry_run:
+    print(unified_diff(path, original, c), end="")
+    sys.exit(0)
+
+atomic_write(path, c)
 
-print("Cleaned successfully.")
\ No newline at end of file
+print("Cleaned successfully.")
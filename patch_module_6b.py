@@ -5,97 +5,83 @@ Run from: C:\\Users\\Sherae's Computer\\loanbeacons-app
 Command:  python patch_module_6b.py
 """
 
-import sys
+from patchkit import Edit, PatchSet
 
 FILE = "src/modules/LenderMatch.jsx"
 
-with open(FILE, "r", encoding="utf-8") as f:
-    c = f.read()
-
-original = c  # keep for rollback check
-
 # ─── CHANGE 1 ─────────────────────────────────────────────────────────────────
-# Add LastResortSection import after the IneligibleLenderRow import
+# Add LastResortSection import after the IneligibleLenderRow import.
+# getNormalizedScenario(form) returns the same frozen object for the same
+# form, so LastResortSection's effect only re-runs when the inputs actually
+# change.
 
 old1 = 'import { IneligibleLenderRow }    from "../components/lenderMatch/IneligibleLenderRow";'
 
 new1 = '''import { IneligibleLenderRow }    from "../components/lenderMatch/IneligibleLenderRow";
 import LastResortSection           from "../components/lenderMatch/LastResortSection";
-import { evaluateHardMoneyPath }   from "../engines/LenderMatchEngine_hardMoney";'''
+import { getNormalizedScenario }   from "../engines/LenderMatchEngine";'''
 
-if old1 not in c:
-    print("ERROR: Could not find IneligibleLenderRow import. Aborting.")
-    sys.exit(1)
 
-c = c.replace(old1, new1, 1)
-print("✓ Change 1: Added LastResortSection and evaluateHardMoneyPath imports")
+# ─── CHANGE 2 ─────────────────────────────────────────────────────────────────
+# Hold the hard money evaluation LastResortSection reports back. The section
+# runs it in the engine worker pool; the chip only reads the result, so the
+# render never evaluates the hard money path on the UI thread.
 
+old2 = "const [results, setResults]   = useState(null);"
 
-# ─── CHANGE 2 ─────────────────────────────────────────────────────────────────
+new2 = """const [results, setResults]   = useState(null);
+  const [hardMoney, setHardMoney] = useState(null);   // ← reported by <LastResortSection>"""
+
+
+# ─── CHANGE 3 ─────────────────────────────────────────────────────────────────
 # Add hardMoney stats chip to the stats row, after the Alternative Path chip
 
-old2 = '''              <div style={S.statChip}>
+old3 = '''              <div style={S.statChip}>
                 <div style={S.statChipDot(T.amber)} />
                 {results.nonQMSection?.totalEligible ?? 0} Alternative Path eligible
               </div>'''
 
-new2 = '''              <div style={S.statChip}>
+new3 = '''              <div style={S.statChip}>
                 <div style={S.statChipDot(T.amber)} />
                 {results.nonQMSection?.totalEligible ?? 0} Alternative Path eligible
               </div>
-              {(() => {
-                const hm = evaluateHardMoneyPath(
-                  normalizeScenario(form),
-                  results.agencySection?.totalEligible ?? 0,
-                  results.nonQMSection?.totalEligible ?? 0
-                );
-                return hm.triggered || hm.heroMode ? (
-                  <div style={S.statChip}>
-                    <div style={S.statChipDot("#e8531a")} />
-                    {hm.eligibleCount} Last Resort Path eligible
-                  </div>
-                ) : null;
-              })()}'''
-
-if old2 not in c:
-    print("ERROR: Could not find Alternative Path stats chip. Aborting.")
-    sys.exit(1)
-
-c = c.replace(old2, new2, 1)
-print("✓ Change 2: Added Last Resort Path stats chip")
+              {(hardMoney?.triggered || hardMoney?.heroMode) && (
+                <div style={S.statChip}>
+                  <div style={S.statChipDot("#e8531a")} />
+                  {hardMoney.eligibleCount} Last Resort Path eligible
+                </div>
+              )}'''
 
 
-# ─── CHANGE 3 ─────────────────────────────────────────────────────────────────
+# ─── CHANGE 4 ─────────────────────────────────────────────────────────────────
 # Add LastResortSection component just before the closing </div>{/* /results */}
 
-old3 = '''          </div>
+old4 = '''          </div>
         )}{/* /results */}'''
 
-new3 = '''            {/* ──────── LAST RESORT PATH (HARD MONEY / PRIVATE / BRIDGE) ──────── */}
+new4 = '''            {/* ──────── LAST RESORT PATH (HARD MONEY / PRIVATE / BRIDGE) ──────── */}
             <LastResortSection
-              scenario={normalizeScenario(form)}
+              scenario={getNormalizedScenario(form)}
               agencyResultCount={results.agencySection?.totalEligible ?? 0}
               nonQMResultCount={results.nonQMSection?.totalEligible ?? 0}
+              onEvaluation={setHardMoney}
             />
 
           </div>
         )}{/* /results */}'''
 
-if old3 not in c:
-    print("ERROR: Could not find closing results div. Aborting.")
-    sys.exit(1)
-
-c = c.replace(old3, new3, 1)
-print("✓ Change 3: Added <LastResortSection /> to results layout")
-
 
-# ─── WRITE OUTPUT ─────────────────────────────────────────────────────────────
-if c == original:
-    print("\nWARNING: No changes were made. Check that the file matches expected version.")
-    sys.exit(1)
+# ─── APPLY ────────────────────────────────────────────────────────────────────
+# All four anchors are located in one scan of the original file; if any is
+# missing the run aborts before writing.
 
-with open(FILE, "w", encoding="utf-8") as f:
-    f.write(c)
+changed = PatchSet(FILE, [
+    Edit(old1, new1, "Change 1: Added LastResortSection and getNormalizedScenario imports"),
+    Edit(old2, new2, "Change 2: Added hardMoney state for the stats chip"),
+    Edit(old3, new3, "Change 3: Added Last Resort Path stats chip"),
+    Edit(old4, new4, "Change 4: Added <LastResortSection /> to results layout"),
+]).run()
 
-print("\n✅ LenderMatch.jsx patched successfully.")
-print("   Run: npm run dev  — and open Lender Match to verify the Last Resort Path section appears.")
+if changed:
+    print("\n✅ LenderMatch.jsx patched successfully.")
+    print("   Run: npm run dev  — and open Lender Match to verify the Last Resort Path section appears.")
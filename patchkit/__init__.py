@@ -0,0 +1,27 @@
+"""
+patchkit
+Shared codemod engine for the LoanBeacons patch scripts.
+Run scripts from the repo root so `import patchkit` resolves.
+"""
+
+from .engine import AnchorMatcher, Edit, PatchError, PatchSet, apply_edits
+from .runner import load_manifest, run_batch, write_results
+from .state import PatchIndex
+from .symbols import SymbolIndex
+from .txn import Transaction, atomic_write, unified_diff
+
+__all__ = [
+    "AnchorMatcher",
+    "Edit",
+    "PatchError",
+    "PatchIndex",
+    "PatchSet",
+    "SymbolIndex",
+    "Transaction",
+    "apply_edits",
+    "atomic_write",
+    "load_manifest",
+    "run_batch",
+    "unified_diff",
+    "write_results",
+]
@@ -0,0 +1,9 @@
+"""
+python -m patchkit <manifest.json> — see patchkit/runner.py.
+"""
+
+import sys
+
+from .runner import main
+
+sys.exit(main())
@@ -0,0 +1,282 @@
+"""
+patchkit/bench.py
+Benchmark and regression harness for the patch tooling.
+
+Two parts:
+
+1. Scaling benchmark — runs each patch-script workload against synthetic
+   JSX fixtures (1k … 100k lines by default) and reports best-of-N wall
+   time, peak traced memory, and the growth exponent between sizes
+   (≈1.0 is linear; ≥1.5 is flagged).
+
+2. Regex backtracking probe — every regex the patch scripts and patchkit
+   rely on is run, in a child process with a timeout, against "near-miss"
+   inputs of growing size: text that starts a match over and over but never
+   completes it. That is exactly the shape that makes a lazy DOTALL span
+   like fix_scenario_validation.py's
+   `runAddressValidation\\(addressData\\).*?setValidating\\(false\\);` go
+   quadratic on a big file. Superlinear growth or a timeout is flagged and
+   the command exits 1, so this can gate changes to the tooling. Patterns
+   the scripts no longer use are kept as "legacy" probes: they are still
+   reported, as a reference point, but do not affect the exit code.
+
+Run from: repo root
+Command:  python -m patchkit.bench
+          python -m patchkit.bench --sizes 1000,10000 --repeat 5
+          python -m patchkit.bench --regex-only
+"""
+
+import argparse
+import math
+import multiprocessing as mp
+import re
+import sys
+import time
+import tracemalloc
+
+from .engine import Edit, apply_edits
+from .symbols import _IMPORT_FROM, _STRIP, extract
+from .templates import _PLACEHOLDER
+from .tokens import _BLOCK_COMMENT, _SCAN, _TEMPLATE, tokenize
+
+DEFAULT_SIZES = (1_000, 5_000, 10_000, 50_000, 100_000)
+GROWTH_LIMIT = 1.5
+PROBE_SIZES = (2_000, 4_000, 8_000)
+PROBE_TIMEOUT = 10.0
+
+
+# ─── Synthetic fixtures ───────────────────────────────────────────────────────
+
+_HEADER = '''import { useState, useEffect, useRef } from "react";
+import { db } from "../firebase/config";
+import { IneligibleLenderRow }    from "../components/lenderMatch/IneligibleLenderRow";
+import {
+  runLenderMatch,
+  normalizeScenario,
+} from "../engines/LenderMatchEngine";
+
+'''
+
+_BLOCK = '''  const [field{i}, setField{i}] = useState('');
+  // ─── Section {i} ─────────────────────────────────────────────
+  const handle{i} = async () => {{
+    if (!field{i}) return;
+    setField{i}(field{i}.trim());
+  }};
+  const getSteps{i} = (type) => {{
+    if (type === "conventional") return ["type","basic_info","operations","submission"];
+    return ["type"];
+  }};
+  <div style={{S.statChip}} key="{i}">
+    <div style={{S.statChipDot(T.amber)}} />
+    {{results.nonQMSection?.totalEligible ?? 0}} Alternative Path eligible {i}
+  </div>
+  {{/* section {i} */}}
+'''
+_BLOCK_LINES = _BLOCK.count("\n")
+
+
+def make_fixture(lines):
+    """JSX-ish source of roughly `lines` lines with unique anchors per block."""
+    blocks = max(1, (lines - _HEADER.count("\n")) // _BLOCK_LINES)
+    return _HEADER + "".join(_BLOCK.format(i=i) for i in range(blocks))
+
+
+def _fixture_edits(text, count=30):
+    """`count` anchors spread evenly through the fixture."""
+    blocks = text.count("const handle")
+    step = max(1, blocks // count)
+    return [
+        Edit(f"  const [field{i}, setField{i}] = useState('');",
+             f"  const [field{i}, setField{i}] = useState('x');",
+             f"field{i} default")
+        for i in range(0, blocks, step)
+    ][:count]
+
+
+def _drift(text):
+    # Same code, different indentation and quote style.
+    return text.replace("  const", "    const").replace("useState('')", 'useState("")')
+
+
+# ─── Workloads ────────────────────────────────────────────────────────────────
+
+def _legacy_chain(text, edits):
+    # What the hand-written scripts did: one full scan + copy per edit.
+    for e in edits:
+        if e.old not in text:
+            raise AssertionError(e.label)
+        text = text.replace(e.old, e.new, 1)
+    return text
+
+
+_RUN_ADDRESS = re.compile(
+    r'async function runAddressValidation\(addressData\).*?setValidating\(false\);\s*\}', re.S)
+_SECTION7_LEGACY = re.compile(r"(return \[)(.*?)(['\"]submission['\"])\]", re.S)
+
+
+def _workloads():
+    """[(name, prepare(text) -> arg, run(arg))] — prepare is not timed."""
+    return [
+        ("legacy str.replace chain ×30",
+         lambda t: (t, _fixture_edits(t)), lambda a: _legacy_chain(*a)),
+        ("patchkit exact ×30",
+         lambda t: (t, _fixture_edits(t)), lambda a: apply_edits(*a, tokens=False)),
+        ("patchkit token fallback ×30",
+         lambda t: (_drift(t), _fixture_edits(t)), lambda a: apply_edits(*a)),
+        ("tokens.tokenize",
+         lambda t: t, tokenize),
+        ("symbols.extract",
+         lambda t: t, extract),
+        ("fix_scenario_validation legacy regex",
+         lambda t: t, lambda t: _RUN_ADDRESS.sub("", t)),
+        ("fix_section7_steps legacy regex",
+         lambda t: t, lambda t: _SECTION7_LEGACY.sub(r"\1\2\3]", t)),
+    ]
+
+
+def _measure(run, arg, repeat):
+    best = math.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        run(arg)
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    run(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def growth_exponent(sizes, times):
+    """Least-squares slope of log(time) vs log(size)."""
+    pts = [(math.log(n), math.log(max(t, 1e-7))) for n, t in zip(sizes, times)]
+    if len(pts) < 2:
+        return None
+    mx = sum(x for x, _ in pts) / len(pts)
+    my = sum(y for _, y in pts) / len(pts)
+    den = sum((x - mx) ** 2 for x, _ in pts)
+    return sum((x - mx) * (y - my) for x, y in pts) / den if den else None
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, repeat=3, only=None):
+    """{workload: [(lines, seconds, peak_bytes), ...]}"""
+    fixtures = {n: make_fixture(n) for n in sizes}
+    results = {}
+    for name, prepare, run in _workloads():
+        if only and not any(o.lower() in name.lower() for o in only):
+            continue
+        rows = []
+        for n in sizes:
+            seconds, peak = _measure(run, prepare(fixtures[n]), repeat)
+            rows.append((n, seconds, peak))
+        results[name] = rows
+    return results
+
+
+# ─── Regex backtracking probe ─────────────────────────────────────────────────
+
+# (label, compiled regex, near-miss unit, legacy). The unit starts a match but
+# never lets it finish; probes repeat it to build inputs of growing size.
+REGEX_PROBES = [
+    ("fix_scenario_validation (legacy): runAddressValidation span", _RUN_ADDRESS,
+     "async function runAddressValidation(addressData) {\n  setValidating(true);\n", True),
+    ("fix_section7_steps (legacy): return [ … submission]", _SECTION7_LEGACY,
+     'return ["type","basic_info","operations"];\n', True),
+    ("symbols: import … from clause", _IMPORT_FROM,
+     "import { a, b, c }\n", False),
+    ("symbols: comment/string strip", _STRIP,
+     "const s = `unterminated ${x} \\` template /* open\n", False),
+    ("tokens: block comment", _BLOCK_COMMENT,
+     "/* never closed * / still open\n", False),
+    ("tokens: template literal", _TEMPLATE,
+     "`open template ${value}\n", False),
+    ("tokens: scanner", _SCAN,
+     "'Don\\'t close /* `${x}\n", False),
+    ("templates: [[ placeholder ]]", _PLACEHOLDER,
+     "[[ name | default that never closes ]\n", False),
+]
+
+
+def _probe_worker(pattern, flags, unit, sizes, queue):
+    rx = re.compile(pattern, flags)
+    times = []
+    for n in sizes:
+        text = unit * n
+        t0 = time.perf_counter()
+        for _ in rx.finditer(text):
+            pass
+        times.append(time.perf_counter() - t0)
+    queue.put(times)
+
+
+def probe_regex(rx, unit, sizes=PROBE_SIZES, timeout=PROBE_TIMEOUT):
+    """(exponent, times) — exponent None and times None on timeout."""
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_probe_worker, args=(rx.pattern, rx.flags, unit, sizes, queue))
+    proc.start()
+    proc.join(timeout)
+    if proc.is_alive():
+        proc.terminate()
+        proc.join()
+        return None, None
+    times = queue.get()
+    return growth_exponent(sizes, times), times
+
+
+def run_regex_probes(sizes=PROBE_SIZES, timeout=PROBE_TIMEOUT):
+    """[(label, exponent, times, flagged, legacy)]"""
+    out = []
+    for label, rx, unit, legacy in REGEX_PROBES:
+        exponent, times = probe_regex(rx, unit, sizes, timeout)
+        flagged = exponent is None or exponent >= GROWTH_LIMIT
+        out.append((label, exponent, times, flagged, legacy))
+    return out
+
+
+# ─── CLI ──────────────────────────────────────────────────────────────────────
+
+def _fmt_bytes(n):
+    return f"{n / 1_048_576:.1f} MB" if n >= 1_048_576 else f"{n / 1024:.0f} KB"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the patch tooling.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated fixture sizes in lines")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timing runs")
+    parser.add_argument("--only", action="append", help="Only workloads matching this text")
+    parser.add_argument("--regex-only", action="store_true", help="Skip the scaling benchmark")
+    args = parser.parse_args(argv)
+
+    flagged = 0
+
+    if not args.regex_only:
+        sizes = tuple(int(s) for s in args.sizes.split(","))
+        results = run_benchmarks(sizes, args.repeat, args.only)
+        print(f"{'workload':36} " + " ".join(f"{n:>10,}" for n in sizes) + "   growth   peak mem")
+        for name, rows in results.items():
+            exponent = growth_exponent([r[0] for r in rows], [r[1] for r in rows])
+            bad = exponent is not None and exponent >= GROWTH_LIMIT
+            flagged += bad
+            cells = " ".join(f"{r[1] * 1000:>8.1f}ms" for r in rows)
+            print(f"{name:36} {cells}   n^{exponent:.2f}{' ⚠' if bad else '  '}  "
+                  f"{_fmt_bytes(rows[-1][2])}")
+        print()
+
+    print("Regex backtracking probe (near-miss inputs):")
+    for label, exponent, times, bad, legacy in run_regex_probes():
+        flagged += bad and not legacy
+        if exponent is None:
+            print(f"  {'-' if legacy else '✗'} {label}: TIMEOUT (> {PROBE_TIMEOUT:.0f}s) — catastrophic backtracking")
+        else:
+            mark = "-" if legacy and bad else "✗" if bad else "✓"
+            note = " — superlinear, will blow up on large files" if bad else ""
+            print(f"  {mark} {label}: n^{exponent:.2f} ({times[-1] * 1000:.1f}ms @ {PROBE_SIZES[-1]:,} units){note}")
+
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""
+patchkit/engine.py
+One-pass multi-edit engine for the JSX patch scripts.
+
+The old scripts ran a chain of `old in c` / `c.replace(old, new, 1)` calls,
+rescanning and copying the whole file once per change. Here every anchor is
+located in a single multi-pattern scan over the ORIGINAL text, then all edits
+are spliced into one output buffer. Any missing anchor aborts the whole patch
+before anything is written — same guarantee as the hand-rolled scripts.
+
+Usage:
+    from patchkit import Edit, PatchSet
+
+    PatchSet("src/modules/LenderMatch.jsx", [
+        Edit(old1, new1, "Added LastResortSection import"),
+        Edit(old2, new2, "Added Last Resort Path stats chip"),
+    ]).run()
+"""
+
+import hashlib
+import sys
+from collections import namedtuple
+from dataclasses import dataclass, field
+
+from .matcher import AnchorMatcher
+from .state import PatchIndex
+from .txn import atomic_write, unified_diff
+
+
+class PatchError(Exception):
+    """Raised when a patch cannot be applied cleanly. Nothing is written."""
+
+
+# ─── Edit definition ──────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class Edit:
+    """Replace the first occurrence of `old` with `new`.
+
+    optional=True turns a missing anchor into a SKIPPED line instead of an
+    abort (the behaviour of patch_scenario_creator.py's `patch()` helper).
+
+    An edit whose `new` text is already in the file counts as applied, so
+    insert-after edits (where `new` still contains `old`) never double up.
+    """
+    old: str
+    new: str
+    label: str = ""
+    optional: bool = False
+
+    def __post_init__(self):
+        if not self.old:
+            raise ValueError("Edit anchor must be a non-empty string")
+
+
+# ─── Splicing ─────────────────────────────────────────────────────────────────
+
+def _patterns(edits):
+    for e in edits:
+        yield e.old
+        if e.new:
+            yield e.new
+
+
+def locate_edits(text, edits, matcher=None, tokens=True):
+    """Resolve every edit to a (start, end) span in `text`.
+
+    Anchors are matched exactly first. With tokens=True, any edit that is
+    neither found nor already present is retried at token level (see
+    patchkit.tokens), which ignores whitespace and quote-style drift.
+
+    Returns (spans, present, missing): spans is a list of (start, end, edit)
+    sorted by position, present lists edits whose `new` text is already in
+    place, and missing lists edits whose anchor was not found.
+    """
+    matcher = matcher or AnchorMatcher(_patterns(edits))
+    found = matcher.first_occurrences(text)
+    exact = {p: (start, start + len(p)) for p, start in found.items()}
+
+    spans, present, missing = _classify(edits, exact)
+    if tokens and missing:
+        from .tokens import tokenized
+        fuzzy = tokenized(text).find_spans(_patterns(missing))
+        retried, present_tok, missing = _classify(missing, fuzzy)
+        spans += retried
+        present += present_tok
+    spans.sort(key=lambda s: s[0])
+
+    for (s1, e1, a), (s2, e2, b) in zip(spans, spans[1:]):
+        if s2 < e1:
+            raise PatchError(
+                f"Overlapping anchors: {a.label or a.old[:40]!r} and {b.label or b.old[:40]!r}"
+            )
+    return spans, present, missing
+
+
+def _classify(edits, found):
+    """Split edits by whether `found` ({pattern: span}) has their old/new text."""
+    spans, present, missing = [], [], []
+    for edit in edits:
+        span = found.get(edit.old)
+        if edit.new in found and (span is None or edit.old in edit.new):
+            present.append(edit)
+        elif span is None:
+            missing.append(edit)
+        else:
+            spans.append((span[0], span[1], edit))
+    return spans, present, missing
+
+
+def splice(text, spans):
+    """Build the output in one buffer from sorted, non-overlapping spans."""
+    parts = []
+    cursor = 0
+    for start, end, edit in spans:
+        parts.append(text[cursor:start])
+        parts.append(edit.new)
+        cursor = end
+    parts.append(text[cursor:])
+    return "".join(parts)
+
+
+EditResult = namedtuple("EditResult", "text applied skipped present")
+
+
+def apply_edits(text, edits, matcher=None, tokens=True):
+    """Apply all edits to `text` in one pass.
+
+    Raises PatchError if a required anchor is missing. Returns an
+    EditResult(text, applied, skipped, present) — the last three are lists
+    of Edit.
+    """
+    spans, present, missing = locate_edits(text, edits, matcher, tokens)
+    required = [e for e in missing if not e.optional]
+    if required:
+        labels = ", ".join(e.label or repr(e.old[:40]) for e in required)
+        raise PatchError(f"Could not find anchor(s): {labels}")
+    return EditResult(splice(text, spans), [s[2] for s in spans], missing, present)
+
+
+# ─── File-level patch set ─────────────────────────────────────────────────────
+
+@dataclass
+class PatchSet:
+    """All edits for one target file, applied in a single read/scan/write."""
+    target: str
+    edits: list
+    patch_id: str = ""
+    encoding: str = "utf-8"
+    tokens: bool = True        # token-level fallback for drifted anchors
+    _matcher: AnchorMatcher = field(default=None, init=False, repr=False)
+
+    @property
+    def matcher(self):
+        if self._matcher is None:
+            self._matcher = AnchorMatcher(_patterns(self.edits))
+        return self._matcher
+
+    @property
+    def id(self):
+        """Explicit patch_id, or a stable fingerprint of the edits."""
+        if self.patch_id:
+            return self.patch_id
+        h = hashlib.sha1()
+        for e in self.edits:
+            h.update(e.old.encode("utf-8") + b"\0" + e.new.encode("utf-8") + b"\0")
+        return f"{self.target}:{h.hexdigest()[:12]}"
+
+    def apply_to(self, text):
+        return apply_edits(text, self.edits, self.matcher, self.tokens)
+
+    def run(self, verbose=True, dry_run=None, index=True):
+        """Read, patch and write the target. Exits(1) on any missing anchor.
+
+        dry_run=None reads `--dry-run` from the command line; a dry run
+        prints the unified diff and leaves the file alone. With index=True
+        the idempotency index (.patchkit/index.json) short-circuits re-runs
+        without reading the file.
+        """
+        if dry_run is None:
+            dry_run = "--dry-run" in sys.argv[1:]
+        idx = PatchIndex.load() if index else None
+
+        if idx and idx.is_current(self.target, [self.id]):
+            print(f"  SKIPPED: {self.target} already has this patch (index)")
+            return False
+
+        with open(self.target, "r", encoding=self.encoding) as f:
+            original = f.read()
+
+        if idx and idx.is_current(self.target, [self.id], text=original):
+            idx.save()
+            print(f"  SKIPPED: {self.target} already has this patch (index)")
+            return False
+
+        try:
+            patched, applied, skipped, present = self.apply_to(original)
+        except PatchError as exc:
+            print(f"ERROR: {exc}. Aborting — {self.target} left untouched.")
+            sys.exit(1)
+
+        if verbose:
+            for edit in applied:
+                print(f"  APPLIED: {edit.label}")
+            for edit in present:
+                print(f"  ALREADY: {edit.label}")
+            for edit in skipped:
+                print(f"  SKIPPED: {edit.label}")
+
+        if dry_run:
+            if patched != original:
+                print(unified_diff(self.target, original, patched), end="")
+            return False
+
+        if patched == original:
+            if present:
+                print(f"\n{self.target} already patched — not rewritten.")
+            else:
+                print(f"\nWARNING: No changes were made to {self.target}.")
+        else:
+            atomic_write(self.target, patched, self.encoding)
+
+        if idx:
+            idx.record(self.target, patched, [self.id], base_text=original)
+            idx.save()
+        return patched != original
@@ -0,0 +1,120 @@
+"""
+patchkit/matcher.py
+Multi-pattern matcher shared by the exact and token-level anchor paths.
+Works over any sequence of hashable items: characters of a string, or
+(kind, value) pairs from patchkit.tokens.
+
+Token sequences walk an Aho-Corasick automaton. String anchors take the
+same single left-to-right pass through the C regex engine instead, over an
+escaped alternation of every anchor: stepping the automaton one character
+at a time in Python is slower per character than the old chained
+str.replace calls were.
+"""
+
+import re
+from collections import deque
+
+
+class AnchorMatcher:
+    """Finds the first occurrence of every pattern in one left-to-right scan.
+
+    Built once per patch set; `first_occurrences(text)` is O(len(text) +
+    total pattern length), independent of how many patterns there are.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(dict.fromkeys(patterns))
+        if self.patterns and all(isinstance(p, str) for p in self.patterns):
+            self._init_string_scan()
+            return
+        self._rx = None
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for idx, pat in enumerate(self.patterns):
+            self._insert(pat, idx)
+        self._link()
+
+    def _insert(self, pattern, idx):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(idx)
+
+    def _link(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                # Merge dictionary-suffix outputs so the scan loop stays flat.
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def _init_string_scan(self):
+        # Longest first, so a match is the longest anchor starting there.
+        alternation = "|".join(map(re.escape, sorted(self.patterns, key=len, reverse=True)))
+        self._rx = re.compile(alternation)
+        # finditer resumes after each match, so an anchor starting inside it
+        # is skipped. `_rx_at` (a zero-width lookahead, which reports every
+        # start position) re-reads just those spans; anchors starting at the
+        # same position as a longer one are its prefixes, in `_prefixes`.
+        self._rx_at = re.compile("(?=(%s))" % alternation)
+        self._longest = max(map(len, self.patterns))
+        known = set(self.patterns)
+        lengths = sorted({len(p) for p in self.patterns})
+        self._prefixes = {
+            q: [q[:n] for n in lengths if n < len(q) and q[:n] in known]
+            for q in self.patterns
+        }
+
+    def first_occurrences(self, text):
+        """Return {pattern: start_index} for every pattern found in `text`."""
+        if self._rx is not None:
+            return self._scan_string(text)
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        found = {}
+        remaining = len(patterns)
+        node = 0
+        for pos, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                for idx in out[node]:
+                    pat = patterns[idx]
+                    if pat not in found:
+                        found[pat] = pos - len(pat) + 1
+                        remaining -= 1
+                if not remaining:
+                    break
+        return found
+
+    def _scan_string(self, text):
+        found = {}
+
+        def record(pat, start):
+            for p in (pat, *self._prefixes[pat]):
+                found.setdefault(p, start)
+
+        for m in self._rx.finditer(text):
+            start, end = m.span()
+            record(m.group(), start)
+            for inner in self._rx_at.finditer(text, start + 1, end - 1 + self._longest):
+                if inner.start() >= end:
+                    break
+                record(inner.group(1), inner.start())
+            if len(found) == len(self.patterns):
+                break
+        return found
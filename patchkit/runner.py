@@ -0,0 +1,260 @@
+"""
+patchkit/runner.py
+Batch patch runner — applies a whole manifest of queued patches in one go.
+
+Instead of `python patch_app_jsx.py`, `python add_firebase_storage.py`, ...
+one at a time, list the patches in a JSON manifest:
+
+    {
+      "patches": [
+        {
+          "id": "app-lender-intake-route",
+          "target": "src/App.jsx",
+          "edits": [
+            {"old": "import Admin from './pages/Admin';",
+             "new": "import Admin from './pages/Admin';\\nimport LenderIntakeForm ...",
+             "label": "Add LenderIntakeForm import"}
+          ]
+        }
+      ]
+    }
+
+Patches are grouped by target file. Patches for the same file run in
+manifest order, in memory, with one final write; different files are
+processed in parallel in a process pool. Targets the idempotency index
+already records as patched are skipped without being read.
+
+Run from: repo root
+Command:  python -m patchkit patches/manifest.json [--jobs N] [--dry-run]
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from .engine import Edit, PatchError, PatchSet
+from .state import PatchIndex
+from .txn import Transaction, unified_diff
+
+# Below this many target files the pool's start-up cost outweighs the win.
+MIN_TARGETS_FOR_POOL = 4
+
+
+# ─── Manifest loading ─────────────────────────────────────────────────────────
+
+def load_manifest(path):
+    """Parse a manifest file into a list of PatchSet, in manifest order.
+
+    Targets are paths relative to the repo root, like the patch scripts.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    entries = data["patches"] if isinstance(data, dict) else data
+
+    patch_sets = []
+    seen = set()
+    for i, entry in enumerate(entries):
+        patch_id = entry.get("id") or f"patch-{i + 1}"
+        if patch_id in seen:
+            raise PatchError(f"Duplicate patch id in manifest: {patch_id}")
+        seen.add(patch_id)
+        target = os.path.normpath(entry["target"])
+        edits = [
+            Edit(e["old"], e["new"], e.get("label", ""), e.get("optional", False))
+            for e in entry["edits"]
+        ]
+        patch_sets.append(PatchSet(target, edits, patch_id=patch_id))
+    return patch_sets
+
+
+def group_by_target(patch_sets):
+    """{target: [PatchSet, ...]} preserving first-seen target order."""
+    groups = {}
+    for ps in patch_sets:
+        groups.setdefault(ps.target, []).append(ps)
+    return groups
+
+
+# ─── Per-target work unit ─────────────────────────────────────────────────────
+
+@dataclass
+class TargetResult:
+    target: str
+    original: str = None
+    patched: str = None
+    patch_ids: list = field(default_factory=list)
+    applied: list = field(default_factory=list)   # [(patch_id, label)]
+    present: list = field(default_factory=list)   # [(patch_id, label)]
+    skipped: list = field(default_factory=list)   # [(patch_id, label)]
+    error: str = None
+    cached: bool = False                          # skipped via the index
+
+    @property
+    def changed(self):
+        return self.error is None and not self.cached and self.patched != self.original
+
+
+def _encode(patch_sets):
+    # Plain tuples pickle cheaply; PatchSet carries a lazily built matcher.
+    return [
+        (ps.id, [(e.old, e.new, e.label, e.optional) for e in ps.edits])
+        for ps in patch_sets
+    ]
+
+
+def apply_target(target, encoded, encoding="utf-8"):
+    """Read `target` once, apply its patches in order in memory.
+
+    Runs inside pool workers, so it takes and returns picklable values
+    and never writes — the caller owns the final write.
+    """
+    result = TargetResult(target, patch_ids=[patch_id for patch_id, _ in encoded])
+    try:
+        with open(target, "r", encoding=encoding) as f:
+            text = f.read()
+    except OSError as exc:
+        result.error = f"cannot read: {exc}"
+        return result
+
+    result.original = text
+    for patch_id, raw_edits in encoded:
+        ps = PatchSet(target, [Edit(*e) for e in raw_edits], patch_id=patch_id)
+        try:
+            text, applied, skipped, present = ps.apply_to(text)
+        except PatchError as exc:
+            result.error = f"[{patch_id}] {exc}"
+            return result
+        result.applied.extend((patch_id, e.label) for e in applied)
+        result.present.extend((patch_id, e.label) for e in present)
+        result.skipped.extend((patch_id, e.label) for e in skipped)
+    result.patched = text
+    return result
+
+
+# ─── Batch execution ──────────────────────────────────────────────────────────
+
+def run_batch(patch_sets, jobs=None, index=None):
+    """Apply every patch set, parallel across target files.
+
+    Returns a list of TargetResult in first-seen target order. No file is
+    written here; see write_results(). Targets that `index` reports as
+    current are returned with cached=True and are never read.
+    """
+    groups = group_by_target(patch_sets)
+    results = {}
+    work = []
+    for target, sets in groups.items():
+        ids = [ps.id for ps in sets]
+        if index is not None and index.is_current(target, ids):
+            results[target] = TargetResult(target, patch_ids=ids, cached=True)
+        else:
+            work.append((target, _encode(sets)))
+
+    if jobs == 1 or len(work) < MIN_TARGETS_FOR_POOL:
+        for t, enc in work:
+            results[t] = apply_target(t, enc)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(apply_target, t, enc) for t, enc in work]
+            for f in futures:
+                r = f.result()
+                results[r.target] = r
+
+    return [results[target] for target in groups]
+
+
+def write_results(results, encoding="utf-8"):
+    """Write every changed target in one transaction.
+
+    Refuses to write if any target failed; otherwise all changed files are
+    swapped in together, or — if a write fails part-way — none of them are.
+    """
+    failed = [r for r in results if r.error]
+    if failed:
+        raise PatchError("; ".join(f"{r.target}: {r.error}" for r in failed))
+    with Transaction(encoding) as txn:
+        for r in results:
+            if r.changed:
+                txn.stage(r.target, r.patched, original=r.original)
+    return txn.committed
+
+
+def record_results(results, index):
+    """Remember what each successfully processed target now contains."""
+    for r in results:
+        if r.error is None and not r.cached:
+            index.record(r.target, r.patched, r.patch_ids, base_text=r.original)
+    index.save()
+
+
+def diff_results(results):
+    """Unified diff of the whole batch, computed in memory."""
+    return "".join(
+        unified_diff(r.target, r.original, r.patched) for r in results if r.changed
+    )
+
+
+def report(results):
+    for r in results:
+        if r.error:
+            print(f"✗ {r.target}\n    ERROR: {r.error}")
+            continue
+        status = "cached" if r.cached else "patched" if r.changed else "unchanged"
+        print(f"✓ {r.target} ({status})")
+        for patch_id, label in r.applied:
+            print(f"    APPLIED [{patch_id}] {label}")
+        for patch_id, label in r.present:
+            print(f"    ALREADY [{patch_id}] {label}")
+        for patch_id, label in r.skipped:
+            print(f"    SKIPPED [{patch_id}] {label}")
+
+
+# ─── CLI ──────────────────────────────────────────────────────────────────────
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply a manifest of JSX/JS patches.")
+    parser.add_argument("manifest", help="Path to the JSON patch manifest")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes (default: CPU count, 1 = no pool)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Print a unified diff instead of writing files")
+    parser.add_argument("--no-index", action="store_true",
+                        help="Ignore the idempotency index and re-check every target")
+    args = parser.parse_args(argv)
+
+    try:
+        patch_sets = load_manifest(args.manifest)
+    except (OSError, ValueError, KeyError, PatchError) as exc:
+        print(f"ERROR: could not load manifest: {exc}")
+        return 1
+
+    index = None if args.no_index else PatchIndex.load()
+    results = run_batch(patch_sets, jobs=args.jobs, index=index)
+    report(results)
+
+    if args.dry_run:
+        if any(r.error for r in results):
+            print("\nERROR: batch would fail — see above.")
+            return 1
+        print()
+        print(diff_results(results), end="")
+        return 0
+
+    try:
+        written = write_results(results)
+    except PatchError as exc:
+        print(f"\nERROR: {exc}\nAborting — no files were written.")
+        return 1
+    if index is not None:
+        record_results(results, index)
+
+    print(f"\n{len(patch_sets)} patches, {len(results)} files, {len(written)} written.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+patchkit/state.py
+Idempotency index — lets a re-run skip targets that are already patched.
+
+For every target the index records the content hash the last run left
+behind, the stat signature (mtime_ns + size) of that file, and the patch
+IDs that have been applied to it. If a later run asks for patch IDs that
+are all recorded and the stat signature still matches, the target is
+skipped without being read or rewritten — no mtime bump, no Vite HMR
+rebuild. If only the stat changed (e.g. the file was touched or checked
+out again) the hash is compared before deciding.
+
+Stored at .patchkit/index.json relative to the repo root.
+"""
+
+import hashlib
+import json
+import os
+
+from .txn import atomic_write
+
+DEFAULT_INDEX_PATH = os.path.join(".patchkit", "index.json")
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _stat_signature(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+class PatchIndex:
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self.entries = {}      # {target: {"sha256", "stat", "applied"}}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path=DEFAULT_INDEX_PATH):
+        index = cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                index.entries = json.load(f).get("targets", {})
+        except (FileNotFoundError, ValueError):
+            index.entries = {}
+        return index
+
+    def save(self):
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        atomic_write(self.path, json.dumps({"targets": self.entries}, indent=2, sort_keys=True))
+        self._dirty = False
+
+    @staticmethod
+    def _key(target):
+        return os.path.normpath(target).replace(os.sep, "/")
+
+    # ─── Queries ──────────────────────────────────────────────────────────────
+
+    def is_current(self, target, patch_ids, text=None):
+        """True if every patch ID is recorded as applied to the file as it is now.
+
+        With `text` omitted this only stats the file — the fast path. Pass
+        the file's text to fall back to a hash comparison when the stat
+        signature has drifted.
+        """
+        entry = self.entries.get(self._key(target))
+        if not entry or not set(patch_ids) <= set(entry["applied"]):
+            return False
+        if _stat_signature(target) == entry["stat"]:
+            return True
+        if text is not None and content_hash(text) == entry["sha256"]:
+            entry["stat"] = _stat_signature(target)
+            self._dirty = True
+            return True
+        return False
+
+    # ─── Updates ──────────────────────────────────────────────────────────────
+
+    def record(self, target, text, patch_ids, base_text=None):
+        """Record `text` as the target's current content with `patch_ids` applied.
+
+        `base_text` is what the patches were applied to; if it is the content
+        the index already knew about, earlier patch IDs carry over. Call after
+        the write (or after deciding no write was needed) so the stored stat
+        signature matches the file on disk.
+        """
+        key = self._key(target)
+        entry = self.entries.get(key)
+        digest = content_hash(text)
+        applied = set(patch_ids)
+        known = {digest}
+        if base_text is not None:
+            known.add(content_hash(base_text))
+        if entry and entry["sha256"] in known:
+            applied |= set(entry["applied"])
+        self.entries[key] = {
+            "sha256":  digest,
+            "stat":    _stat_signature(target),
+            "applied": sorted(applied),
+        }
+        self._dirty = True
@@ -0,0 +1,367 @@
+"""
+patchkit/symbols.py
+Project-wide export/import index for src/.
+
+fix_engine_import.py and fix_intake_imports.py only exist because import
+paths broke after files moved. This index knows where every symbol lives:
+it scans src/ once, records each module's exports and import edges in
+.patchkit/symbols.json, and afterwards re-scans only files whose mtime or
+size changed. With the index warm, checking that every relative import in
+the tree resolves (and that every named import is actually exported) is a
+few stat calls and dictionary lookups — no `vite build` needed.
+
+Run from: repo root
+Command:  python -m patchkit.symbols --check
+          python -m patchkit.symbols --where evaluateHardMoneyPath
+          python -m patchkit.symbols --fix [--dry-run]
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import re
+import sys
+
+from .engine import Edit, PatchSet
+from .txn import atomic_write
+
+DEFAULT_ROOT = "src"
+DEFAULT_INDEX_PATH = os.path.join(".patchkit", "symbols.json")
+INDEX_VERSION = 1
+
+SOURCE_EXTS = (".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx")
+RESOLVE_SUFFIXES = ("", ".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs",
+                    "/index.js", "/index.jsx", "/index.ts", "/index.tsx")
+# "@/x" → "src/x" (the alias the engine tests import through).
+ALIASES = {"@/": "src/"}
+
+
+# ─── Extraction ───────────────────────────────────────────────────────────────
+
+_STRIP = re.compile(
+    r'("(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`(?:\\.|[^`\\])*`)|(//[^\n]*|/\*(?:[^*]|\*(?!/))*(?:\*/|\Z))',
+    re.S,
+)
+# The clause is spelled out (default, then {…} or * as ns) rather than a lazy
+# `[^;'"]*?`, which backtracked quadratically over `import {…}` lines that
+# never reach a `from` (see python -m patchkit.bench --regex-only).
+_IMPORT_FROM = re.compile(
+    r'^[ \t]*import\s+(?P<clause>(?:[\w$]+\s*(?:,\s*)?)?(?:\{[^{}]*\}|\*\s*as\s+[\w$]+)?)'
+    r'\s*from\s*(?P<q>["\'])(?P<src>[^"\']+)(?P=q)', re.M)
+_IMPORT_BARE = re.compile(r'^[ \t]*import\s*(?P<q>["\'])(?P<src>[^"\']+)(?P=q)', re.M)
+_IMPORT_DYN  = re.compile(r'\bimport\(\s*(?P<q>["\'])(?P<src>[^"\']+)(?P=q)\s*\)')
+_REEXPORT    = re.compile(
+    r'^[ \t]*export\s+(?P<clause>\*(?:\s+as\s+[\w$]+)?|\{[^}]*\})\s*from\s*'
+    r'(?P<q>["\'])(?P<src>[^"\']+)(?P=q)', re.M)
+_EXPORT_DECL = re.compile(
+    r'^[ \t]*export\s+(?:async\s+)?(?:function\*?|const|let|var|class)\s+([\w$]+)', re.M)
+_EXPORT_DEFAULT = re.compile(r'^[ \t]*export\s+default\b', re.M)
+_EXPORT_LIST = re.compile(r'^[ \t]*export\s*\{(?P<names>[^}]*)\}(?!\s*from)', re.M)
+
+
+def _strip_comments(text):
+    # Keep string literals (import specifiers live there), blank out comments.
+    return _STRIP.sub(lambda m: m.group(1) or " ", text)
+
+
+def _split_names(body):
+    """'a, b as c' → [('a', 'a'), ('b', 'c')] as (local-side, exported-side)."""
+    pairs = []
+    for part in body.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        bits = re.split(r"\s+as\s+", part)
+        pairs.append((bits[0].strip(), bits[-1].strip()))
+    return pairs
+
+
+def _parse_clause(clause):
+    clause = clause.strip()
+    default = namespace = None
+    names = []
+    brace = re.search(r"\{([^}]*)\}", clause)
+    if brace:
+        names = [imported for imported, _ in _split_names(brace.group(1))]
+        clause = clause[:brace.start()] + clause[brace.end():]
+    ns = re.search(r"\*\s*as\s+([\w$]+)", clause)
+    if ns:
+        namespace = ns.group(1)
+        clause = clause[:ns.start()] + clause[ns.end():]
+    head = clause.strip().strip(",").strip()
+    if head and head != "type":
+        default = head
+    return default, names, namespace
+
+
+def extract(text):
+    """{'exports': [...], 'default': bool, 'star': [...], 'imports': [...]}."""
+    code = _strip_comments(text)
+    imports = []
+
+    for m in _IMPORT_FROM.finditer(code):
+        default, names, namespace = _parse_clause(m.group("clause"))
+        imports.append({"source": m.group("src"), "quote": m.group("q"),
+                        "default": default, "names": names, "namespace": namespace})
+    for m in _IMPORT_BARE.finditer(code):
+        imports.append({"source": m.group("src"), "quote": m.group("q"),
+                        "default": None, "names": [], "namespace": None})
+    for m in (_IMPORT_DYN.finditer(code) if "import(" in code else ()):
+        imports.append({"source": m.group("src"), "quote": m.group("q"),
+                        "default": None, "names": [], "namespace": "*dynamic*"})
+
+    exports = set(_EXPORT_DECL.findall(code))
+    has_default = bool(_EXPORT_DEFAULT.search(code))
+    for m in _EXPORT_LIST.finditer(code):
+        for _, exported in _split_names(m.group("names")):
+            if exported == "default":
+                has_default = True
+            else:
+                exports.add(exported)
+
+    star = []
+    for m in _REEXPORT.finditer(code):
+        clause = m.group("clause")
+        imports.append({"source": m.group("src"), "quote": m.group("q"),
+                        "default": None, "names": [], "namespace": "*reexport*"})
+        if clause.startswith("{"):
+            for _, exported in _split_names(clause[1:-1]):
+                if exported == "default":
+                    has_default = True
+                else:
+                    exports.add(exported)
+        elif " as " in clause:
+            exports.add(clause.split()[-1])
+        else:
+            star.append(m.group("src"))
+
+    return {"exports": sorted(exports), "default": has_default,
+            "star": star, "imports": imports}
+
+
+# ─── Index ────────────────────────────────────────────────────────────────────
+
+def _walk(root):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in ("node_modules", ".git", "dist")]
+        for name in filenames:
+            if name.endswith(SOURCE_EXTS):
+                yield os.path.join(dirpath, name).replace(os.sep, "/")
+
+
+class SymbolIndex:
+    def __init__(self, root=DEFAULT_ROOT, path=DEFAULT_INDEX_PATH):
+        self.root = root
+        self.path = path
+        self.files = {}        # {path: {"stat", "exports", "default", "star", "imports"}}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, root=DEFAULT_ROOT, path=DEFAULT_INDEX_PATH):
+        index = cls(root, path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION and data.get("root") == root:
+                index.files = data["files"]
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+        return index
+
+    def save(self):
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        atomic_write(self.path, json.dumps(
+            {"version": INDEX_VERSION, "root": self.root, "files": self.files},
+            separators=(",", ":"),
+        ))
+        self._dirty = False
+
+    def refresh(self):
+        """Re-scan only files whose mtime/size changed; drop deleted ones.
+
+        Returns the number of files (re)parsed.
+        """
+        seen = set()
+        parsed = 0
+        for path in _walk(self.root):
+            seen.add(path)
+            st = os.stat(path)
+            stat = [st.st_mtime_ns, st.st_size]
+            entry = self.files.get(path)
+            if entry and entry["stat"] == stat:
+                continue
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                info = extract(f.read())
+            info["stat"] = stat
+            self.files[path] = info
+            parsed += 1
+            self._dirty = True
+        for path in set(self.files) - seen:
+            del self.files[path]
+            self._dirty = True
+        return parsed
+
+    # ─── Resolution ───────────────────────────────────────────────────────────
+
+    @staticmethod
+    def is_local(spec):
+        return spec.startswith((".", "/")) or any(spec.startswith(a) for a in ALIASES)
+
+    def resolve(self, importer, spec):
+        """Path of the module `spec` refers to from `importer`, or None."""
+        for alias, target in ALIASES.items():
+            if spec.startswith(alias):
+                base = posixpath.normpath(target + spec[len(alias):])
+                break
+        else:
+            base = posixpath.normpath(posixpath.join(posixpath.dirname(importer), spec))
+        for suffix in RESOLVE_SUFFIXES:
+            candidate = base + suffix
+            if candidate in self.files:
+                return candidate
+        # Assets (.css, .svg, ...) are not indexed but are valid imports.
+        if os.path.isfile(base):
+            return base
+        return None
+
+    def exported_names(self, path, _seen=None):
+        """Names `path` exports, following `export * from` chains."""
+        entry = self.files.get(path)
+        if not entry:
+            return set()
+        names = set(entry["exports"])
+        _seen = _seen or set()
+        _seen.add(path)
+        for spec in entry["star"]:
+            target = self.resolve(path, spec)
+            if target and target not in _seen:
+                names |= self.exported_names(target, _seen)
+        return names
+
+    def where(self, symbol):
+        """Files that export `symbol` (use 'default' for default exports)."""
+        if symbol == "default":
+            return sorted(p for p, e in self.files.items() if e["default"])
+        return sorted(p for p in self.files if symbol in self.exported_names(p))
+
+    # ─── Checks ───────────────────────────────────────────────────────────────
+
+    def problems(self):
+        """[(importer, import_record, message)] for every broken local import."""
+        found = []
+        for importer, entry in sorted(self.files.items()):
+            for imp in entry["imports"]:
+                spec = imp["source"]
+                if not self.is_local(spec):
+                    continue
+                target = self.resolve(importer, spec)
+                if target is None:
+                    found.append((importer, imp, f"cannot resolve '{spec}'"))
+                    continue
+                if target not in self.files:
+                    continue
+                exported = self.exported_names(target)
+                missing = [n for n in imp["names"] if n not in exported]
+                if imp["default"] and not self.files[target]["default"]:
+                    missing.append("default")
+                if missing:
+                    found.append((importer, imp,
+                                  f"'{spec}' does not export {', '.join(missing)}"))
+        return found
+
+    def suggest(self, importer, imp):
+        """Relative specifier for a module that provides everything `imp` needs.
+
+        Prefers a candidate whose file name matches the broken specifier's
+        basename; returns None if there is no single clear answer.
+        """
+        needed = set(imp["names"])
+        candidates = [
+            p for p in self.files
+            if p != importer
+            and needed <= self.exported_names(p)
+            and (not imp["default"] or self.files[p]["default"])
+        ]
+        stem = posixpath.basename(imp["source"])
+        named = [p for p in candidates
+                 if posixpath.splitext(posixpath.basename(p))[0] == stem
+                 or posixpath.basename(posixpath.dirname(p)) == stem]
+        pick = named if named else candidates
+        if len(pick) != 1:
+            return None
+        rel = posixpath.relpath(posixpath.splitext(pick[0])[0], posixpath.dirname(importer))
+        if posixpath.basename(rel) == "index":
+            rel = posixpath.dirname(rel) or "."
+        return rel if rel.startswith(".") else "./" + rel
+
+
+# ─── Import rewriting ─────────────────────────────────────────────────────────
+
+def fix_imports(index, dry_run=False):
+    """Rewrite every unresolvable import that has exactly one sensible target.
+
+    Returns the list of (importer, old_spec, new_spec) that were (or, for a
+    dry run, would be) rewritten.
+    """
+    rewrites = {}
+    for importer, imp, message in index.problems():
+        if not message.startswith("cannot resolve"):
+            continue
+        new_spec = index.suggest(importer, imp)
+        if new_spec:
+            rewrites.setdefault(importer, {})[imp["source"]] = (imp["quote"], new_spec)
+
+    done = []
+    for importer, specs in rewrites.items():
+        edits = [
+            Edit(f"{q}{old}{q}", f"{q}{new}{q}", f"{old} → {new}")
+            for old, (q, new) in specs.items()
+        ]
+        PatchSet(importer, edits, tokens=False).run(dry_run=dry_run, index=False)
+        done.extend((importer, old, new) for old, (_, new) in specs.items())
+    return done
+
+
+# ─── CLI ──────────────────────────────────────────────────────────────────────
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export/import index for src/.")
+    parser.add_argument("--root", default=DEFAULT_ROOT)
+    parser.add_argument("--check", action="store_true", help="Report broken local imports")
+    parser.add_argument("--where", metavar="SYMBOL", help="Which files export SYMBOL")
+    parser.add_argument("--fix", action="store_true", help="Rewrite unresolvable import paths")
+    parser.add_argument("--dry-run", action="store_true", help="With --fix: print diffs only")
+    args = parser.parse_args(argv)
+
+    index = SymbolIndex.load(args.root)
+    parsed = index.refresh()
+    index.save()
+    print(f"{len(index.files)} modules indexed ({parsed} re-parsed).")
+
+    if args.where:
+        for path in index.where(args.where):
+            print(f"  {path}")
+
+    if args.fix:
+        for importer, old, new in fix_imports(index, dry_run=args.dry_run):
+            print(f"  {importer}: '{old}' → '{new}'")
+        if not args.dry_run:
+            index.refresh()
+            index.save()
+
+    if args.check or not (args.where or args.fix):
+        problems = index.problems()
+        for importer, _, message in problems:
+            print(f"✗ {importer}: {message}")
+        if problems:
+            print(f"\n{len(problems)} broken import(s).")
+            return 1
+        print("✓ Every local import resolves.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
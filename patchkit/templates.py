@@ -0,0 +1,213 @@
+"""
+patchkit/templates.py
+Render component files from parameterized templates.
+
+write_last_resort.py and write_hard_money_card.py used to carry the whole
+component source as one Python string literal, which drifted from the
+real files in src/components/lenderMatch/. The sources now live as
+templates under patchkit/templates/, and components.json lists which file
+each one renders to and with what parameters.
+
+Template syntax is `[[ name ]]` or `[[ name | default ]]` — chosen because
+JSX already uses `{}` and `${}` everywhere. Templates are compiled once into
+a list of literal/placeholder segments and the compiled form is cached in
+.patchkit/templates.json, keyed by template mtime and size. Output is
+streamed segment by segment into a temp file that is then renamed over the
+target, so a half-rendered component is never visible to Vite.
+
+Run from: repo root
+Command:  python -m patchkit.templates --all
+          python -m patchkit.templates HardMoneyLenderCard \\
+              --out src/components/lenderMatch/PrivateLenderCard.jsx \\
+              --set componentName=PrivateLenderCard --set accent=#3b82f6
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+from .txn import atomic_write
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
+REGISTRY_PATH = os.path.join(TEMPLATE_DIR, "components.json")
+CACHE_PATH = os.path.join(".patchkit", "templates.json")
+
+_PLACEHOLDER = re.compile(r"\[\[\s*([A-Za-z_]\w*)\s*(?:\|\s*(.*?)\s*)?\]\]")
+
+
+class TemplateError(Exception):
+    """Raised for unknown templates or missing parameters."""
+
+
+# ─── Compilation ──────────────────────────────────────────────────────────────
+
+def compile_template(source):
+    """Split template text into segments.
+
+    Each segment is either a literal string or a [name, default] pair
+    (default is None when the placeholder has none).
+    """
+    segments = []
+    cursor = 0
+    for m in _PLACEHOLDER.finditer(source):
+        if m.start() > cursor:
+            segments.append(source[cursor:m.start()])
+        segments.append([m.group(1), m.group(2)])
+        cursor = m.end()
+    if cursor < len(source):
+        segments.append(source[cursor:])
+    return segments
+
+
+class TemplateCache:
+    """Compiled templates, persisted between runs."""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self.entries = {}
+        self._dirty = False
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, ValueError):
+            pass
+
+    def get(self, template_path):
+        st = os.stat(template_path)
+        stat = [st.st_mtime_ns, st.st_size]
+        key = os.path.abspath(template_path)
+        entry = self.entries.get(key)
+        if entry and entry["stat"] == stat:
+            return entry["segments"]
+        with open(template_path, "r", encoding="utf-8") as f:
+            segments = compile_template(f.read())
+        self.entries[key] = {"stat": stat, "segments": segments}
+        self._dirty = True
+        return segments
+
+    def save(self):
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        atomic_write(self.path, json.dumps(self.entries))
+        self._dirty = False
+
+
+# ─── Rendering ────────────────────────────────────────────────────────────────
+
+def template_path(name):
+    """Resolve a template name ('HardMoneyLenderCard') or path to a file."""
+    if os.path.isfile(name):
+        return name
+    path = os.path.join(TEMPLATE_DIR, name if name.endswith(".tmpl") else name + ".jsx.tmpl")
+    if not os.path.isfile(path):
+        raise TemplateError(f"Unknown template: {name}")
+    return path
+
+
+def render_iter(segments, params):
+    """Yield output chunks; raises TemplateError on a missing parameter."""
+    for seg in segments:
+        if isinstance(seg, str):
+            yield seg
+            continue
+        name, default = seg
+        value = params.get(name, default)
+        if value is None:
+            raise TemplateError(f"Missing template parameter: {name}")
+        yield str(value)
+
+
+def missing_params(segments, params):
+    return sorted({
+        seg[0] for seg in segments
+        if not isinstance(seg, str) and seg[1] is None and seg[0] not in params
+    })
+
+
+def render_to(out_path, template, params, cache=None):
+    """Render `template` with `params` and stream it to `out_path`."""
+    cache = cache or TemplateCache()
+    segments = cache.get(template_path(template))
+    missing = missing_params(segments, params)
+    if missing:
+        raise TemplateError(f"Missing template parameter(s): {', '.join(missing)}")
+    atomic_write(out_path, render_iter(segments, params))
+    return out_path
+
+
+def render(template, params, cache=None):
+    """Render to a string (for diffs and checks)."""
+    cache = cache or TemplateCache()
+    return "".join(render_iter(cache.get(template_path(template)), params))
+
+
+def load_registry(path=REGISTRY_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["components"]
+
+
+# ─── CLI ──────────────────────────────────────────────────────────────────────
+
+def _parse_sets(pairs):
+    params = {}
+    for pair in pairs or []:
+        if "=" not in pair:
+            raise TemplateError(f"--set expects name=value, got {pair!r}")
+        name, value = pair.split("=", 1)
+        params[name] = value
+    return params
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render component files from templates.")
+    parser.add_argument("template", nargs="?", help="Template name or path")
+    parser.add_argument("--out", help="Output file")
+    parser.add_argument("--set", action="append", metavar="NAME=VALUE",
+                        help="Template parameter (repeatable)")
+    parser.add_argument("--all", action="store_true",
+                        help="Render every component in components.json")
+    parser.add_argument("--only", action="append", metavar="OUT",
+                        help="With --all: only this output path (repeatable)")
+    parser.add_argument("--check", action="store_true",
+                        help="With --all: report files that differ from their template")
+    args = parser.parse_args(argv)
+
+    cache = TemplateCache()
+    try:
+        if args.all:
+            stale = 0
+            for comp in load_registry():
+                if args.only and comp["out"] not in args.only:
+                    continue
+                params = {**comp.get("params", {}), **_parse_sets(args.set)}
+                if args.check:
+                    try:
+                        with open(comp["out"], "r", encoding="utf-8") as f:
+                            current = f.read()
+                    except FileNotFoundError:
+                        current = None
+                    if current != render(comp["template"], params, cache):
+                        stale += 1
+                        print(f"✗ {comp['out']} differs from {comp['template']}")
+                    continue
+                render_to(comp["out"], comp["template"], params, cache)
+                print(f"✓ {comp['out']}")
+            cache.save()
+            return 1 if stale else 0
+
+        if not args.template or not args.out:
+            parser.error("give a template and --out, or use --all")
+        render_to(args.out, args.template, _parse_sets(args.set), cache)
+        cache.save()
+        print(f"✓ {args.out}")
+        return 0
+    except TemplateError as exc:
+        print(f"ERROR: {exc}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+patchkit/tests/test_engine.py
+Anchor location, splicing and the PatchSet run path.
+"""
+
+import os
+
+import pytest
+
+from patchkit.engine import Edit, PatchError, PatchSet, apply_edits
+from patchkit.matcher import AnchorMatcher
+
+SOURCE = """\
+import React from 'react';
+
+function Card() {
+    const label = "Hard Money";
+    return <div>{label}</div>;
+}
+
+export default Card;
+"""
+
+
+def test_overlapping_anchors_raise():
+    edits = [
+        Edit("function Card() {", "function Card(props) {", "signature"),
+        Edit("Card() {\n    const", "Card() {\n    let", "binding"),
+    ]
+    with pytest.raises(PatchError, match="Overlapping anchors"):
+        apply_edits(SOURCE, edits)
+
+
+def test_ambiguous_anchor_patches_first_occurrence_only():
+    text = "a = 1;\nb = 2;\na = 1;\n"
+    result = apply_edits(text, [Edit("a = 1;", "a = 3;", "first a")])
+    assert result.text == "a = 3;\nb = 2;\na = 1;\n"
+
+
+@pytest.mark.parametrize("text", [
+    "const label = useState('');",
+    "setLabel(label); label = useState",
+    "useStateuseState",
+])
+def test_string_matcher_agrees_with_find_on_nested_and_overlapping_anchors(text):
+    # "label" hides inside "setLabel(label)"-style matches, "use" is a prefix
+    # of "useState", and "State(" starts inside "useState(".
+    patterns = ["useState", "use", "State(", "label", "setLabel(label)", "tel", "absent"]
+    expected = {p: text.find(p) for p in patterns if p in text}
+    assert AnchorMatcher(patterns).first_occurrences(text) == expected
+
+
+def test_missing_required_anchor_aborts_every_edit():
+    edits = [
+        Edit("export default Card;", "export { Card };", "export"),
+        Edit("function Missing() {", "function Found() {", "missing"),
+    ]
+    with pytest.raises(PatchError, match="missing"):
+        apply_edits(SOURCE, edits)
+
+    result = apply_edits(SOURCE, [edits[0], Edit(edits[1].old, "", "optional", optional=True)])
+    assert [e.label for e in result.applied] == ["export"]
+    assert [e.label for e in result.skipped] == ["optional"]
+
+
+def test_edits_splice_in_file_order_whatever_their_listed_order():
+    edits = [
+        Edit("export default Card;", "export { Card };", "last"),
+        Edit("import React from 'react';", "import React, { memo } from 'react';", "first"),
+        Edit('"Hard Money"', '"Private Money"', "middle"),
+    ]
+    result = apply_edits(SOURCE, edits)
+    assert [e.label for e in result.applied] == ["first", "middle", "last"]
+    assert result.text == (
+        SOURCE.replace("import React from", "import React, { memo } from")
+              .replace("Hard Money", "Private Money")
+              .replace("export default Card;", "export { Card };")
+    )
+
+
+def test_already_applied_edit_is_reported_present():
+    once = apply_edits(SOURCE, [Edit("Hard Money", "Bridge Loan", "label")])
+    again = apply_edits(once.text, [Edit("Hard Money", "Bridge Loan", "label")])
+    assert again.text == once.text
+    assert [e.label for e in again.present] == ["label"]
+
+
+def test_token_matching_ignores_whitespace_and_quote_drift():
+    anchor = "const label = 'Hard Money';\n  return <div>{ label }</div>;"
+    edit = Edit(anchor, 'const label = "Bridge";\n    return <div>{label}</div>;', "drifted")
+
+    with pytest.raises(PatchError):
+        apply_edits(SOURCE, [edit], tokens=False)
+
+    result = apply_edits(SOURCE, [edit])
+    assert [e.label for e in result.applied] == ["drifted"]
+    assert '    const label = "Bridge";\n    return <div>{label}</div>;\n}' in result.text
+    assert result.text.startswith("import React from 'react';")
+
+
+@pytest.fixture
+def target(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "Card.jsx"
+    path.write_text(SOURCE, encoding="utf-8")
+    return path
+
+
+def test_patchset_missing_anchor_leaves_target_untouched(target):
+    patch = PatchSet(str(target.name), [
+        Edit("export default Card;", "export { Card };", "export"),
+        Edit("function Missing() {", "", "missing"),
+    ])
+    with pytest.raises(SystemExit):
+        patch.run(verbose=False, dry_run=False)
+    assert target.read_text(encoding="utf-8") == SOURCE
+    assert not os.path.exists(os.path.join(".patchkit", "index.json"))
+
+
+def test_patchset_rerun_is_skipped_by_the_index(target, capsys):
+    patch = PatchSet(str(target.name), [Edit("Hard Money", "Bridge Loan", "label")])
+    assert patch.run(verbose=False, dry_run=False) is True
+    patched = target.read_text(encoding="utf-8")
+    mtime = target.stat().st_mtime_ns
+    capsys.readouterr()
+
+    assert patch.run(verbose=False, dry_run=False) is False
+    assert "already has this patch (index)" in capsys.readouterr().out
+    assert target.stat().st_mtime_ns == mtime
+
+    # Touching the file drifts the stat signature; the hash still matches.
+    os.utime(target, ns=(mtime + 10**9, mtime + 10**9))
+    assert patch.run(verbose=False, dry_run=False) is False
+    assert "(index)" in capsys.readouterr().out
+    assert target.read_text(encoding="utf-8") == patched
@@ -0,0 +1,61 @@
+"""
+patchkit/tests/test_templates.py
+Template compile/render round-trip and the compiled-template cache.
+"""
+
+import os
+
+import pytest
+
+from patchkit.templates import (
+    TemplateCache,
+    TemplateError,
+    compile_template,
+    load_registry,
+    render,
+    render_to,
+)
+
+TEMPLATE = "export default function [[ name ]]() {\n  return <h2 style={{ color: '[[ accent | #e8531a ]]' }}>[[name]]</h2>;\n}\n"
+
+
+def test_compile_splits_literals_and_placeholders():
+    assert compile_template(TEMPLATE) == [
+        "export default function ", ["name", None],
+        "() {\n  return <h2 style={{ color: '", ["accent", "#e8531a"],
+        "' }}>", ["name", None],
+        "</h2>;\n}\n",
+    ]
+
+
+def test_render_round_trip(tmp_path):
+    tmpl = tmp_path / "Title.jsx.tmpl"
+    tmpl.write_text(TEMPLATE, encoding="utf-8")
+    cache = TemplateCache(str(tmp_path / "cache.json"))
+
+    text = render(str(tmpl), {"name": "Title"}, cache)
+    assert text == (
+        "export default function Title() {\n"
+        "  return <h2 style={{ color: '#e8531a' }}>Title</h2>;\n}\n"
+    )
+
+    out = tmp_path / "Title.jsx"
+    render_to(str(out), str(tmpl), {"name": "Title"}, cache)
+    assert out.read_text(encoding="utf-8") == text
+
+    cache.save()
+    reloaded = TemplateCache(str(tmp_path / "cache.json"))
+    assert render(str(tmpl), {"name": "Title", "accent": "#333"}, reloaded) == text.replace("#e8531a", "#333")
+
+    with pytest.raises(TemplateError, match="name"):
+        render_to(str(tmp_path / "Missing.jsx"), str(tmpl), {}, cache)
+    assert not (tmp_path / "Missing.jsx").exists()
+
+
+def test_registered_components_match_their_templates(tmp_path, monkeypatch):
+    # Registry output paths are relative to the repo root, as for the CLI.
+    monkeypatch.chdir(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    cache = TemplateCache(str(tmp_path / "cache.json"))
+    for comp in load_registry():
+        with open(comp["out"], "r", encoding="utf-8") as f:
+            assert render(comp["template"], comp["params"], cache) == f.read(), comp["out"]
@@ -0,0 +1,57 @@
+"""
+patchkit/tests/test_txn.py
+Multi-file transactions — all files swapped in, or none.
+"""
+
+import os
+
+import pytest
+
+from patchkit import txn
+from patchkit.txn import Transaction
+
+
+def test_commit_swaps_in_every_file(tmp_path):
+    a, b = tmp_path / "a.js", tmp_path / "b.js"
+    a.write_text("old a", encoding="utf-8")
+    with Transaction() as t:
+        t.stage(str(a), "new a")
+        t.stage(str(b), "new b")
+    assert a.read_text(encoding="utf-8") == "new a"
+    assert b.read_text(encoding="utf-8") == "new b"
+
+
+def test_failed_swap_rolls_back_files_already_replaced(tmp_path, monkeypatch):
+    a, b, c = tmp_path / "a.js", tmp_path / "b.js", tmp_path / "c.js"
+    a.write_text("old a", encoding="utf-8")
+    b.write_text("old b", encoding="utf-8")
+    real_replace = os.replace
+
+    def failing_replace(src, dst):
+        if os.fspath(dst) == str(b):
+            raise OSError("disk full")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(txn.os, "replace", failing_replace)
+    t = Transaction()
+    t.stage(str(c), "new c")
+    t.stage(str(a), "new a")
+    t.stage(str(b), "new b")
+    with pytest.raises(OSError, match="disk full"):
+        t.commit()
+
+    assert a.read_text(encoding="utf-8") == "old a"
+    assert b.read_text(encoding="utf-8") == "old b"
+    assert not c.exists()
+    assert sorted(os.listdir(tmp_path)) == ["a.js", "b.js"]
+
+
+def test_error_inside_block_discards_staged_writes(tmp_path):
+    a = tmp_path / "a.js"
+    a.write_text("old a", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        with Transaction() as t:
+            t.stage(str(a), "new a")
+            raise RuntimeError("abort")
+    assert a.read_text(encoding="utf-8") == "old a"
+    assert os.listdir(tmp_path) == ["a.js"]
@@ -0,0 +1,132 @@
+"""
+patchkit/tokens.py
+Token-level anchor matching for JS/JSX.
+
+Exact string anchors only match when every space of indentation is the
+same as when the patch was written. Here both the file and each anchor are
+tokenized once — whitespace dropped, string quotes normalized, comment
+bodies whitespace-collapsed — and anchors are matched as token sequences
+with the same multi-pattern matcher the exact path uses. A match maps back
+to a character span in the original text, so splicing is unchanged.
+
+The tokenizer is deliberately forgiving rather than a full JS parser: it
+only has to produce the SAME tokens for an anchor and for the file, so an
+apostrophe in JSX text (`Don't`) that never closes on its line falls back
+to a plain punctuation token instead of swallowing the rest of the file.
+
+Tokenized files are cached by content hash, so any number of patches can
+query the same file without re-tokenizing it.
+"""
+
+import hashlib
+import re
+from collections import OrderedDict, namedtuple
+
+from .matcher import AnchorMatcher
+
+Token = namedtuple("Token", "kind value start end")
+
+_WS          = re.compile(r"\s+")
+_STRING      = re.compile(r"\"(?:\\.|[^\"\\\n])*\"|'(?:\\.|[^'\\\n])*'", re.S)
+_TEMPLATE    = re.compile(r"`(?:\\.|[^`\\])*`", re.S)
+_LINE_COMMENT  = re.compile(r"//[^\n]*")
+# An unclosed /* runs to the end of the file, as it does for the JS parser;
+# the old lazy `/\*.*?\*/` rescanned the rest of the file from every /*.
+_BLOCK_COMMENT = re.compile(r"/\*(?:[^*]|\*(?!/))*(?:\*/|\Z)")
+_IDENT       = re.compile(r"[A-Za-z_$\u00c0-\uffff][\w$\u00c0-\uffff]*")
+_NUMBER      = re.compile(r"\d[\w.]*|\.\d[\w]*")
+_PUNCT       = re.compile(r"=>|\.\.\.|[=!]==?|[<>]=?|&&|\|\||\?\?|\?\.|[-+*/%&|^]=?|.", re.S)
+
+# One alternation in priority order, so the whole file is split by a single
+# finditer in C instead of a Python loop trying each pattern per position.
+# A quote that does not close on its line fails "str" and falls through to
+# "punct", as does an unclosed backtick.
+_SCAN = re.compile("|".join(f"(?P<{kind}>{rx.pattern})" for kind, rx in (
+    ("ws",      _WS),
+    ("str",     _STRING),
+    ("tpl",     _TEMPLATE),
+    ("line",    _LINE_COMMENT),
+    ("block",   _BLOCK_COMMENT),
+    ("id",      _IDENT),
+    ("num",     _NUMBER),
+    ("punct",   _PUNCT),
+)), re.S)
+
+
+def tokenize(text):
+    """Split JS/JSX source into Tokens, skipping whitespace."""
+    tokens = []
+    append = tokens.append
+    for m in _SCAN.finditer(text):
+        kind = m.lastgroup
+        if kind == "ws":
+            continue
+        value = m.group()
+        start, end = m.span()
+        if kind == "str":
+            # Quote style is irrelevant: 'a' and "a" are the same token.
+            append(Token("str", value[1:-1], start, end))
+        elif kind == "line":
+            append(Token("comment", _WS.sub(" ", value[2:]).strip(), start, end))
+        elif kind == "block":
+            body = value[2:-2] if len(value) >= 4 and value.endswith("*/") else value[2:]
+            append(Token("comment", _WS.sub(" ", body).strip(), start, end))
+        else:
+            append(Token(kind, value, start, end))
+    return tokens
+
+
+def token_key(tokens):
+    """Hashable, position-free form of a token sequence for matching."""
+    return tuple((t.kind, t.value) for t in tokens)
+
+
+# ─── Per-file cache ───────────────────────────────────────────────────────────
+
+class TokenizedSource:
+    """One file's tokens plus helpers to turn token matches into char spans."""
+
+    def __init__(self, text):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.keys = token_key(self.tokens)
+
+    def find_spans(self, anchors):
+        """{anchor: (start, end)} for the first token-level match of each anchor.
+
+        Anchors that tokenize to nothing or are not found are left out.
+        """
+        by_key = {}
+        for anchor in anchors:
+            key = token_key(tokenize(anchor))
+            if key:
+                by_key.setdefault(key, []).append(anchor)
+        if not by_key:
+            return {}
+
+        found = AnchorMatcher(by_key).first_occurrences(self.keys)
+        spans = {}
+        for key, first in found.items():
+            last = first + len(key) - 1
+            span = (self.tokens[first].start, self.tokens[last].end)
+            for anchor in by_key[key]:
+                spans[anchor] = span
+        return spans
+
+
+_CACHE = OrderedDict()
+_CACHE_SIZE = 32
+
+
+def tokenized(text):
+    """TokenizedSource for `text`, shared by every caller with the same content."""
+    digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+    source = _CACHE.get(digest)
+    if source is None:
+        source = TokenizedSource(text)
+        _CACHE[digest] = source
+        if len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    else:
+        _CACHE.move_to_end(digest)
+    return source
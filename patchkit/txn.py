@@ -0,0 +1,141 @@
+"""
+patchkit/txn.py
+Dry-run diffs and all-or-nothing writes for the patch tooling.
+
+`open(path, "w")` truncates first and writes second, so a crash in between
+leaves Vite watching a half-written JSX file. Every write here goes to a
+temp file in the same directory and is swapped in with os.replace(), which
+is atomic on both POSIX and Windows. A Transaction stages all targets before
+touching any of them, and puts the originals back if a later swap fails.
+"""
+
+import difflib
+import os
+import tempfile
+
+
+# ─── Dry-run ──────────────────────────────────────────────────────────────────
+
+def unified_diff(path, before, after, context=3):
+    """Unified diff of one file, built entirely in memory."""
+    return "".join(difflib.unified_diff(
+        before.splitlines(keepends=True),
+        after.splitlines(keepends=True),
+        fromfile=f"a/{path}",
+        tofile=f"b/{path}",
+        n=context,
+    ))
+
+
+# ─── Atomic writes ────────────────────────────────────────────────────────────
+
+def _write_temp(path, content, encoding):
+    # `content` is a str or an iterable of str chunks (streamed as produced).
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".patchkit-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            if isinstance(content, str):
+                f.write(content)
+            else:
+                for chunk in content:
+                    f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+    except BaseException:
+        _discard(tmp)
+        raise
+    return tmp
+
+
+def _discard(tmp):
+    try:
+        os.remove(tmp)
+    except OSError:
+        pass
+
+
+def atomic_write(path, content, encoding="utf-8"):
+    """Replace `path` with `content` without ever exposing a partial file.
+
+    `content` may be a string or an iterable of string chunks.
+    """
+    os.replace(_write_temp(path, content, encoding), path)
+
+
+class Transaction:
+    """Commit several file rewrites together or not at all.
+
+        with Transaction() as txn:
+            txn.stage("src/App.jsx", new_app, original=old_app)
+            txn.stage("src/firebase/config.js", new_cfg, original=old_cfg)
+        # both files swapped in on clean exit; neither touched on error
+    """
+
+    def __init__(self, encoding="utf-8"):
+        self.encoding = encoding
+        self._pending = []     # [(path, content, original)]
+        self.committed = []
+
+    def stage(self, path, content, original=None):
+        """Queue a rewrite. `original` is used for rollback if provided."""
+        if original is None and os.path.exists(path):
+            with open(path, "r", encoding=self.encoding) as f:
+                original = f.read()
+        self._pending.append((path, content, original))
+
+    def diff(self):
+        """Unified diff of everything staged — nothing touches disk."""
+        return "".join(
+            unified_diff(path, original or "", content)
+            for path, content, original in self._pending
+            if content != original
+        )
+
+    def commit(self):
+        # Phase 1: every new version lands in a temp file beside its target.
+        temps = []
+        try:
+            for path, content, _ in self._pending:
+                temps.append(_write_temp(path, content, self.encoding))
+        except BaseException:
+            for tmp in temps:
+                _discard(tmp)
+            raise
+
+        # Phase 2: swap them in; undo the swaps already made if one fails.
+        swapped = []
+        try:
+            for (path, _, original), tmp in zip(self._pending, temps):
+                os.replace(tmp, path)
+                swapped.append((path, original))
+        except BaseException:
+            for tmp in temps[len(swapped):]:
+                _discard(tmp)
+            self._rollback(swapped)
+            raise
+
+        self.committed = [p for p, _, _ in self._pending]
+        self._pending = []
+        return self.committed
+
+    def _rollback(self, swapped):
+        for path, original in reversed(swapped):
+            if original is None:
+                _discard(path)
+            else:
+                atomic_write(path, original, self.encoding)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self._pending = []
+        return False
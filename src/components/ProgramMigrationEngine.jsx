@@ -4,7 +4,8 @@
  *
  * Standalone drop-in component. Wire into AUSRescue.jsx with 3 lines.
  * Consumes rankPrograms() / identifyPrimaryBlocker() / assessFeasibility()
- * from the deterministic Rule Engine. No AI calls — pure rule output display.
+ * from the deterministic Rule Engine, and solveFixPlans() from the Fix Solver
+ * for each card's cheapest remediation. No AI calls — pure rule output display.
  *
  * Props:
  *   profile  {Object}  Borrower profile (see programRuleEngine.js BORROWER_PROFILE_DEFAULTS)
@@ -22,6 +23,7 @@ import {
   identifyPrimaryBlocker,
   assessFeasibility,
 } from '../engines/programRuleEngine';
+import { solveFixPlans } from '../engines/programFixSolver';
 import { mergeReasoningResults, getStrategyNames } from '../services/ausRescueReasoning';
 
 // ─── Color tokens (consistent with LoanBeacons dark theme) ───────────────────
@@ -212,7 +214,7 @@ function EligibilityBadge({ tier, label }) {
 }
 
 // ─── Program Card ─────────────────────────────────────────────────────────────
-function ProgramCard({ result, isExpanded, onToggle, isBestPath }) {
+function ProgramCard({ result, fixPlan, isExpanded, onToggle, isBestPath }) {
   const tier = result.eligible ? 'eligible' : result.conditional ? 'conditional' : 'disqualified';
   const tierCfg = TIER_CONFIG[tier];
   const isDimmed = tier === 'disqualified';
@@ -346,6 +348,32 @@ function ProgramCard({ result, isExpanded, onToggle, isBestPath }) {
             </div>
           )}
 
+          {/* Fastest Fix */}
+          {!result.eligible && fixPlan?.fixable && fixPlan.steps.length > 0 && (
+            <div style={{
+              background: C.tealDim, border: `1px solid ${C.teal}30`,
+              borderRadius: 6, padding: '8px 10px',
+            }}>
+              <div style={{ display: 'flex', justifyContent: 'space-between', marginBottom: 6 }}>
+                <span style={{ color: C.teal, fontSize: 11, fontWeight: 700, letterSpacing: '0.07em' }}>
+                  FASTEST FIX
+                </span>
+                {fixPlan.cashRequired > 0 && (
+                  <span style={{ color: C.textSecond, fontSize: 11, fontFamily: "'DM Mono', monospace" }}>
+                    Cash: ${fixPlan.cashRequired.toLocaleString()}
+                  </span>
+                )}
+              </div>
+              <div style={{ display: 'flex', flexDirection: 'column', gap: 3 }}>
+                {fixPlan.steps.map((s, i) => (
+                  <div key={i} style={{ color: C.textPrimary, fontSize: 12, display: 'flex', gap: 6 }}>
+                    <span style={{ color: C.teal, flexShrink: 0 }}>{i + 1}.</span> {s.detail}
+                  </div>
+                ))}
+              </div>
+            </div>
+          )}
+
           {/* Passes */}
           {result.passes.length > 0 && (
             <div>
@@ -452,7 +480,7 @@ function ProgramCard({ result, isExpanded, onToggle, isBestPath }) {
 }
 
 // ─── Tier Section ─────────────────────────────────────────────────────────────
-function TierSection({ tier, results, expandedId, onToggle, bestPathId }) {
+function TierSection({ tier, results, fixPlans, expandedId, onToggle, bestPathId }) {
   const [collapsed, setCollapsed] = useState(tier === 'disqualified');
   const cfg = TIER_CONFIG[tier];
   if (results.length === 0) return null;
@@ -491,6 +519,7 @@ function TierSection({ tier, results, expandedId, onToggle, bestPathId }) {
             <ProgramCard
               key={r.programId}
               result={r}
+              fixPlan={fixPlans.get(r.programId)}
               isExpanded={expandedId === r.programId}
               onToggle={() => onToggle(r.programId)}
               isBestPath={r.programId === bestPathId}
@@ -619,6 +648,12 @@ export default function ProgramMigrationEngine({ profile, sonnetResults, sonnetL
     return { ranked, primaryBlocker, feasibility };
   }, [profile]);
 
+  // Cheapest remediation per program, for the expanded cards
+  const fixPlans = useMemo(() => {
+    if (!profile || !profile.fico) return new Map();
+    return new Map(solveFixPlans(profile).map(plan => [plan.programId, plan]));
+  }, [profile]);
+
   // Merge Sonnet refinements on top of rule engine output
   const ranked = useMemo(
     () => mergeReasoningResults(rawRanked, sonnetResults),
@@ -715,6 +750,7 @@ export default function ProgramMigrationEngine({ profile, sonnetResults, sonnetL
       <TierSection
         tier="eligible"
         results={eligible}
+        fixPlans={fixPlans}
         expandedId={expandedId}
         onToggle={handleToggle}
         bestPathId={bestPathId}
@@ -722,6 +758,7 @@ export default function ProgramMigrationEngine({ profile, sonnetResults, sonnetL
       <TierSection
         tier="conditional"
         results={conditional}
+        fixPlans={fixPlans}
         expandedId={expandedId}
         onToggle={handleToggle}
         bestPathId={bestPathId}
@@ -729,6 +766,7 @@ export default function ProgramMigrationEngine({ profile, sonnetResults, sonnetL
       <TierSection
         tier="disqualified"
         results={disqualified}
+        fixPlans={fixPlans}
         expandedId={expandedId}
         onToggle={handleToggle}
         bestPathId={null}
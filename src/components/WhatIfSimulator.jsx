@@ -8,8 +8,8 @@
  *   3. Co-Borrower       — add income, DTI recalculates across all 11 programs
  *   4. Comparison        — two scenarios side by side, fastest path highlighted
  *
- * All math is deterministic. No AI calls. Re-runs rankPrograms() from the
- * Rule Engine on every change.
+ * All math is deterministic. No AI calls. Re-runs rankProgramOutcomes() from
+ * the Rule Engine on every change (compact codes — no blocker text is built).
  *
  * Props:
  *   baseProfile   {Object}   pmeProfile from AUSRescue — borrower baseline
@@ -19,7 +19,7 @@
  */
 
 import { useState, useMemo } from 'react';
-import { rankPrograms, assessFeasibility, identifyPrimaryBlocker } from '../engines/programRuleEngine';
+import { rankProgramOutcomes, assessFeasibility, identifyPrimaryBlocker } from '../engines/programRuleEngine';
 
 // ── Math helpers ──────────────────────────────────────────────────────────────
 
@@ -115,12 +115,12 @@ function FeasPill({ label }) {
 function ResultsColumn({ profile, baseProfile, label, highlight }) {
   const ranked = useMemo(() => {
     if (!profile?.fico) return [];
-    return rankPrograms(profile);
+    return rankProgramOutcomes(profile);
   }, [profile]);
 
   const baseRanked = useMemo(() => {
     if (!baseProfile?.fico) return [];
-    return rankPrograms(baseProfile);
+    return rankProgramOutcomes(baseProfile);
   }, [baseProfile]);
 
   const feasibility = useMemo(() => ranked.length ? assessFeasibility(ranked) : null, [ranked]);
@@ -337,8 +337,8 @@ export default function WhatIfSimulator({ baseProfile, loanAmount, interestRate
   }), [baseProfile, compScenarios]);
 
   // Determine best comparison scenario
-  const compFeasibility = compProfiles.map(p => p?.fico ? assessFeasibility(rankPrograms(p)) : 'LOW');
-  const compEligible    = compProfiles.map(p => p?.fico ? rankPrograms(p).filter(r => r.eligible).length : 0);
+  const compFeasibility = compProfiles.map(p => p?.fico ? assessFeasibility(rankProgramOutcomes(p)) : 'LOW');
+  const compEligible    = compProfiles.map(p => p?.fico ? rankProgramOutcomes(p).filter(r => r.eligible).length : 0);
   const bestCompIdx     = compEligible[0] >= compEligible[1] ? 0 : 1;
 
   const noBase = !baseProfile?.fico;
@@ -6,7 +6,8 @@
  * All functionality preserved.
  * ============================================================
  */
-import React, { useState } from 'react';
+import React, { useMemo, useState } from 'react';
+import { expandResult, getResultLender } from '../../engines/LenderMatchEngine';
 
 // ─── Eligibility Status ───────────────────────────────────────────────────────
 const STATUS_CONFIG = {
@@ -363,8 +364,13 @@ function DisclaimerFooter({ disclaimer }) {
 }
 
 // ─── Main Component ───────────────────────────────────────────────────────────
-export function AlternativeLenderCard({ result, onSelectLender, isSelected, animationDelay }) {
+export function AlternativeLenderCard({ result, engineOutput, lenderMatrix, onSelectLender, isSelected, animationDelay }) {
   const [expanded, setExpanded] = useState(false);
+  // Rows are compact; breakdown, narrative and profile text are built on first expand.
+  const detail = useMemo(
+    () => (expanded && result ? expandResult(result, engineOutput, lenderMatrix) : null),
+    [expanded, result, engineOutput, lenderMatrix]
+  );
   if (!result) return null;
 
   const {
@@ -373,11 +379,14 @@ export function AlternativeLenderCard({ result, onSelectLender, isSelected, anim
     eligible, eligibilityStatus, eligibilityLabel,
     passReasons, conditionalFlags, narrative,
     overlayRisk, overlaySignals,
-    tierBasis, tierNotes, typicalUseCase,
+    tierBasis, typicalUseCase,
     strengths, weaknesses,
     guidelineVersionRef, dataSource, disclaimer,
     isPlaceholder,
-  } = result;
+  } = detail || result;
+
+  const tierNotes = detail?.tierNotes ?? result.tierNotes ?? getResultLender(result, { matrixVersion: engineOutput?.matrixVersion, ...lenderMatrix })?.tierNotes;
+  const signals   = overlaySignals ?? engineOutput?.overlayRisk?.signals;
 
   const progMeta   = PROGRAM_META[program] || PROGRAM_META.DSCR;
   const risk       = RISK_STYLE[overlayRisk] || RISK_STYLE.LOW;
@@ -434,7 +443,7 @@ export function AlternativeLenderCard({ result, onSelectLender, isSelected, anim
         <div className="flex items-center gap-2 flex-shrink-0">
           <div className="flex items-center gap-1 px-2 py-1 rounded text-xs font-bold font-mono border"
             style={{ backgroundColor: risk.bg, borderColor: risk.border, color: risk.color }}
-            title={`Overlay Risk: ${overlayRisk}${overlaySignals?.length ? ` — ${overlaySignals.join(', ')}` : ''}`}>
+            title={`Overlay Risk: ${overlayRisk}${signals?.length ? ` — ${signals.join(', ')}` : ''}`}>
             {risk.icon} {risk.label}
           </div>
 
@@ -477,9 +486,9 @@ export function AlternativeLenderCard({ result, onSelectLender, isSelected, anim
             <NonQMScoreBreakdown breakdown={breakdown} maxPossible={scoreMax} isPlaceholder={isPlaceholder} />
           </div>
 
-          {showDSCRPanel     && <DSCRPanel result={result} />}
-          {showAssetPanel    && <AssetDepletionPanel result={result} />}
-          {showBankStmtPanel && <BankStatementPanel result={result} />}
+          {showDSCRPanel     && <DSCRPanel result={detail ?? result} />}
+          {showAssetPanel    && <AssetDepletionPanel result={detail ?? result} />}
+          {showBankStmtPanel && <BankStatementPanel result={detail ?? result} />}
 
           {narrative && <NarrativeBlock narrative={narrative} />}
 
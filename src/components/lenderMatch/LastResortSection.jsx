@@ -1,17 +1,33 @@
 import { useState, useEffect } from "react";
-import { evaluateHardMoneyPath } from "../../engines/LenderMatchEngine_hardMoney";
+import { getEngineWorkerPool, isAbortError } from "../../services/engineWorkerPool";
 import HardMoneyLenderCard from "./HardMoneyLenderCard";
 
-const LastResortSection = ({ scenario, agencyResultCount = 0, nonQMResultCount = 0 }) => {
+const LastResortSection = ({ scenario, agencyResultCount = 0, nonQMResultCount = 0, onEvaluation }) => {
   const [evaluation, setEvaluation] = useState(null);
   const [collapsed, setCollapsed] = useState(false);
 
+  // Runs in the engine worker pool; a newer scenario supersedes an older
+  // request ("hardMoney" key) and unmount cancels the pending one.
+  // onEvaluation hands the result to the parent (e.g. a stats chip) so the
+  // page never evaluates the hard money path a second time.
   useEffect(() => {
     if (!scenario) return;
-    const result = evaluateHardMoneyPath(scenario, agencyResultCount, nonQMResultCount);
-    setEvaluation(result);
-    if (result.heroMode) setCollapsed(false);
-  }, [scenario, agencyResultCount, nonQMResultCount]);
+    const controller = new AbortController();
+    getEngineWorkerPool()
+      .run("evaluateHardMoneyPath", [scenario, agencyResultCount, nonQMResultCount], {
+        key: "LastResortSection:hardMoney",
+        signal: controller.signal,
+      })
+      .then((result) => {
+        setEvaluation(result);
+        onEvaluation?.(result);
+        if (result.heroMode) setCollapsed(false);
+      })
+      .catch((err) => {
+        if (!isAbortError(err)) console.error("[LastResortSection] Hard money evaluation failed:", err);
+      });
+    return () => controller.abort();
+  }, [scenario, agencyResultCount, nonQMResultCount, onEvaluation]);
 
   if (!evaluation || (!evaluation.triggered && !evaluation.heroMode)) return null;
 
@@ -6,7 +6,8 @@
  * All functionality preserved.
  * ============================================================
  */
-import React, { useState } from 'react';
+import React, { useMemo, useState } from 'react';
+import { expandResult, getResultLender } from '../../engines/LenderMatchEngine';
 
 // ─── Score helpers ────────────────────────────────────────────────────────────
 const scoreColor = (s) =>
@@ -221,16 +222,24 @@ function OverlaySignalsList({ signals, level }) {
 }
 
 // ─── Main Component ───────────────────────────────────────────────────────────
-export function LenderScorecardCard({ result, onSelectLender, isSelected, animationDelay }) {
+export function LenderScorecardCard({ result, engineOutput, lenderMatrix, onSelectLender, isSelected, animationDelay }) {
   const [expanded, setExpanded] = useState(false);
+  // Rows are compact; breakdown, narrative and profile text are built on first expand.
+  const detail = useMemo(
+    () => (expanded && result ? expandResult(result, engineOutput, lenderMatrix) : null),
+    [expanded, result, engineOutput, lenderMatrix]
+  );
   if (!result) return null;
 
   const {
     lenderName, shortName, program, fitScore, breakdown,
     eligible, passReasons, overlayRisk, overlaySignals,
-    tier, tierNotes, strengths, weaknesses, narrative,
+    tier, strengths, weaknesses, narrative,
     notes, guidelineVersionRef, accentColor,
-  } = result;
+  } = detail || result;
+
+  const tierNotes = detail?.tierNotes ?? result.tierNotes ?? getResultLender(result, { matrixVersion: engineOutput?.matrixVersion, ...lenderMatrix })?.tierNotes;
+  const signals   = overlaySignals ?? engineOutput?.overlayRisk?.signals;
 
   const risk      = RISK_STYLE[overlayRisk] || RISK_STYLE.LOW;
   const progColor = PROGRAM_COLOR[program]  || '#3b82f6';
@@ -287,7 +296,7 @@ export function LenderScorecardCard({ result, onSelectLender, isSelected, animat
           {/* Risk badge */}
           <div className="flex items-center gap-1 px-2 py-1 rounded text-xs font-bold font-mono border"
             style={{ backgroundColor: risk.bg, borderColor: risk.border, color: risk.color }}
-            title={`Overlay Risk: ${overlayRisk}${overlaySignals?.length ? ` (${overlaySignals.join(', ')})` : ''}`}>
+            title={`Overlay Risk: ${overlayRisk}${signals?.length ? ` (${signals.join(', ')})` : ''}`}>
             {risk.icon} {risk.label}
           </div>
 
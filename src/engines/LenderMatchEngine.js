@@ -50,6 +50,18 @@ import {
   mergeNonQMWithOverrides,
 } from "../data/nonQMLenderMatrix";
 
+import {
+  buildEligibilityIndex,
+  selectCandidates,
+  categoryMask,
+  hasBit,
+} from "./lenderEligibilityIndex";
+
+import {
+  compileColumns,
+  enumCode,
+} from "./lenderMatrixColumns";
+
 
 // ─── Engine Configuration ─────────────────────────────────────────────────────
 
@@ -195,6 +207,57 @@ export function normalizeScenario(raw = {}) {
 }
 
 
+// ─── STEP 1 (memoized): Shared Normalized Scenario ───────────────────────────
+// One LenderMatch render used to normalize the same form three times (engine
+// run, hard-money stat chip, <LastResortSection>), producing a new object each
+// time and re-firing LastResortSection's useEffect. getNormalizedScenario()
+// caches on a stable key of the raw inputs and returns the SAME frozen object
+// for equal inputs, so downstream engines and React deps can compare by
+// identity. normalizeScenario() itself stays a plain, mutable-result function.
+
+const SCENARIO_CACHE_SIZE = 50;
+const scenarioCache       = new Map();   // key → frozen scenario (Map order = LRU)
+
+// Like JSON.stringify with sorted keys, except that values JSON would fold
+// together stay distinct (as programRuleCore's keyPart does): NaN, ±Infinity
+// and -0 are written bare instead of as null/0, undefined array slots as `u`,
+// and a Date as its timestamp rather than its ISO string.
+function stableStringify(value) {
+  if (value === undefined || typeof value === "function") return "u";
+  if (typeof value === "number") return Object.is(value, -0) ? "-0" : String(value);
+  if (value instanceof Date) return `D${value.getTime()}`;
+  if (value === null || typeof value !== "object") return JSON.stringify(value);
+  if (Array.isArray(value)) return `[${value.map(stableStringify).join(",")}]`;
+  const keys = Object.keys(value).filter((k) => value[k] !== undefined).sort();
+  return `{${keys.map((k) => `${JSON.stringify(k)}:${stableStringify(value[k])}`).join(",")}}`;
+}
+
+/** Stable cache key for raw scenario inputs — independent of key order. */
+export function scenarioKey(raw = {}) {
+  return stableStringify(raw ?? {});
+}
+
+export function getNormalizedScenario(raw = {}) {
+  const key    = scenarioKey(raw);
+  const cached = scenarioCache.get(key);
+  if (cached) {
+    scenarioCache.delete(key);
+    scenarioCache.set(key, cached);
+    return cached;
+  }
+  const scenario = Object.freeze(normalizeScenario(raw ?? {}));
+  scenarioCache.set(key, scenario);
+  if (scenarioCache.size > SCENARIO_CACHE_SIZE) {
+    scenarioCache.delete(scenarioCache.keys().next().value);
+  }
+  return scenario;
+}
+
+export function clearScenarioCache() {
+  scenarioCache.clear();
+}
+
+
 // ─── STEP 2A: Agency Eligibility Gating ──────────────────────────────────────
 export function checkAgencyEligibility(lender, program, scenario) {
   const g = lender.guidelines[program];
@@ -202,18 +265,15 @@ export function checkAgencyEligibility(lender, program, scenario) {
     return { eligible: false, failReason: `Lender does not offer ${program}`, reasons: [] };
   }
 
-  const {
-    loanAmount, creditScore, ltv, dti, propertyType, occupancy,
-    state, creditEvent, creditEventMonths, transactionType, incomeDocType,
-    vaEntitlement,
-  } = scenario;
-
+  // Scenario fields are read by the rule that needs them, not up front, so
+  // the incremental matcher can record exactly which fields a result used.
   const reasons = [];
 
   if (!lender.programs.includes(program)) {
     return { eligible: false, failReason: `${lender.shortName} does not offer ${program}`, reasons };
   }
 
+  const { loanAmount } = scenario;
   if (loanAmount > g.maxLoanAmount) {
     return {
       eligible: false,
@@ -223,6 +283,7 @@ export function checkAgencyEligibility(lender, program, scenario) {
     };
   }
 
+  const { creditScore } = scenario;
   if (creditScore < g.minFICO) {
     return {
       eligible: false,
@@ -233,16 +294,17 @@ export function checkAgencyEligibility(lender, program, scenario) {
 
   if (program === AGENCY_PROGRAMS.FHA && creditScore < g.ficoCutoffForReducedLTV) {
     const reducedMax = g.reducedLTVBelowCutoff || 90;
-    if (ltv > reducedMax) {
+    if (scenario.ltv > reducedMax) {
       return {
         eligible: false,
-        failReason: `FHA requires FICO ${g.ficoCutoffForReducedLTV}+ for ${ltv}% LTV. ` +
+        failReason: `FHA requires FICO ${g.ficoCutoffForReducedLTV}+ for ${scenario.ltv}% LTV. ` +
                     `With FICO ${creditScore}, maximum LTV is ${reducedMax}%.`,
         reasons,
       };
     }
   }
 
+  const { ltv, transactionType } = scenario;
   const ltvMap = { purchase: "purchase", "rate-term": "rateTerm", cashout: "cashOut" };
   const ltvKey = ltvMap[transactionType] || "purchase";
   const maxLTV = g.maxLTV?.[ltvKey] ?? g.maxLTV?.purchase;
@@ -255,6 +317,7 @@ export function checkAgencyEligibility(lender, program, scenario) {
     };
   }
 
+  const { dti } = scenario;
   if (dti > g.maxDTI) {
     return {
       eligible: false,
@@ -263,31 +326,33 @@ export function checkAgencyEligibility(lender, program, scenario) {
     };
   }
 
-  const propertyFails = checkAgencyPropertyType(g, propertyType, program);
+  const propertyFails = checkAgencyPropertyType(g, scenario.propertyType, program);
   if (propertyFails) {
     return { eligible: false, failReason: propertyFails, reasons };
   }
 
+  const { occupancy } = scenario;
   const occupancyFail = checkAgencyOccupancy(g, lender, occupancy, ltv, transactionType, program);
   if (occupancyFail) {
     return { eligible: false, failReason: occupancyFail, reasons };
   }
 
-  if (lender.states && !lender.states.includes("ALL") && state) {
-    if (!lender.states.includes(state)) {
+  if (lender.states && !lender.states.includes("ALL") && scenario.state) {
+    if (!lender.states.includes(scenario.state)) {
       return {
         eligible: false,
-        failReason: `${lender.shortName} is not licensed in ${state}`,
+        failReason: `${lender.shortName} is not licensed in ${scenario.state}`,
         reasons,
       };
     }
   }
 
-  const seasoningFail = checkSeasoning(g, creditEvent, creditEventMonths, lender.shortName, program);
+  const seasoningFail = checkSeasoning(g, scenario, lender.shortName, program);
   if (seasoningFail) {
     return { eligible: false, failReason: seasoningFail, reasons };
   }
 
+  const { incomeDocType } = scenario;
   if (g.incomeTypes && !g.incomeTypes.includes(incomeDocType) && incomeDocType !== "fullDoc") {
     return {
       eligible: false,
@@ -308,8 +373,8 @@ export function checkAgencyEligibility(lender, program, scenario) {
   reasons.push(`FICO ${creditScore} meets ${lender.shortName} minimum (${g.minFICO})`);
   reasons.push(`LTV ${ltv}% within ${lender.shortName} ceiling (${maxLTV}%)`);
   reasons.push(`DTI ${dti}% within ${lender.shortName} limit (${g.maxDTI}%)`);
-  if (creditEvent !== CREDIT_EVENTS.NONE) {
-    reasons.push(`${creditEvent} seasoning satisfied (${creditEventMonths} mo provided)`);
+  if (scenario.creditEvent !== CREDIT_EVENTS.NONE) {
+    reasons.push(`${scenario.creditEvent} seasoning satisfied (${scenario.creditEventMonths} mo provided)`);
   }
 
   return { eligible: true, failReason: null, reasons };
@@ -345,7 +410,8 @@ function checkAgencyOccupancy(g, lender, occupancy, ltv, transactionType, progra
   return null;
 }
 
-function checkSeasoning(g, creditEvent, creditEventMonths, lenderName, program) {
+function checkSeasoning(g, scenario, lenderName, program) {
+  const { creditEvent } = scenario;
   if (!creditEvent || creditEvent === CREDIT_EVENTS.NONE) return null;
 
   let required = 0;
@@ -362,6 +428,7 @@ function checkSeasoning(g, creditEvent, creditEventMonths, lenderName, program)
     label    = "Short Sale";
   }
 
+  const { creditEventMonths } = scenario;
   if (creditEventMonths < required) {
     return `${label} seasoning: ${creditEventMonths} months provided, ` +
            `${required} months required by ${lenderName} for ${program}`;
@@ -383,24 +450,11 @@ export function checkNonQMEligibility(lender, program, scenario) {
     };
   }
 
-  const {
-    creditScore, ltv, loanAmount, propertyType, occupancy,
-    state, creditEvent, creditEventMonths, transactionType,
-    dscr, totalAssets, reservesMonths,
-  } = scenario;
-
+  // Fields are read rule by rule (see checkAgencyEligibility).
   const reasons          = [];
   const conditionalFlags = [];
   let   seasoningViolation = false;
 
-  const occupancyKey = occupancy === "Primary"    ? "primary"
-                     : occupancy === "SecondHome"  ? "secondHome"
-                     : "investment";
-
-  const txKey = transactionType === "cashOut" ? "cashOut"
-              : transactionType === "rateTerm" ? "rateTerm"
-              : "purchase";
-
   if (!lender.programs.includes(program)) {
     return {
       eligible: false,
@@ -409,6 +463,7 @@ export function checkNonQMEligibility(lender, program, scenario) {
     };
   }
 
+  const { creditScore } = scenario;
   if (creditScore < g.minFICO) {
     return {
       eligible: false,
@@ -418,6 +473,7 @@ export function checkNonQMEligibility(lender, program, scenario) {
     };
   }
 
+  const { loanAmount } = scenario;
   if (loanAmount > g.maxLoanAmount) {
     return {
       eligible: false,
@@ -427,6 +483,15 @@ export function checkNonQMEligibility(lender, program, scenario) {
     };
   }
 
+  const { occupancy, transactionType, ltv } = scenario;
+  const occupancyKey = occupancy === "Primary"    ? "primary"
+                     : occupancy === "SecondHome"  ? "secondHome"
+                     : "investment";
+
+  const txKey = transactionType === "cashOut" ? "cashOut"
+              : transactionType === "rateTerm" ? "rateTerm"
+              : "purchase";
+
   const ltvBlock = g.maxLTV?.[occupancyKey];
   if (!ltvBlock) {
     return {
@@ -445,11 +510,11 @@ export function checkNonQMEligibility(lender, program, scenario) {
     };
   }
 
-  if (g.allowedPropertyTypes && !g.allowedPropertyTypes.includes(propertyType)) {
+  if (g.allowedPropertyTypes && !g.allowedPropertyTypes.includes(scenario.propertyType)) {
     if (g.allowedPropertyTypes[0] !== "ALL") {
       return {
         eligible: false,
-        failReason: `${lender.shortName} ${program} does not allow ${propertyType}`,
+        failReason: `${lender.shortName} ${program} does not allow ${scenario.propertyType}`,
         reasons, seasoningViolation, conditionalFlags,
       };
     }
@@ -463,6 +528,7 @@ export function checkNonQMEligibility(lender, program, scenario) {
     };
   }
 
+  const dscr = program === PROGRAMS.DSCR ? scenario.dscr : null;
   if (program === PROGRAMS.DSCR) {
     if (dscr === null || dscr === undefined) {
       return {
@@ -480,6 +546,7 @@ export function checkNonQMEligibility(lender, program, scenario) {
     }
   }
 
+  const totalAssets = program === PROGRAMS.ASSET_DEPLETION ? scenario.totalAssets : null;
   if (program === PROGRAMS.ASSET_DEPLETION) {
     if (!totalAssets || totalAssets < g.minAssets) {
       return {
@@ -491,7 +558,7 @@ export function checkNonQMEligibility(lender, program, scenario) {
     }
   }
 
-  const seasoningFail = checkSeasoning(g, creditEvent, creditEventMonths, lender.shortName, program);
+  const seasoningFail = checkSeasoning(g, scenario, lender.shortName, program);
   if (seasoningFail) {
     seasoningViolation = true;
     return {
@@ -501,11 +568,11 @@ export function checkNonQMEligibility(lender, program, scenario) {
     };
   }
 
-  if (lender.states && !lender.states.includes("ALL") && state) {
-    if (!lender.states.includes(state)) {
+  if (lender.states && !lender.states.includes("ALL") && scenario.state) {
+    if (!lender.states.includes(scenario.state)) {
       return {
         eligible: false,
-        failReason: `${lender.shortName} is not licensed in ${state}`,
+        failReason: `${lender.shortName} is not licensed in ${scenario.state}`,
         reasons, seasoningViolation, conditionalFlags,
       };
     }
@@ -515,7 +582,7 @@ export function checkNonQMEligibility(lender, program, scenario) {
     conditionalFlags.push("SHORT_TERM_RENTAL_NOT_ACCEPTED");
   }
 
-  if (g.minReserveMonths && reservesMonths < g.minReserveMonths) {
+  if (g.minReserveMonths && scenario.reservesMonths < g.minReserveMonths) {
     conditionalFlags.push(`RESERVES_BELOW_MINIMUM_${g.minReserveMonths}MO`);
   }
 
@@ -595,7 +662,20 @@ export function scoreAgencyLender(lender, program, scenario) {
   };
 }
 
+// Depends only on the lender record, never the scenario — cached per lender.
+const programStrengthCache = new WeakMap();   // lender → { program → score }
+
 function getProgramStrengthScore(lender, program) {
+  let byProgram = programStrengthCache.get(lender);
+  if (!byProgram) {
+    byProgram = {};
+    programStrengthCache.set(lender, byProgram);
+  }
+  byProgram[program] ??= computeProgramStrengthScore(lender, program);
+  return byProgram[program];
+}
+
+function computeProgramStrengthScore(lender, program) {
   const tierToScore = { "A+": 20, "A": 16, "B+": 12, "B": 8, "C": 4 };
   const base = tierToScore[lender.tier] ?? 10;
   const strengthText = (lender.strengths || []).join(" ").toLowerCase();
@@ -608,7 +688,7 @@ function getProgramStrengthScore(lender, program) {
 // ─── STEP 3B: Non-QM Fit Scoring ─────────────────────────────────────────────
 export function scoreNonQMLender(lender, program, scenario) {
   const g = lender.guidelines[program];
-  const { creditScore, ltv, dscr, totalAssets, occupancy, transactionType } = scenario;
+  const { creditScore, ltv, occupancy, transactionType } = scenario;
   const isPlaceholder = lender.dataSource === DATA_SOURCES.PLACEHOLDER;
 
   const occupancyKey = occupancy === "Primary"   ? "primary"
@@ -652,14 +732,16 @@ export function scoreNonQMLender(lender, program, scenario) {
   score += priorityScore;
   breakdown.priorityScore = priorityScore;
 
-  if (program === PROGRAMS.DSCR && dscr && g.minDSCR) {
+  const dscr = program === PROGRAMS.DSCR ? scenario.dscr : null;
+  if (dscr && g.minDSCR) {
     const dscrCushion = dscr - g.minDSCR;
     const dscrBonus   = dscrCushion >= 0.25 ? 3 : dscrCushion >= 0.10 ? 1 : 0;
     score = Math.min(totalMax, score + dscrBonus);
     breakdown.dscrBonus = dscrBonus;
   }
 
-  if (program === PROGRAMS.ASSET_DEPLETION && totalAssets && g.minAssets) {
+  const totalAssets = program === PROGRAMS.ASSET_DEPLETION ? scenario.totalAssets : null;
+  if (totalAssets && g.minAssets) {
     const assetRatio = totalAssets / g.minAssets;
     const assetBonus = assetRatio >= 3 ? 3 : assetRatio >= 2 ? 2 : 0;
     score = Math.min(totalMax, score + assetBonus);
@@ -830,13 +912,19 @@ export function calculateConfidenceScore(scenario, options = {}) {
 
 
 // ─── STEP 7: Rank + Package Results ──────────────────────────────────────────
+/**
+ * `totals` — eligible counts when the caller already cut its eligible rows
+ * down to the top maxResultsPerSection (matchScenario does); defaults to
+ * counting the arrays.
+ */
 export function rankAndPackageResults(
   agencyResults,
   nonQMResults,
   scenario,
   overlayRisk,
   confidence,
-  mode = PRESENTATION_MODES.SEPARATE_SECTIONS
+  mode = PRESENTATION_MODES.SEPARATE_SECTIONS,
+  totals = {}
 ) {
   const { intent = SCENARIO_INTENT.AGENCY_FIRST } = scenario;
 
@@ -844,40 +932,40 @@ export function rankAndPackageResults(
   const agencyIneligible = agencyResults.filter((r) => !r.eligible);
   const nonQMEligible    = nonQMResults.filter((r) => r.eligible);
   const nonQMIneligible  = nonQMResults.filter((r) => !r.eligible);
-
-  const sortByScore = (a, b) => b.fitScore - a.fitScore;
-  agencyEligible.sort(sortByScore);
-  nonQMEligible.sort(sortByScore);
+  const agencyTotal      = totals.agency ?? agencyEligible.length;
+  const nonQMTotal       = totals.nonQM  ?? nonQMEligible.length;
 
   const cap = ENGINE_CONFIG.maxResultsPerSection;
-  const agencyDisplay = agencyEligible.slice(0, cap);
-  const nonQMDisplay  = nonQMEligible.slice(0, cap);
+  const agencyDisplay = selectTopK(agencyEligible, cap);
+  const nonQMDisplay  = selectTopK(nonQMEligible, cap);
 
   const agencySection = buildSectionSummary(
-    "Agency", agencyDisplay, agencyIneligible, agencyEligible.length, scenario, overlayRisk
+    "Agency", agencyDisplay, agencyIneligible, agencyTotal, scenario, overlayRisk
   );
 
   const nonQMSection = buildNonQMSectionSummary(
-    nonQMDisplay, nonQMIneligible, nonQMEligible.length, scenario,
-    agencyEligible.length === 0, overlayRisk
+    nonQMDisplay, nonQMIneligible, nonQMTotal, scenario,
+    agencyTotal === 0, overlayRisk
   );
 
   let combinedSection = null;
   if (mode === PRESENTATION_MODES.COMBINED_RANKED) {
-    const combinedEligible = [
-      ...agencyEligible,
+    // The top `cap` of the union only ever draws on each side's top `cap`.
+    const combinedEligible = selectTopK([
+      ...agencyDisplay,
       ...nonQMEligible.filter((r) => r.dataSource !== DATA_SOURCES.PLACEHOLDER),
-    ].sort(sortByScore).slice(0, cap);
+    ], cap);
     combinedSection = { results: combinedEligible };
   }
 
-  if (mode === PRESENTATION_MODES.FALLBACK_ONLY && agencyEligible.length > 0) {
+  if (mode === PRESENTATION_MODES.FALLBACK_ONLY && agencyTotal > 0) {
     nonQMSection.visible = false;
   }
 
   return {
     mode,
     intent,
+    scenario,
     scenarioSummary: buildScenarioSummary(scenario),
     confidence,
     overlayRisk,
@@ -885,11 +973,80 @@ export function rankAndPackageResults(
     nonQMSection,
     combinedSection,
     hasPlaceholderResults: nonQMEligible.some((r) => r.dataSource === DATA_SOURCES.PLACEHOLDER),
-    totalEligible: agencyEligible.length + nonQMEligible.length,
+    totalEligible: agencyTotal + nonQMTotal,
     timestamp: new Date().toISOString(),
   };
 }
 
+// Best `k` by fitScore without sorting everything: a bounded min-heap with
+// the weakest kept item at the root, O(n log k). Ties keep arrival order,
+// exactly like a stable sort; a non-numeric score ranks below any number.
+function createTopK(k) {
+  const heap = [];   // { score, seq, item }
+  let seq = 0;
+
+  const worse = (a, b) => a.score < b.score || (a.score === b.score && a.seq > b.seq);
+  const swap  = (i, j) => { const t = heap[i]; heap[i] = heap[j]; heap[j] = t; };
+
+  const siftUp = (i) => {
+    while (i > 0) {
+      const parent = (i - 1) >> 1;
+      if (!worse(heap[i], heap[parent])) return;
+      swap(i, parent);
+      i = parent;
+    }
+  };
+  const siftDown = (i) => {
+    for (;;) {
+      const l = 2 * i + 1;
+      const r = l + 1;
+      let worst = i;
+      if (l < heap.length && worse(heap[l], heap[worst])) worst = l;
+      if (r < heap.length && worse(heap[r], heap[worst])) worst = r;
+      if (worst === i) return;
+      swap(i, worst);
+      i = worst;
+    }
+  };
+
+  function offer(score, item) {
+    const node = {
+      score: typeof score === "number" && !Number.isNaN(score) ? score : -Infinity,
+      seq:   seq++,
+      item,
+    };
+    if (heap.length < k) {
+      heap.push(node);
+      siftUp(heap.length - 1);
+    } else if (k > 0 && worse(heap[0], node)) {
+      heap[0] = node;
+      siftDown(0);
+    }
+  }
+
+  /**
+   * Score an offer has to beat to be kept: -Infinity while fewer than `k`
+   * items are held. A tie never displaces (the earlier arrival wins).
+   */
+  function floor() {
+    if (k <= 0) return Infinity;
+    return heap.length < k ? -Infinity : heap[0].score;
+  }
+
+  /** Kept items, best first. */
+  function sorted() {
+    return [...heap].sort((a, b) => (worse(a, b) ? 1 : worse(b, a) ? -1 : 0)).map((n) => n.item);
+  }
+
+  return { offer, floor, sorted };
+}
+
+function selectTopK(rows, k) {
+  const top = createTopK(k);
+  rows.forEach((row) => top.offer(row.fitScore, row));
+  return top.sorted();
+}
+
 function buildSectionSummary(type, eligible, ineligible, totalEligible, scenario, overlayRisk) {
   const noMatch = totalEligible === 0;
   return {
@@ -977,77 +1134,96 @@ function buildNoNonQMMatchMessage(scenario) {
 
 // ─── Main Entry Point ─────────────────────────────────────────────────────────
 export function runLenderMatch(rawInputs = {}, options = {}) {
+  // ── STEP 1: Normalize scenario (memoized, frozen) ──────────────────────
+  const scenario = getNormalizedScenario(rawInputs);
+  return matchScenario(scenario, buildMatchContext(options));
+}
+
+/**
+ * Lender universe + indexes + run options, resolved once. Shared by
+ * runLenderMatch (one scenario) and runLenderMatchBatch (many).
+ */
+function buildMatchContext(options = {}, defaults = {}) {
   const {
     agencyOverrides    = [],
     nonQMOverrides     = [],
+    matrixVersion      = null,
     firestoreAvailable = true,
     mode               = ENGINE_CONFIG.resultsPresentationMode,
+    includeIneligible  = defaults.includeIneligible ?? true,
   } = options;
 
-  // ── STEP 1: Normalize scenario ─────────────────────────────────────────
-  const scenario = normalizeScenario(rawInputs);
+  // ── Build active lender lists + eligibility indexes (cached) ───────────
+  return {
+    agencyIndex: getAgencyIndex(resolveAgencyLenders(agencyOverrides, matrixVersion)),
+    nonQMIndex:  getNonQMIndex(resolveNonQMLenders(nonQMOverrides, matrixVersion)),
+    matrixVersion,
+    firestoreAvailable,
+    mode,
+    includeIneligible,
+  };
+}
+
+/**
+ * Per-pair evaluation, split out so the incremental matcher can memoize it.
+ * `candidates` picks which index entries survive pruning. Optional
+ * `agencyScore` returns a pair's fitScore when it is provably eligible
+ * (null otherwise) without building a row, so only the pairs that make
+ * the displayed top N ever get one. Given the top N's current floor, it
+ * may return -Infinity instead for an eligible pair that cannot beat it.
+ */
+const DIRECT_EVALUATION = {
+  agency:      evaluateAgencyEntry,
+  agencyScore: scoreAgencyEntryColumnar,
+  nonQM:       evaluateNonQMEntry,
+  candidates:  selectCandidates,
+};
 
-  // ── Build active lender lists ──────────────────────────────────────────
-  const agencyLenders = applyAgencyOverrides(getActiveAgencyLenders(), agencyOverrides);
-  const nonQMLenders  = mergeNonQMWithOverrides(nonQMOverrides);
+function matchScenario(scenario, context, evaluate = DIRECT_EVALUATION) {
+  const { agencyIndex, nonQMIndex, matrixVersion, firestoreAvailable, mode, includeIneligible } = context;
 
   // ── Determine which programs to evaluate ──────────────────────────────
   const agencyProgramsToEval = resolveAgencyPrograms(scenario);
   const nonQMProgramToEval   = resolveNonQMProgram(scenario);
 
+  // ── STEP 4: Scenario-level overlay risk (same for every lender) ────────
+  const overlayRisk = assessOverlayRisk(scenario);
+
   // ── STEP 2–5: Evaluate all Agency lenders ─────────────────────────────
+  // With includeIneligible: false, the index prunes pairs that cannot pass
+  // and only the survivors are gated in full. Otherwise every pair is
+  // gated so each ineligible row carries its exact failReason.
+  //
+  // Eligible pairs only compete for the top maxResultsPerSection slots;
+  // the rest are counted, never turned into rows.
   const agencyResults = [];
+  const agencyTop     = createTopK(ENGINE_CONFIG.maxResultsPerSection);
+  let   agencyEligibleCount = 0;
 
   if (!scenario.isNonQMPath) {
-    agencyLenders.forEach((lender) => {
-      agencyProgramsToEval.forEach((program) => {
-        if (!lender.programs.includes(program)) return;
-
-        const eligibility = checkAgencyEligibility(lender, program, scenario);
-        const overlayRisk = assessOverlayRisk(scenario);
-        const tier        = getTierIndicator(lender, "Agency");
-
-        let fitScore  = 0;
-        let breakdown = {};
-
-        if (eligibility.eligible) {
-          const scored = scoreAgencyLender(lender, program, scenario);
-          fitScore  = scored.fitScore;
-          breakdown = scored.breakdown;
-        }
-
-        agencyResults.push({
-          lenderId:            lender.id,
-          lenderName:          lender.name,
-          shortName:           lender.shortName,
-          accentColor:         lender.accentColor,
-          program,
-          eligible:            eligibility.eligible,
-          eligibilityStatus:   eligibility.eligible
-                                 ? ELIGIBILITY_STATUS.ELIGIBLE
-                                 : ELIGIBILITY_STATUS.INELIGIBLE,
-          failReason:          eligibility.failReason,
-          passReasons:         eligibility.reasons,
-          fitScore,
-          breakdown,
-          overlayRisk:         overlayRisk.level,
-          overlaySignals:      overlayRisk.signals,
-          tier:                tier.display,
-          tierBasis:           tier.basis,
-          strengths:           lender.strengths,
-          weaknesses:          lender.weaknesses,
-          tierNotes:           lender.tierNotes,
-          guidelineVersionRef: lender.guidelineVersionRef,
-          dataSource:          lender.dataSource,
-          notes:               lender.guidelines[program]?.notes || [],
-          narrative:           eligibility.eligible
-                                 ? buildAgencyNarrative(lender, program, scenario, fitScore, breakdown)
-                                 : null,
-        });
-      });
+    const entries = includeIneligible
+      ? agencyIndex.entries.filter((e) => agencyProgramsToEval.includes(e.program))
+      : evaluate.candidates(agencyIndex, agencyIndexQuery(scenario, agencyProgramsToEval));
+
+    entries.forEach((entry) => {
+      const score = evaluate.agencyScore?.(entry, scenario, agencyIndex, agencyTop.floor()) ?? null;
+      if (score !== null) {
+        agencyEligibleCount++;
+        agencyTop.offer(score, { entry, score });
+        return;
+      }
+      const row = evaluate.agency(entry, scenario, overlayRisk);
+      if (row.eligible) {
+        agencyEligibleCount++;
+        agencyTop.offer(row.fitScore, { row });
+      } else if (includeIneligible) {
+        agencyResults.push(row);
+      }
     });
-  } else {
-    agencyLenders.forEach((lender) => {
+    agencyResults.unshift(...agencyTop.sorted().map(({ row, entry, score }) =>
+      row ?? agencyRow(entry, true, null, score, overlayRisk)));
+  } else if (includeIneligible) {
+    agencyIndex.lenders.forEach((lender) => {
       agencyResults.push({
         lenderId:            lender.id,
         lenderName:          lender.name,
@@ -1068,85 +1244,16 @@ export function runLenderMatch(rawInputs = {}, options = {}) {
   const nonQMResults = [];
 
   if (nonQMProgramToEval) {
-    const relevantLenders = nonQMLenders.filter(
-      (l) => l.active && l.programs.includes(nonQMProgramToEval)
-    );
+    const entries = includeIneligible
+      ? nonQMIndex.entries.filter((e) => e.program === nonQMProgramToEval)
+      : evaluate.candidates(nonQMIndex, nonQMIndexQuery(scenario, nonQMProgramToEval));
 
-    relevantLenders.forEach((lender) => {
-      const eligibility = checkNonQMEligibility(lender, nonQMProgramToEval, scenario);
-      const overlayRisk = assessOverlayRisk(scenario);
-      const tier        = getTierIndicator(lender, "NonQM");
-
-      let fitScore  = 0;
-      let breakdown = {};
-      let eligStatus = ELIGIBILITY_STATUS.INELIGIBLE;
-
-      if (eligibility.eligible) {
-        const scored = scoreNonQMLender(lender, nonQMProgramToEval, scenario);
-        fitScore  = scored.fitScore;
-        breakdown = scored.breakdown;
-
-        if (lender.dataSource === DATA_SOURCES.PLACEHOLDER) {
-          const meetsException = placeholderMeetsControlledException(
-            scenario,
-            {
-              overlayRisk:        overlayRisk.level,
-              confidenceScore:    0.85,
-              seasoningViolation: eligibility.seasoningViolation || false,
-              conditionalFlags:   eligibility.conditionalFlags   || [],
-              applicableMaxLTV:   breakdown.applicableMaxLTV,
-              matchedProgram:     nonQMProgramToEval,
-            },
-            lender.guidelines[nonQMProgramToEval]
-          );
-          eligStatus = meetsException
-            ? ELIGIBILITY_STATUS.ELIGIBLE
-            : ELIGIBILITY_STATUS.CONDITIONAL;
-        } else {
-          eligStatus = ELIGIBILITY_STATUS.ELIGIBLE;
-        }
-      }
-
-      nonQMResults.push({
-        lenderId:            lender.id,
-        lenderName:          lender.profileName ?? lender.name,
-        shortName:           lender.shortName,
-        accentColor:         lender.accentColor,
-        program:             nonQMProgramToEval,
-        eligible:            eligibility.eligible,
-        eligibilityStatus:   eligStatus,
-        eligibilityLabel:    getEligibilityLabel(eligStatus, lender.dataSource),
-        eligibilityClass:    getEligibilityClass(eligStatus, lender.dataSource),
-        failReason:          eligibility.failReason,
-        passReasons:         eligibility.reasons,
-        conditionalFlags:    eligibility.conditionalFlags || [],
-        seasoningViolation:  eligibility.seasoningViolation || false,
-        fitScore,
-        breakdown,
-        overlayRisk:         overlayRisk.level,
-        overlaySignals:      overlayRisk.signals,
-        tier:                tier.display,
-        tierBasis:           tier.basis,
-        strengths:           lender.strengths,
-        weaknesses:          lender.weaknesses,
-        tierNotes:           lender.tierNotes,
-        typicalUseCase:      lender.typicalUseCase,
-        guidelineVersionRef: lender.guidelineVersionRef,
-        dataSource:          lender.dataSource,
-        isPlaceholder:       lender.dataSource === DATA_SOURCES.PLACEHOLDER,
-        disclaimer:          lender.disclaimer,
-        excludeFromCombined: lender.dataSource === DATA_SOURCES.PLACEHOLDER,
-        narrative:           eligibility.eligible
-                               ? buildNonQMNarrative(lender, nonQMProgramToEval, scenario,
-                                   fitScore, breakdown, agencyResults.some((r) => r.eligible))
-                               : null,
-      });
+    entries.forEach((entry) => {
+      const row = evaluate.nonQM(entry, scenario, overlayRisk);
+      if (row.eligible || includeIneligible) nonQMResults.push(row);
     });
   }
 
-  // ── STEP 4: Scenario-level overlay risk ───────────────────────────────
-  const overlayRisk = assessOverlayRisk(scenario);
-
   // ── STEP 6: Confidence score ──────────────────────────────────────────
   const hasPlaceholderResults = nonQMResults.some(
     (r) => r.eligible && r.dataSource === DATA_SOURCES.PLACEHOLDER
@@ -1157,9 +1264,876 @@ export function runLenderMatch(rawInputs = {}, options = {}) {
   );
 
   // ── STEP 7: Rank and package ──────────────────────────────────────────
-  return rankAndPackageResults(
-    agencyResults, nonQMResults, scenario, overlayRisk, confidence, mode
+  // matrixVersion names the lender data this run used, so expandResult()
+  // and buildDecisionRecord() resolve rows against the same universe. The
+  // override arrays themselves stay with the caller — the output is posted
+  // back from the worker and persisted, and must not carry them.
+  return {
+    ...rankAndPackageResults(
+      agencyResults, nonQMResults, scenario, overlayRisk, confidence, mode,
+      { agency: agencyEligibleCount }
+    ),
+    matrixVersion,
+  };
+}
+
+
+// ─── Per-Pair Evaluation ─────────────────────────────────────────────────────
+// One compact result row per lender × program. Narrative and breakdown are
+// left to expandResult().
+
+function evaluateAgencyEntry(entry, scenario, overlayRisk) {
+  const { lender, program } = entry;
+  const eligibility = checkAgencyEligibility(lender, program, scenario);
+  const fitScore = eligibility.eligible
+    ? scoreAgencyLender(lender, program, scenario).fitScore
+    : 0;
+  return agencyRow(entry, eligibility.eligible, eligibility.failReason, fitScore, overlayRisk);
+}
+
+/**
+ * fitScore of a pair the agency index's columns prove eligible, decided and
+ * scored straight from the typed arrays; null otherwise. Those pairs go
+ * through evaluateAgencyEntry, where checkAgencyEligibility owns the exact
+ * failReason text.
+ */
+// Eligibility still runs for every pair (the section totals count them);
+// only scoring is skipped when the entry's ceiling can't beat `floor`.
+function scoreAgencyEntryColumnar(entry, scenario, index, floor = -Infinity) {
+  if (!index?.columns || !agencyColumnsEligible(index, entry.slot, scenario)) return null;
+  if (index.columns.numeric.scoreCeiling[entry.slot] <= floor) return -Infinity;
+  return agencyColumnsFitScore(index, entry.slot, scenario);
+}
+
+function agencyRow({ lender, program, tier }, eligible, failReason, fitScore, overlayRisk) {
+  return {
+    lenderId:            lender.id,
+    lenderName:          lender.name,
+    shortName:           lender.shortName,
+    accentColor:         lender.accentColor,
+    program,
+    eligible,
+    eligibilityStatus:   eligible
+                           ? ELIGIBILITY_STATUS.ELIGIBLE
+                           : ELIGIBILITY_STATUS.INELIGIBLE,
+    failReason,
+    fitScore,
+    overlayRisk:         overlayRisk.level,
+    tier:                tier.display,
+    tierBasis:           tier.basis,
+    guidelineVersionRef: lender.guidelineVersionRef,
+    dataSource:          lender.dataSource,
+  };
+}
+
+function evaluateNonQMEntry({ lender, program, tier }, scenario, overlayRisk) {
+  const eligibility = checkNonQMEligibility(lender, program, scenario);
+
+  let fitScore   = 0;
+  let eligStatus = ELIGIBILITY_STATUS.INELIGIBLE;
+
+  if (eligibility.eligible) {
+    const scored = scoreNonQMLender(lender, program, scenario);
+    fitScore = scored.fitScore;
+
+    if (lender.dataSource === DATA_SOURCES.PLACEHOLDER) {
+      const meetsException = placeholderMeetsControlledException(
+        scenario,
+        {
+          overlayRisk:        overlayRisk.level,
+          confidenceScore:    0.85,
+          seasoningViolation: eligibility.seasoningViolation || false,
+          conditionalFlags:   eligibility.conditionalFlags   || [],
+          applicableMaxLTV:   scored.breakdown.applicableMaxLTV,
+          matchedProgram:     program,
+        },
+        lender.guidelines[program]
+      );
+      eligStatus = meetsException
+        ? ELIGIBILITY_STATUS.ELIGIBLE
+        : ELIGIBILITY_STATUS.CONDITIONAL;
+    } else {
+      eligStatus = ELIGIBILITY_STATUS.ELIGIBLE;
+    }
+  }
+
+  return {
+    lenderId:            lender.id,
+    lenderName:          lender.profileName ?? lender.name,
+    shortName:           lender.shortName,
+    accentColor:         lender.accentColor,
+    program,
+    eligible:            eligibility.eligible,
+    eligibilityStatus:   eligStatus,
+    eligibilityLabel:    getEligibilityLabel(eligStatus, lender.dataSource),
+    eligibilityClass:    getEligibilityClass(eligStatus, lender.dataSource),
+    failReason:          eligibility.failReason,
+    seasoningViolation:  eligibility.seasoningViolation || false,
+    fitScore,
+    overlayRisk:         overlayRisk.level,
+    tier:                tier.display,
+    tierBasis:           tier.basis,
+    guidelineVersionRef: lender.guidelineVersionRef,
+    dataSource:          lender.dataSource,
+    isPlaceholder:       lender.dataSource === DATA_SOURCES.PLACEHOLDER,
+    excludeFromCombined: lender.dataSource === DATA_SOURCES.PLACEHOLDER,
+  };
+}
+
+
+// ─── Batch / Portfolio Entry Point ───────────────────────────────────────────
+// Re-matches many scenarios (e.g. the whole `scenarios` collection after a
+// guideline change). The merged lender universe and its indexes are built
+// once for the whole run; scenarios are consumed lazily from any iterable
+// and packaged results are yielded one chunk at a time, so memory stays
+// bounded by chunkSize no matter how many scenarios go through.
+//
+// Batch defaults to includeIneligible: false — ineligible rows are what
+// make a single result large, and portfolio re-runs only need the matches.
+// Scenarios skip the getNormalizedScenario() LRU, which would only churn.
+
+export const BATCH_DEFAULT_CHUNK_SIZE = 500;
+
+function batchItem(raw, position, context) {
+  try {
+    return {
+      id:     raw?.id ?? raw?.scenarioId ?? position,
+      result: matchScenario(normalizeScenario(raw ?? {}), context),
+      error:  null,
+    };
+  } catch (err) {
+    return { id: raw?.id ?? raw?.scenarioId ?? position, result: null, error: err?.message || String(err) };
+  }
+}
+
+/**
+ * @param {Iterable} scenarios  — raw scenario inputs (array, generator, …)
+ * @param {Object}   options    — runLenderMatch options + chunkSize
+ * @yields {{ items: Array<{id, result, error}>, processed: number }}
+ */
+export function* runLenderMatchBatch(scenarios, options = {}) {
+  const { chunkSize = BATCH_DEFAULT_CHUNK_SIZE } = options;
+  const context = buildMatchContext(options, { includeIneligible: false });
+
+  let items     = [];
+  let processed = 0;
+  for (const raw of scenarios) {
+    items.push(batchItem(raw, processed, context));
+    processed += 1;
+    if (items.length >= chunkSize) {
+      yield { items, processed };
+      items = [];
+    }
+  }
+  if (items.length) yield { items, processed };
+}
+
+/** Same as runLenderMatchBatch for async sources (paged Firestore reads). */
+export async function* runLenderMatchBatchAsync(scenarios, options = {}) {
+  const { chunkSize = BATCH_DEFAULT_CHUNK_SIZE } = options;
+  const context = buildMatchContext(options, { includeIneligible: false });
+
+  let items     = [];
+  let processed = 0;
+  for await (const raw of scenarios) {
+    items.push(batchItem(raw, processed, context));
+    processed += 1;
+    if (items.length >= chunkSize) {
+      yield { items, processed };
+      items = [];
+    }
+  }
+  if (items.length) yield { items, processed };
+}
+
+
+// ─── Incremental Re-Match ────────────────────────────────────────────────────
+// For live "what-if" edits: one matcher per lender universe, fed the full
+// form on every change. Each lender × program result records the scenario
+// fields its gate (checkAgencyEligibility / checkNonQMEligibility, including
+// checkSeasoning) and scorer actually read; the gates read fields rule by
+// rule, so a pair that fails on FICO never depends on DTI. A pair is
+// re-evaluated only when one of ITS fields differs from the scenario it was
+// last evaluated against — otherwise the previous row object is reused. The
+// pruning query is re-run only when one of its inputs changed.
+//
+// Scenario-level steps (program selection, overlay risk, confidence,
+// ranking) are cheap and always recomputed. Rows carry the overlay risk
+// level, so a pair evaluated under a different level is always redone.
+//
+// When the edited field is one EVERY pair read last time (FICO, usually),
+// tracking can't save anything, so that run evaluates untracked and marks
+// its rows as depending on all fields; the first edit to a narrower field
+// re-tracks them.
+//
+//   const matcher = createIncrementalMatcher({ agencyOverrides, nonQMOverrides });
+//   matcher.run(form);                 // full run
+//   matcher.run({ ...form, creditScore: 681 });
+//   matcher.lastRun;                   // { changedFields, evaluated, reused, broad }
+
+// Scenario fields get one bit each, so a pair's dependencies are a single
+// integer and "did anything it read change?" is one AND. Normalized
+// scenarios always have the same shape; past 31 fields, the rest share the
+// top bit (conservative — they invalidate together).
+const fieldBits = new Map();
+
+function fieldBit(field) {
+  let bit = fieldBits.get(field);
+  if (bit === undefined) {
+    bit = 1 << Math.min(fieldBits.size, 31);
+    fieldBits.set(field, bit);
+  }
+  return bit;
+}
+
+// Getter prototypes are built once per scenario shape, so every view shares
+// one hidden class and the gates' property reads stay monomorphic.
+const viewPrototypes = new Map();   // "field,field,…" → prototype
+
+/** Read-only view of `scenario` that ORs each field read into recorder.deps. */
+function trackedView(scenario, recorder) {
+  const fields = Object.keys(scenario);
+  const shape  = fields.join(",");
+  let proto = viewPrototypes.get(shape);
+  if (!proto) {
+    proto = {};
+    fields.forEach((field) => {
+      const bit = fieldBit(field);
+      Object.defineProperty(proto, field, {
+        enumerable: true,
+        get() { this.recorder.deps |= bit; return this.scenario[field]; },
+      });
+    });
+    viewPrototypes.set(shape, proto);
+  }
+  const view = Object.create(proto);
+  view.scenario = scenario;
+  view.recorder = recorder;
+  return view;
+}
+
+const ALL_FIELDS = -1;
+
+function changedMask(prev, next) {
+  let mask = 0;
+  Object.keys(next).forEach((field) => {
+    if (!Object.is(prev[field], next[field])) mask |= fieldBit(field);
+  });
+  return mask;
+}
+
+export function createIncrementalMatcher(options = {}) {
+  const context  = buildMatchContext(options);
+  const pairs    = new Map();   // index entry → { scenario, deps, row }
+  const queries  = new Map();   // index → { key, entries }
+  const recorder = { deps: 0 };
+  let previous   = null;        // last scenario
+  let current    = null;        // per-run state, see run()
+  let commonDeps = 0;           // fields every pair read in the last tracked run
+  let stats      = null;
+
+  const reuseOrEvaluate = (entry, evaluateEntry, overlayRisk) => {
+    const memo = pairs.get(entry);
+    if (memo && memo.row.overlayRisk === overlayRisk.level) {
+      let changed = current.masks.get(memo.scenario);
+      if (changed === undefined) {
+        changed = changedMask(memo.scenario, current.scenario);
+        current.masks.set(memo.scenario, changed);
+      }
+      if (!(memo.deps & changed)) {
+        if (memo.deps !== ALL_FIELDS) current.common &= memo.deps;
+        stats.reused++;
+        return memo.row;
+      }
+    }
+    recorder.deps = 0;
+    const row  = evaluateEntry(entry, current.view, overlayRisk);
+    const deps = current.broad ? ALL_FIELDS : recorder.deps;
+    current.common &= deps;
+    pairs.set(entry, { scenario: current.scenario, deps, row });
+    stats.evaluated++;
+    return row;
+  };
+
+  // Pairs read the scenario through current.view, never the plain object.
+  const evaluate = {
+    agency: (entry, _scenario, overlayRisk) =>
+      reuseOrEvaluate(entry, evaluateAgencyEntry, overlayRisk),
+    nonQM:  (entry, _scenario, overlayRisk) =>
+      reuseOrEvaluate(entry, evaluateNonQMEntry, overlayRisk),
+    candidates: (index, query) => {
+      const key  = JSON.stringify(query);
+      const memo = queries.get(index);
+      if (memo?.key === key) return memo.entries;
+      const entries = selectCandidates(index, query);
+      queries.set(index, { key, entries });
+      return entries;
+    },
+  };
+
+  function run(rawInputs = {}) {
+    const scenario = getNormalizedScenario(rawInputs);
+    const broad    = !!previous && (changedMask(previous, scenario) & commonDeps) !== 0;
+    stats = {
+      changedFields: previous
+        ? Object.keys(scenario).filter((f) => !Object.is(previous[f], scenario[f]))
+        : null,
+      evaluated: 0,
+      reused:    0,
+      broad,
+    };
+    current = {
+      scenario,
+      broad,
+      view:   broad ? scenario : trackedView(scenario, recorder),
+      masks:  new Map(),        // older scenario → bits changed since
+      common: ALL_FIELDS,
+    };
+    previous = scenario;
+
+    const output = matchScenario(scenario, context, evaluate);
+    if (!broad && current.common !== ALL_FIELDS) commonDeps = current.common;
+    return output;
+  }
+
+  function reset() {
+    pairs.clear();
+    queries.clear();
+    previous   = null;
+    commonDeps = 0;
+  }
+
+  return { run, reset, get lastRun() { return stats; } };
+}
+
+
+// ─── What-If Sensitivity Sweep ───────────────────────────────────────────────
+// Answers "how many FICO points (or how much LTV) until lender X opens up?"
+// by evaluating a FICO × LTV × DTI (× loan amount) grid around one base
+// scenario and returning, per lender × program, which grid points pass.
+//
+// The gates only compare the swept fields against a handful of guideline
+// constants (SWEEP_BREAKPOINTS). Two grid values that sit on the same side
+// of every constant a pair uses get the same verdict from that pair, so each
+// axis is collapsed into per-pair classes up front and the real gate runs
+// once per distinct class combination — a few dozen calls per pair rather
+// than one per grid point. Any comparison added to a gate on a swept field
+// must add its constant here too.
+//
+//   const sweep = runEligibilitySweep(form, {
+//     creditScore: [620, 640, 660, 680, 700],
+//     ltv:         [80, 85, 90, 95, 97],
+//     dti:         [36, 43, 45, 50],
+//   });
+//   sweep.lenders[0].opensAt.creditScore;   // lowest swept FICO that passes
+//
+// Axes are used as given (FICO points, LTV %, DTI %, dollars), sorted, and
+// always include the base scenario's own value. An omitted axis stays at
+// the base value. Sweeping loanAmount without an ltv axis re-derives LTV
+// from propertyValue, unless the base inputs pinned an explicit ltv.
+
+export const SWEEP_AXES = ["creditScore", "ltv", "dti", "loanAmount"];
+
+const nestedValues = (v) => (v && typeof v === "object" ? Object.values(v).flatMap(nestedValues) : [v]);
+
+const SWEEP_BREAKPOINTS = {
+  Agency: (g = {}) => ({
+    creditScore: [g.minFICO, g.ficoCutoffForReducedLTV],
+    ltv:         [g.reducedLTVBelowCutoff || 90, ...nestedValues(g.maxLTV), ...nestedValues(g.investmentMaxLTV)],
+    dti:         [g.maxDTI],
+    loanAmount:  [g.maxLoanAmount],
+  }),
+  NonQM: (g = {}) => ({
+    creditScore: [g.minFICO],
+    ltv:         nestedValues(g.maxLTV),
+    dti:         [],
+    loanAmount:  [g.maxLoanAmount],
+  }),
+};
+
+// Where `value` sits relative to each breakpoint (below / equal / above /
+// incomparable), packed into one number. Uses the same relational
+// operators as the gates, so null and NaN classify the way they compare.
+function sweepClassCode(value, breakpoints) {
+  let code = 0;
+  breakpoints.forEach((b) => {
+    if (typeof b !== "number") return;
+    const side = value < b ? 0 : value > b ? 2 : value === b ? 1 : 3;
+    code = code * 4 + side;
+  });
+  return code;
+}
+
+// Per-value class ids (0..n-1) for one pair along one axis.
+function sweepClasses(values, breakpoints) {
+  const ids = new Map();
+  const classOf = values.map((v) => {
+    const code = sweepClassCode(v, breakpoints);
+    if (!ids.has(code)) ids.set(code, ids.size);
+    return ids.get(code);
+  });
+  return { classOf, count: ids.size };
+}
+
+function sweepAxis(values, baseValue) {
+  const list = (values || []).filter((v) => typeof v === "number" && !Number.isNaN(v));
+  if (typeof baseValue === "number" && !Number.isNaN(baseValue)) list.push(baseValue);
+  const sorted = [...new Set(list)].sort((a, b) => a - b);
+  return sorted.length ? sorted : [baseValue];
+}
+
+/** Flat position of grid point (creditScore i, ltv j, dti k, loanAmount m). */
+export function sweepGridIndex(axes, i, j, k, m = 0) {
+  return ((i * axes.ltv.length + j) * axes.dti.length + k) * axes.loanAmount.length + m;
+}
+
+/**
+ * @param {Object} rawInputs  base scenario (same shape as runLenderMatch)
+ * @param {Object} axes       { creditScore?, ltv?, dti?, loanAmount? } — arrays of values
+ * @param {Object} options    agencyOverrides / nonQMOverrides, as runLenderMatch
+ * @returns {{ axes, base, points, evaluations, lenders }} — per lender × program:
+ *   grid      Uint8Array, 1 = eligible, indexed by sweepGridIndex(axes, …)
+ *   opensAt   most permissive swept value that passes with the other axes at
+ *             base: lowest creditScore, highest ltv / dti / loanAmount (null = none)
+ *   frontier  per (ltv, dti, loanAmount) cell, the lowest passing creditScore
+ */
+export function runEligibilitySweep(rawInputs = {}, axes = {}, options = {}) {
+  const base    = normalizeScenario(rawInputs);
+  const context = buildMatchContext(options);
+
+  const grid = {};
+  SWEEP_AXES.forEach((field) => { grid[field] = sweepAxis(axes[field], base[field]); });
+  const [F, L, D, A] = SWEEP_AXES.map((field) => grid[field].length);
+
+  // LTV per (ltv, loanAmount) cell — only loanAmount moves it when derived.
+  const ltvFromLoan = !axes.ltv?.length && !parseFloat(rawInputs.ltv) && base.propertyValue > 0;
+  const ltvAt = (j, m) => (ltvFromLoan
+    ? parseFloat(((grid.loanAmount[m] / base.propertyValue) * 100).toFixed(2))
+    : grid.ltv[j]);
+  const ltvValues = [];
+  for (let j = 0; j < L; j++) for (let m = 0; m < A; m++) ltvValues.push(ltvAt(j, m));
+
+  const baseAt = Object.fromEntries(
+    SWEEP_AXES.map((field) => [field, Math.max(0, grid[field].indexOf(base[field]))])
   );
+
+  const pairs = [];
+  if (!base.isNonQMPath) {
+    const programs = resolveAgencyPrograms(base);
+    context.agencyIndex.entries
+      .filter((e) => programs.includes(e.program))
+      .forEach((entry) => pairs.push({ entry, universe: "Agency", check: checkAgencyEligibility }));
+  }
+  const nonQMProgram = resolveNonQMProgram(base);
+  if (nonQMProgram) {
+    context.nonQMIndex.entries
+      .filter((e) => e.program === nonQMProgram)
+      .forEach((entry) => pairs.push({ entry, universe: "NonQM", check: checkNonQMEligibility }));
+  }
+
+  let evaluations = 0;
+  const points = F * L * D * A;
+
+  const lenders = pairs.map(({ entry, universe, check }) => {
+    const { lender, program, g } = entry;
+    const breakpoints = SWEEP_BREAKPOINTS[universe](g);
+    const fc = sweepClasses(grid.creditScore, breakpoints.creditScore);
+    const lc = sweepClasses(ltvValues, breakpoints.ltv);
+    const dc = sweepClasses(grid.dti, breakpoints.dti);
+    const ac = sweepClasses(grid.loanAmount, breakpoints.loanAmount);
+
+    const verdicts = new Int8Array(fc.count * lc.count * dc.count * ac.count).fill(-1);
+    const cells = new Uint8Array(points);
+    let eligibleCount = 0;
+
+    for (let i = 0; i < F; i++) {
+      for (let j = 0; j < L; j++) {
+        for (let k = 0; k < D; k++) {
+          for (let m = 0; m < A; m++) {
+            const key = ((fc.classOf[i] * lc.count + lc.classOf[j * A + m]) * dc.count
+                        + dc.classOf[k]) * ac.count + ac.classOf[m];
+            if (verdicts[key] === -1) {
+              const point = {
+                ...base,
+                creditScore: grid.creditScore[i],
+                ltv:         ltvAt(j, m),
+                dti:         grid.dti[k],
+                loanAmount:  grid.loanAmount[m],
+              };
+              verdicts[key] = check(lender, program, point).eligible ? 1 : 0;
+              evaluations++;
+            }
+            const v = verdicts[key];
+            cells[sweepGridIndex(grid, i, j, k, m)] = v;
+            eligibleCount += v;
+          }
+        }
+      }
+    }
+
+    const at = (i, j, k, m) => cells[sweepGridIndex(grid, i, j, k, m)] === 1;
+    const { creditScore: bi, ltv: bj, dti: bk, loanAmount: bm } = baseAt;
+    const lowest  = (n, passes, values) => { for (let x = 0; x < n; x++) if (passes(x)) return values[x]; return null; };
+    const highest = (n, passes, values) => { for (let x = n - 1; x >= 0; x--) if (passes(x)) return values[x]; return null; };
+
+    const frontier = [];
+    for (let j = 0; j < L; j++) {
+      for (let k = 0; k < D; k++) {
+        for (let m = 0; m < A; m++) {
+          const minCreditScore = lowest(F, (i) => at(i, j, k, m), grid.creditScore);
+          if (minCreditScore !== null) {
+            frontier.push({ ltv: ltvAt(j, m), dti: grid.dti[k], loanAmount: grid.loanAmount[m], minCreditScore });
+          }
+        }
+      }
+    }
+
+    return {
+      lenderId:       lender.id,
+      lenderName:     lender.profileName ?? lender.name,
+      shortName:      lender.shortName,
+      program,
+      universe,
+      eligibleAtBase: at(bi, bj, bk, bm),
+      eligibleCount,
+      opensAt: {
+        creditScore: lowest(F,  (i) => at(i, bj, bk, bm), grid.creditScore),
+        ltv:         ltvFromLoan ? null : highest(L, (j) => at(bi, j, bk, bm), grid.ltv),
+        dti:         highest(D, (k) => at(bi, bj, k, bm), grid.dti),
+        loanAmount:  highest(A, (m) => at(bi, bj, bk, m), grid.loanAmount),
+      },
+      frontier,
+      grid: cells,
+    };
+  });
+
+  return { axes: grid, base: baseAt, points, evaluations, lenders };
+}
+
+
+// ─── Lender Universe + Eligibility Indexes ───────────────────────────────────
+// The merged lender list is cached per overrides array (the Firestore hook
+// hands the same array back until the collection changes), and each merged
+// list gets one compiled index. A new overrides array = a new matrix version.
+//
+// In the engine worker every call arrives as a structured clone, so the
+// overrides are a new array each time and the identity caches never hit.
+// Callers that pass `matrixVersion` (lenderMatrixVersion(agency, nonQM)) get
+// the merged list cached by that version instead — the same version yields
+// the same list, so the index caches hit as well. A version seen recently is
+// also enough on its own: a caller holding only matrixVersion (no override
+// arrays) gets the merged list that version was built from.
+
+const MERGED_VERSION_CACHE_SIZE = 4;
+
+let baseAgencyLenders     = null;
+const mergedAgencyCache   = new WeakMap();   // agencyOverrides → lenders
+const mergedNonQMCache    = new WeakMap();   // nonQMOverrides  → lenders
+const mergedByVersion     = new Map();       // "universe:matrixVersion" → lenders (Map order = LRU)
+const agencyIndexCache    = new WeakMap();   // lenders → index
+const nonQMIndexCache     = new WeakMap();   // lenders → index
+
+function resolveAgencyLenders(overrides = [], matrixVersion = null) {
+  baseAgencyLenders ??= getActiveAgencyLenders();
+  if (!overrides.length) return recallMerged("agency", matrixVersion) ?? baseAgencyLenders;
+  return resolveMerged(mergedAgencyCache, "agency", overrides, matrixVersion,
+    () => applyAgencyOverrides(baseAgencyLenders, overrides));
+}
+
+function resolveNonQMLenders(overrides = [], matrixVersion = null) {
+  if (!overrides.length) return recallMerged("nonQM", matrixVersion) ?? mergeNonQMWithOverrides(overrides);
+  return resolveMerged(mergedNonQMCache, "nonQM", overrides, matrixVersion,
+    () => mergeNonQMWithOverrides(overrides));
+}
+
+// Versions are hashes of the overrides, so a version with no overrides for a
+// universe never has an entry there and falls through to the static list.
+function recallMerged(universe, matrixVersion) {
+  return matrixVersion ? mergedByVersion.get(`${universe}:${matrixVersion}`) ?? null : null;
+}
+
+function resolveMerged(byOverrides, universe, overrides, matrixVersion, merge) {
+  let lenders = byOverrides.get(overrides);
+  if (lenders) return lenders;
+  const key = matrixVersion ? `${universe}:${matrixVersion}` : null;
+  lenders = key && mergedByVersion.get(key);
+  if (!lenders) {
+    lenders = merge();
+    if (key && mergedByVersion.size >= MERGED_VERSION_CACHE_SIZE) {
+      mergedByVersion.delete(mergedByVersion.keys().next().value);
+    }
+  }
+  if (key) {
+    mergedByVersion.delete(key);
+    mergedByVersion.set(key, lenders);
+  }
+  byOverrides.set(overrides, lenders);
+  return lenders;
+}
+
+const AGENCY_LTV_KEYS = { purchase: "purchase", "rate-term": "rateTerm", cashout: "cashOut" };
+const NONQM_OCC_KEYS  = ["primary", "secondHome", "investment"];
+const NONQM_TX_KEYS   = ["purchase", "rateTerm", "cashOut"];
+
+const isLicensedIn = (lender, state) =>
+  !(lender.states && !lender.states.includes("ALL") && state && !lender.states.includes(state));
+
+function getAgencyIndex(lenders) {
+  let index = agencyIndexCache.get(lenders);
+  if (index) return index;
+
+  // One entry per lender × offered program, lender-major in program order —
+  // the same order the results were always produced in.
+  const programOrder = Object.values(AGENCY_PROGRAMS);
+  const entries = [];
+  lenders.forEach((lender) => {
+    const tier = getTierIndicator(lender, "Agency");
+    programOrder.forEach((program) => {
+      if (!lender.programs.includes(program)) return;
+      entries.push({ lender, program, g: lender.guidelines[program], tier, slot: entries.length });
+    });
+  });
+
+  const ltvCeilings = {};
+  Object.values(AGENCY_LTV_KEYS).forEach((k) => {
+    // `maxLTV && ltv > maxLTV` — a missing / zero ceiling never fails.
+    ltvCeilings[`maxLTV:${k}`] = (e) => (e.g?.maxLTV?.[k] ?? e.g?.maxLTV?.purchase) || null;
+  });
+
+  index = {
+    ...buildEligibilityIndex(entries, {
+      floors:   { minFICO: (e) => e.g?.minFICO },
+      ceilings: {
+        maxLoanAmount: (e) => e.g?.maxLoanAmount,
+        maxDTI:        (e) => e.g?.maxDTI,
+        ...ltvCeilings,
+      },
+      categories: {
+        program:      (e, programs) => !!e.g && e.program === programs,
+        state:        (e, state)    => isLicensedIn(e.lender, state),
+        occupancy:    (e, occ)      => !(occ === "Investment" && !e.g?.allowsInvestment),
+        propertyType: (e, pt)       => !!e.g && !checkAgencyPropertyType(e.g, pt, e.program),
+      },
+    }),
+    lenders,
+    byId: new Map(lenders.map((l) => [l.id, l])),
+    columns: compileAgencyColumns(entries),
+  };
+  agencyIndexCache.set(lenders, index);
+  return index;
+}
+
+function agencyIndexQuery(scenario, programs) {
+  const ltvKey = AGENCY_LTV_KEYS[scenario.transactionType] || "purchase";
+  return {
+    program:               programs,
+    minFICO:               scenario.creditScore,
+    maxLoanAmount:         scenario.loanAmount,
+    maxDTI:                scenario.dti,
+    [`maxLTV:${ltvKey}`]:  scenario.ltv,
+    state:                 scenario.state,
+    occupancy:             scenario.occupancy,
+    propertyType:          scenario.propertyType,
+  };
+}
+
+// Agency limits as typed columns (lenderMatrixColumns.js), one row per index
+// entry (entry.slot). Each column is the value the gate / scorer would
+// resolve from the guideline object, so the kernels below are the same
+// comparisons and arithmetic as checkAgencyEligibility / scoreAgencyLender.
+
+function compileAgencyColumns(entries) {
+  const numeric = {
+    minFICO:               (e) => e.g?.minFICO,
+    maxLoanAmount:         (e) => e.g?.maxLoanAmount,
+    maxDTI:                (e) => e.g?.maxDTI,
+    ficoCutoff:            (e) => e.g?.ficoCutoffForReducedLTV,
+    reducedLTV:            (e) => e.g?.reducedLTVBelowCutoff || 90,
+    "seasoning:BK":        (e) => e.g?.bkSeasoning || 0,
+    "seasoning:FC":        (e) => e.g?.fcSeasoning || 0,
+    "seasoning:shortSale": (e) => e.g?.shortSaleSeasoning || e.g?.fcSeasoning || 0,
+    programStrength:       (e) => getProgramStrengthScore(e.lender, e.program),
+    priorityScore:         (e) => Math.round((e.lender.priorityWeight / 100) * 15),
+    // Best fitScore the entry can reach: full FICO, LTV and DTI points.
+    scoreCeiling:          (e) => Math.min(100, Math.max(0, 25 + 20 + 20 +
+                             getProgramStrengthScore(e.lender, e.program) +
+                             Math.round((e.lender.priorityWeight / 100) * 15))),
+  };
+  Object.values(AGENCY_LTV_KEYS).forEach((k) => {
+    numeric[`maxLTV:${k}`]           = (e) => e.g?.maxLTV?.[k] ?? e.g?.maxLTV?.purchase;
+    numeric[`investmentMaxLTV:${k}`] = (e) => e.g?.investmentMaxLTV?.[k];
+  });
+
+  const columns = compileColumns(entries, {
+    numeric,
+    flags: {
+      hasGuidelines:      (e) => !!e.g,
+      requiresPrimary:    (e) => e.g?.requiresPrimaryResidence,
+      investmentLTVCheck: (e) => e.g?.allowsInvestment && e.g?.investmentMaxLTV,
+    },
+    enums: { program: (e) => e.program },
+  });
+  columns.fhaCode = enumCode(columns.enums.program, AGENCY_PROGRAMS.FHA);
+  columns.vaCode  = enumCode(columns.enums.program, AGENCY_PROGRAMS.VA);
+  return columns;
+}
+
+// The gate maps "rate-term"/"cashout"; occupancy + scoring map "rateTerm"/"cashOut".
+const camelTxKey = (tx) => (tx === "cashOut" ? "cashOut" : tx === "rateTerm" ? "rateTerm" : "purchase");
+
+/**
+ * Columns + category bitsets this scenario's categorical fields select —
+ * the same for every entry, so resolved once and kept until one of those
+ * fields changes.
+ */
+function agencyColumnProbe(index, scenario) {
+  const { transactionType, propertyType, occupancy, state, creditEvent } = scenario;
+  const cached = index.columns.probe;
+  if (cached && cached.transactionType === transactionType && cached.propertyType === propertyType &&
+      cached.occupancy === occupancy && cached.state === state && cached.creditEvent === creditEvent) {
+    return cached;
+  }
+  const n      = index.columns.numeric;
+  const camel  = camelTxKey(transactionType);
+  const probe  = {
+    transactionType, propertyType, occupancy, state, creditEvent,
+    gateMaxLTV:   n[`maxLTV:${AGENCY_LTV_KEYS[transactionType] || "purchase"}`],
+    scoreMaxLTV:  n[`maxLTV:${camel}`],
+    investMaxLTV: occupancy === "Investment" ? n[`investmentMaxLTV:${camel}`] : null,
+    seasoning:    creditEvent && creditEvent !== CREDIT_EVENTS.NONE ? n[`seasoning:${creditEvent}`] ?? null : null,
+    categories:   [
+      categoryMask(index, "propertyType", propertyType),
+      categoryMask(index, "occupancy",    occupancy),
+      categoryMask(index, "state",        state),
+    ],
+  };
+  index.columns.probe = probe;
+  return probe;
+}
+
+/**
+ * checkAgencyEligibility's verdict from the columns. `false` only means
+ * "not proven eligible" — the caller re-runs the gate for the reason.
+ */
+function agencyColumnsEligible(index, i, scenario) {
+  const { numeric: n, exact, flags: f, enums, fhaCode, vaCode } = index.columns;
+  // Entries exist only for offered programs; non-fullDoc never reaches here
+  // on the agency path, but let the gate handle it if it ever does. A null
+  // or string limit (e.g. a Firestore override) is NaN in the columns but
+  // coerces in the gate, so only the gate and scorer can judge that entry.
+  if (!f.hasGuidelines[i] || !exact[i] || scenario.incomeDocType !== "fullDoc") return false;
+
+  const probe = agencyColumnProbe(index, scenario);
+  const { creditScore, ltv, dti, loanAmount, occupancy } = scenario;
+  if (loanAmount > n.maxLoanAmount[i]) return false;
+  if (creditScore < n.minFICO[i]) return false;
+
+  const program = enums.program.codes[i];
+  if (program === fhaCode && creditScore < n.ficoCutoff[i] && ltv > n.reducedLTV[i]) return false;
+
+  const maxLTV = probe.gateMaxLTV[i];
+  if (maxLTV && ltv > maxLTV) return false;
+  if (dti > n.maxDTI[i]) return false;
+
+  // propertyType, occupancy (investment allowed), state licensing
+  if (!probe.categories.every((bits) => hasBit(bits, i))) return false;
+  if (probe.investMaxLTV && f.investmentLTVCheck[i]) {
+    const invMax = probe.investMaxLTV[i];
+    if (invMax && ltv > invMax) return false;
+  }
+  if (probe.seasoning && scenario.creditEventMonths < probe.seasoning[i]) return false;
+
+  if (program === vaCode && f.requiresPrimary[i] && occupancy !== "Primary") return false;
+  return true;
+}
+
+/** scoreAgencyLender(...).fitScore from the columns, same arithmetic. */
+function agencyColumnsFitScore(index, i, scenario) {
+  const n = index.columns.numeric;
+  const { creditScore, ltv, dti } = scenario;
+  const tableLTV = agencyColumnProbe(index, scenario).scoreMaxLTV[i];
+  const maxLTV   = Number.isNaN(tableLTV) ? 97 : tableLTV;
+
+  let score = 0;
+  score += Math.min(25, Math.round(((creditScore - n.minFICO[i]) / 200) * 25));
+  score += Math.max(0, Math.min(20, Math.round(((maxLTV - ltv) / 30) * 20)));
+  score += Math.max(0, Math.min(20, Math.round(((n.maxDTI[i] - dti) / 20) * 20)));
+  score += n.programStrength[i];
+  score += n.priorityScore[i];
+  return Math.min(100, Math.max(0, score));
+}
+
+function getNonQMIndex(lenders) {
+  let index = nonQMIndexCache.get(lenders);
+  if (index) return index;
+
+  const entries = [];
+  lenders.forEach((lender) => {
+    if (!lender.active) return;
+    const tier = getTierIndicator(lender, "NonQM");
+    lender.programs.forEach((program) => {
+      entries.push({ lender, program, g: lender.guidelines[program], tier });
+    });
+  });
+
+  const ltvCeilings = {};
+  NONQM_OCC_KEYS.forEach((occ) => {
+    NONQM_TX_KEYS.forEach((tx) => {
+      ltvCeilings[`maxLTV:${occ}:${tx}`] = (e) => {
+        const block = e.g?.maxLTV?.[occ];
+        if (!block) return e.g ? -Infinity : null;   // occupancy not allowed
+        return block[tx] ?? block.purchase;
+      };
+    });
+  });
+
+  index = {
+    ...buildEligibilityIndex(entries, {
+      floors: {
+        minFICO:   (e) => e.g?.minFICO,
+        minDSCR:   (e) => (e.program === PROGRAMS.DSCR ? e.g?.minDSCR : null),
+        minAssets: (e) => (e.program === PROGRAMS.ASSET_DEPLETION ? e.g?.minAssets : null),
+      },
+      ceilings: {
+        maxLoanAmount: (e) => e.g?.maxLoanAmount,
+        ...ltvCeilings,
+      },
+      categories: {
+        program:      (e, program) => !!e.g && e.program === program,
+        state:        (e, state)   => isLicensedIn(e.lender, state),
+        occupancy:    (e, occ)     => !(e.program === PROGRAMS.DSCR && occ === "Primary"),
+        propertyType: (e, pt)      => {
+          const allowed = e.g?.allowedPropertyTypes;
+          return !allowed || allowed.includes(pt) || allowed[0] === "ALL";
+        },
+      },
+    }),
+    lenders,
+    byId: new Map(lenders.map((l) => [l.id, l])),
+  };
+  nonQMIndexCache.set(lenders, index);
+  return index;
+}
+
+function nonQMIndexQuery(scenario, program) {
+  const occKey = scenario.occupancy === "Primary"    ? "primary"
+               : scenario.occupancy === "SecondHome" ? "secondHome"
+               : "investment";
+  const txKey  = scenario.transactionType === "cashOut"  ? "cashOut"
+               : scenario.transactionType === "rateTerm" ? "rateTerm"
+               : "purchase";
+  return {
+    program,
+    minFICO:                       scenario.creditScore,
+    maxLoanAmount:                 scenario.loanAmount,
+    [`maxLTV:${occKey}:${txKey}`]: scenario.ltv,
+    minDSCR:                       scenario.dscr,
+    // `!totalAssets` always fails Asset Depletion, so 0 may prune.
+    minAssets:                     scenario.totalAssets,
+    state:                         scenario.state,
+    occupancy:                     scenario.occupancy,
+    propertyType:                  scenario.propertyType,
+  };
 }
 
 
@@ -1285,9 +2259,118 @@ function formatProgramLabel(program) {
 }
 
 
+// ─── Result Detail (lazy) ────────────────────────────────────────────────────
+// Result rows are compact: status, score and the few fields a collapsed card
+// shows. Everything else — score breakdown, pass reasons, narrative, lender
+// profile text — is rebuilt for ONE row on demand from the lender record and
+// the scenario the engine ran (engineOutput.scenario). Expanded rows are
+// cached per row object, so re-opening a card costs nothing.
+//
+// Lenders are looked up by id in the universe the run used. The output only
+// records its matrixVersion; callers pass the override arrays that version
+// was built from (useLenderOverrides() / the engine options), and a version
+// merged recently in this thread resolves without them. Rows that already
+// carry a narrative are returned unchanged.
+
+const expandedResultCache = new WeakMap();   // result row → expanded row
+
+const isAgencyProgram = (program) => Object.values(AGENCY_PROGRAMS).includes(program);
+
+/**
+ * The lender record behind a result row, or null if it is not in the
+ * universe. `options` is { agencyOverrides, nonQMOverrides, matrixVersion } —
+ * the engine options the run used.
+ */
+export function getResultLender(result, options = {}) {
+  const { agencyOverrides = [], nonQMOverrides = [], matrixVersion = null } = options ?? {};
+  const index = isAgencyProgram(result.program)
+    ? getAgencyIndex(resolveAgencyLenders(agencyOverrides, matrixVersion))
+    : getNonQMIndex(resolveNonQMLenders(nonQMOverrides, matrixVersion));
+  return index.byId.get(result.lenderId) ?? null;
+}
+
+// Overrides for a different matrix version than the run's (the matrix moved
+// on since) would describe other lenders; fall back to the version alone.
+function runLenderMatrix(engineOutput, options) {
+  const matrixVersion = engineOutput?.matrixVersion ?? null;
+  if (matrixVersion && options.matrixVersion && options.matrixVersion !== matrixVersion) {
+    return { matrixVersion };
+  }
+  return { matrixVersion, ...options };
+}
+
+/**
+ * @param {Object} result       — a row from agencySection / nonQMSection
+ * @param {Object} engineOutput — the runLenderMatch() output the row came from
+ * @param {Object} options      — { agencyOverrides, nonQMOverrides, matrixVersion, scenario }
+ *                                matrixVersion defaults to engineOutput's;
+ *                                `scenario` is used when engineOutput has none
+ */
+export function expandResult(result, engineOutput = null, options = {}) {
+  if (!result || "narrative" in result) return result;
+  const cached = expandedResultCache.get(result);
+  if (cached) return cached;
+
+  const scenario = engineOutput?.scenario ?? options.scenario;
+  const lender   = getResultLender(result, runLenderMatrix(engineOutput, options));
+  const { program } = result;
+  if (!scenario || !lender?.guidelines?.[program]) return result;
+
+  const shared = {
+    overlaySignals: engineOutput?.overlayRisk?.signals ?? assessOverlayRisk(scenario).signals,
+    strengths:      lender.strengths,
+    weaknesses:     lender.weaknesses,
+    tierNotes:      lender.tierNotes,
+  };
+
+  let expanded;
+  if (isAgencyProgram(program)) {
+    const eligibility = checkAgencyEligibility(lender, program, scenario);
+    const breakdown   = eligibility.eligible
+      ? scoreAgencyLender(lender, program, scenario).breakdown
+      : {};
+    expanded = {
+      ...result,
+      ...shared,
+      passReasons: eligibility.reasons,
+      breakdown,
+      notes:       lender.guidelines[program]?.notes || [],
+      narrative:   result.eligible
+                     ? buildAgencyNarrative(lender, program, scenario, result.fitScore, breakdown)
+                     : null,
+    };
+  } else {
+    const eligibility = checkNonQMEligibility(lender, program, scenario);
+    const breakdown   = eligibility.eligible
+      ? scoreNonQMLender(lender, program, scenario).breakdown
+      : {};
+    const agencyAlsoWorks = engineOutput
+      ? (engineOutput.agencySection?.totalEligible ?? 0) > 0
+      : !!options.agencyAlsoWorks;
+    expanded = {
+      ...result,
+      ...shared,
+      passReasons:      eligibility.reasons,
+      conditionalFlags: eligibility.conditionalFlags || [],
+      breakdown,
+      typicalUseCase:   lender.typicalUseCase,
+      disclaimer:       lender.disclaimer,
+      narrative:        result.eligible
+                          ? buildNonQMNarrative(lender, program, scenario,
+                              result.fitScore, breakdown, agencyAlsoWorks)
+                          : null,
+    };
+  }
+
+  expandedResultCache.set(result, expanded);
+  return expanded;
+}
+
+
 // ─── Decision Record Builder ─────────────────────────────────────────────────
-export function buildDecisionRecord(selectedResult, scenario, engineOutput) {
-  const isPlaceholder = selectedResult.dataSource === DATA_SOURCES.PLACEHOLDER;
+export function buildDecisionRecord(result, scenario, engineOutput, lenderMatrix = {}) {
+  const selectedResult = expandResult(result, engineOutput, { ...lenderMatrix, scenario });
+  const isPlaceholder  = selectedResult.dataSource === DATA_SOURCES.PLACEHOLDER;
 
   return {
     recordType: "LENDER_MATCH_SELECTION",
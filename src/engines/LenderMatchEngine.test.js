@@ -6,7 +6,7 @@
  * ============================================================
  *
  * Test suites:
- *   Step 1 — normalizeScenario
+ *   Step 1 — normalizeScenario (+ memoized getNormalizedScenario)
  *   Step 2 — Agency + Non-QM eligibility gating
  *   Step 3 — Fit scoring
  *   Step 4 — Overlay risk assessment
@@ -15,11 +15,15 @@
  *   Step 7 — Rank + package results
  *   Engine Tests T7–T13 (from governance spec)
  *   PRD Section 23 — 10 full scenario integration tests
- *   Decision Record builder
+ *   Decision Record builder (+ lazy expandResult detail)
+ *   Batch + incremental re-match
+ *   What-if eligibility sweep
  */
 
 import {
   normalizeScenario,
+  getNormalizedScenario,
+  scenarioKey,
   checkAgencyEligibility,
   checkNonQMEligibility,
   scoreAgencyLender,
@@ -29,7 +33,13 @@ import {
   calculateConfidenceScore,
   rankAndPackageResults,
   runLenderMatch,
+  runLenderMatchBatch,
+  createIncrementalMatcher,
+  runEligibilitySweep,
+  sweepGridIndex,
   buildDecisionRecord,
+  expandResult,
+  getResultLender,
   ENGINE_CONFIG,
   PRESENTATION_MODES,
   OVERLAY_RISK,
@@ -215,6 +225,41 @@ describe("Step 1 — normalizeScenario", () => {
 
 });
 
+describe("Step 1 — getNormalizedScenario (memoized)", () => {
+
+  test("Returns the same frozen object for equal inputs in any key order", () => {
+    const a = getNormalizedScenario({ loanAmount: 400000, propertyValue: 500000 });
+    const b = getNormalizedScenario({ propertyValue: 500000, loanAmount: 400000 });
+    expect(a).toBe(b);
+    expect(Object.isFrozen(a)).toBe(true);
+    expect(scenarioKey({ x: 1, y: 2 })).toBe(scenarioKey({ y: 2, x: 1 }));
+  });
+
+  test("Returns a new scenario when any input changes", () => {
+    const a = getNormalizedScenario(cleanConventionalScenario);
+    const b = getNormalizedScenario({ ...cleanConventionalScenario, creditScore: 700 });
+    expect(a).not.toBe(b);
+    expect(b.creditScore).toBe(700);
+  });
+
+  test("Keeps values JSON would collapse distinct", () => {
+    const distinct = [null, undefined, NaN, Infinity, -Infinity, 0, -0, "NaN", "null", new Date(0), new Date(0).toISOString()];
+    const keys = distinct.map((v) => scenarioKey({ creditScore: v, assets: [v] }));
+    expect(new Set(keys).size).toBe(distinct.length);
+    expect(scenarioKey({ creditScore: NaN })).toBe(scenarioKey({ creditScore: Number("abc") }));
+    expect(scenarioKey({ creditScore: undefined })).toBe(scenarioKey({}));
+
+    const nan = getNormalizedScenario({ ...cleanConventionalScenario, creditScore: NaN });
+    expect(getNormalizedScenario({ ...cleanConventionalScenario, creditScore: null })).not.toBe(nan);
+  });
+
+  test("Matches normalizeScenario field for field", () => {
+    const cached = getNormalizedScenario(dscrInvestorScenario);
+    expect({ ...cached }).toEqual(normalizeScenario(dscrInvestorScenario));
+  });
+
+});
+
 
 // ─── Step 2A: Agency Eligibility Gating ──────────────────────────────────────
 
@@ -628,6 +673,62 @@ describe("Engine Tests T7–T13 — Presentation Mode + Fallback Logic", () => {
     });
   });
 
+  test("Top-N cut: highest fitScore first, ties keep lender order, totals uncapped", () => {
+    const cap  = ENGINE_CONFIG.maxResultsPerSection;
+    const rows = Array.from({ length: cap * 3 }, (_, i) => ({
+      lenderId: `L${i}`, eligible: true, fitScore: (i * 7) % 5, dataSource: DATA_SOURCES.REAL,
+    }));
+    const scenario = normalizeScenario(cleanConventionalScenario);
+    const result   = rankAndPackageResults(
+      rows, [], scenario, assessOverlayRisk(scenario), calculateConfidenceScore(scenario, true)
+    );
+    const expected = [...rows].sort((a, b) => b.fitScore - a.fitScore).slice(0, cap);
+    expect(result.agencySection.eligible.map((r) => r.lenderId))
+      .toEqual(expected.map((r) => r.lenderId));
+    expect(result.agencySection.totalEligible).toBe(rows.length);
+  });
+
+  test("runLenderMatch shows the same top N as ranking every eligible row", () => {
+    const cap  = ENGINE_CONFIG.maxResultsPerSection;
+    const full = (() => {
+      ENGINE_CONFIG.maxResultsPerSection = Infinity;
+      try { return runLenderMatch(cleanConventionalScenario); }
+      finally { ENGINE_CONFIG.maxResultsPerSection = cap; }
+    })();
+    const result = runLenderMatch(cleanConventionalScenario);
+    expect(result.agencySection.eligible.map((r) => r.lenderId))
+      .toEqual(full.agencySection.eligible.slice(0, cap).map((r) => r.lenderId));
+    expect(result.agencySection.totalEligible).toBe(full.agencySection.totalEligible);
+    expect(result.totalEligible).toBe(full.totalEligible);
+  });
+
+  test("Pairs skipped by the score ceiling never belong in the top N", () => {
+    // A small cap fills the top N early, and zero-priority lenders have
+    // ceilings low enough to be skipped against its floor.
+    const cap = ENGINE_CONFIG.maxResultsPerSection;
+    const agencyOverrides = agencyLenderMatrix
+      .filter((_, i) => i % 2)
+      .map((lender) => ({ id: lender.id, priorityWeight: 0 }));
+    const ranked = (scenario, limit) => {
+      ENGINE_CONFIG.maxResultsPerSection = limit;
+      try { return runLenderMatch(scenario, { agencyOverrides }).agencySection; }
+      finally { ENGINE_CONFIG.maxResultsPerSection = cap; }
+    };
+    [
+      cleanConventionalScenario,
+      { ...cleanConventionalScenario, creditScore: 800, dti: 20 },
+      { ...cleanConventionalScenario, creditScore: 660, dti: 45 },
+    ].forEach((scenario) => {
+      const full = ranked(scenario, Infinity);
+      [1, 2, 3].forEach((limit) => {
+        const top = ranked(scenario, limit);
+        expect(top.eligible.map((r) => [r.lenderId, r.fitScore]))
+          .toEqual(full.eligible.slice(0, limit).map((r) => [r.lenderId, r.fitScore]));
+        expect(top.totalEligible).toBe(full.totalEligible);
+      });
+    });
+  });
+
 });
 
 
@@ -825,6 +926,97 @@ describe("Decision Record™ Builder (AC5)", () => {
 });
 
 
+// ─── Lazy Result Detail ───────────────────────────────────────────────────────
+
+describe("expandResult — lazy narrative + breakdown", () => {
+
+  test("Result rows are compact — no narrative, breakdown or profile text", () => {
+    const engineOutput = runLenderMatch(cleanConventionalScenario);
+    const row = engineOutput.agencySection.eligible[0];
+    expect(row).toHaveProperty("fitScore");
+    expect(row).toHaveProperty("eligibilityStatus");
+    expect(row).not.toHaveProperty("narrative");
+    expect(row).not.toHaveProperty("breakdown");
+    expect(row).not.toHaveProperty("strengths");
+  });
+
+  test("Expanded Agency row matches the scorer and is cached per row", () => {
+    const engineOutput = runLenderMatch(cleanConventionalScenario);
+    const row      = engineOutput.agencySection.eligible[0];
+    const expanded = expandResult(row, engineOutput);
+    const lender   = agencyLenderMatrix.find((l) => l.id === row.lenderId);
+    const scored   = scoreAgencyLender(lender, row.program, normalizeScenario(cleanConventionalScenario));
+
+    expect(expanded.breakdown).toEqual(scored.breakdown);
+    expect(expanded.narrative.length).toBeGreaterThan(20);
+    expect(expanded.passReasons.length).toBeGreaterThan(0);
+    expect(expandResult(row, engineOutput)).toBe(expanded);
+  });
+
+  test("Detail and Decision Record resolve lenders with the run's overrides", () => {
+    const g = uwm.guidelines.Conventional;
+    const agencyOverrides = [{ id: uwm.id, guidelines: { ...uwm.guidelines, Conventional: { ...g, minFICO: 800 } } }];
+    const engineOptions = { agencyOverrides };
+    const engineOutput = runLenderMatch(cleanConventionalScenario, engineOptions);
+    const row = engineOutput.agencySection.ineligible.find(
+      (r) => r.lenderId === uwm.id && r.program === "Conventional");
+    expect(row.failReason).toContain("800");
+    // The output names its lender data but does not carry the override arrays.
+    expect(engineOutput).not.toHaveProperty("lenderMatrix");
+    expect(JSON.stringify(engineOutput)).not.toContain('"minFICO":800');
+
+    // Same detail whether the output is used in place or came back cloned
+    // from the worker / IndexedDB.
+    [engineOutput, structuredClone(engineOutput)].forEach((output) => {
+      const clonedRow = output.agencySection.ineligible.find((r) => r.lenderId === uwm.id && r.program === "Conventional");
+      expect(getResultLender(clonedRow, engineOptions).guidelines.Conventional.minFICO).toBe(800);
+      const expanded = expandResult(clonedRow, output, engineOptions);
+      expect(expanded.breakdown).toEqual({});
+      expect(expanded.narrative).toBeNull();
+      const record = buildDecisionRecord(clonedRow, output.scenario, output, engineOptions);
+      expect(record.reasonsSnapshot).toEqual(expanded.passReasons);
+      expect(record.eligibilityStatus).toBe(row.eligibilityStatus);
+    });
+
+    // Without the recorded overrides the base lender would have passed.
+    expect(checkAgencyEligibility(uwm, "Conventional", engineOutput.scenario).eligible).toBe(true);
+  });
+
+  test("Expanded DSCR and Asset Depletion rows carry what the card panels read", () => {
+    // AlternativeLenderCard's DSCRPanel needs breakdown; AssetDepletionPanel
+    // parses the qualifying income out of passReasons. Compact rows have neither.
+    const assetScenario = {
+      ...cleanConventionalScenario, loanType: "NonQM", loanAmount: 600000, propertyValue: 800000,
+      creditScore: 700, dti: 20, state: "CA", incomeDocType: "assetDepletion", totalAssets: 1200000,
+    };
+    [[dscrInvestorScenario, PROGRAMS.DSCR], [assetScenario, PROGRAMS.ASSET_DEPLETION]].forEach(([raw, program]) => {
+      const engineOutput = runLenderMatch(raw);
+      const row = engineOutput.nonQMSection.eligible.find((r) => r.program === program);
+      expect(row).not.toHaveProperty("breakdown");
+      expect(row).not.toHaveProperty("passReasons");
+      const expanded = expandResult(row, engineOutput);
+      expect(expanded.breakdown).toHaveProperty("programMatchScore");
+      expect(expanded.passReasons.length).toBeGreaterThan(0);
+    });
+    const asset = runLenderMatch(assetScenario);
+    const assetRow = asset.nonQMSection.eligible.find((r) => r.program === PROGRAMS.ASSET_DEPLETION);
+    expect(expandResult(assetRow, asset).passReasons.join(" ")).toMatch(/\$([\d,]+)\/mo qualifying/);
+  });
+
+  test("Expanded Non-QM row carries conditional flags and narrative", () => {
+    const engineOutput = runLenderMatch(dscrInvestorScenario);
+    const row = engineOutput.nonQMSection.eligible[0];
+    if (row) {
+      const expanded = expandResult(row, engineOutput);
+      expect(expanded.narrative).toBeTruthy();
+      expect(Array.isArray(expanded.conditionalFlags)).toBe(true);
+      expect(expanded.breakdown).toHaveProperty("programMatchScore");
+    }
+  });
+
+});
+
+
 // ─── Engine Config Tests ──────────────────────────────────────────────────────
 
 describe("Engine Configuration", () => {
@@ -850,3 +1042,231 @@ describe("Engine Configuration", () => {
   });
 
 });
+
+
+// ─── Eligibility Index Tests ──────────────────────────────────────────────────
+
+describe("Eligibility Index — candidate pruning", () => {
+
+  const eligibleIds = (result) => [
+    ...result.agencySection.eligible,
+    ...result.nonQMSection.eligible,
+  ].map((r) => `${r.lenderId}_${r.program}`);
+
+  test("includeIneligible: false returns the same eligible results", () => {
+    [cleanConventionalScenario, vaPurchaseScenario, dscrInvestorScenario, recentBKScenario]
+      .forEach((raw) => {
+        const full   = runLenderMatch(raw);
+        const pruned = runLenderMatch(raw, { includeIneligible: false });
+        expect(eligibleIds(pruned)).toEqual(eligibleIds(full));
+        expect(pruned.totalEligible).toBe(full.totalEligible);
+      });
+  });
+
+  test("Agency rows decided from the lender columns match the gate and scorer", () => {
+    [cleanConventionalScenario, vaPurchaseScenario, recentBKScenario,
+     { ...cleanConventionalScenario, loanType: null, occupancy: "Investment", transactionType: "cashout" },
+     { ...cleanConventionalScenario, loanType: "FHA", creditScore: 560, ltv: 92 }]
+      .forEach((raw) => {
+        const scenario = normalizeScenario(raw);
+        runLenderMatch(raw).agencySection.eligible.forEach((row) => {
+          const lender = agencyLenderMatrix.find((l) => l.id === row.lenderId);
+          expect(checkAgencyEligibility(lender, row.program, scenario).eligible).toBe(true);
+          expect(row.fitScore).toBe(scoreAgencyLender(lender, row.program, scenario).fitScore);
+        });
+        runLenderMatch(raw).agencySection.ineligible.forEach((row) => {
+          const lender = agencyLenderMatrix.find((l) => l.id === row.lenderId);
+          expect(row.failReason).toBe(checkAgencyEligibility(lender, row.program, scenario).failReason);
+        });
+      });
+  });
+
+  test("Overrides with null or numeric-string limits are judged by the gate", () => {
+    const scenario = { ...cleanConventionalScenario, dti: 48 };
+    const conventionalRow = (result) => result.agencySection.eligible
+      .find((r) => r.lenderId === uwm.id && r.program === "Conventional");
+    expect(conventionalRow(runLenderMatch(scenario))).toBeDefined();
+
+    ["45", null].forEach((maxDTI) => {
+      const agencyOverrides = [{
+        id: uwm.id,
+        guidelines: { ...uwm.guidelines, Conventional: { ...uwm.guidelines.Conventional, maxDTI } },
+      }];
+      const full = runLenderMatch(scenario, { agencyOverrides });
+      expect(conventionalRow(full)).toBeUndefined();
+      expect(full.agencySection.ineligible.find((r) => r.lenderId === uwm.id && r.program === "Conventional")
+        .failReason).toContain("DTI 48%");
+      expect(conventionalRow(runLenderMatch(scenario, { agencyOverrides, includeIneligible: false }))).toBeUndefined();
+    });
+  });
+
+  test("Cloned overrides with the same matrixVersion reuse the merged lenders", () => {
+    // What the worker sees: a structured clone of the overrides on every run.
+    const overrides = [{ id: uwm.id, priorityWeight: 1 }];
+    const row       = { lenderId: uwm.id, program: "Conventional" };
+    const lenderFor = (matrixVersion) =>
+      getResultLender(row, { agencyOverrides: structuredClone(overrides), matrixVersion });
+
+    expect(lenderFor("v1")).toBe(lenderFor("v1"));
+    expect(lenderFor("v1").priorityWeight).toBe(1);
+    expect(lenderFor("v2")).not.toBe(lenderFor("v1"));
+    expect(lenderFor(null)).not.toBe(lenderFor(null));
+
+    const output = runLenderMatch(cleanConventionalScenario,
+      { agencyOverrides: structuredClone(overrides), matrixVersion: "v1" });
+    expect(output.matrixVersion).toBe("v1");
+    // A recently merged version resolves from the version alone.
+    expect(getResultLender(row, { matrixVersion: output.matrixVersion })).toBe(lenderFor("v1"));
+    // Overrides for a newer version are not applied to this run's rows.
+    const newer = [{ id: uwm.id, tierNotes: "newer matrix" }];
+    const expand = (options) => expandResult({ ...row }, { ...output, matrixVersion: "v1" }, options);
+    expect(expand({ agencyOverrides: newer, matrixVersion: "v9" }).tierNotes).toBe(uwm.tierNotes);
+  });
+
+  test("includeIneligible: false builds no ineligible rows", () => {
+    const result = runLenderMatch(
+      { ...cleanConventionalScenario, creditScore: 500 },
+      { includeIneligible: false }
+    );
+    expect(result.agencySection.ineligible).toHaveLength(0);
+    expect(result.nonQMSection.ineligible).toHaveLength(0);
+  });
+
+});
+
+
+// ─── Batch Mode Tests ─────────────────────────────────────────────────────────
+
+describe("runLenderMatchBatch — portfolio re-match", () => {
+
+  const portfolio = [
+    { id: "s1", ...cleanConventionalScenario },
+    { id: "s2", ...vaPurchaseScenario },
+    { id: "s3", ...dscrInvestorScenario },
+    { id: "s4", ...recentBKScenario },
+    { id: "s5", ...cleanConventionalScenario, creditScore: 500 },
+  ];
+
+  test("Yields results in chunks, in input order, with scenario ids", () => {
+    const chunks = [...runLenderMatchBatch(portfolio, { chunkSize: 2 })];
+    expect(chunks.map((c) => c.items.length)).toEqual([2, 2, 1]);
+    expect(chunks[2].processed).toBe(5);
+    expect(chunks.flatMap((c) => c.items).map((i) => i.id)).toEqual(["s1", "s2", "s3", "s4", "s5"]);
+  });
+
+  test("Each batch result matches a single runLenderMatch call", () => {
+    const items = [...runLenderMatchBatch(portfolio, { includeIneligible: true })]
+      .flatMap((c) => c.items);
+    items.forEach((item, i) => {
+      const single = runLenderMatch(portfolio[i]);
+      expect(item.error).toBeNull();
+      expect(item.result.totalEligible).toBe(single.totalEligible);
+      expect(item.result.agencySection.eligible).toEqual(single.agencySection.eligible);
+    });
+  });
+
+});
+
+
+// ─── Incremental Re-Match ─────────────────────────────────────────────────────
+
+describe("createIncrementalMatcher — what-if re-match", () => {
+
+  const withoutTimestamp = ({ timestamp, ...rest }) => rest;
+
+  test("Every step matches a full runLenderMatch", () => {
+    const matcher = createIncrementalMatcher();
+    const steps = [
+      cleanConventionalScenario,
+      { ...cleanConventionalScenario, creditScore: 681 },
+      { ...cleanConventionalScenario, creditScore: 681, state: "TX" },
+      { ...cleanConventionalScenario, creditScore: 590, reservesMonths: 2 },
+      dscrInvestorScenario,
+      { ...dscrInvestorScenario, dscr: 1.05 },
+      cleanConventionalScenario,
+    ];
+    steps.forEach((raw) => {
+      expect(withoutTimestamp(matcher.run(raw))).toEqual(withoutTimestamp(runLenderMatch(raw)));
+    });
+  });
+
+  test("Unrelated field change reuses every prior row", () => {
+    const matcher = createIncrementalMatcher();
+    const first   = matcher.run(cleanConventionalScenario);
+    const second  = matcher.run({ ...cleanConventionalScenario, reservesMonths: 11 });
+    expect(matcher.lastRun.changedFields).toEqual(["reservesMonths"]);
+    expect(matcher.lastRun.evaluated).toBe(0);
+    expect(second.agencySection.eligible[0]).toBe(first.agencySection.eligible[0]);
+  });
+
+  test("Changing a field re-evaluates only pairs that read it", () => {
+    const matcher = createIncrementalMatcher();
+    matcher.run(lowFICOScenario);
+    matcher.run({ ...lowFICOScenario, dti: 41 });
+    // FICO 500 fails every Conventional pair before DTI is ever read.
+    expect(matcher.lastRun.changedFields).toContain("dti");
+    expect(matcher.lastRun.evaluated).toBe(0);
+    expect(matcher.lastRun.reused).toBeGreaterThan(0);
+  });
+
+});
+
+
+// ─── What-If Sensitivity Sweep ────────────────────────────────────────────────
+
+describe("runEligibilitySweep — FICO × LTV × DTI frontier", () => {
+
+  const axes = {
+    creditScore: [580, 600, 619, 620, 640, 680, 720],
+    ltv:         [80, 90, 95, 97],
+    dti:         [36, 45, 50],
+  };
+
+  test("Every grid point matches the gate for that exact scenario", () => {
+    const sweep = runEligibilitySweep(cleanConventionalScenario, axes);
+    const base  = normalizeScenario(cleanConventionalScenario);
+    expect(sweep.points).toBe(
+      sweep.axes.creditScore.length * sweep.axes.ltv.length * sweep.axes.dti.length
+    );
+    sweep.lenders.forEach((row) => {
+      const lender = agencyLenderMatrix.find((l) => l.id === row.lenderId);
+      sweep.axes.creditScore.forEach((creditScore, i) => {
+        sweep.axes.ltv.forEach((ltv, j) => {
+          sweep.axes.dti.forEach((dti, k) => {
+            const expected = checkAgencyEligibility(
+              lender, row.program, { ...base, creditScore, ltv, dti }
+            ).eligible;
+            expect(row.grid[sweepGridIndex(sweep.axes, i, j, k)] === 1).toBe(expected);
+          });
+        });
+      });
+    });
+  });
+
+  test("Gates run once per threshold class, not once per point", () => {
+    const sweep = runEligibilitySweep(cleanConventionalScenario, axes);
+    expect(sweep.evaluations).toBeLessThan(sweep.points * sweep.lenders.length / 4);
+  });
+
+  test("Base point agrees with runLenderMatch and opensAt finds the FICO floor", () => {
+    const sweep  = runEligibilitySweep(cleanConventionalScenario, axes);
+    const single = runLenderMatch(cleanConventionalScenario);
+    const atBase = sweep.lenders.filter((r) => r.eligibleAtBase);
+    expect(atBase.length).toBe(single.agencySection.totalEligible);
+
+    const opened = sweep.lenders.find((r) => r.opensAt.creditScore !== null);
+    const lender = agencyLenderMatrix.find((l) => l.id === opened.lenderId);
+    expect(opened.opensAt.creditScore).toBeGreaterThanOrEqual(
+      lender.guidelines[opened.program].minFICO
+    );
+  });
+
+  test("Base value is always on the axis; omitted axes stay at base", () => {
+    const sweep = runEligibilitySweep(cleanConventionalScenario, { creditScore: [600, 700] });
+    const base  = normalizeScenario(cleanConventionalScenario);
+    expect(sweep.axes.creditScore).toContain(base.creditScore);
+    expect(sweep.axes.dti).toEqual([base.dti]);
+    expect(sweep.axes.loanAmount).toEqual([base.loanAmount]);
+  });
+
+});
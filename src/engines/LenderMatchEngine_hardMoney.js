@@ -10,6 +10,11 @@
 // ============================================================
 
 import { hardMoneyLenders } from "../data/hardMoneyLenderMatrix";
+import { buildEligibilityIndex, selectCandidates } from "./lenderEligibilityIndex";
+import { scenarioKey } from "./LenderMatchEngine";
+
+const EXPERIENCE_LEVELS = { none: 0, some: 1, seasoned: 2 };
+const EVALUATION_MEMO_SIZE = 8;
 
 // ============================================================
 // ROUTING TRIGGERS
@@ -172,9 +177,8 @@ export function checkHardMoneyEligibility(lender, scenario) {
 
   // === BORROWER EXPERIENCE ===
   const borrowerExperience = scenario.borrowerExperience || "none";
-  const expLevels = { none: 0, some: 1, seasoned: 2 };
-  const requiredLevel = expLevels[qualification.borrowerExperienceRequired] || 0;
-  const borrowerLevel = expLevels[borrowerExperience] || 0;
+  const requiredLevel = EXPERIENCE_LEVELS[qualification.borrowerExperienceRequired] || 0;
+  const borrowerLevel = EXPERIENCE_LEVELS[borrowerExperience] || 0;
   if (borrowerLevel < requiredLevel) {
     disqualifiers.push(
       `Lender requires ${qualification.borrowerExperienceRequired} experience — borrower has ${borrowerExperience}`
@@ -330,13 +334,124 @@ export function scoreHardMoneyLender(lender, scenario) {
   };
 }
 
+// ============================================================
+// LENDER INDEX
+// Active lenders compiled once into bitsets (see lenderEligibilityIndex)
+// over the hard disqualifiers: state, property type, loan amount,
+// LTV on ARV, rehab capacity, experience, fast close and the
+// ground-up / foreign national / land niches. A scenario's candidates are
+// one indexed lookup; checkHardMoneyEligibility still runs on every
+// survivor and stays the source of truth, so results are unchanged.
+//
+// Cached per lender array. The first time an array is seen it is indexed
+// from a deep-frozen copy, so neither the caller's array nor the shared
+// hardMoneyLenders export is touched, and results are built from the same
+// snapshot the index was. Edits made to that array afterwards are not picked
+// up — to change the lender list, pass a new array.
+// ============================================================
+const hardMoneyIndexCache = new WeakMap(); // lenders → { index, memo }
+
+function deepFreeze(value) {
+  if (value && typeof value === "object" && !Object.isFrozen(value)) {
+    Object.values(value).forEach(deepFreeze);
+    Object.freeze(value);
+  }
+  return value;
+}
+
+const snapshotLenders = (lenders) => deepFreeze(structuredClone(lenders));
+
+const nicheGate = (niche) => (lender, required) => !required || Boolean(lender.niches[niche]);
+
+function buildHardMoneyIndex(lenders) {
+  return buildEligibilityIndex(lenders.filter((lender) => lender.active), {
+    floors: {
+      minLoanAmount: (lender) => lender.qualification.minLoanAmount,
+      experience: (lender) => EXPERIENCE_LEVELS[lender.qualification.borrowerExperienceRequired] || 0,
+    },
+    ceilings: {
+      maxLoanAmount: (lender) => lender.qualification.maxLoanAmount,
+      maxLTVonARV: (lender) => lender.qualification.maxLTVonARV,
+      rehabBudget: (lender) => lender.rehab.rehabBudgetCapacity,
+    },
+    categories: {
+      state: (lender, state) => !state || lender.statesActive.includes(state),
+      propertyType: (lender, type) => !type || lender.propertyTypesAccepted.includes(type),
+      fastClose: (lender, required) => !required || lender.terms.fastCloseCapable,
+      groundUp: nicheGate("groundUpConstruction"),
+      foreignNational: nicheGate("foreignNational"),
+      land: nicheGate("landLoans"),
+    },
+  });
+}
+
+function getHardMoneyIndex(lenders) {
+  let cached = hardMoneyIndexCache.get(lenders);
+  if (!cached) {
+    cached = { index: buildHardMoneyIndex(snapshotLenders(lenders)), memo: new Map() };
+    hardMoneyIndexCache.set(lenders, cached);
+  }
+  return cached;
+}
+
+// Same parsing as checkHardMoneyEligibility, so nothing is pruned that the
+// full check would keep.
+function hardMoneyIndexQuery(scenario) {
+  const loanAmount = parseFloat(scenario.loanAmount) || 0;
+  const arv = parseFloat(scenario.arv) || 0;
+  return {
+    state: scenario.propertyState || scenario.state,
+    propertyType: scenario.propertyType || "",
+    minLoanAmount: loanAmount,
+    maxLoanAmount: loanAmount,
+    maxLTVonARV: arv > 0 ? (loanAmount / arv) * 100 : null,
+    rehabBudget: parseFloat(scenario.rehabBudget) || 0,
+    experience: EXPERIENCE_LEVELS[scenario.borrowerExperience || "none"] || 0,
+    fastClose: (parseInt(scenario.daysToClose) || 30) <= 10,
+    groundUp: scenario.constructionType === "ground_up",
+    foreignNational: scenario.citizenshipStatus === "foreign_national",
+    land: scenario.propertyType === "land",
+  };
+}
+
+/** Active lenders that can still pass checkHardMoneyEligibility. */
+export function selectHardMoneyCandidates(scenario, lenders = hardMoneyLenders) {
+  const { index } = getHardMoneyIndex(lenders);
+  return selectCandidates(index, hardMoneyIndexQuery(scenario));
+}
+
 // ============================================================
 // MAIN EVALUATOR
 // Call this from LenderMatch to get the full Last Resort Path results
 // Returns: { triggered, triggerReasons, results, heroMode }
 // heroMode = true when both Agency and NonQM returned 0 eligible lenders
+//
+// Memoized per (scenario, agency count, non-QM count) for each lender
+// list, keyed by scenarioKey() so equal scenarios hit in any key order.
+// A repeat call (e.g. LastResortSection re-rendering with the same inputs)
+// is a lookup. The returned object is shared between callers: treat it as
+// read-only.
 // ============================================================
-export function evaluateHardMoneyPath(scenario, agencyResultCount = 0, nonQMResultCount = 0) {
+export function evaluateHardMoneyPath(
+  scenario,
+  agencyResultCount = 0,
+  nonQMResultCount = 0,
+  lenders = hardMoneyLenders
+) {
+  const { memo } = getHardMoneyIndex(lenders);
+  const key = `${agencyResultCount}|${nonQMResultCount}|${scenarioKey(scenario)}`;
+  let evaluation = memo.get(key);
+  if (evaluation) {
+    memo.delete(key);
+  } else {
+    evaluation = computeHardMoneyPath(scenario, agencyResultCount, nonQMResultCount, lenders);
+    if (memo.size >= EVALUATION_MEMO_SIZE) memo.delete(memo.keys().next().value);
+  }
+  memo.set(key, evaluation); // Map order = LRU
+  return evaluation;
+}
+
+function computeHardMoneyPath(scenario, agencyResultCount, nonQMResultCount, lenders) {
   const routing = checkHardMoneyRoutingTriggers(scenario);
   const heroMode = agencyResultCount === 0 && nonQMResultCount === 0;
 
@@ -352,9 +467,7 @@ export function evaluateHardMoneyPath(scenario, agencyResultCount = 0, nonQMResu
 
   const results = [];
 
-  for (const lender of hardMoneyLenders) {
-    if (!lender.active) continue;
-
+  for (const lender of selectHardMoneyCandidates(scenario, lenders)) {
     const eligibility = checkHardMoneyEligibility(lender, scenario);
 
     if (eligibility.eligible) {
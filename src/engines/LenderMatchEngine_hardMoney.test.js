@@ -0,0 +1,89 @@
+// ============================================================
+// LenderMatchEngine_hardMoney.test.js
+// Module 6B — Last Resort Path: lender index + evaluation memo
+// ============================================================
+
+import {
+  checkHardMoneyEligibility,
+  evaluateHardMoneyPath,
+  selectHardMoneyCandidates,
+} from "./LenderMatchEngine_hardMoney";
+import { hardMoneyLenders } from "../data/hardMoneyLenderMatrix";
+
+// Synthetic "hundreds of private lenders" universe with varied limits.
+const manyLenders = hardMoneyLenders.flatMap((lender) =>
+  Array.from({ length: 40 }, (_, i) => ({
+    ...lender,
+    id: `${lender.id}_${i}`,
+    active: i % 7 !== 0,
+    statesActive: i % 2 ? ["TX", "GA"] : lender.statesActive,
+    qualification: {
+      ...lender.qualification,
+      minLoanAmount: lender.qualification.minLoanAmount + i * 5000,
+      maxLTVonARV: lender.qualification.maxLTVonARV - (i % 10),
+    },
+    niches: { ...lender.niches, landLoans: i % 3 === 0 },
+  }))
+);
+
+const scenarios = [
+  { loanAmount: 300000, arv: 600000, state: "TX", propertyType: "SFR", loanPurpose: "fix_and_flip" },
+  { loanAmount: 90000, arv: 120000, state: "CA", propertyType: "condo", daysToClose: 7 },
+  { loanAmount: 450000, state: "NY", propertyType: "land", constructionType: "ground_up" },
+  { loanAmount: 2500000, arv: 3000000, propertyState: "FL", rehabBudget: 900000, borrowerExperience: "some" },
+  { loanAmount: "n/a", citizenshipStatus: "foreign_national", propertyType: "" },
+];
+
+describe("Hard money lender index", () => {
+  test("Every lender that passes the full check survives the index; others are pruned", () => {
+    scenarios.forEach((scenario) => {
+      const candidates = new Set(selectHardMoneyCandidates(scenario, manyLenders).map((lender) => lender.id));
+      manyLenders
+        .filter((lender) => lender.active && checkHardMoneyEligibility(lender, scenario).eligible)
+        .forEach((lender) => expect(candidates.has(lender.id)).toBe(true));
+    });
+    const active = manyLenders.filter((lender) => lender.active).length;
+    expect(selectHardMoneyCandidates(scenarios[2], manyLenders).length).toBeLessThan(active / 4);
+  });
+
+  test("Indexed evaluation matches a full scan of every active lender", () => {
+    scenarios.forEach((scenario) => {
+      const expected = manyLenders
+        .filter((lender) => lender.active && checkHardMoneyEligibility(lender, scenario).eligible)
+        .map((lender) => lender.id);
+      const { results } = evaluateHardMoneyPath(scenario, 0, 0, manyLenders);
+      expect(results.map((r) => r.lender.id).sort()).toEqual(expected.sort());
+    });
+  });
+
+  test("Evaluation is memoized per scenario and result counts", () => {
+    const scenario = scenarios[0];
+    const first = evaluateHardMoneyPath({ ...scenario }, 0, 0, manyLenders);
+    expect(evaluateHardMoneyPath({ ...scenario }, 0, 0, manyLenders)).toBe(first);
+    expect(evaluateHardMoneyPath({ ...scenario }, 2, 0, manyLenders)).not.toBe(first);
+    expect(evaluateHardMoneyPath({ ...scenario, state: "GA" }, 0, 0, manyLenders)).not.toBe(first);
+  });
+
+  test("Equal scenarios share a memo entry regardless of key order", () => {
+    const scenario = { loanPurpose: "fix_and_flip", state: "TX", arv: 600000, loanAmount: 300000, propertyType: "SFR" };
+    expect(evaluateHardMoneyPath(scenario, 0, 0, manyLenders))
+      .toBe(evaluateHardMoneyPath(scenarios[0], 0, 0, manyLenders));
+  });
+
+  test("Indexing leaves lender lists untouched; a new list is re-indexed", () => {
+    const lenders = manyLenders.slice(0, 10).map((lender) => ({ ...lender, qualification: { ...lender.qualification } }));
+    const before = evaluateHardMoneyPath(scenarios[0], 0, 0, lenders);
+    evaluateHardMoneyPath(scenarios[0]);
+    expect(Object.isFrozen(lenders)).toBe(false);
+    expect(Object.isFrozen(lenders[0].qualification)).toBe(false);
+    expect(Object.isFrozen(hardMoneyLenders)).toBe(false);
+
+    // The index is a snapshot: an in-place edit does not leak into it.
+    lenders[0].qualification.maxLTVonARV = 0;
+    expect(evaluateHardMoneyPath(scenarios[0], 0, 0, lenders)).toBe(before);
+
+    const after = evaluateHardMoneyPath(scenarios[0], 0, 0, [...lenders, ...manyLenders.slice(10)]);
+    expect(after).not.toBe(before);
+    expect(after.eligibleCount).toBe(evaluateHardMoneyPath(scenarios[0], 0, 0, manyLenders).eligibleCount);
+  });
+});
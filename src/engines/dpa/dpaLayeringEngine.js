@@ -80,61 +80,103 @@ export function calcAssistanceAmount(program, purchasePrice, loanAmount) {
 }
 
 // ─── BUILD CANDIDATE STACKS ──────────────────────────────────────────────────
+// A stack is a clique in the layering graph: every pair of programs in it
+// must pass canLayer. Up to `maxPrograms` programs layer (3 by default —
+// some states allow three-program stacks; pass Infinity for no limit).
+// Each program's assistance is computed once, and the search visits the
+// largest amounts first so the top-N heap fills with strong stacks early.
+// Two bounds cut the rest:
+//   CLTV   assistance only adds up, so once a partial stack breaks the
+//          CLTV limit (or reaches the price) every extension does too
+//   top-N  a branch whose best reachable total, from the next-largest
+//          amounts, cannot beat the weakest kept stack is skipped
 export function buildCandidateStacks(eligiblePrograms, {
   purchasePrice,
   loanAmount,
   loanType,
   currentCLTV,
+  maxPrograms = MAX_LAYERED_PROGRAMS,
+  maxStacks = MAX_STACKS,
 }) {
-  const stacks = [];
   const cltvLimit = AGENCY_CLTV_LIMITS[loanType]?.communitySeconds || 100;
+  const cltvOf = total => (loanAmount / (purchasePrice - total)) * 100;
+  const canExtend = total => cltvOf(total) <= cltvLimit && total < purchasePrice;
 
-  // Single program stacks
-  eligiblePrograms.forEach(program => {
-    const assistanceAmount = calcAssistanceAmount(program, purchasePrice, loanAmount);
-    const newCLTV = ((loanAmount / (purchasePrice - assistanceAmount)) * 100);
-
-    if (newCLTV <= cltvLimit) {
-      stacks.push({
-        programs: [program],
-        totalAssistance: assistanceAmount,
-        resultingCLTV: Math.round(newCLTV * 100) / 100,
-        monthlyPaymentImpact: getMonthlyImpact([program], assistanceAmount),
-        layeringBasis: 'Single program — no layering required',
-        agencyCitation: getAgencyCitation(loanType),
-        stackType: getStackType([program]),
-      });
-    }
-  });
+  // `pos` is the catalog position: output order and final tie-break.
+  const nodes = eligiblePrograms
+    .map((program, pos) => ({
+      program,
+      pos,
+      assistance: calcAssistanceAmount(program, purchasePrice, loanAmount),
+      amortizing: program.programType === 'standard_second' ? (program.maxAssistanceFlat || 0) : 0,
+    }))
+    .sort((a, b) => b.assistance - a.assistance || a.pos - b.pos);
+  const n = nodes.length;
+
+  const prefix = new Float64Array(n + 1);
+  nodes.forEach((node, i) => { prefix[i + 1] = prefix[i] + node.assistance; });
+  // Largest total a layered stack can have under the CLTV limit (with a
+  // hair of slack for floating point), and the most a stack at sorted
+  // index `j` can reach with up to `k` more programs after it.
+  const ceiling = purchasePrice - (loanAmount * 100) / cltvLimit;
+  const maxTotal = ceiling + Math.abs(ceiling) * 1e-9 + 1e-6;
+  const bestReach = (total, j, k) => Math.min(maxTotal, total + prefix[Math.min(n, j + 1 + k)] - prefix[j + 1]);
+
+  const compatible = nodes.map(a => Uint8Array.from(nodes, b => (a !== b && canLayer(a.program, b.program) ? 1 : 0)));
+
+  const heap = createBoundedHeap(maxStacks, compareStacks);
+
+  const search = (members, total, amortizing, candidates) => {
+    const depthLeft = maxPrograms - members.length - 1;
+    for (let c = 0; c < candidates.length; c++) {
+      const j = candidates[c];
+      const node = nodes[j];
+      const stackTotal = total + node.assistance;
+      const worst = heap.full() ? heap.worst() : null;
+
+      // Later candidates are smaller, so no later branch can do better either.
+      if (worst && Math.max(stackTotal, bestReach(stackTotal, j, depthLeft)) < worst.totalAssistance) break;
+
+      const stack = {
+        members: [...members, node],
+        totalAssistance: stackTotal,
+        monthlyPaymentImpact: Math.round(((amortizing + node.amortizing) * 0.07) / 12),
+      };
+      const fits = stack.members.length === 1 ? cltvOf(stackTotal) <= cltvLimit : canExtend(stackTotal);
+      if (fits) heap.offer(stack);
 
-  // Two-program stacks
-  for (let i = 0; i < eligiblePrograms.length; i++) {
-    for (let j = i + 1; j < eligiblePrograms.length; j++) {
-      const p1 = eligiblePrograms[i];
-      const p2 = eligiblePrograms[j];
-
-      if (!canLayer(p1, p2)) continue;
-
-      const a1 = calcAssistanceAmount(p1, purchasePrice, loanAmount);
-      const a2 = calcAssistanceAmount(p2, purchasePrice, loanAmount);
-      const totalAssistance = a1 + a2;
-      const newCLTV = ((loanAmount / (purchasePrice - totalAssistance)) * 100);
-
-      if (newCLTV <= cltvLimit && totalAssistance < purchasePrice) {
-        stacks.push({
-          programs: [p1, p2],
-          totalAssistance,
-          resultingCLTV: Math.round(newCLTV * 100) / 100,
-          monthlyPaymentImpact: getMonthlyImpact([p1, p2], totalAssistance),
-          layeringBasis: `${p1.name} permits layering with ${p2.programType} programs per program guidelines`,
-          agencyCitation: getAgencyCitation(loanType),
-          stackType: getStackType([p1, p2]),
-        });
+      if (depthLeft <= 0 || !canExtend(stackTotal)) continue;
+      // Best any extension could rank: more assistance at most the headroom,
+      // payment impact never lower, at least one more program.
+      const optimistic = {
+        totalAssistance: bestReach(stackTotal, j, depthLeft),
+        monthlyPaymentImpact: stack.monthlyPaymentImpact,
+        members: { length: stack.members.length + 1 },
+      };
+      if (worst && compareStacks(optimistic, worst, false) > 0) continue;
+
+      const next = [];
+      for (let d = c + 1; d < candidates.length; d++) {
+        if (compatible[j][candidates[d]]) next.push(candidates[d]);
       }
+      if (next.length) search(stack.members, stackTotal, amortizing + node.amortizing, next);
     }
-  }
+  };
+  search([], 0, 0, nodes.map((_, i) => i));
 
-  return rankStacks(stacks);
+  return heap.sorted().map(({ members }) => {
+    const programs = members.map(m => m.program);
+    const totalAssistance = members.reduce((sum, m) => sum + m.assistance, 0);
+    return {
+      programs,
+      totalAssistance,
+      resultingCLTV: Math.round(cltvOf(totalAssistance) * 100) / 100,
+      monthlyPaymentImpact: getMonthlyImpact(programs, totalAssistance),
+      layeringBasis: getLayeringBasis(programs),
+      agencyCitation: getAgencyCitation(loanType),
+      stackType: getStackType(programs),
+    };
+  });
 }
 
 // ─── LAYERING COMPATIBILITY CHECK ────────────────────────────────────────────
@@ -182,6 +224,13 @@ function getAgencyCitation(loanType) {
   return citations[loanType] || 'Agency guidelines apply';
 }
 
+// ─── LAYERING BASIS ──────────────────────────────────────────────────────────
+function getLayeringBasis(programs) {
+  if (programs.length === 1) return 'Single program — no layering required';
+  const [first, ...others] = programs;
+  return `${first.name} permits layering with ${others.map(p => p.programType).join(' and ')} programs per program guidelines`;
+}
+
 // ─── STACK TYPE LABEL ────────────────────────────────────────────────────────
 function getStackType(programs) {
   const types = programs.map(p => p.programType);
@@ -192,21 +241,73 @@ function getStackType(programs) {
 }
 
 // ─── RANK STACKS ─────────────────────────────────────────────────────────────
-function rankStacks(stacks) {
-  return stacks
-    .sort((a, b) => {
-      // 1. Max assistance first
-      if (b.totalAssistance !== a.totalAssistance) {
-        return b.totalAssistance - a.totalAssistance;
-      }
-      // 2. Lower monthly payment impact
-      if (a.monthlyPaymentImpact !== b.monthlyPaymentImpact) {
-        return a.monthlyPaymentImpact - b.monthlyPaymentImpact;
-      }
-      // 3. Fewer programs is simpler
-      return a.programs.length - b.programs.length;
-    })
-    .slice(0, 5); // Top 5 stacks max
+const MAX_STACKS = 5; // Top 5 stacks max
+const MAX_LAYERED_PROGRAMS = 3;
+
+// Negative when `a` ranks ahead of `b`. Catalog order breaks exact ties, so
+// singles and pairs come out in the order the old nested loops built them.
+function compareStacks(a, b, byCatalog = true) {
+  // 1. Max assistance first
+  if (b.totalAssistance !== a.totalAssistance) {
+    return b.totalAssistance - a.totalAssistance;
+  }
+  // 2. Lower monthly payment impact
+  if (a.monthlyPaymentImpact !== b.monthlyPaymentImpact) {
+    return a.monthlyPaymentImpact - b.monthlyPaymentImpact;
+  }
+  // 3. Fewer programs is simpler
+  if (a.members.length !== b.members.length || !byCatalog) {
+    return a.members.length - b.members.length;
+  }
+  // 4. Catalog order
+  const pa = catalogPositions(a);
+  const pb = catalogPositions(b);
+  for (let i = 0; i < pa.length; i++) {
+    if (pa[i] !== pb[i]) return pa[i] - pb[i];
+  }
+  return 0;
+}
+
+function catalogPositions(stack) {
+  stack.positions ??= stack.members.map(m => m.pos).sort((x, y) => x - y);
+  return stack.positions;
+}
+
+// Keeps the `limit` best items; the weakest sits at the root.
+function createBoundedHeap(limit, compare) {
+  const items = [];
+  const behind = (i, j) => compare(items[i], items[j]) > 0;
+  const swap = (i, j) => { [items[i], items[j]] = [items[j], items[i]]; };
+
+  const offer = item => {
+    if (items.length < limit) {
+      items.push(item);
+      for (let i = items.length - 1; i > 0 && behind(i, (i - 1) >> 1); i = (i - 1) >> 1) swap(i, (i - 1) >> 1);
+      return;
+    }
+    if (!limit || compare(item, items[0]) >= 0) return;
+    items[0] = item;
+    for (let i = 0; ;) {
+      const l = 2 * i + 1;
+      const r = l + 1;
+      let w = i;
+      if (l < items.length && behind(l, w)) w = l;
+      if (r < items.length && behind(r, w)) w = r;
+      if (w === i) return;
+      swap(i, w);
+      i = w;
+    }
+  };
+
+  return {
+    offer,
+    full: () => items.length >= limit,
+    worst: () => items[0],
+    sorted: () => [...items].sort(compare).map(item => ({
+      ...item,
+      members: [...item.members].sort((a, b) => a.pos - b.pos),
+    })),
+  };
 }
 // ─── AMI CALCULATION ─────────────────────────────────────────────────────────
 export function calculateAMIPercent(state, annualIncome) {
@@ -0,0 +1,52 @@
+// DPA Intelligence™ — Layering Engine tests
+// Stack search: layering depth, compatibility, CLTV limit, top-N ranking
+
+import { buildCandidateStacks } from './dpaLayeringEngine';
+
+const program = (name, overrides = {}) => ({
+  id: name,
+  name,
+  programType: 'grant',
+  canBeLayered: 'yes',
+  adminEntity: name,
+  fundingSource: 'local',
+  maxAssistanceFlat: 5000,
+  ...overrides,
+});
+
+const scenario = { purchasePrice: 300000, loanAmount: 285000, loanType: 'Conventional' };
+const names = stacks => stacks.map(s => s.programs.map(p => p.name));
+
+describe('buildCandidateStacks', () => {
+  test('Layers three compatible programs and ranks the largest stack first', () => {
+    const programs = [program('A', { maxAssistanceFlat: 8000 }), program('B'), program('C', { maxAssistanceFlat: 3000 })];
+    const stacks = buildCandidateStacks(programs, scenario);
+
+    expect(names(stacks)[0]).toEqual(['A', 'B', 'C']);
+    expect(stacks[0].totalAssistance).toBe(16000);
+    expect(stacks[0].layeringBasis).toBe('A permits layering with grant and grant programs per program guidelines');
+    expect(stacks).toHaveLength(5);
+  });
+
+  test('Every program in a stack must layer with every other one', () => {
+    const programs = [
+      program('A', { adminEntity: 'HFA', fundingSource: 'state_bond' }),
+      program('B', { adminEntity: 'HFA', fundingSource: 'state_bond' }),
+      program('C'),
+    ];
+    const stacked = names(buildCandidateStacks(programs, scenario)).filter(s => s.length > 1);
+
+    expect(stacked).toEqual([['A', 'C'], ['B', 'C']]);
+  });
+
+  test('Stops adding programs at the CLTV limit and honors maxPrograms', () => {
+    // Conventional community seconds: 105% CLTV → at most ~$28,571 of assistance.
+    const programs = ['A', 'B', 'C', 'D', 'E', 'F', 'G'].map(n => program(n, { maxAssistanceFlat: 6000 }));
+    const deep = buildCandidateStacks(programs, { ...scenario, maxPrograms: Infinity });
+    const pairs = buildCandidateStacks(programs, { ...scenario, maxPrograms: 2 });
+
+    expect(deep[0].programs).toHaveLength(4);
+    expect(deep.every(s => s.resultingCLTV <= 105)).toBe(true);
+    expect(Math.max(...pairs.map(s => s.programs.length))).toBe(2);
+  });
+});
@@ -0,0 +1,182 @@
+/**
+ * ============================================================
+ * LoanBeacons Lender Match™
+ * src/engines/lenderEligibilityIndex.js
+ * Precompiled eligibility index — candidate pruning before gating
+ * ============================================================
+ *
+ * runLenderMatch used to walk every lender × program pair through the
+ * full gating function. This module compiles a lender universe once into
+ * bitsets so a scenario can discard impossible pairs up front:
+ *
+ *   floors      entry minimum  (e.g. minFICO)       pass when value >= floor
+ *   ceilings    entry maximum  (e.g. maxLTV, maxDTI) pass when value <= ceiling
+ *   categories  predicate per distinct scenario value (state, property type,
+ *               program) — evaluated once per value, then cached as a bitset
+ *
+ * Floors and ceilings are stored as sorted distinct levels, each with a
+ * cumulative bitset ("every entry whose floor is <= this level"), so a
+ * query is a binary search plus a word-wise AND — no per-lender work.
+ *
+ * Pruning is CONSERVATIVE: an entry is only dropped when the gate would
+ * certainly fail it. Non-numeric thresholds and non-numeric scenario values
+ * never prune. The detailed check functions remain the source of truth for
+ * everything that survives, so results are identical with or without it.
+ * ============================================================
+ */
+
+
+// ─── Bitsets ──────────────────────────────────────────────────────────────────
+
+function newBits(size, fill = false) {
+  const bits = new Uint32Array((size + 31) >>> 5);
+  if (fill) {
+    bits.fill(0xffffffff);
+    const tail = size & 31;
+    if (tail) bits[bits.length - 1] = (1 << tail) - 1;
+  }
+  return bits;
+}
+
+function setBit(bits, i) {
+  bits[i >>> 5] |= 1 << (i & 31);
+}
+
+export function hasBit(bits, i) {
+  return (bits[i >>> 5] & (1 << (i & 31))) !== 0;
+}
+
+function andInto(target, bits) {
+  for (let w = 0; w < target.length; w++) target[w] &= bits[w];
+}
+
+/** Ascending list of set positions. */
+export function bitPositions(bits) {
+  const out = [];
+  for (let w = 0; w < bits.length; w++) {
+    let word = bits[w];
+    while (word) {
+      const low = word & -word;
+      out.push((w << 5) + 31 - Math.clz32(low));
+      word ^= low;
+    }
+  }
+  return out;
+}
+
+const isNum = (v) => typeof v === "number" && !Number.isNaN(v);
+
+
+// ─── Threshold Dimensions ─────────────────────────────────────────────────────
+
+function compileThreshold(entries, valueOf, isFloor) {
+  const size   = entries.length;
+  const values = entries.map(valueOf);
+  const loose  = newBits(size);                // non-numeric → never pruned
+  values.forEach((v, i) => { if (!isNum(v)) setBit(loose, i); });
+
+  // Floors: levels ascending, mask[i] = entries with floor <= levels[i].
+  // Ceilings: levels descending, mask[i] = entries with ceiling >= levels[i].
+  const levels = [...new Set(values.filter(isNum))]
+    .sort((a, b) => (isFloor ? a - b : b - a));
+  const order = values
+    .map((v, i) => i)
+    .filter((i) => isNum(values[i]))
+    .sort((a, b) => (isFloor ? values[a] - values[b] : values[b] - values[a]));
+
+  const masks = [];
+  const running = loose.slice();
+  let k = 0;
+  levels.forEach((level) => {
+    while (k < order.length && values[order[k]] === level) setBit(running, order[k++]);
+    masks.push(running.slice());
+  });
+
+  return { isFloor, levels, masks, loose };
+}
+
+function thresholdMask(dim, value) {
+  if (!isNum(value)) return null;
+  const { levels, masks, isFloor } = dim;
+  // Last level that still passes: floor <= value, or ceiling >= value.
+  let lo = 0;
+  let hi = levels.length - 1;
+  let hit = -1;
+  while (lo <= hi) {
+    const mid = (lo + hi) >>> 1;
+    const passes = isFloor ? levels[mid] <= value : levels[mid] >= value;
+    if (passes) { hit = mid; lo = mid + 1; } else { hi = mid - 1; }
+  }
+  return hit === -1 ? dim.loose : masks[hit];
+}
+
+
+// ─── Index Build / Query ──────────────────────────────────────────────────────
+
+/**
+ * @param {Array}  entries  — anything; positions are preserved in results
+ * @param {Object} spec     — { floors: {name: entry → number},
+ *                              ceilings: {name: entry → number},
+ *                              categories: {name: (entry, value) → bool} }
+ */
+export function buildEligibilityIndex(entries, spec = {}) {
+  const { floors = {}, ceilings = {}, categories = {} } = spec;
+  const thresholds = {};
+  Object.entries(floors).forEach(([name, fn]) => {
+    thresholds[name] = compileThreshold(entries, fn, true);
+  });
+  Object.entries(ceilings).forEach(([name, fn]) => {
+    thresholds[name] = compileThreshold(entries, fn, false);
+  });
+  return {
+    entries,
+    size:       entries.length,
+    thresholds,
+    categories,
+    categoryMasks: Object.fromEntries(Object.keys(categories).map((n) => [n, new Map()])),
+  };
+}
+
+/** Cached bitset of entries that pass category `name` for `value`. */
+export function categoryMask(index, name, value) {
+  const cache = index.categoryMasks[name];
+  let bits = cache.get(value);
+  if (!bits) {
+    bits = newBits(index.size);
+    const test = index.categories[name];
+    index.entries.forEach((entry, i) => { if (test(entry, value)) setBit(bits, i); });
+    cache.set(value, bits);
+  }
+  return bits;
+}
+
+/**
+ * Bitset of entries that can still pass. `query` maps dimension names to
+ * scenario values; an array value on a category means "any of these".
+ */
+export function queryEligibilityIndex(index, query = {}) {
+  const bits = newBits(index.size, true);
+  Object.entries(query).forEach(([name, value]) => {
+    if (index.thresholds[name]) {
+      const mask = thresholdMask(index.thresholds[name], value);
+      if (mask) andInto(bits, mask);
+    } else if (index.categories[name]) {
+      if (Array.isArray(value)) {
+        const union = newBits(index.size);
+        value.forEach((v) => {
+          const m = categoryMask(index, name, v);
+          for (let w = 0; w < union.length; w++) union[w] |= m[w];
+        });
+        andInto(bits, union);
+      } else {
+        andInto(bits, categoryMask(index, name, value));
+      }
+    }
+  });
+  return bits;
+}
+
+/** Entries (in original order) that survive the query. */
+export function selectCandidates(index, query = {}) {
+  return bitPositions(queryEligibilityIndex(index, query)).map((i) => index.entries[i]);
+}
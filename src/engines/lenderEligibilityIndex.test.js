@@ -0,0 +1,52 @@
+/**
+ * ============================================================
+ * LoanBeacons Lender Match™
+ * src/engines/lenderEligibilityIndex.test.js
+ * Precompiled eligibility index — floors, ceilings, categories
+ * ============================================================
+ */
+
+import {
+  buildEligibilityIndex,
+  selectCandidates,
+} from "./lenderEligibilityIndex";
+
+
+// ─── Shared Fixtures ──────────────────────────────────────────────────────────
+
+const entries = [
+  { id: "a", minFICO: 620, maxLTV: 97, states: ["ALL"] },
+  { id: "b", minFICO: 580, maxLTV: 90, states: ["GA", "FL"] },
+  { id: "c", minFICO: 700, maxLTV: 80, states: ["CA"] },
+  { id: "d",               maxLTV: 85, states: ["ALL"] },   // no FICO floor
+];
+
+const index = buildEligibilityIndex(entries, {
+  floors:     { minFICO: (e) => e.minFICO },
+  ceilings:   { maxLTV:  (e) => e.maxLTV },
+  categories: { state:   (e, st) => e.states.includes("ALL") || e.states.includes(st) },
+});
+
+const ids = (query) => selectCandidates(index, query).map((e) => e.id);
+
+
+describe("lenderEligibilityIndex", () => {
+
+  test("Floors keep entries whose minimum is met (missing floor never prunes)", () => {
+    expect(ids({ minFICO: 600 })).toEqual(["b", "d"]);
+    expect(ids({ minFICO: 700 })).toEqual(["a", "b", "c", "d"]);
+    expect(ids({ minFICO: 500 })).toEqual(["d"]);
+  });
+
+  test("Ceilings keep entries whose maximum is not exceeded", () => {
+    expect(ids({ maxLTV: 85 })).toEqual(["a", "b", "d"]);
+    expect(ids({ maxLTV: 95 })).toEqual(["a"]);
+    expect(ids({ maxLTV: 99 })).toEqual([]);
+  });
+
+  test("Categories and thresholds combine; non-numeric values do not prune", () => {
+    expect(ids({ state: "GA", minFICO: 640, maxLTV: 88 })).toEqual(["a", "b"]);
+    expect(ids({ state: "TX", minFICO: null })).toEqual(["a", "d"]);
+  });
+
+});
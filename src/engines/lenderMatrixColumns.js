@@ -0,0 +1,90 @@
+/**
+ * ============================================================
+ * LoanBeacons Lender Match™
+ * src/engines/lenderMatrixColumns.js
+ * Columnar lender matrix — typed-array limits per lender × program
+ * ============================================================
+ *
+ * The lender matrices are nested object literals; walking
+ * `lender.guidelines[program].maxLTV[key]` for every pair on every call
+ * is pointer chasing. This module compiles a list of entries once into
+ * parallel columns, position i = entry i:
+ *
+ *   numeric  Float64Array — limits (min FICO, max LTV / DTI, loan bounds,
+ *            seasoning months). Anything that is not a number becomes NaN,
+ *            which fails every `<` / `>` exactly like an undefined limit
+ *            and propagates through arithmetic the same way.
+ *   exact    Uint8Array   — 1 when every numeric value of the entry was a
+ *            number or undefined. A null or numeric-string limit ("45")
+ *            coerces in a JS comparison but is NaN here, so kernels must
+ *            defer to the object-walking code for entries with exact = 0.
+ *   flags    Uint8Array   — booleans (allowsInvestment, requiresPrimary…)
+ *   enums    Uint16Array codes into an interned `values` list, so
+ *            comparisons are integer compares
+ *
+ * Hot paths then scan with `cols.numeric.minFICO[i]` instead of a chain
+ * of property lookups. The source objects remain the source of truth —
+ * columns are rebuilt whenever the entry list changes (see the index
+ * caches in LenderMatchEngine.js).
+ * ============================================================
+ */
+
+const toNumber = (v) => (typeof v === "number" ? v : NaN);
+const isExact  = (v) => v === undefined || typeof v === "number";
+
+
+// ─── Enums ────────────────────────────────────────────────────────────────────
+
+function compileEnum(entries, valueOf) {
+  const values = [];
+  const codeOf = new Map();
+  const codes  = new Uint16Array(entries.length);
+  entries.forEach((entry, i) => {
+    const value = valueOf(entry);
+    if (!codeOf.has(value)) {
+      codeOf.set(value, values.length);
+      values.push(value);
+    }
+    codes[i] = codeOf.get(value);
+  });
+  return { codes, values, codeOf };
+}
+
+/** Interned code for `value`, or -1 when no entry has it. */
+export function enumCode(column, value) {
+  return column.codeOf.has(value) ? column.codeOf.get(value) : -1;
+}
+
+
+// ─── Compile ──────────────────────────────────────────────────────────────────
+
+/**
+ * @param {Array}  entries — anything; positions are preserved
+ * @param {Object} spec    — { numeric: {name: entry → number},
+ *                             flags:   {name: entry → bool},
+ *                             enums:   {name: entry → value} }
+ */
+export function compileColumns(entries, spec = {}) {
+  const { numeric = {}, flags = {}, enums = {} } = spec;
+  const size = entries.length;
+
+  const columns = { size, numeric: {}, exact: new Uint8Array(size).fill(1), flags: {}, enums: {} };
+  Object.entries(numeric).forEach(([name, fn]) => {
+    const col = new Float64Array(size);
+    entries.forEach((entry, i) => {
+      const value = fn(entry);
+      col[i] = toNumber(value);
+      if (!isExact(value)) columns.exact[i] = 0;
+    });
+    columns.numeric[name] = col;
+  });
+  Object.entries(flags).forEach(([name, fn]) => {
+    const col = new Uint8Array(size);
+    entries.forEach((entry, i) => { col[i] = fn(entry) ? 1 : 0; });
+    columns.flags[name] = col;
+  });
+  Object.entries(enums).forEach(([name, fn]) => {
+    columns.enums[name] = compileEnum(entries, fn);
+  });
+  return columns;
+}
@@ -0,0 +1,66 @@
+/**
+ * ============================================================
+ * LoanBeacons Lender Match™
+ * src/engines/lenderMatrixColumns.test.js
+ * Columnar lender matrix — numeric, flag and enum columns
+ * ============================================================
+ */
+
+import {
+  compileColumns,
+  enumCode,
+} from "./lenderMatrixColumns";
+
+
+// ─── Shared Fixtures ──────────────────────────────────────────────────────────
+
+const entries = [
+  { id: "a", program: "FHA",          g: { minFICO: 580, maxLTV: { purchase: 96.5 } } },
+  { id: "b", program: "Conventional", g: { minFICO: 620, maxLTV: {} } },
+  { id: "c", program: "FHA",          g: null },
+];
+
+const columns = compileColumns(entries, {
+  numeric: {
+    minFICO: (e) => e.g?.minFICO,
+    maxLTV:  (e) => e.g?.maxLTV?.purchase,
+  },
+  flags: { hasGuidelines: (e) => !!e.g },
+  enums: { program: (e) => e.program },
+});
+
+
+describe("lenderMatrixColumns", () => {
+
+  test("Numeric columns are typed arrays in entry order; missing values are NaN", () => {
+    expect(columns.size).toBe(3);
+    expect(columns.numeric.minFICO).toBeInstanceOf(Float64Array);
+    expect(Array.from(columns.numeric.minFICO.slice(0, 2))).toEqual([580, 620]);
+    expect(Number.isNaN(columns.numeric.minFICO[2])).toBe(true);
+    expect(Number.isNaN(columns.numeric.maxLTV[1])).toBe(true);
+  });
+
+  test("NaN compares like the undefined it replaces", () => {
+    const missing = columns.numeric.minFICO[2];
+    expect(700 < missing).toBe(700 < undefined);
+    expect(700 > missing).toBe(700 > undefined);
+  });
+
+  test("Entries with a null or numeric-string limit are flagged inexact", () => {
+    const loose = compileColumns([
+      { maxDTI: 45 }, { maxDTI: undefined }, { maxDTI: "45" }, { maxDTI: null },
+    ], { numeric: { maxDTI: (e) => e.maxDTI } });
+    expect(Array.from(loose.exact)).toEqual([1, 1, 0, 0]);
+    expect(Array.from(columns.exact)).toEqual([1, 1, 1]);
+  });
+
+  test("Flags and interned enums", () => {
+    expect(Array.from(columns.flags.hasGuidelines)).toEqual([1, 1, 0]);
+    const program = columns.enums.program;
+    expect(program.values).toEqual(["FHA", "Conventional"]);
+    expect(Array.from(program.codes)).toEqual([0, 1, 0]);
+    expect(enumCode(program, "Conventional")).toBe(1);
+    expect(enumCode(program, "VA")).toBe(-1);
+  });
+
+});
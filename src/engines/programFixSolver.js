@@ -0,0 +1,330 @@
+/**
+ * LoanBeacons™ — Program Fix Solver
+ * AUS Rescue v2.0 — Layer 1: Fix In Place
+ *
+ * For each program in PROGRAM_MATRIX, finds the cheapest combination of
+ * remediations that makes the borrower fully eligible (no blockers):
+ *
+ *   RAISE_FICO      rapid rescore / targeted paydown        points
+ *   WAIT_SEASONING  bankruptcy / foreclosure seasoning      years
+ *   DOWN_PAYMENT    extra cash down → lower LTV / loan      dollars
+ *   PAY_DOWN_DEBT   pay off monthly obligations → DTI       $/mo
+ *   ADD_INCOME      co-borrower income → DTI                $/mo
+ *
+ * Switching program is the choice between the per-program plans; pass
+ * `currentProgramId` to charge FIX_COSTS.programSwitch for leaving it.
+ *
+ * Candidate amounts come from the program's rule thresholds — the only
+ * amounts worth trying for a lever are 0 and the exact amount that clears
+ * a threshold — so each program is a branch-and-bound over a few dozen
+ * leaves at most, pruned by the best plan found so far. Every leaf is
+ * confirmed with evaluateProgramCodes(): a plan is only returned if the
+ * rule engine itself calls the adjusted profile eligible.
+ *
+ * Hard gates (occupancy, VA, USDA area, investment, jumbo floor, 203k
+ * rehab) cannot be bought down; those programs come back unfixable.
+ *
+ * Down payment is not credited against DTI (the housing payment it lowers
+ * is not part of the profile), so DTI plans are slightly conservative.
+ *
+ * ⚠️  NO AI CALLS — Fully deterministic.
+ *
+ * Usage:
+ *   import { solveFixPlans } from '../engines/programFixSolver';
+ *   const plans = solveFixPlans(profile);        // cheapest fixable first
+ *   plans[0].steps  // [{ lever, label, amount, unit, detail }, …]
+ *   plans[0].adjustedProfile  // the profile the plan was verified against
+ */
+
+import {
+  PROGRAM_MATRIX,
+  PROGRAM_ID,
+  BORROWER_PROFILE_DEFAULTS,
+  compileProgram,
+  evaluateProgramCodes,
+  effectiveMaxLTV,
+  estimateMonthlyIncome,
+} from './programRuleEngine';
+import { isBlockerOutcome } from './programRuleCore';
+
+// ─── Cost Model ───────────────────────────────────────────────────────────────
+// Relative cost per unit of each lever, in dollar-equivalents so plans that
+// mix levers can be compared. Cash levers are priced at their cash cost.
+
+export const FIX_COSTS = {
+  ficoPoint:        150,      // per point of score increase
+  seasoningYear:    25_000,   // per year of waiting
+  downPayment:      1,        // per dollar of extra down payment
+  debtPayoffMonths: 30,       // payoff $ per $1/mo removed (~3.3% minimum payment)
+  coBorrowerIncome: 24,       // per $1/mo of added income
+  programSwitch:    2_500,    // leaving `currentProgramId` (re-disclose, re-run AUS)
+};
+
+export const FIX_LIMITS = {
+  maxFicoIncrease:   60,        // points
+  maxSeasoningYears: 4,
+  maxDownPayment:    Infinity,  // dollars
+  maxDebtPaydown:    Infinity,  // $/mo — defaults to profile.monthlyDebts when known
+  maxAddedIncome:    Infinity,  // $/mo
+};
+
+// Rules a lever can move. Any other blocker is a hard gate.
+const FIXABLE_RULES = new Set(['FICO', 'DTI', 'LTV', 'LOAN_AMOUNT_MAX', 'BANKRUPTCY', 'FORECLOSURE']);
+
+const money = n => `$${Math.round(n).toLocaleString()}`;
+const round2 = n => +n.toFixed(2);
+const isNum = v => typeof v === 'number' && Number.isFinite(v);
+
+// ─── Levers ───────────────────────────────────────────────────────────────────
+//
+// Search state: { fico, ltv, loanAmount, debts, income, bankruptcyYearsAgo,
+// foreclosureYearsAgo }. `amounts(state, ctx)` lists the non-zero amounts
+// worth trying; `apply` returns the next state.
+
+const LEVERS = [
+
+  {
+    lever: 'RAISE_FICO',
+    label: 'Raise credit score',
+    unit:  'points',
+    amounts({ fico }, { program, limits }) {
+      if (!isNum(fico)) return [];
+      const { rules } = program;
+      const thresholds = [rules.minFICO];
+      // Clearing a reduced-LTV FICO tier can replace extra down payment
+      if (rules.maxLTVLowFICO && rules.reducedLTVFICOThreshold) thresholds.push(rules.reducedLTVFICOThreshold);
+      if (program.id === PROGRAM_ID.NON_QM_BANK_STMT && rules.lowFICOThreshold) thresholds.push(rules.lowFICOThreshold);
+      return thresholds
+        .filter(t => isNum(t) && t > fico && t - fico <= limits.maxFicoIncrease)
+        .map(t => t - fico);
+    },
+    apply: (state, points) => ({ ...state, fico: state.fico + points }),
+    cost:  (points, costs) => points * costs.ficoPoint,
+    detail: (points, before) => `Raise FICO ${before.fico} → ${before.fico + points} (+${points} pts)`,
+  },
+
+  {
+    lever: 'WAIT_SEASONING',
+    label: 'Wait out seasoning',
+    unit:  'years',
+    amounts(state, { program, limits }) {
+      const { rules } = program;
+      const need = Math.max(
+        0,
+        rules.bankruptcySeasoningYrs > 0 && isNum(state.bankruptcyYearsAgo)
+          ? rules.bankruptcySeasoningYrs - state.bankruptcyYearsAgo : 0,
+        rules.foreclosureSeasoningYrs > 0 && isNum(state.foreclosureYearsAgo)
+          ? rules.foreclosureSeasoningYrs - state.foreclosureYearsAgo : 0,
+      );
+      return need > 0 && need <= limits.maxSeasoningYears ? [need] : [];
+    },
+    apply: (state, years) => ({
+      ...state,
+      bankruptcyYearsAgo:  isNum(state.bankruptcyYearsAgo)  ? state.bankruptcyYearsAgo + years  : state.bankruptcyYearsAgo,
+      foreclosureYearsAgo: isNum(state.foreclosureYearsAgo) ? state.foreclosureYearsAgo + years : state.foreclosureYearsAgo,
+    }),
+    cost:  (years, costs) => years * costs.seasoningYear,
+    detail: years => `Wait ${years} more year${years === 1 ? '' : 's'} for derogatory-event seasoning`,
+  },
+
+  {
+    lever: 'DOWN_PAYMENT',
+    label: 'Increase down payment',
+    unit:  'dollars',
+    amounts(state, { program, base, limits }) {
+      const { loanAmount, ltv } = state;
+      if (!isNum(loanAmount) || loanAmount <= 0) return [];
+      const { rules } = program;
+      const targets = [];
+      if (rules.maxLTV != null && isNum(ltv) && ltv > 0) {
+        const value = loanAmount / (ltv / 100);
+        const cap   = effectiveMaxLTV(program, { ...base, fico: state.fico });
+        targets.push(Math.floor((cap / 100) * value));
+      }
+      if (rules.maxLoanAmount) targets.push(rules.maxLoanAmount);
+      return [...new Set(targets
+        .filter(t => t < loanAmount)
+        .map(t => Math.ceil(loanAmount - t))
+        .filter(d => d <= limits.maxDownPayment))];
+    },
+    apply(state, dollars) {
+      const loanAmount = state.loanAmount - dollars;
+      const ltv = isNum(state.ltv) && state.ltv > 0
+        ? round2((loanAmount / (state.loanAmount / (state.ltv / 100))) * 100)
+        : state.ltv;
+      return { ...state, loanAmount, ltv };
+    },
+    cost:  (dollars, costs) => dollars * costs.downPayment,
+    cash:  dollars => dollars,
+    detail: (dollars, before, after) =>
+      `Add ${money(dollars)} to down payment (loan ${money(before.loanAmount)} → ${money(after.loanAmount)}` +
+      (isNum(after.ltv) ? `, LTV ${before.ltv}% → ${after.ltv}%)` : ')'),
+  },
+
+  {
+    lever: 'PAY_DOWN_DEBT',
+    label: 'Pay down monthly debt',
+    unit:  '$/mo',
+    amounts({ debts, income }, { program, limits }) {
+      const { maxDTI } = program.rules;
+      if (maxDTI == null || !isNum(debts) || (debts / income) * 100 <= maxDTI) return [];
+      const needed = Math.ceil(debts - (maxDTI / 100) * income);
+      const payable = Math.min(needed, limits.maxDebtPaydown);
+      return payable > 0 ? [payable] : [];
+    },
+    apply: (state, monthly) => ({ ...state, debts: state.debts - monthly }),
+    cost:  (monthly, costs) => monthly * costs.debtPayoffMonths,
+    cash:  (monthly, costs) => monthly * costs.debtPayoffMonths,
+    detail: (monthly, before, after, costs) =>
+      `Pay off ~${money(monthly)}/mo of debt (≈${money(monthly * costs.debtPayoffMonths)} in balances)`,
+  },
+
+  {
+    lever: 'ADD_INCOME',
+    label: 'Add co-borrower income',
+    unit:  '$/mo',
+    amounts({ debts, income }, { program, limits }) {
+      const { maxDTI } = program.rules;
+      if (maxDTI == null || !isNum(debts) || (debts / income) * 100 <= maxDTI) return [];
+      if (maxDTI <= 0) return [];
+      const needed = Math.ceil(debts / (maxDTI / 100) - income);
+      return needed <= limits.maxAddedIncome ? [needed] : [];
+    },
+    apply: (state, monthly) => ({ ...state, income: state.income + monthly }),
+    cost:  (monthly, costs) => monthly * costs.coBorrowerIncome,
+    detail: monthly => `Add ~${money(monthly)}/mo of qualifying co-borrower income`,
+  },
+
+];
+
+// ─── Search ───────────────────────────────────────────────────────────────────
+
+function _stateProfile(base, initial, state) {
+  const dtiMoved = state.debts !== initial.debts || state.income !== initial.income;
+  return {
+    ...base,
+    fico:                state.fico,
+    ltv:                 state.ltv,
+    loanAmount:          state.loanAmount,
+    bankruptcyYearsAgo:  state.bankruptcyYearsAgo,
+    foreclosureYearsAgo: state.foreclosureYearsAgo,
+    dti:                 dtiMoved ? round2((state.debts / state.income) * 100) : base.dti,
+  };
+}
+
+function _solveProgram(base, compiled, options) {
+  const { program } = compiled;
+  const { costs, limits, currentProgramId } = options;
+  const outcome = evaluateProgramCodes(base, compiled);
+
+  const switchCost = currentProgramId != null && program.id !== currentProgramId ? costs.programSwitch : 0;
+  const plan = {
+    programId:       program.id,
+    programName:     program.name,
+    icon:            program.icon,
+    eligibleNow:     outcome.eligible,
+    fixable:         true,
+    cost:            switchCost,
+    cashRequired:    0,
+    steps:           [],
+    unfixable:       [],
+    switchProgram:   switchCost > 0,
+    adjustedProfile: base,
+  };
+  if (outcome.eligible) return plan;
+
+  // Hard gates cannot be remediated — no search needed
+  plan.unfixable = compiled.specs
+    .filter((spec, i) => isBlockerOutcome(outcome.codes[i]) && !FIXABLE_RULES.has(spec.rule))
+    .map(spec => spec.rule);
+  if (plan.unfixable.length) return { ...plan, fixable: false, cost: Infinity, adjustedProfile: null };
+
+  const income  = estimateMonthlyIncome(base);
+  const initial = {
+    fico:                base.fico,
+    ltv:                 base.ltv,
+    loanAmount:          base.loanAmount,
+    debts:               isNum(base.dti) ? (base.dti / 100) * income : null,
+    income,
+    bankruptcyYearsAgo:  base.bankruptcyYearsAgo,
+    foreclosureYearsAgo: base.foreclosureYearsAgo,
+  };
+  const ctx = { program, base, limits };
+  let best = null;
+
+  const search = (i, state, cost, picks) => {
+    if (best && cost >= best.cost) return;   // bound: costs only grow
+    if (i === LEVERS.length) {
+      if (evaluateProgramCodes(_stateProfile(base, initial, state), compiled).eligible) {
+        best = { cost, picks, state };
+      }
+      return;
+    }
+    const lever = LEVERS[i];
+    search(i + 1, state, cost, picks);
+    for (const amount of lever.amounts(state, ctx)) {
+      const next = lever.apply(state, amount);
+      search(i + 1, next, cost + lever.cost(amount, costs), [...picks, { lever, amount, before: state, after: next }]);
+    }
+  };
+  search(0, initial, switchCost, []);
+
+  if (!best) {
+    return { ...plan, fixable: false, cost: Infinity, unfixable: ['NO_PLAN'], adjustedProfile: null };
+  }
+  return {
+    ...plan,
+    cost:         Math.round(best.cost),
+    cashRequired: Math.round(best.picks.reduce((sum, p) => sum + (p.lever.cash?.(p.amount, costs) ?? 0), 0)),
+    steps:        best.picks.map(({ lever, amount, before, after }) => ({
+      lever:  lever.lever,
+      label:  lever.label,
+      amount,
+      unit:   lever.unit,
+      detail: lever.detail(amount, before, after, costs),
+    })),
+    adjustedProfile: _stateProfile(base, initial, best.state),
+  };
+}
+
+function _options(profile, { costs, limits, currentProgramId } = {}) {
+  return {
+    costs:  { ...FIX_COSTS, ...costs },
+    limits: {
+      ...FIX_LIMITS,
+      ...(profile.monthlyDebts > 0 ? { maxDebtPaydown: profile.monthlyDebts } : {}),
+      ...limits,
+    },
+    currentProgramId,
+  };
+}
+
+/**
+ * Cheapest set of changes that makes `program` eligible.
+ *
+ * @param {Object} profile  Borrower profile (see BORROWER_PROFILE_DEFAULTS);
+ *                          optional monthlyIncome / monthlyDebts sharpen DTI plans
+ * @param {Object} program  Program definition from PROGRAM_MATRIX
+ * @param {Object} [options]  { costs, limits, currentProgramId }
+ * @returns {FixPlan}
+ */
+export function solveProgramFix(profile, program, options) {
+  const base = { ...BORROWER_PROFILE_DEFAULTS, ...profile };
+  return _solveProgram(base, compileProgram(program), _options(base, options));
+}
+
+/**
+ * Fix plans for every program: programs eligible or fixable first, by cost;
+ * then unfixable ones (hard gates, or beyond `limits`).
+ *
+ * @param {Object} profile
+ * @param {Object} [options]  { costs, limits, currentProgramId }
+ * @returns {FixPlan[]}
+ */
+export function solveFixPlans(profile, options) {
+  const base = { ...BORROWER_PROFILE_DEFAULTS, ...profile };
+  const opts = _options(base, options);
+  return PROGRAM_MATRIX
+    .map(program => _solveProgram(base, compileProgram(program), opts))
+    .sort((a, b) => (a.cost === b.cost ? 0 : a.cost < b.cost ? -1 : 1));
+}
@@ -0,0 +1,52 @@
+/**
+ * LoanBeacons™ — Program Fix Solver
+ * Cheapest remediation per program, verified against the rule engine
+ */
+
+import { solveFixPlans, solveProgramFix, FIX_COSTS } from './programFixSolver';
+import { PROGRAM_MATRIX, PROGRAM_ID, evaluateProgram } from './programRuleEngine';
+
+const profiles = [
+  { fico: 612, dti: 52.4, ltv: 96.5, loanAmount: 312000, occupancy: 'PRIMARY' },
+  { fico: 560, dti: 41, ltv: 97, loanAmount: 250000, occupancy: 'PRIMARY', bankruptcyYearsAgo: 1 },
+  { fico: 690, dti: 49, ltv: 95, loanAmount: 420000, occupancy: 'PRIMARY', monthlyIncome: 9000, monthlyDebts: 1200 },
+];
+
+const program = id => PROGRAM_MATRIX.find(p => p.id === id);
+
+describe('Program fix solver', () => {
+  test('Every fixable plan clears its program in the rule engine', () => {
+    profiles.forEach((profile) => {
+      const plans = solveFixPlans(profile);
+      expect(plans.length).toBe(PROGRAM_MATRIX.length);
+      plans.forEach((plan, i) => {
+        if (i > 0) expect(plan.cost).toBeGreaterThanOrEqual(plans[i - 1].cost);
+        if (!plan.fixable) return expect(plan.adjustedProfile).toBeNull();
+        expect(plan.eligibleNow || plan.steps.length > 0).toBe(true);
+        expect(evaluateProgram(plan.adjustedProfile, program(plan.programId)).eligible).toBe(true);
+      });
+    });
+  });
+
+  test('Eligible programs need no steps; hard gates are unfixable', () => {
+    const eligible = solveFixPlans({ fico: 760, dti: 30, ltv: 75, loanAmount: 300000, occupancy: 'PRIMARY' })
+      .find(plan => plan.eligibleNow);
+    expect(eligible.steps).toEqual([]);
+    expect(eligible.cost).toBe(0);
+
+    const va = solveProgramFix(profiles[0], program(PROGRAM_ID.VA));
+    expect(va.fixable).toBe(false);
+    expect(va.cost).toBe(Infinity);
+    expect(va.unfixable.length).toBeGreaterThan(0);
+  });
+
+  test('Leaving the current program is charged the switch cost', () => {
+    const profile = profiles[2];
+    const stay = solveFixPlans(profile);
+    const moved = solveFixPlans(profile, { currentProgramId: stay[0].programId });
+    const other = moved.find(plan => plan.programId !== stay[0].programId && plan.fixable);
+    expect(other.switchProgram).toBe(true);
+    expect(other.cost).toBe(stay.find(plan => plan.programId === other.programId).cost + FIX_COSTS.programSwitch);
+    expect(moved.find(plan => plan.programId === stay[0].programId).switchProgram).toBe(false);
+  });
+});
@@ -0,0 +1,130 @@
+/**
+ * LoanBeacons™ — Program Rule Core
+ * src/engines/programRuleCore.js
+ *
+ * Shared evaluation core for the two program rule engines:
+ *
+ *   src/engines/programRuleEngine.js   PROGRAM_MATRIX  → rankPrograms / identifyPrimaryBlocker
+ *   src/utils/programRuleEngine.js     PROGRAM_RULES   → evaluatePrograms / detectPrimaryTrigger
+ *
+ * Each engine describes its rules as specs and compiles its program list
+ * into a rule table once. Evaluating a profile writes one outcome code and
+ * one gap per (program, rule) — no strings. Engines build their own text
+ * and scores from the codes.
+ *
+ * Table evaluations are memoized per profile VALUE (not object identity) in
+ * one small LRU shared by every table, so an AUS Rescue analysis that asks
+ * for rankings, the primary blocker and feasibility of the same borrower
+ * runs each threshold check once.
+ *
+ * A spec is:
+ *   { rule, applies(program) → bool, check(profile, program, out) → code }
+ * `check` may leave a numeric gap in `out.gap`.
+ */
+
+/** Outcome code per rule. Blocker codes encode severity (higher = worse). */
+export const RULE_OUTCOME = {
+  SKIPPED:                0,
+  PASS:                   1,
+  WARNING:                2,
+  BLOCKER_MEDIUM:         3,
+  BLOCKER_HIGH:           4,
+  BLOCKER_CRITICAL:       5,
+  BLOCKER_DISQUALIFYING:  6,
+};
+
+export const isBlockerOutcome = code => code >= RULE_OUTCOME.BLOCKER_MEDIUM;
+
+const MEMO_SIZE = 32;
+
+let nextTableId = 1;
+
+
+// ─── Compile ─────────────────────────────────────────────────────────────────
+
+/**
+ * @param {Function} specsFor  program → ordered specs that apply to it
+ * @returns {{ program, specs }}
+ */
+export function compileRuleProgram(program, specsFor) {
+  return { program, specs: specsFor(program) };
+}
+
+/**
+ * Compile a program list into a rule table.
+ *
+ * @param {string}   name      Table name (for debugging)
+ * @param {Object[]} programs
+ * @param {Function} specsFor  program → ordered specs that apply to it
+ * @param {Function} [finish]  (evaluation, compiled, profile) → stored value;
+ *                             lets an engine memoize its scores with the codes
+ */
+export function compileRuleTable(name, programs, specsFor, finish = evaluation => evaluation) {
+  return {
+    id: nextTableId++,
+    name,
+    programs,
+    compiled: programs.map(program => compileRuleProgram(program, specsFor)),
+    finish,
+  };
+}
+
+
+// ─── Evaluate ────────────────────────────────────────────────────────────────
+
+const out = { gap: null };
+
+/** Codes and gaps (null = none) for one compiled program. */
+export function evaluateRuleProgram(compiled, profile) {
+  const { program, specs } = compiled;
+  const n     = specs.length;
+  const codes = new Array(n);
+  const gaps  = new Array(n);
+  for (let i = 0; i < n; i++) {
+    out.gap  = null;
+    codes[i] = specs[i].check(profile, program, out);
+    gaps[i]  = out.gap;
+  }
+  return { codes, gaps };
+}
+
+// Profile values → key. Numbers, strings, null / undefined and -0 / NaN all
+// stay distinct, so two profiles share a key only if every check sees the
+// same inputs.
+function keyPart(value) {
+  if (typeof value === 'number') return Object.is(value, -0) ? '-0' : String(value);
+  if (value === undefined) return 'u';
+  return JSON.stringify(value);
+}
+
+export function profileKey(profile) {
+  const keys = Object.keys(profile).sort();
+  let key = '';
+  for (const k of keys) key += `${k}=${keyPart(profile[k])};`;
+  return key;
+}
+
+const memo = new Map();   // `${table.id}|${profileKey}` → values (Map order = LRU)
+
+/**
+ * Evaluate every program in `table` for `profile`, in table order. Returns
+ * `table.finish(...)` per program. Memoized — treat the result as read-only.
+ */
+export function evaluateRuleTable(table, profile) {
+  const key = `${table.id}|${profileKey(profile)}`;
+  let values = memo.get(key);
+  if (values) {
+    memo.delete(key);
+  } else {
+    values = table.compiled.map(compiled =>
+      table.finish(evaluateRuleProgram(compiled, profile), compiled, profile));
+    if (memo.size >= MEMO_SIZE) memo.delete(memo.keys().next().value);
+  }
+  memo.set(key, values);
+  return values;
+}
+
+/** Drop memoized evaluations (e.g. after editing a rule table in place). */
+export function clearRuleMemo() {
+  memo.clear();
+}
@@ -0,0 +1,59 @@
+/**
+ * LoanBeacons™ — Program Rule Core
+ * Shared evaluation core + per-profile memo
+ */
+
+import {
+  RULE_OUTCOME,
+  compileRuleTable,
+  evaluateRuleTable,
+  profileKey,
+} from './programRuleCore';
+import { rankProgramOutcomes } from './programRuleEngine';
+import { evaluatePrograms, detectPrimaryTrigger } from '../utils/programRuleEngine';
+
+describe('Program rule core', () => {
+  test('Each check runs once per distinct profile value', () => {
+    let calls = 0;
+    const spec = {
+      rule: 'FICO',
+      check: (profile, program, out) => {
+        calls++;
+        if (profile.fico < program.minFico) {
+          out.gap = program.minFico - profile.fico;
+          return RULE_OUTCOME.BLOCKER_HIGH;
+        }
+        return RULE_OUTCOME.PASS;
+      },
+    };
+    const table = compileRuleTable('test', [{ minFico: 620 }, { minFico: 580 }], () => [spec]);
+
+    const first = evaluateRuleTable(table, { fico: 600 });
+    expect(first.map(e => e.codes[0])).toEqual([RULE_OUTCOME.BLOCKER_HIGH, RULE_OUTCOME.PASS]);
+    expect(first[0].gaps[0]).toBe(20);
+    expect(evaluateRuleTable(table, { fico: 600 })).toBe(first);
+    expect(calls).toBe(2);
+
+    evaluateRuleTable(table, { fico: 640 });
+    expect(calls).toBe(4);
+  });
+
+  test('Profile keys keep null, undefined, NaN and numeric strings apart', () => {
+    const keys = [null, undefined, NaN, 0, -0, '640', 640].map(fico => profileKey({ fico }));
+    expect(new Set(keys).size).toBe(keys.length);
+    expect(profileKey({ a: 1, b: 2 })).toBe(profileKey({ b: 2, a: 1 }));
+  });
+
+  test('Both engines read from the shared memo', () => {
+    const profile = { fico: 612, dti: 52.4, ltv: 96.5, loanAmount: 312000, occupancy: 'PRIMARY' };
+    const ranked = rankProgramOutcomes({ ...profile });
+    expect(rankProgramOutcomes({ ...profile })[0]).toBe(ranked[0]);
+
+    const fields = { fico: 739, backDti: 48.29, ltv: 76, occupancy: 'primary', propertyType: 'sfr', isIncomeAMIEligible: true };
+    const result = evaluatePrograms(fields);
+    expect(result.primaryTrigger).toEqual(detectPrimaryTrigger({ ...fields }));
+    expect(result.eligible.map(p => p.id)).toEqual(['fha', 'conventional', 'homeready', 'asset_depletion_nonqm']);
+    result.ineligible[0].failReasons.push('mutated');
+    expect(evaluatePrograms(fields).ineligible[0].failReasons).not.toContain('mutated');
+  });
+});
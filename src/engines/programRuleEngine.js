@@ -17,6 +17,17 @@
  * Profile shape: see BORROWER_PROFILE_DEFAULTS below.
  */
 
+import {
+  RULE_OUTCOME,
+  isBlockerOutcome as isBlocker,
+  compileRuleProgram,
+  compileRuleTable,
+  evaluateRuleProgram,
+  evaluateRuleTable,
+} from './programRuleCore.js';
+
+export { RULE_OUTCOME };
+
 // ─── Loan Limits (2026) ───────────────────────────────────────────────────────
 
 export const CONFORMING_LIMIT_2026 = 806_500;
@@ -563,324 +574,391 @@ export const BORROWER_PROFILE_DEFAULTS = {
   propertyNeedsRehab: null,   // true = property needs renovation; false = move-in ready; null = unknown
 };
 
-// ─── Rule Evaluation ──────────────────────────────────────────────────────────
+// ─── Compiled Rule Programs ───────────────────────────────────────────────────
+//
+// Each PROGRAM_MATRIX entry is compiled once, at load time, into the ordered
+// list of rules that apply to it (a program with no maxDTI never carries a
+// DTI rule). Evaluating a profile then writes one numeric outcome code and
+// one gap per rule — no strings, no per-rule objects. Compilation, evaluation
+// and the per-profile memo live in programRuleCore.js, shared with
+// src/utils/programRuleEngine.js.
+//
+//   rankProgramOutcomes(profile)   compact outcomes only — What-If re-ranks
+//                                  on every keystroke and never shows text
+//   describeRuleOutcomes(outcome)  blocker / warning / pass objects, built
+//                                  when a view actually displays them
+//   rankPrograms(profile)          full RuleResults (codes + text), for PME
+//
+// identifyPrimaryBlocker() and assessFeasibility() accept either shape.
+//
+// Programs outside PROGRAM_MATRIX are compiled on first use (cached per
+// program object). Rules are read at compile time — edit a program by
+// replacing its object, not by mutating `rules` in place.
+
+const O = RULE_OUTCOME;
+const SEVERITY_OF = {
+  [O.BLOCKER_MEDIUM]:        'MEDIUM',
+  [O.BLOCKER_HIGH]:          'HIGH',
+  [O.BLOCKER_CRITICAL]:      'CRITICAL',
+  [O.BLOCKER_DISQUALIFYING]: 'DISQUALIFYING',
+};
 
-/**
- * Evaluate a single program against the borrower profile.
- * Returns a full RuleResult object consumed by the PME and Sonnet.
- *
- * @param {Object} profile  - Borrower profile (see BORROWER_PROFILE_DEFAULTS)
- * @param {Object} program  - Program definition from PROGRAM_MATRIX
- * @returns {RuleResult}
- */
-export function evaluateProgram(profile, program) {
-  const { rules } = program;
-  const blockers  = [];   // Hard fails — reduce approval probability significantly
-  const warnings  = [];   // Near-miss — require compensating factors / AUS
-  const passes    = [];   // Rules this borrower satisfies
-
-  // ── Helper: record a blocker ────────────────────────────────────────────
-  const addBlocker = (rule, label, borrowerValue, threshold, gap, remediation, severity = 'HIGH') => {
-    blockers.push({ rule, label, borrowerValue, threshold, gap, remediation, severity });
-  };
+const money = n => `$${n.toLocaleString()}`;
 
-  // ── Helper: record a warning ────────────────────────────────────────────
-  const addWarning = (rule, label, borrowerValue, threshold, note = '') => {
-    warnings.push({ rule, label, borrowerValue, threshold, note });
-  };
+// FHA / 203k: lower LTV cap if FICO < 580. Non-QM Bank Statement: lower
+// LTV if FICO < 640.
+function _effectiveMaxLTV(program, rules, profile) {
+  let effectiveMaxLTV = rules.maxLTV;
+  if (rules.maxLTVLowFICO && rules.reducedLTVFICOThreshold && profile.fico < rules.reducedLTVFICOThreshold) {
+    effectiveMaxLTV = rules.maxLTVLowFICO;
+  }
+  if (program.id === PROGRAM_ID.NON_QM_BANK_STMT && rules.lowFICOThreshold && profile.fico < rules.lowFICOThreshold) {
+    effectiveMaxLTV = rules.maxLTVLowFICO;
+  }
+  return effectiveMaxLTV;
+}
 
-  // ── Helper: record a pass ───────────────────────────────────────────────
-  const addPass = (rule, label, borrowerValue, threshold = null) => {
-    passes.push({ rule, label, borrowerValue, threshold });
-  };
+/** LTV ceiling `program` applies to `profile` (FICO-reduced where the program has one). */
+export function effectiveMaxLTV(program, profile) {
+  return _effectiveMaxLTV(program, program.rules, profile);
+}
+
+/**
+ * One entry per rule, in evaluation order. `applies(rules)` is decided at
+ * compile time; `check(profile, program, out)` returns an outcome code and
+ * leaves the numeric gap (if any) in `out.gap`. `blocker` / `warning` /
+ * `pass` build the display objects from the same inputs.
+ */
+const RULE_SPECS = [
 
   // ══════════════════════════════════════════════════════════════════════════
   // RULE 1: FICO / Credit Score
   // ══════════════════════════════════════════════════════════════════════════
-  if (profile.fico != null) {
-    const minFICO = rules.minFICO ?? 0;
-    if (profile.fico < minFICO) {
-      const gap = minFICO - profile.fico;
-      addBlocker(
-        'FICO',
-        'Credit Score Below Program Minimum',
-        profile.fico,
-        minFICO,
-        gap,
-        `FICO must increase by ${gap} points to meet ${program.name} minimum (${minFICO})`,
-        gap >= 40 ? 'CRITICAL' : 'HIGH',
-      );
-    } else if (profile.fico < minFICO + 20) {
+  {
+    rule:    'FICO',
+    label:   'Credit Score Below Program Minimum',
+    applies: () => true,
+    check(profile, { rules }, out) {
+      if (profile.fico == null) return O.SKIPPED;
+      const minFICO = rules.minFICO ?? 0;
+      if (profile.fico < minFICO) {
+        const gap = minFICO - profile.fico;
+        out.gap = gap;
+        return gap >= 40 ? O.BLOCKER_CRITICAL : O.BLOCKER_HIGH;
+      }
       // Within 20 points of minimum — lender overlays may apply
-      addWarning(
-        'FICO',
-        'FICO Near Program Minimum — Lender Overlays May Apply',
-        profile.fico,
-        minFICO,
-        `Score is ${profile.fico - minFICO} points above minimum; many lenders require 620–640 floor`,
-      );
-    } else {
-      addPass('FICO', 'Credit Score', profile.fico, minFICO);
-    }
-  }
+      return profile.fico < minFICO + 20 ? O.WARNING : O.PASS;
+    },
+    blocker: (profile, program, gap) => [
+      profile.fico,
+      program.rules.minFICO ?? 0,
+      `FICO must increase by ${gap} points to meet ${program.name} minimum (${program.rules.minFICO ?? 0})`,
+    ],
+    warning: (profile, { rules }) => ({
+      label:         'FICO Near Program Minimum — Lender Overlays May Apply',
+      borrowerValue: profile.fico,
+      threshold:     rules.minFICO ?? 0,
+      note:          `Score is ${profile.fico - (rules.minFICO ?? 0)} points above minimum; many lenders require 620–640 floor`,
+    }),
+    pass: (profile, { rules }) => ['Credit Score', profile.fico, rules.minFICO ?? 0],
+  },
 
   // ══════════════════════════════════════════════════════════════════════════
   // RULE 2: DTI — Debt-to-Income Ratio
   // ══════════════════════════════════════════════════════════════════════════
-  if (rules.maxDTI != null && profile.dti != null) {
-    const maxDTI      = rules.maxDTI;
-    const stdDTI      = rules.standardMaxDTI ?? rules.maxDTI;
-
-    if (profile.dti > maxDTI) {
-      const gap = +(profile.dti - maxDTI).toFixed(2);
-      addBlocker(
-        'DTI',
-        'Debt-to-Income Ratio Exceeds Maximum',
-        profile.dti,
-        maxDTI,
-        gap,
-        `DTI must be reduced by ${gap.toFixed(1)}% — pay down ${_dtiToPayoffEstimate(gap, profile.loanAmount)}`,
-        gap >= 8 ? 'CRITICAL' : gap >= 3 ? 'HIGH' : 'MEDIUM',
-      );
-    } else if (profile.dti > stdDTI) {
+  {
+    rule:    'DTI',
+    label:   'Debt-to-Income Ratio Exceeds Maximum',
+    applies: rules => rules.maxDTI != null,
+    check(profile, { rules }, out) {
+      if (profile.dti == null) return O.SKIPPED;
+      if (profile.dti > rules.maxDTI) {
+        const gap = +(profile.dti - rules.maxDTI).toFixed(2);
+        out.gap = gap;
+        return gap >= 8 ? O.BLOCKER_CRITICAL : gap >= 3 ? O.BLOCKER_HIGH : O.BLOCKER_MEDIUM;
+      }
       // Between standard and max — needs AUS / compensating factors
-      addWarning(
-        'DTI',
-        `DTI ${profile.dti}% Exceeds Standard ${stdDTI}% — AUS / Compensating Factors Required`,
-        profile.dti,
-        stdDTI,
-        `Within ${program.name} maximum (${maxDTI}%) but above standard ceiling; AUS approval and compensating factors needed`,
-      );
-    } else {
-      addPass('DTI', 'Debt-to-Income Ratio', `${profile.dti}%`, `${maxDTI}% max`);
-    }
-  }
+      return profile.dti > (rules.standardMaxDTI ?? rules.maxDTI) ? O.WARNING : O.PASS;
+    },
+    blocker: (profile, { rules }, gap) => [
+      profile.dti,
+      rules.maxDTI,
+      `DTI must be reduced by ${gap.toFixed(1)}% — pay down ${_dtiToPayoffEstimate(gap, profile.loanAmount)}`,
+    ],
+    warning: (profile, program) => {
+      const stdDTI = program.rules.standardMaxDTI ?? program.rules.maxDTI;
+      return {
+        label:         `DTI ${profile.dti}% Exceeds Standard ${stdDTI}% — AUS / Compensating Factors Required`,
+        borrowerValue: profile.dti,
+        threshold:     stdDTI,
+        note:          `Within ${program.name} maximum (${program.rules.maxDTI}%) but above standard ceiling; AUS approval and compensating factors needed`,
+      };
+    },
+    pass: (profile, { rules }) => ['Debt-to-Income Ratio', `${profile.dti}%`, `${rules.maxDTI}% max`],
+  },
 
   // ══════════════════════════════════════════════════════════════════════════
   // RULE 3: LTV — Loan-to-Value
   // ══════════════════════════════════════════════════════════════════════════
-  if (rules.maxLTV != null && profile.ltv != null) {
-    // FHA / 203k: lower LTV cap if FICO < 580
-    let effectiveMaxLTV = rules.maxLTV;
-    if (rules.maxLTVLowFICO && rules.reducedLTVFICOThreshold && profile.fico < rules.reducedLTVFICOThreshold) {
-      effectiveMaxLTV = rules.maxLTVLowFICO;
-    }
-    // Non-QM Bank Statement: lower LTV if FICO < 640
-    if (program.id === PROGRAM_ID.NON_QM_BANK_STMT && rules.lowFICOThreshold && profile.fico < rules.lowFICOThreshold) {
-      effectiveMaxLTV = rules.maxLTVLowFICO;
-    }
-
-    if (profile.ltv > effectiveMaxLTV) {
-      const gap = +(profile.ltv - effectiveMaxLTV).toFixed(2);
-      addBlocker(
-        'LTV',
-        'Loan-to-Value Exceeds Maximum',
-        profile.ltv,
-        effectiveMaxLTV,
-        gap,
-        `LTV must be reduced by ${gap.toFixed(1)}% — requires additional down payment or equity`,
-        gap >= 10 ? 'HIGH' : 'MEDIUM',
-      );
-    } else if (profile.ltv > effectiveMaxLTV - 3) {
-      addWarning(
-        'LTV',
-        'LTV Near Maximum',
-        profile.ltv,
-        effectiveMaxLTV,
-        'Slight value changes could affect eligibility',
-      );
-    } else {
-      addPass('LTV', 'Loan-to-Value', `${profile.ltv}%`, `${effectiveMaxLTV}% max`);
-    }
-  }
+  {
+    rule:    'LTV',
+    label:   'Loan-to-Value Exceeds Maximum',
+    applies: rules => rules.maxLTV != null,
+    check(profile, program, out) {
+      if (profile.ltv == null) return O.SKIPPED;
+      const effectiveMaxLTV = _effectiveMaxLTV(program, program.rules, profile);
+      if (profile.ltv > effectiveMaxLTV) {
+        const gap = +(profile.ltv - effectiveMaxLTV).toFixed(2);
+        out.gap = gap;
+        return gap >= 10 ? O.BLOCKER_HIGH : O.BLOCKER_MEDIUM;
+      }
+      return profile.ltv > effectiveMaxLTV - 3 ? O.WARNING : O.PASS;
+    },
+    blocker: (profile, program, gap) => [
+      profile.ltv,
+      _effectiveMaxLTV(program, program.rules, profile),
+      `LTV must be reduced by ${gap.toFixed(1)}% — requires additional down payment or equity`,
+    ],
+    warning: (profile, program) => ({
+      label:         'LTV Near Maximum',
+      borrowerValue: profile.ltv,
+      threshold:     _effectiveMaxLTV(program, program.rules, profile),
+      note:          'Slight value changes could affect eligibility',
+    }),
+    pass: (profile, program) => ['Loan-to-Value', `${profile.ltv}%`, `${_effectiveMaxLTV(program, program.rules, profile)}% max`],
+  },
 
   // ══════════════════════════════════════════════════════════════════════════
   // RULE 4: Loan Amount (Max)
   // ══════════════════════════════════════════════════════════════════════════
-  if (rules.maxLoanAmount && profile.loanAmount != null) {
-    if (profile.loanAmount > rules.maxLoanAmount) {
-      const gap = profile.loanAmount - rules.maxLoanAmount;
-      addBlocker(
-        'LOAN_AMOUNT_MAX',
-        'Loan Amount Exceeds Program Limit',
-        `$${profile.loanAmount.toLocaleString()}`,
-        `$${rules.maxLoanAmount.toLocaleString()}`,
-        gap,
-        `Loan exceeds ${program.name} limit by $${gap.toLocaleString()} — consider Jumbo or Non-QM`,
-        'CRITICAL',
-      );
-    } else {
-      addPass('LOAN_AMOUNT_MAX', 'Loan Amount', `$${profile.loanAmount.toLocaleString()}`, `$${rules.maxLoanAmount.toLocaleString()} max`);
-    }
-  }
+  {
+    rule:    'LOAN_AMOUNT_MAX',
+    label:   'Loan Amount Exceeds Program Limit',
+    applies: rules => !!rules.maxLoanAmount,
+    check(profile, { rules }, out) {
+      if (profile.loanAmount == null) return O.SKIPPED;
+      if (profile.loanAmount > rules.maxLoanAmount) {
+        out.gap = profile.loanAmount - rules.maxLoanAmount;
+        return O.BLOCKER_CRITICAL;
+      }
+      return O.PASS;
+    },
+    blocker: (profile, program, gap) => [
+      money(profile.loanAmount),
+      money(program.rules.maxLoanAmount),
+      `Loan exceeds ${program.name} limit by ${money(gap)} — consider Jumbo or Non-QM`,
+    ],
+    pass: (profile, { rules }) => ['Loan Amount', money(profile.loanAmount), `${money(rules.maxLoanAmount)} max`],
+  },
 
   // ══════════════════════════════════════════════════════════════════════════
   // RULE 5: Loan Amount (Min) — Jumbo
   // ══════════════════════════════════════════════════════════════════════════
-  if (rules.minLoanAmount && profile.loanAmount != null) {
-    if (profile.loanAmount < rules.minLoanAmount) {
-      addBlocker(
-        'LOAN_AMOUNT_MIN',
-        'Loan Amount Below Jumbo Threshold',
-        `$${profile.loanAmount.toLocaleString()}`,
-        `$${rules.minLoanAmount.toLocaleString()} min`,
-        rules.minLoanAmount - profile.loanAmount,
-        `Loan is conforming — consider FHA, Conventional, or HomeReady instead`,
-        'DISQUALIFYING',
-      );
-    } else {
-      addPass('LOAN_AMOUNT_MIN', 'Jumbo Loan Amount', `$${profile.loanAmount.toLocaleString()}`, `> $${rules.minLoanAmount.toLocaleString()}`);
-    }
-  }
+  {
+    rule:    'LOAN_AMOUNT_MIN',
+    label:   'Loan Amount Below Jumbo Threshold',
+    applies: rules => !!rules.minLoanAmount,
+    check(profile, { rules }, out) {
+      if (profile.loanAmount == null) return O.SKIPPED;
+      if (profile.loanAmount < rules.minLoanAmount) {
+        out.gap = rules.minLoanAmount - profile.loanAmount;
+        return O.BLOCKER_DISQUALIFYING;
+      }
+      return O.PASS;
+    },
+    blocker: (profile, { rules }) => [
+      money(profile.loanAmount),
+      `${money(rules.minLoanAmount)} min`,
+      'Loan is conforming — consider FHA, Conventional, or HomeReady instead',
+    ],
+    pass: (profile, { rules }) => ['Jumbo Loan Amount', money(profile.loanAmount), `> ${money(rules.minLoanAmount)}`],
+  },
 
   // ══════════════════════════════════════════════════════════════════════════
   // RULE 6: Primary Residence
   // ══════════════════════════════════════════════════════════════════════════
-  if (rules.requiresPrimaryResidence && profile.occupancy != null) {
-    if (profile.occupancy !== 'PRIMARY') {
-      addBlocker(
-        'OCCUPANCY',
-        'Primary Residence Required',
-        profile.occupancy,
-        'PRIMARY',
-        null,
-        `${program.name} requires the property to be the borrower's primary residence`,
-        'DISQUALIFYING',
-      );
-    } else {
-      addPass('OCCUPANCY', 'Occupancy — Primary Residence', profile.occupancy);
-    }
-  }
+  {
+    rule:    'OCCUPANCY',
+    label:   'Primary Residence Required',
+    applies: rules => !!rules.requiresPrimaryResidence,
+    check(profile) {
+      if (profile.occupancy == null) return O.SKIPPED;
+      return profile.occupancy !== 'PRIMARY' ? O.BLOCKER_DISQUALIFYING : O.PASS;
+    },
+    blocker: (profile, program) => [
+      profile.occupancy,
+      'PRIMARY',
+      `${program.name} requires the property to be the borrower's primary residence`,
+    ],
+    pass: profile => ['Occupancy — Primary Residence', profile.occupancy],
+  },
 
   // ══════════════════════════════════════════════════════════════════════════
   // RULE 7: VA Eligibility (Hard Gate)
   // ══════════════════════════════════════════════════════════════════════════
-  if (rules.requiresVAEligibility) {
-    if (!profile.vaEligible) {
-      addBlocker(
-        'VA_ELIGIBILITY',
-        'VA Eligibility Required',
-        'Not eligible',
-        'VA COE required',
-        null,
-        'Must be veteran, active-duty service member, or surviving spouse with valid COE',
-        'DISQUALIFYING',
-      );
-    } else {
-      addPass('VA_ELIGIBILITY', 'VA Eligibility', 'COE Verified');
-    }
-  }
+  {
+    rule:    'VA_ELIGIBILITY',
+    label:   'VA Eligibility Required',
+    applies: rules => !!rules.requiresVAEligibility,
+    check: profile => (!profile.vaEligible ? O.BLOCKER_DISQUALIFYING : O.PASS),
+    blocker: () => [
+      'Not eligible',
+      'VA COE required',
+      'Must be veteran, active-duty service member, or surviving spouse with valid COE',
+    ],
+    pass: () => ['VA Eligibility', 'COE Verified'],
+  },
 
   // ══════════════════════════════════════════════════════════════════════════
   // RULE 8: USDA Rural Area (Hard Gate)
   // ══════════════════════════════════════════════════════════════════════════
-  if (rules.requiresRuralArea) {
-    if (!profile.ruralEligible) {
-      addBlocker(
-        'RURAL_AREA',
-        'USDA-Eligible Rural Area Required',
-        'Not in eligible area',
-        'USDA eligible area',
-        null,
-        'Property must be located in a USDA-designated rural or suburban eligible area',
-        'DISQUALIFYING',
-      );
-    } else {
-      addPass('RURAL_AREA', 'USDA Rural Area', 'Eligible area confirmed');
-    }
-  }
+  {
+    rule:    'RURAL_AREA',
+    label:   'USDA-Eligible Rural Area Required',
+    applies: rules => !!rules.requiresRuralArea,
+    check: profile => (!profile.ruralEligible ? O.BLOCKER_DISQUALIFYING : O.PASS),
+    blocker: () => [
+      'Not in eligible area',
+      'USDA eligible area',
+      'Property must be located in a USDA-designated rural or suburban eligible area',
+    ],
+    pass: () => ['USDA Rural Area', 'Eligible area confirmed'],
+  },
 
   // ══════════════════════════════════════════════════════════════════════════
   // RULE 9: Investment Property (Hard Gate — DSCR)
   // ══════════════════════════════════════════════════════════════════════════
-  if (rules.requiresInvestmentProperty) {
-    if (!profile.investmentProperty) {
-      addBlocker(
-        'INVESTMENT_PROPERTY',
-        'Investment Property Required',
-        profile.occupancy ?? 'Not investment',
-        'Investment / rental',
-        null,
-        'DSCR loans are for non-owner-occupied investment / rental properties only',
-        'DISQUALIFYING',
-      );
-    } else {
-      addPass('INVESTMENT_PROPERTY', 'Investment Property', 'Confirmed');
-    }
-  }
+  {
+    rule:    'INVESTMENT_PROPERTY',
+    label:   'Investment Property Required',
+    applies: rules => !!rules.requiresInvestmentProperty,
+    check: profile => (!profile.investmentProperty ? O.BLOCKER_DISQUALIFYING : O.PASS),
+    blocker: profile => [
+      profile.occupancy ?? 'Not investment',
+      'Investment / rental',
+      'DSCR loans are for non-owner-occupied investment / rental properties only',
+    ],
+    pass: () => ['Investment Property', 'Confirmed'],
+  },
 
   // ══════════════════════════════════════════════════════════════════════════
   // RULE 10: Bankruptcy Seasoning
   // ══════════════════════════════════════════════════════════════════════════
-  if (rules.bankruptcySeasoningYrs > 0 && profile.bankruptcyYearsAgo != null) {
-    if (profile.bankruptcyYearsAgo < rules.bankruptcySeasoningYrs) {
-      const yearsNeeded = rules.bankruptcySeasoningYrs - profile.bankruptcyYearsAgo;
-      addBlocker(
-        'BANKRUPTCY',
-        'Bankruptcy Seasoning Not Met',
-        `${profile.bankruptcyYearsAgo} years`,
-        `${rules.bankruptcySeasoningYrs} years`,
-        yearsNeeded,
-        `Bankruptcy discharged too recently — need ${yearsNeeded} more year(s) for ${program.name}`,
-        'HIGH',
-      );
-    } else {
-      addPass('BANKRUPTCY', 'Bankruptcy Seasoning', `${profile.bankruptcyYearsAgo} years`, `${rules.bankruptcySeasoningYrs} years required`);
-    }
-  }
+  {
+    rule:    'BANKRUPTCY',
+    label:   'Bankruptcy Seasoning Not Met',
+    applies: rules => rules.bankruptcySeasoningYrs > 0,
+    check(profile, { rules }, out) {
+      if (profile.bankruptcyYearsAgo == null) return O.SKIPPED;
+      if (profile.bankruptcyYearsAgo < rules.bankruptcySeasoningYrs) {
+        out.gap = rules.bankruptcySeasoningYrs - profile.bankruptcyYearsAgo;
+        return O.BLOCKER_HIGH;
+      }
+      return O.PASS;
+    },
+    blocker: (profile, program, gap) => [
+      `${profile.bankruptcyYearsAgo} years`,
+      `${program.rules.bankruptcySeasoningYrs} years`,
+      `Bankruptcy discharged too recently — need ${gap} more year(s) for ${program.name}`,
+    ],
+    pass: (profile, { rules }) => ['Bankruptcy Seasoning', `${profile.bankruptcyYearsAgo} years`, `${rules.bankruptcySeasoningYrs} years required`],
+  },
 
   // ══════════════════════════════════════════════════════════════════════════
   // RULE 11: Foreclosure Seasoning
   // ══════════════════════════════════════════════════════════════════════════
-  if (rules.foreclosureSeasoningYrs > 0 && profile.foreclosureYearsAgo != null) {
-    if (profile.foreclosureYearsAgo < rules.foreclosureSeasoningYrs) {
-      const yearsNeeded = rules.foreclosureSeasoningYrs - profile.foreclosureYearsAgo;
-      addBlocker(
-        'FORECLOSURE',
-        'Foreclosure Seasoning Not Met',
-        `${profile.foreclosureYearsAgo} years`,
-        `${rules.foreclosureSeasoningYrs} years`,
-        yearsNeeded,
-        `Foreclosure too recent — need ${yearsNeeded} more year(s) for ${program.name}`,
-        'HIGH',
-      );
-    } else {
-      addPass('FORECLOSURE', 'Foreclosure Seasoning', `${profile.foreclosureYearsAgo} years`, `${rules.foreclosureSeasoningYrs} years required`);
-    }
-  }
+  {
+    rule:    'FORECLOSURE',
+    label:   'Foreclosure Seasoning Not Met',
+    applies: rules => rules.foreclosureSeasoningYrs > 0,
+    check(profile, { rules }, out) {
+      if (profile.foreclosureYearsAgo == null) return O.SKIPPED;
+      if (profile.foreclosureYearsAgo < rules.foreclosureSeasoningYrs) {
+        out.gap = rules.foreclosureSeasoningYrs - profile.foreclosureYearsAgo;
+        return O.BLOCKER_HIGH;
+      }
+      return O.PASS;
+    },
+    blocker: (profile, program, gap) => [
+      `${profile.foreclosureYearsAgo} years`,
+      `${program.rules.foreclosureSeasoningYrs} years`,
+      `Foreclosure too recent — need ${gap} more year(s) for ${program.name}`,
+    ],
+    pass: (profile, { rules }) => ['Foreclosure Seasoning', `${profile.foreclosureYearsAgo} years`, `${rules.foreclosureSeasoningYrs} years required`],
+  },
 
   // ══════════════════════════════════════════════════════════════════════════
   // RULE 12: Property Rehab Requirement (FHA 203k)
   // ══════════════════════════════════════════════════════════════════════════
-  if (rules.requiresRehab) {
-    if (profile.propertyNeedsRehab === false) {
-      // Explicitly move-in ready — 203k not appropriate
-      addBlocker(
-        'REHAB_REQUIRED',
-        'Property Renovation Required for 203k',
-        'Move-in ready / no rehab',
-        'Property must need renovation ($5,000+ in repairs)',
-        null,
-        'FHA 203k is for properties requiring renovation — use standard FHA for move-in ready',
-        'DISQUALIFYING',
-      );
-    } else if (profile.propertyNeedsRehab === true) {
-      addPass('REHAB_REQUIRED', 'Rehab Property Confirmed', 'Renovation needed');
-    }
-    // null = unknown — skip check (benefit of the doubt)
+  {
+    rule:    'REHAB_REQUIRED',
+    label:   'Property Renovation Required for 203k',
+    applies: rules => !!rules.requiresRehab,
+    // Explicitly move-in ready — 203k not appropriate; null = unknown —
+    // skip check (benefit of the doubt)
+    check: profile => (
+      profile.propertyNeedsRehab === false ? O.BLOCKER_DISQUALIFYING
+        : profile.propertyNeedsRehab === true ? O.PASS
+        : O.SKIPPED
+    ),
+    blocker: () => [
+      'Move-in ready / no rehab',
+      'Property must need renovation ($5,000+ in repairs)',
+      'FHA 203k is for properties requiring renovation — use standard FHA for move-in ready',
+    ],
+    pass: () => ['Rehab Property Confirmed', 'Renovation needed'],
+  },
+
+];
+
+// ─── Compile ─────────────────────────────────────────────────────────────────
+
+const specsFor = program => RULE_SPECS.filter(spec => spec.applies(program.rules));
+
+const PROGRAM_TABLE = compileRuleTable('PROGRAM_MATRIX', PROGRAM_MATRIX, specsFor, _outcome);
+
+const compiledPrograms = new WeakMap(   // program → compiled
+  PROGRAM_TABLE.compiled.map(compiled => [compiled.program, compiled]),
+);
+
+/** Rules that apply to `program`, in evaluation order. Cached per program. */
+export function compileProgram(program) {
+  let compiled = compiledPrograms.get(program);
+  if (!compiled) {
+    compiled = compileRuleProgram(program, specsFor);
+    compiledPrograms.set(program, compiled);
   }
+  return compiled;
+}
 
+// ─── Hot Path: Outcome Codes ─────────────────────────────────────────────────
 
+/**
+ * Evaluate a compiled program. Returns a compact RuleOutcome — program
+ * identity, eligibility flags, approvalProbability, ruleScore, and
+ *   codes[i] / gaps[i]  outcome and gap (null = none) of compiled.specs[i]
+ */
+export function evaluateProgramCodes(profile, compiled) {
+  return _outcome(evaluateRuleProgram(compiled, profile), compiled, profile);
+}
 
-  const disqualifyingBlockers = blockers.filter(b => b.severity === 'DISQUALIFYING');
-  const hardBlockers          = blockers.filter(b => b.severity !== 'DISQUALIFYING');
+function _outcome({ codes, gaps }, compiled, profile) {
+  const { program, specs } = compiled;
+  const n = specs.length;
+
+  let passCount = 0, warningCount = 0, hardCount = 0, disqualifyingCount = 0;
+  for (let i = 0; i < n; i++) {
+    const code = codes[i];
+    if (code === O.PASS) passCount++;
+    else if (code === O.WARNING) warningCount++;
+    else if (code === O.BLOCKER_DISQUALIFYING) disqualifyingCount++;
+    else if (code !== O.SKIPPED) hardCount++;
+  }
 
   // Disqualified = has any DISQUALIFYING blocker (hard gate failed)
-  const disqualified = disqualifyingBlockers.length > 0;
-
+  const disqualified = disqualifyingCount > 0;
   // Eligible = no blockers at all (may have warnings)
-  const eligible = !disqualified && hardBlockers.length === 0;
-
+  const eligible = !disqualified && hardCount === 0;
   // Conditional = no hard gates failed, but has soft blockers (near-miss)
   const conditional = !disqualified && !eligible;
 
@@ -892,44 +970,36 @@ export function evaluateProgram(profile, program) {
 
   let approvalProbability = 0;
 
-  if (disqualified) {
-    approvalProbability = 0;
-  } else {
+  if (!disqualified) {
     // Base: eligible programs start high; conditional programs start lower
     approvalProbability = eligible ? 92 : 70;
 
     // Warning deductions (not blockers — just near misses)
-    for (const w of warnings) {
-      if (w.rule === 'DTI')  approvalProbability -= 8;
-      if (w.rule === 'FICO') approvalProbability -= 5;
-      if (w.rule === 'LTV')  approvalProbability -= 3;
+    for (let i = 0; i < n; i++) {
+      if (codes[i] !== O.WARNING) continue;
+      const rule = specs[i].rule;
+      if (rule === 'DTI')  approvalProbability -= 8;
+      if (rule === 'FICO') approvalProbability -= 5;
+      if (rule === 'LTV')  approvalProbability -= 3;
     }
 
     // Blocker deductions (conditional path — program not hard-disqualified)
-    for (const b of hardBlockers) {
-      const gap = b.gap ?? 0;
+    for (let i = 0; i < n; i++) {
+      if (!isBlocker(codes[i])) continue;
+      const rule = specs[i].rule;
+      const gap  = gaps[i] ?? 0;
 
-      if (b.rule === 'DTI') {
+      if (rule === 'DTI') {
         // Each 1% over the max = -10 pts; sharper penalty past 5%
         const dtiPenalty = gap <= 5
           ? gap * 10
           : 50 + (gap - 5) * 15;
         approvalProbability -= Math.min(70, dtiPenalty);
       }
-
-      if (b.rule === 'FICO') {
-        approvalProbability -= Math.min(60, gap * 3);
-      }
-
-      if (b.rule === 'LTV') {
-        approvalProbability -= Math.min(40, gap * 5);
-      }
-
-      if (b.rule === 'LOAN_AMOUNT_MAX') {
-        approvalProbability -= 60;
-      }
-
-      if (b.rule === 'BANKRUPTCY' || b.rule === 'FORECLOSURE') {
+      if (rule === 'FICO')            approvalProbability -= Math.min(60, gap * 3);
+      if (rule === 'LTV')             approvalProbability -= Math.min(40, gap * 5);
+      if (rule === 'LOAN_AMOUNT_MAX') approvalProbability -= 60;
+      if (rule === 'BANKRUPTCY' || rule === 'FORECLOSURE') {
         approvalProbability -= Math.min(50, gap * 15);
       }
     }
@@ -941,14 +1011,65 @@ export function evaluateProgram(profile, program) {
   // A normalized score of how well the borrower fits this program's rules.
   // Separate from approvalProbability — used for PME ranking sort.
 
-  const totalRulesChecked = passes.length + warnings.length + hardBlockers.length + disqualifyingBlockers.length;
+  const totalRulesChecked = passCount + warningCount + hardCount + disqualifyingCount;
   const ruleScore = totalRulesChecked === 0
     ? 50
-    : Math.round(
-        ((passes.length * 1.0) + (warnings.length * 0.5)) / totalRulesChecked * 100
-      );
+    : Math.round(((passCount * 1.0) + (warningCount * 0.5)) / totalRulesChecked * 100);
 
-  // ─── Final Result Object ──────────────────────────────────────────────────
+  return {
+    programId:    program.id,
+    programName:  program.name,
+    icon:         program.icon,
+    sortPriority: program.sortPriority,
+    compiled,
+    profile,
+    codes,
+    gaps,
+    eligible,
+    conditional,
+    disqualified,
+    warningCount,
+    approvalProbability,
+    ruleScore,
+  };
+}
+
+// ─── Text Materialization ────────────────────────────────────────────────────
+
+/** Blocker / warning / pass objects for an evaluateProgramCodes() result. */
+export function describeRuleOutcomes({ compiled, profile, codes, gaps }) {
+  const { program, specs } = compiled;
+  const blockers = [];   // Hard fails — reduce approval probability significantly
+  const warnings = [];   // Near-miss — require compensating factors / AUS
+  const passes   = [];   // Rules this borrower satisfies
+
+  specs.forEach((spec, i) => {
+    const code = codes[i];
+    const gap  = gaps[i];
+    if (isBlocker(code)) {
+      const [borrowerValue, threshold, remediation] = spec.blocker(profile, program, gap);
+      blockers.push({ rule: spec.rule, label: spec.label, borrowerValue, threshold, gap, remediation, severity: SEVERITY_OF[code] });
+    } else if (code === O.WARNING) {
+      const { label, borrowerValue, threshold, note = '' } = spec.warning(profile, program);
+      warnings.push({ rule: spec.rule, label, borrowerValue, threshold, note });
+    } else if (code === O.PASS) {
+      const [label, borrowerValue, threshold = null] = spec.pass(profile, program);
+      passes.push({ rule: spec.rule, label, borrowerValue, threshold });
+    }
+  });
+
+  return {
+    blockers,
+    warnings,
+    passes,
+    disqualifyingBlockers: blockers.filter(b => b.severity === 'DISQUALIFYING'),
+    hardBlockers:          blockers.filter(b => b.severity !== 'DISQUALIFYING'),
+  };
+}
+
+function _ruleResult(outcome) {
+  const { compiled: { program }, eligible, conditional, disqualified } = outcome;
+  const { blockers, warnings, passes, disqualifyingBlockers, hardBlockers } = describeRuleOutcomes(outcome);
 
   return {
     // Identity
@@ -974,8 +1095,8 @@ export function evaluateProgram(profile, program) {
     hardBlockers,
 
     // Scores
-    approvalProbability,      // 0–100 (deterministic estimate; Sonnet refines)
-    ruleScore,                // 0–100 (rule compliance score)
+    approvalProbability: outcome.approvalProbability,  // 0–100 (deterministic estimate; Sonnet refines)
+    ruleScore:           outcome.ruleScore,            // 0–100 (rule compliance score)
 
     // Program info (passed through for UI)
     strengths:          program.strengths,
@@ -985,8 +1106,49 @@ export function evaluateProgram(profile, program) {
   };
 }
 
+// ─── Rule Evaluation ──────────────────────────────────────────────────────────
+
+/**
+ * Evaluate a single program against the borrower profile.
+ * Returns a full RuleResult object consumed by the PME and Sonnet.
+ *
+ * @param {Object} profile  - Borrower profile (see BORROWER_PROFILE_DEFAULTS)
+ * @param {Object} program  - Program definition from PROGRAM_MATRIX
+ * @returns {RuleResult}
+ */
+export function evaluateProgram(profile, program) {
+  return _ruleResult(evaluateProgramCodes(profile, compileProgram(program)));
+}
+
 // ─── Rank All Programs ────────────────────────────────────────────────────────
 
+// Tier: eligible=2, conditional=1, disqualified=0
+const tier = r => r.eligible ? 2 : r.conditional ? 1 : 0;
+
+// Eligible → conditional → disqualified; then approvalProbability desc,
+// then sortPriority desc.
+function _byRank(a, b) {
+  const tDiff = tier(b) - tier(a);
+  if (tDiff !== 0) return tDiff;
+  const pDiff = b.approvalProbability - a.approvalProbability;
+  if (pDiff !== 0) return pDiff;
+  return b.sortPriority - a.sortPriority;
+}
+
+/**
+ * Evaluate all programs and rank them without building any blocker text.
+ * Same order as rankPrograms(); pass an entry to describeRuleOutcomes()
+ * when its blockers / warnings / passes are needed. Outcomes are memoized
+ * per profile (see programRuleCore.js) — treat them as read-only.
+ *
+ * @param {Object} profile  Borrower profile (see BORROWER_PROFILE_DEFAULTS)
+ * @returns {RuleOutcome[]}
+ */
+export function rankProgramOutcomes(profile) {
+  const merged = { ...BORROWER_PROFILE_DEFAULTS, ...profile };
+  return evaluateRuleTable(PROGRAM_TABLE, merged).slice().sort(_byRank);
+}
+
 /**
  * Evaluate and rank all 11 programs for a borrower profile.
  * Returns sorted array: eligible → conditional → disqualified.
@@ -996,21 +1158,23 @@ export function evaluateProgram(profile, program) {
  * @returns {RuleResult[]}  Sorted array of 11 program evaluations
  */
 export function rankPrograms(profile) {
-  const merged = { ...BORROWER_PROFILE_DEFAULTS, ...profile };
-  const results = PROGRAM_MATRIX.map(p => evaluateProgram(merged, p));
-
-  // Tier: eligible=2, conditional=1, disqualified=0
-  const tier = r => r.eligible ? 2 : r.conditional ? 1 : 0;
+  return rankProgramOutcomes(profile).map(_ruleResult);
+}
 
-  results.sort((a, b) => {
-    const tDiff = tier(b) - tier(a);
-    if (tDiff !== 0) return tDiff;
-    const pDiff = b.approvalProbability - a.approvalProbability;
-    if (pDiff !== 0) return pDiff;
-    return b.sortPriority - a.sortPriority;
-  });
+// Views over either a RuleOutcome (codes) or a RuleResult (materialized text).
+function _forEachBlocker(result, fn) {
+  if (!result.codes) {
+    for (const b of result.blockers) fn(b.rule, b.label, b.severity === 'DISQUALIFYING');
+    return;
+  }
+  const { compiled: { specs }, codes } = result;
+  for (let i = 0; i < codes.length; i++) {
+    if (isBlocker(codes[i])) fn(specs[i].rule, specs[i].label, codes[i] === O.BLOCKER_DISQUALIFYING);
+  }
+}
 
-  return results;
+function _warningCount(result) {
+  return result.codes ? result.warningCount : result.warnings.length;
 }
 
 // ─── Primary Blocker Identification ──────────────────────────────────────────
@@ -1019,7 +1183,7 @@ export function rankPrograms(profile) {
  * Identifies the dominant blocking rule across all evaluated programs.
  * Used to populate the AUS Rescue "PRIMARY BLOCKER" summary chip.
  *
- * @param {RuleResult[]} rankedResults  Output of rankPrograms()
+ * @param {RuleResult[]|RuleOutcome[]} rankedResults  Output of rankPrograms() or rankProgramOutcomes()
  * @returns {{ rule: string, label: string, count: number } | null}
  */
 export function identifyPrimaryBlocker(rankedResults) {
@@ -1027,10 +1191,10 @@ export function identifyPrimaryBlocker(rankedResults) {
   const labels = {};
 
   for (const result of rankedResults) {
-    for (const blocker of result.blockers) {
-      counts[blocker.rule] = (counts[blocker.rule] || 0) + 1;
-      labels[blocker.rule] = blocker.label;
-    }
+    _forEachBlocker(result, (rule, label) => {
+      counts[rule] = (counts[rule] || 0) + 1;
+      labels[rule] = label;
+    });
   }
 
   const sorted = Object.entries(counts).sort((a, b) => b[1] - a[1]);
@@ -1047,7 +1211,7 @@ export function identifyPrimaryBlocker(rankedResults) {
  * MEDIUM — 1–2 eligible, or 1+ high-probability, or 2+ conditional
  * LOW    — no eligible programs, few/no conditionals with meaningful probability
  *
- * @param {RuleResult[]} rankedResults  Output of rankPrograms()
+ * @param {RuleResult[]|RuleOutcome[]} rankedResults  Output of rankPrograms() or rankProgramOutcomes()
  * @returns {'HIGH' | 'MEDIUM' | 'LOW'}
  */
 export function assessFeasibility(rankedResults) {
@@ -1061,16 +1225,20 @@ export function assessFeasibility(rankedResults) {
 
   const disqualified       = rankedResults.filter(r => r.disqualified).length;
   const totalPrograms      = rankedResults.length;
-  const cleanPaths         = rankedResults.filter(r => r.eligible && r.approvalProbability >= 80 && r.warnings.length === 0);
+  const cleanPaths         = rankedResults.filter(r => r.eligible && r.approvalProbability >= 80 && _warningCount(r) === 0);
   const warningOnlyElig    = rankedResults.filter(r => r.eligible && r.approvalProbability >= 65);
   const strongConditionals = rankedResults.filter(r => r.conditional && r.approvalProbability >= 55);
 
   // Count distinct disqualifying blocker types (hard gates)
-  const hardGateCount = rankedResults
-    .flatMap(r => r.disqualifyingBlockers)
-    .filter(b => ['VA_ELIGIBILITY', 'RURAL_AREA', 'INVESTMENT_PROPERTY', 'LOAN_AMOUNT_MIN'].includes(b.rule))
-    .map(b => b.rule)
-    .filter((v, i, a) => a.indexOf(v) === i).length;
+  const hardGates = new Set();
+  for (const r of rankedResults) {
+    _forEachBlocker(r, (rule, label, disqualifying) => {
+      if (disqualifying && ['VA_ELIGIBILITY', 'RURAL_AREA', 'INVESTMENT_PROPERTY', 'LOAN_AMOUNT_MIN'].includes(rule)) {
+        hardGates.add(rule);
+      }
+    });
+  }
+  const hardGateCount = hardGates.size;
 
   // If most programs are disqualified with multiple hard gates, LOW regardless
   if (disqualified >= totalPrograms - 2 && cleanPaths.length === 0) return 'LOW';
@@ -1140,12 +1308,21 @@ function _isInvestment(raw) {
   return val.includes('INVEST') || val.includes('RENTAL') || val === 'NOO';
 }
 
+function _assumedMonthlyIncome(loanAmount) {
+  return loanAmount ? Math.max(5_000, loanAmount * 0.012) : 6_500;
+}
+
+/** Gross monthly income: profile.monthlyIncome when known, else estimated from loan size. */
+export function estimateMonthlyIncome(profile) {
+  return profile.monthlyIncome > 0 ? profile.monthlyIncome : _assumedMonthlyIncome(profile.loanAmount);
+}
+
 /**
  * Rough monthly debt payoff estimate from a DTI gap.
  * Assumes ~$300/mo debt per 1% DTI at average income ($6,500/mo).
  */
 function _dtiToPayoffEstimate(dtiGap, loanAmount) {
-  const assumedMonthlyIncome = loanAmount ? Math.max(5_000, loanAmount * 0.012) : 6_500;
+  const assumedMonthlyIncome = _assumedMonthlyIncome(loanAmount);
   const monthlyDebtTarget    = Math.round((dtiGap / 100) * assumedMonthlyIncome);
   return `~$${monthlyDebtTarget.toLocaleString()}/mo debt reduction`;
 }
@@ -1158,9 +1335,16 @@ export default {
   BORROWER_PROFILE_DEFAULTS,
   CONFORMING_LIMIT_2026,
   HIGH_BALANCE_LIMIT_2026,
+  RULE_OUTCOME,
+  compileProgram,
   evaluateProgram,
+  evaluateProgramCodes,
+  describeRuleOutcomes,
   rankPrograms,
+  rankProgramOutcomes,
   identifyPrimaryBlocker,
   assessFeasibility,
   extractProfileFromScenario,
+  effectiveMaxLTV,
+  estimateMonthlyIncome,
 };
@@ -0,0 +1,56 @@
+/**
+ * LoanBeacons™ — Program Rule Engine
+ * Compiled rule programs: compact outcomes vs full RuleResults
+ */
+
+import {
+  rankPrograms,
+  rankProgramOutcomes,
+  describeRuleOutcomes,
+  identifyPrimaryBlocker,
+  assessFeasibility,
+  RULE_OUTCOME,
+} from './programRuleEngine';
+
+const profiles = [
+  { fico: 612, dti: 52.4, ltv: 96.5, loanAmount: 312000, occupancy: 'PRIMARY' },
+  { fico: 560, dti: 41, ltv: 97, loanAmount: 250000, occupancy: 'PRIMARY', bankruptcyYearsAgo: 1 },
+  { fico: 740, dti: 36, ltv: 80, loanAmount: 1200000, occupancy: 'INVESTMENT', investmentProperty: true },
+  { fico: 680, dti: 44, ltv: 100, loanAmount: 300000, vaEligible: true, ruralEligible: true, propertyNeedsRehab: false },
+  { fico: null, dti: null, ltv: null, loanAmount: null },
+];
+
+describe('Compiled rule programs', () => {
+  test('rankProgramOutcomes ranks like rankPrograms without building text', () => {
+    profiles.forEach((profile) => {
+      const outcomes = rankProgramOutcomes(profile);
+      const results  = rankPrograms(profile);
+      expect(outcomes.map(o => [o.programId, o.eligible, o.conditional, o.approvalProbability, o.ruleScore]))
+        .toEqual(results.map(r => [r.programId, r.eligible, r.conditional, r.approvalProbability, r.ruleScore]));
+      outcomes.forEach((o) => {
+        expect(o.blockers).toBeUndefined();
+        o.codes.forEach(code => expect(Object.values(RULE_OUTCOME).includes(code)).toBe(true));
+      });
+    });
+  });
+
+  test('describeRuleOutcomes materializes the same text as rankPrograms', () => {
+    profiles.forEach((profile) => {
+      const results = rankPrograms(profile);
+      rankProgramOutcomes(profile).forEach((outcome, i) => {
+        const { blockers, warnings, passes, disqualifyingBlockers, hardBlockers } = results[i];
+        expect(describeRuleOutcomes(outcome)).toEqual({ blockers, warnings, passes, disqualifyingBlockers, hardBlockers });
+      });
+    });
+  });
+
+  test('Primary blocker and feasibility agree for both shapes', () => {
+    profiles.forEach((profile) => {
+      const outcomes = rankProgramOutcomes(profile);
+      const results  = rankPrograms(profile);
+      expect(identifyPrimaryBlocker(outcomes)).toEqual(identifyPrimaryBlocker(results));
+      expect(assessFeasibility(outcomes)).toBe(assessFeasibility(results));
+    });
+    expect(identifyPrimaryBlocker(rankProgramOutcomes({ ...profiles[0], fico: 700, dti: 58 })).rule).toBe('DTI');
+  });
+});
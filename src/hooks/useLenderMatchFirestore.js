@@ -23,13 +23,14 @@
  *
  * EXPORTS:
  *   useLenderOverrides()     — returns { agencyOverrides, nonQMOverrides,
- *                                        loading, error, firestoreAvailable }
+ *                                        loading, error, firestoreAvailable,
+ *                                        matrixVersion }
  *   useDecisionRecordLog()   — returns { records, loading, error }
  *                              for reading a loan's Decision Record history
  * ============================================================
  */
 
-import { useState, useEffect, useRef, useCallback } from "react";
+import { useState, useEffect, useRef, useCallback, useMemo } from "react";
 import {
   collection,
   query,
@@ -40,6 +41,7 @@ import {
   limit,
 } from "firebase/firestore";
 import { db } from "@/firebase";
+import { getLenderMatchCache, lenderMatrixVersion } from "@/services/lenderMatchCache";
 
 
 // ─── Constants ────────────────────────────────────────────────────────────────
@@ -205,6 +207,16 @@ export function useLenderOverrides() {
     (age) => age > 90
   );
 
+  // New overrides = new matrix version: cached match results computed
+  // against anything else can no longer be served, so drop them.
+  const matrixVersion = useMemo(
+    () => lenderMatrixVersion(agencyOverrides, nonQMOverrides),
+    [agencyOverrides, nonQMOverrides]
+  );
+  useEffect(() => {
+    if (!loading) getLenderMatchCache().invalidate(matrixVersion);
+  }, [loading, matrixVersion]);
+
   return {
     agencyOverrides,
     nonQMOverrides,
@@ -213,6 +225,7 @@ export function useLenderOverrides() {
     firestoreAvailable,
     guidelineAgesDays,
     hasStaleGuidelines,
+    matrixVersion,
   };
 }
 
@@ -7,18 +7,20 @@
  * ============================================================
  */
 import { useSearchParams } from 'react-router-dom';
-import React, { useState, useCallback, useRef, useEffect } from 'react';
+import React, { useState, useCallback, useRef, useEffect, useMemo } from 'react';
 import { db } from '../firebase/config';
 import { collection, addDoc, serverTimestamp, doc, getDoc } from 'firebase/firestore';
 import {
-  runLenderMatch,
   buildDecisionRecord,
-  normalizeScenario,
+  getNormalizedScenario,
   OVERLAY_RISK,
   ELIGIBILITY_STATUS,
   SCENARIO_INTENT,
   ENGINE_VERSION,
 } from '../engines/LenderMatchEngine';
+import { getEngineWorkerPool, isAbortError } from '../services/engineWorkerPool';
+import { getLenderMatchCache } from '../services/lenderMatchCache';
+import { useLenderOverrides } from '../hooks/useLenderMatchFirestore';
 import { useLenderProfiles } from '../hooks/useLenderProfiles';
 import { useNextStepIntelligence } from '../hooks/useNextStepIntelligence';
 import NextStepCard from '../components/NextStepCard';
@@ -97,6 +99,20 @@ const fmt$  = (n) => n ? `$${Number(n).toLocaleString()}` : '';
 
 const confColor = { HIGH: '#16a34a', MODERATE: '#d97706', LOW: '#dc2626' };
 
+// Form strings → engine inputs
+const toEngineInputs = (form) => ({
+  ...form,
+  loanAmount:        Number(form.loanAmount)        || 0,
+  propertyValue:     Number(form.propertyValue)     || 0,
+  creditScore:       Number(form.creditScore)       || 0,
+  monthlyIncome:     Number(form.monthlyIncome)     || 0,
+  monthlyDebts:      Number(form.monthlyDebts)      || 0,
+  dscr:              form.dscr ? parseFloat(form.dscr) : null,
+  totalAssets:       Number(form.totalAssets)       || 0,
+  reservesMonths:    Number(form.reservesMonths)    || 0,
+  creditEventMonths: Number(form.creditEventMonths) || 0,
+});
+
 // Resolve borrower name from any of the possible Firestore field names
 function resolveBorrowerFromScenario(s) {
   const first = s.borrowerFirstName || s.firstName || s.primaryBorrowerFirstName || '';
@@ -330,8 +346,20 @@ export default function LenderMatch() {
   const [savingRecord, setSavingRecord]     = useState(false);
 
   const resultsRef = useRef(null);
+  const runSeq     = useRef(0);   // latest Run / cache restore wins
   const { getAeInfo } = useLenderProfiles();
   const [searchParams] = useSearchParams();
+  const [reopened, setReopened] = useState(null);   // inputs of a pre-loaded scenario
+
+  // Lender data the engine runs against — also the cache's matrix version.
+  // matrixVersion lets the worker reuse its merged lenders + indexes even
+  // though the overrides arrive as a fresh structured clone on every run.
+  const { agencyOverrides, nonQMOverrides, firestoreAvailable, matrixVersion, loading: overridesLoading } =
+    useLenderOverrides();
+  const engineOptions = useMemo(
+    () => ({ agencyOverrides, nonQMOverrides, matrixVersion, firestoreAvailable }),
+    [agencyOverrides, nonQMOverrides, matrixVersion, firestoreAvailable]
+  );
 
   // ── Scenario pre-load — captures borrower + all loan fields ──────────────
   useEffect(() => {
@@ -344,15 +372,18 @@ export default function LenderMatch() {
           const s = snap.data();
 
           // Loan fields
-          if (s.loanAmount)    set('loanAmount',    String(s.loanAmount));
-          if (s.propertyValue) set('propertyValue', String(s.propertyValue));
-          if (s.creditScore)   set('creditScore',   String(s.creditScore));
-          if (s.state)         set('state',         s.state);
-          if (s.loanType)      set('loanType',      s.loanType);
-          if (s.propertyType)  set('propertyType',  s.propertyType);
-          if (s.occupancy)     set('occupancy',     s.occupancy);
-          if (s.monthlyIncome) set('monthlyIncome', String(s.monthlyIncome));
-          if (s.monthlyDebts)  set('monthlyDebts',  String(s.monthlyDebts));
+          const loaded = {};
+          if (s.loanAmount)    loaded.loanAmount    = String(s.loanAmount);
+          if (s.propertyValue) loaded.propertyValue = String(s.propertyValue);
+          if (s.creditScore)   loaded.creditScore   = String(s.creditScore);
+          if (s.state)         loaded.state         = s.state;
+          if (s.loanType)      loaded.loanType      = s.loanType;
+          if (s.propertyType)  loaded.propertyType  = s.propertyType;
+          if (s.occupancy)     loaded.occupancy     = s.occupancy;
+          if (s.monthlyIncome) loaded.monthlyIncome = String(s.monthlyIncome);
+          if (s.monthlyDebts)  loaded.monthlyDebts  = String(s.monthlyDebts);
+          setForm(p => ({ ...p, ...loaded }));
+          setReopened(toEngineInputs({ ...INITIAL_FORM, ...loaded }));
 
           // Borrower identification — resolve from scenario
           setBorrower(resolveBorrowerFromScenario(s));
@@ -361,6 +392,17 @@ export default function LenderMatch() {
     })();
   }, [searchParams]);
 
+  // ── Reopened scenario: show the last match if nothing changed since ─────
+  // Waits for the overrides so the lookup uses the same matrix version a
+  // Run would.
+  useEffect(() => {
+    if (!reopened || overridesLoading) return;
+    const seq = runSeq.current;
+    getLenderMatchCache().get(reopened, engineOptions).then((cached) => {
+      if (cached && runSeq.current === seq) setResults(cached);
+    });
+  }, [reopened, overridesLoading, engineOptions]);
+
   // ── NSI ───────────────────────────────────────────────────────────────────
   const scenarioIdParam = searchParams.get('scenarioId');
   const loanPurpose = form.transactionType === 'cashOut'  ? 'cash_out_refi'
@@ -398,29 +440,26 @@ export default function LenderMatch() {
 
   const handleRun = useCallback(async () => {
     setLoading(true); setError(null); setSelectedLender(null);
+    const seq = ++runSeq.current;
+    let superseded = false;
     try {
-      const raw = {
-        ...form,
-        loanAmount:        Number(form.loanAmount)        || 0,
-        propertyValue:     Number(form.propertyValue)     || 0,
-        creditScore:       Number(form.creditScore)       || 0,
-        monthlyIncome:     Number(form.monthlyIncome)     || 0,
-        monthlyDebts:      Number(form.monthlyDebts)      || 0,
-        dscr:              form.dscr ? parseFloat(form.dscr) : null,
-        totalAssets:       Number(form.totalAssets)       || 0,
-        reservesMonths:    Number(form.reservesMonths)    || 0,
-        creditEventMonths: Number(form.creditEventMonths) || 0,
-      };
-      await new Promise(r => setTimeout(r, 60));
-      setResults(runLenderMatch(raw, { firestoreAvailable: true }));
+      const raw = toEngineInputs(form);
+      // Unchanged scenario + lender data → cached result; otherwise the
+      // engine runs in the worker pool, where a newer Run supersedes this one.
+      const result = await getLenderMatchCache().run(raw, engineOptions, () =>
+        getEngineWorkerPool().run('runLenderMatch', [raw, engineOptions], { key: 'lenderMatch' }));
+      if (runSeq.current !== seq) { superseded = true; return; }
+      setResults(result);
       setTimeout(() => resultsRef.current?.scrollIntoView({ behavior: 'smooth', block: 'start' }), 100);
     } catch (err) {
+      if (isAbortError(err)) { superseded = true; return; }
       console.error('[LenderMatch] Engine error:', err);
       setError(err?.message || 'An unexpected error occurred. Please try again.');
-    } finally { setLoading(false); }
-  }, [form]);
+    } finally { if (!superseded) setLoading(false); }
+  }, [form, engineOptions]);
 
   const handleClear = useCallback(() => {
+    runSeq.current++; setReopened(null); setLoading(false);
     setForm(INITIAL_FORM); setResults(null); setError(null);
     setSelectedLender(null); setBorrower(null);
   }, []);
@@ -428,7 +467,7 @@ export default function LenderMatch() {
   const handleSelectLender = useCallback((result) => {
     if (!results) return;
     setSelectedLender(result.lenderId);
-    const scenario = normalizeScenario({
+    const scenario = getNormalizedScenario({
       ...form,
       loanAmount:    Number(form.loanAmount)    || 0,
       propertyValue: Number(form.propertyValue) || 0,
@@ -439,8 +478,8 @@ export default function LenderMatch() {
       city:            borrower?.city    || null,
       county:          borrower?.county  || null,
     });
-    setDecisionModal({ open: true, record: buildDecisionRecord(result, scenario, results), result });
-  }, [form, results, borrower]);
+    setDecisionModal({ open: true, record: buildDecisionRecord(result, scenario, results, engineOptions), result });
+  }, [form, results, borrower, engineOptions]);
 
   const handleSaveDecisionRecord = useCallback(async (record) => {
     setSavingRecord(true);
@@ -778,7 +817,7 @@ export default function LenderMatch() {
               ) : (
                 (results.agencySection?.eligible || []).map((r, i) => (
                   <div key={`ag-${r.lenderId}-${i}`}>
-                    <LenderScorecardCard result={r} onSelectLender={handleSelectLender}
+                    <LenderScorecardCard result={r} engineOutput={results} lenderMatrix={engineOptions} onSelectLender={handleSelectLender}
                       isSelected={selectedLender === r.lenderId} style={{ animationDelay: `${i*40}ms` }} />
                     <AePanel lenderName={r.lenderName} getAeInfo={getAeInfo} />
                   </div>
@@ -825,7 +864,7 @@ export default function LenderMatch() {
               ) : (
                 (results.nonQMSection?.eligible || []).map((r, i) => (
                   <div key={`alt-${r.lenderId}-${i}`}>
-                    <AlternativeLenderCard result={r} onSelectLender={handleSelectLender}
+                    <AlternativeLenderCard result={r} engineOutput={results} lenderMatrix={engineOptions} onSelectLender={handleSelectLender}
                       isSelected={selectedLender === r.lenderId} style={{ animationDelay: `${i*40}ms` }} />
                     <AePanel lenderName={r.lenderName} getAeInfo={getAeInfo} />
                   </div>
@@ -3,8 +3,19 @@
 // AUS Rescue v2.0 — Sonnet Reasoning Layer
 // Refines Rule Engine seed probabilities with nuanced analysis
 // Called AFTER Rule Engine, BEFORE PME display
+//
+// Responses are cached by request content (see ausRescueReasoningCache),
+// so reopening an unchanged borrower skips the API call. For offline
+// tests and benchmarks, swap the transport:
+//
+//   setReasoningTransport(createReplayTransport(recording, { onMiss: stubReasoningTransport }));
 // ============================================================
 
+import { getReasoningCache } from "./ausRescueReasoningCache";
+
+export const REASONING_MODEL = "claude-sonnet-4-5";
+const REASONING_MAX_TOKENS    = 2048;
+
 // ─── 23 Fix Strategies (condensed for prompt) ───────────────
 const FIX_STRATEGIES = [
   { id: 1,  name: "Pay Down Revolving Debt",          impact: "DTI/FICO",      effort: "MEDIUM" },
@@ -146,34 +157,19 @@ REQUIRED RESPONSE FORMAT (JSON only)
 }`;
 }
 
-// ─── Main Export ──────────────────────────────────────────────
-/**
- * Calls Claude Sonnet to refine Rule Engine seed probabilities.
- *
- * @param {object} borrowerProfile  — extracted profile from Haiku (FICO, DTI, LTV, etc.)
- * @param {object} ruleEngineResults — output from programRuleEngine (programs[], feasibility, primaryBlocker)
- * @returns {Promise<object>}        — { feasibility, primaryBlocker, feasibilityRationale,
- *                                       overallRecommendation, programs[] }
- */
-export async function runSonnetReasoning({ borrowerProfile, ruleEngineResults }) {
-  if (!borrowerProfile || !ruleEngineResults) {
-    throw new Error("runSonnetReasoning: borrowerProfile and ruleEngineResults are required");
-  }
-
-  const userPrompt = buildUserPrompt(borrowerProfile, ruleEngineResults);
+// ─── Transports ──────────────────────────────────────────────
+// (request, context) → raw response text. `context` carries the
+// { borrowerProfile, ruleEngineResults } the request was built from.
 
+/** Live Anthropic Messages API call. */
+export async function liveReasoningTransport(request) {
   const response = await fetch("https://api.anthropic.com/v1/messages", {
     method: "POST",
     headers: {
       "Content-Type": "application/json",
       "anthropic-dangerous-direct-browser-access": "true",
     },
-    body: JSON.stringify({
-      model:      "claude-sonnet-4-5",
-      max_tokens: 2048,
-      system:     SYSTEM_PROMPT,
-      messages:   [{ role: "user", content: userPrompt }],
-    }),
+    body: JSON.stringify(request),
   });
 
   if (!response.ok) {
@@ -181,9 +177,53 @@ export async function runSonnetReasoning({ borrowerProfile, ruleEngineResults })
     throw new Error(`Sonnet reasoning API error ${response.status}: ${errText}`);
   }
 
-  const data    = await response.json();
-  const rawText = data.content?.map(b => b.text || "").join("") ?? "";
+  const data = await response.json();
+  return data.content?.map(b => b.text || "").join("") ?? "";
+}
 
+/**
+ * Local stub — a well-formed response that keeps every seed probability.
+ * Use as a replay fallback to exercise the full path offline.
+ */
+export async function stubReasoningTransport(request, { ruleEngineResults }) {
+  return JSON.stringify({
+    feasibility:           ruleEngineResults.feasibility ?? "MODERATE",
+    primaryBlocker:        ruleEngineResults.primaryBlocker ?? "Unknown",
+    feasibilityRationale:  "Stub response — rule engine seeds unchanged.",
+    overallRecommendation: "Stub response — no AI analysis was run.",
+    programs: ruleEngineResults.programs.map(p => {
+      const seed = p.eligible ? (p.approvalProbability ?? p.probability ?? null) : null;
+      return {
+        programId:             p.id,
+        refinedProbability:    seed,
+        probabilityDelta:      seed == null ? null : 0,
+        narrative:             "",
+        keyStrengths:          [],
+        keyRisks:              [],
+        recommendedStrategies: [],
+      };
+    }),
+  });
+}
+
+let reasoningTransport = liveReasoningTransport;
+
+/** Replace the transport used by runSonnetReasoning (null = live API). */
+export function setReasoningTransport(transport) {
+  reasoningTransport = transport ?? liveReasoningTransport;
+}
+
+/** API request body for a profile + rule results. Identical inputs → identical body. */
+export function buildReasoningRequest(profile, ruleEngineResults) {
+  return {
+    model:      REASONING_MODEL,
+    max_tokens: REASONING_MAX_TOKENS,
+    system:     SYSTEM_PROMPT,
+    messages:   [{ role: "user", content: buildUserPrompt(profile, ruleEngineResults) }],
+  };
+}
+
+function parseReasoningText(rawText) {
   // Strip any accidental markdown fences
   const clean = rawText
     .replace(/^```json\s*/i, "")
@@ -191,13 +231,42 @@ export async function runSonnetReasoning({ borrowerProfile, ruleEngineResults })
     .replace(/\s*```$/,      "")
     .trim();
 
-  let parsed;
   try {
-    parsed = JSON.parse(clean);
+    return JSON.parse(clean);
   } catch (e) {
     console.error("[ausRescueReasoning] JSON parse failed. Raw response:", rawText);
     throw new Error("Sonnet returned invalid JSON. See console for raw response.");
   }
+}
+
+// ─── Main Export ──────────────────────────────────────────────
+/**
+ * Calls Claude Sonnet to refine Rule Engine seed probabilities.
+ * Repeat calls with the same inputs are served from the reasoning cache.
+ *
+ * @param {object} borrowerProfile  — extracted profile from Haiku (FICO, DTI, LTV, etc.)
+ * @param {object} ruleEngineResults — output from programRuleEngine (programs[], feasibility, primaryBlocker)
+ * @param {object} [cache]           — reasoning cache (default shared); null to always call
+ * @param {Function} [transport]     — overrides the configured transport for this call
+ * @returns {Promise<object>}        — { feasibility, primaryBlocker, feasibilityRationale,
+ *                                       overallRecommendation, programs[] }
+ */
+export async function runSonnetReasoning({
+  borrowerProfile,
+  ruleEngineResults,
+  cache     = getReasoningCache(),
+  transport = reasoningTransport,
+}) {
+  if (!borrowerProfile || !ruleEngineResults) {
+    throw new Error("runSonnetReasoning: borrowerProfile and ruleEngineResults are required");
+  }
+
+  const request = buildReasoningRequest(borrowerProfile, ruleEngineResults);
+  const compute = async () =>
+    parseReasoningText(await transport(request, { borrowerProfile, ruleEngineResults }));
+
+  // Cached responses are shared — clamp into a new object, never in place
+  const parsed = cache ? await cache.run(request, compute) : await compute();
 
   // ── Safety guard: clamp refined probabilities to seed ±15 ────
   if (parsed.programs && ruleEngineResults.programs) {
@@ -206,21 +275,24 @@ export async function runSonnetReasoning({ borrowerProfile, ruleEngineResults })
       seedMap[p.id] = p.approvalProbability ?? p.probability ?? null;
     });
 
-    parsed.programs = parsed.programs.map(prog => {
-      const seed = seedMap[prog.programId];
-      if (prog.refinedProbability == null || seed == null) return prog;
-
-      const clamped = Math.max(
-        Math.min(prog.refinedProbability, seed + 15),
-        Math.max(0, seed - 15)
-      );
-
-      return {
-        ...prog,
-        refinedProbability: Math.round(clamped),
-        probabilityDelta:   Math.round(clamped - seed),
-      };
-    });
+    return {
+      ...parsed,
+      programs: parsed.programs.map(prog => {
+        const seed = seedMap[prog.programId];
+        if (prog.refinedProbability == null || seed == null) return prog;
+
+        const clamped = Math.max(
+          Math.min(prog.refinedProbability, seed + 15),
+          Math.max(0, seed - 15)
+        );
+
+        return {
+          ...prog,
+          refinedProbability: Math.round(clamped),
+          probabilityDelta:   Math.round(clamped - seed),
+        };
+      }),
+    };
   }
 
   return parsed;
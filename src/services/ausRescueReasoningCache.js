@@ -0,0 +1,182 @@
+// ============================================================
+// src/services/ausRescueReasoningCache.js
+// AUS Rescue — Sonnet reasoning response cache + record/replay
+//
+// Reopening AUS Rescue on a borrower whose profile and rule results
+// haven't changed sends the exact same request to the API. This cache
+// answers it from the last response instead of waiting seconds and
+// paying for the tokens again.
+//
+//   const cache  = getReasoningCache();
+//   const parsed = await cache.run(request, () => callApi(request));
+//
+// Entries are content-addressed: the key is the model + a hash of the
+// canonical request body (model, max_tokens, system and user prompt), so
+// any change to the prompt, the rule results it embeds or the model
+// version is simply a different key. Same two tiers as lenderMatchCache
+// (memory LRU + IndexedDB), plus a TTL so a long-lived answer is
+// eventually re-asked. Identical requests already in flight share one
+// API call.
+//
+// Transports (request, context) → raw response text:
+//   createRecordingTransport(live)         records every response by key
+//   createReplayTransport(recording, ...)  serves recorded responses
+//                                          offline — tests, benchmarks
+//
+// The cache is best-effort: any IndexedDB failure degrades to a miss.
+// ============================================================
+
+import { hashString, createIndexedDBStorage } from "./idbStore";
+
+const DEFAULT_MEMORY_SIZE = 20;
+const DEFAULT_TTL_MS      = 24 * 60 * 60 * 1000;   // 24h
+const IDB_NAME            = "loanbeacons-reasoning-cache";
+const IDB_STORE           = "ausReasoning";
+const IDB_MAX_ENTRIES     = 100;
+
+
+// ─── Keys ────────────────────────────────────────────────────
+/** Content address of an API request body. */
+export function reasoningRequestKey(request) {
+  const canonical = JSON.stringify({
+    model:      request.model,
+    max_tokens: request.max_tokens,
+    system:     request.system,
+    messages:   request.messages,
+  });
+  return { key: `${request.model}:${hashString(canonical)}`, canonical, version: request.model };
+}
+
+
+// ─── Cache ───────────────────────────────────────────────────
+export function createReasoningCache({
+  memorySize = DEFAULT_MEMORY_SIZE,
+  ttl        = DEFAULT_TTL_MS,
+  storage    = createIndexedDBStorage({
+    dbName:     IDB_NAME,
+    storeName:  IDB_STORE,
+    maxEntries: IDB_MAX_ENTRIES,
+  }),
+  now        = Date.now,
+} = {}) {
+  const memory   = new Map();   // key → { canonical, version, result, storedAt } (Map order = LRU)
+  const inflight = new Map();   // canonical → Promise<result>
+
+  const warn = (what, err) => {
+    if (process.env.NODE_ENV !== "production") {
+      console.warn(`[ausRescueReasoningCache] ${what} failed:`, err?.message || err);
+    }
+  };
+
+  const fresh = (entry, canonical) =>
+    entry?.canonical === canonical && now() - entry.storedAt < ttl;
+
+  const remember = (key, entry) => {
+    memory.delete(key);
+    memory.set(key, entry);
+    if (memory.size > memorySize) memory.delete(memory.keys().next().value);
+  };
+
+  function peek({ key, canonical }) {
+    const hit = memory.get(key);
+    if (!fresh(hit, canonical)) return null;
+    remember(key, hit);
+    return hit.result;
+  }
+
+  async function read(address) {
+    const hit = peek(address);
+    if (hit || !storage) return hit;
+    try {
+      const record = await storage.get(address.key);
+      if (!fresh(record, address.canonical)) return null;
+      const { canonical, version, result, storedAt } = record;
+      remember(address.key, { canonical, version, result, storedAt });
+      return result;
+    } catch (err) {
+      warn("read", err);
+      return null;
+    }
+  }
+
+  function write({ key, canonical, version }, result) {
+    const storedAt = now();
+    remember(key, { canonical, version, result, storedAt });
+    storage?.put({ key, canonical, version, result, storedAt })
+      .catch((err) => warn("write", err));
+  }
+
+  /** Cached result for `request`, or null. Never calls the API. */
+  function get(request) {
+    return read(reasoningRequestKey(request));
+  }
+
+  /**
+   * Cached result, or `compute()` stored on success. Concurrent calls for
+   * the same request share one `compute()`; a failure is not cached.
+   */
+  function run(request, compute) {
+    const address = reasoningRequestKey(request);
+    const hit = peek(address);
+    if (hit) return Promise.resolve(hit);
+
+    let pending = inflight.get(address.canonical);
+    if (!pending) {
+      pending = (async () => {
+        const cached = await read(address);
+        if (cached) return cached;
+        const result = await compute();
+        write(address, result);
+        return result;
+      })().finally(() => inflight.delete(address.canonical));
+      inflight.set(address.canonical, pending);
+    }
+    return pending;
+  }
+
+  function clear() {
+    memory.clear();
+    return storage?.clear().catch((err) => warn("clear", err));
+  }
+
+  return { get, run, clear, get size() { return memory.size; } };
+}
+
+
+// ─── Record / Replay ─────────────────────────────────────────
+/**
+ * Wraps `transport`, keeping every response text in `recording`
+ * (key → text). Save `recording` as JSON to replay it later.
+ */
+export function createRecordingTransport(transport, recording = {}) {
+  const record = async (request, context) => {
+    const text = await transport(request, context);
+    recording[reasoningRequestKey(request).key] = text;
+    return text;
+  };
+  record.recording = recording;
+  return record;
+}
+
+/**
+ * Serves responses from `recording` without touching the network.
+ * Unrecorded requests go to `onMiss(request, context)` (e.g. a local
+ * stub), or throw.
+ */
+export function createReplayTransport(recording, { onMiss } = {}) {
+  return async (request, context) => {
+    const { key } = reasoningRequestKey(request);
+    if (Object.hasOwn(recording, key)) return recording[key];
+    if (onMiss) return onMiss(request, context);
+    throw new Error(`No recorded reasoning response for ${key}`);
+  };
+}
+
+
+// ─── Shared Cache ────────────────────────────────────────────
+let sharedCache = null;
+
+export function getReasoningCache() {
+  sharedCache ??= createReasoningCache();
+  return sharedCache;
+}
@@ -0,0 +1,117 @@
+/**
+ * ============================================================
+ * src/services/ausRescueReasoningCache.test.js
+ * Sonnet reasoning cache — content keys, coalescing, TTL, replay
+ * ============================================================
+ */
+
+import {
+  createReasoningCache,
+  createRecordingTransport,
+  createReplayTransport,
+  reasoningRequestKey,
+} from "./ausRescueReasoningCache";
+import {
+  runSonnetReasoning,
+  buildReasoningRequest,
+  stubReasoningTransport,
+} from "./ausRescueReasoning";
+import { memoryStorage } from "../test-utils/memoryStorage";
+
+const borrowerProfile = { fico: 642, dti: 47.5, ltv: 96.5, loanAmount: 312000, occupancy: "PRIMARY" };
+const ruleEngineResults = {
+  primaryBlocker: "DTI",
+  feasibility:    "MODERATE",
+  programs: [
+    { id: "FHA",          name: "FHA",          eligible: true,  approvalProbability: 62 },
+    { id: "CONVENTIONAL", name: "Conventional", eligible: false, approvalProbability: 0, blockers: [{ rule: "DTI" }] },
+  ],
+};
+
+// Counting transport that answers like the model, pushing FHA past the clamp.
+const counted = () => {
+  const transport = async (request, context) => {
+    transport.calls++;
+    const parsed = JSON.parse(await stubReasoningTransport(request, context));
+    parsed.programs[0].refinedProbability = 90;
+    return "```json\n" + JSON.stringify(parsed) + "\n```";
+  };
+  transport.calls = 0;
+  return transport;
+};
+
+describe("ausRescueReasoningCache", () => {
+
+  test("Repeat runs with the same inputs are served from the cache", async () => {
+    const cache     = createReasoningCache({ storage: null });
+    const transport = counted();
+    const first  = await runSonnetReasoning({ borrowerProfile, ruleEngineResults, cache, transport });
+    const second = await runSonnetReasoning({ borrowerProfile: { ...borrowerProfile }, ruleEngineResults, cache, transport });
+    expect(transport.calls).toBe(1);
+    expect(second).toEqual(first);
+    expect(first.programs[0].refinedProbability).toBe(77);
+    expect(first.programs[0].probabilityDelta).toBe(15);
+
+    await runSonnetReasoning({ borrowerProfile: { ...borrowerProfile, fico: 660 }, ruleEngineResults, cache, transport });
+    expect(transport.calls).toBe(2);
+    const other = buildReasoningRequest(borrowerProfile, ruleEngineResults);
+    expect(reasoningRequestKey({ ...other, model: "other-model" }).key)
+      .not.toBe(reasoningRequestKey(other).key);
+  });
+
+  test("Concurrent identical requests share one call; failures are not cached", async () => {
+    const cache     = createReasoningCache({ storage: null });
+    const transport = counted();
+    const results = await Promise.all([1, 2, 3].map(() =>
+      runSonnetReasoning({ borrowerProfile, ruleEngineResults, cache, transport })));
+    expect(transport.calls).toBe(1);
+    results.forEach((r) => expect(r).toEqual(results[0]));
+
+    const failing = async () => "not json";
+    const profile = { ...borrowerProfile, fico: 700 };
+    await expect(runSonnetReasoning({ borrowerProfile: profile, ruleEngineResults, cache, transport: failing }))
+      .rejects.toThrow("invalid JSON");
+    await runSonnetReasoning({ borrowerProfile: profile, ruleEngineResults, cache, transport });
+    expect(transport.calls).toBe(2);
+  });
+
+  test("Persistent entries survive a reload until the TTL expires", async () => {
+    const storage   = memoryStorage();
+    const transport = counted();
+    let clock = 1_000;
+    const now = () => clock;
+    const request = buildReasoningRequest(borrowerProfile, ruleEngineResults);
+
+    await createReasoningCache({ storage, now, ttl: 60_000 })
+      .run(request, async () => ({ fromApi: ++transport.calls }));
+    await Promise.resolve();
+    expect(storage.rows.size).toBe(1);
+
+    const reloaded = createReasoningCache({ storage, now, ttl: 60_000 });
+    expect(await reloaded.get(request)).toEqual({ fromApi: 1 });
+
+    clock += 60_000;
+    expect(await createReasoningCache({ storage, now, ttl: 60_000 }).get(request)).toBeNull();
+    expect(await reloaded.get(request)).toBeNull();
+  });
+
+  test("Recorded responses replay offline", async () => {
+    const live      = counted();
+    const recorder  = createRecordingTransport(live);
+    const recorded  = await runSonnetReasoning({ borrowerProfile, ruleEngineResults, cache: null, transport: recorder });
+    expect(Object.keys(recorder.recording)).toHaveLength(1);
+
+    const replay   = createReplayTransport(JSON.parse(JSON.stringify(recorder.recording)));
+    const replayed = await runSonnetReasoning({ borrowerProfile, ruleEngineResults, cache: null, transport: replay });
+    expect(replayed).toEqual(recorded);
+    expect(live.calls).toBe(1);
+
+    const unseen = { ...borrowerProfile, ltv: 80 };
+    await expect(runSonnetReasoning({ borrowerProfile: unseen, ruleEngineResults, cache: null, transport: replay }))
+      .rejects.toThrow("No recorded reasoning response");
+
+    const stubbed = createReplayTransport(recorder.recording, { onMiss: stubReasoningTransport });
+    const result  = await runSonnetReasoning({ borrowerProfile: unseen, ruleEngineResults, cache: null, transport: stubbed });
+    expect(result.programs.map((p) => p.refinedProbability)).toEqual([62, null]);
+  });
+});
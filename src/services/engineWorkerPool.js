@@ -0,0 +1,175 @@
+// ============================================================
+// src/services/engineWorkerPool.js
+// Engine Worker Pool — runs LenderMatch / hard-money / DPA engines
+// off the UI thread with a promise API.
+//
+//   const pool = getEngineWorkerPool();
+//   const result = await pool.run("runLenderMatch", [raw, opts], {
+//     key:    "lenderMatch",        // coalesce: newer request supersedes older
+//     signal: controller.signal,    // cancel when inputs change / unmount
+//   });
+//
+// Coalescing: requests that share a `key` replace each other. A queued
+// request that is superseded never runs; a running one finishes in its
+// worker but its result is dropped. Either way the superseded promise
+// rejects with an AbortError (check with isAbortError) — callers should
+// ignore those.
+//
+// Without Worker support (jsdom tests, SSR) the pool runs the same
+// registry inline on a macrotask, keeping the same promise semantics.
+// ============================================================
+
+import { runEngine } from "../workers/engineRegistry";
+
+const DEFAULT_POOL_SIZE = 2;
+
+export function abortError(message = "Superseded by a newer engine request") {
+  const err = new Error(message);
+  err.name = "AbortError";
+  return err;
+}
+
+export function isAbortError(err) {
+  return err?.name === "AbortError";
+}
+
+function defaultCreateWorker() {
+  return new Worker(new URL("../workers/engineWorker.js", import.meta.url), { type: "module" });
+}
+
+function defaultPoolSize() {
+  const cores = typeof navigator !== "undefined" ? navigator.hardwareConcurrency || 2 : 2;
+  return Math.max(1, Math.min(DEFAULT_POOL_SIZE, cores - 1));
+}
+
+
+// ─── Pool ────────────────────────────────────────────────────
+export function createEngineWorkerPool({
+  size         = defaultPoolSize(),
+  createWorker = typeof Worker !== "undefined" ? defaultCreateWorker : null,
+} = {}) {
+  let nextId = 1;
+  const queue = [];            // jobs waiting for a slot
+  const latestByKey = new Map();
+  const slots = [];            // { worker, job }
+
+  const settle = (job, ok, value) => {
+    if (job.done) return;
+    job.done = true;
+    if (job.key && latestByKey.get(job.key) === job) latestByKey.delete(job.key);
+    job.cleanup?.();
+    ok ? job.resolve(value) : job.reject(value);
+  };
+
+  const cancel = (job, err = abortError()) => {
+    if (job.done) return;
+    const queued = queue.indexOf(job);
+    if (queued !== -1) queue.splice(queued, 1);
+    settle(job, false, err);
+  };
+
+  const makeSlot = () => {
+    const slot = { worker: createWorker(), job: null };
+    slot.worker.onmessage = (event) => {
+      const { ok, result, error } = event.data || {};
+      const job = slot.job;
+      slot.job = null;
+      if (job) ok ? settle(job, true, result) : settle(job, false, new Error(error));
+      pump();
+    };
+    slot.worker.onerror = (event) => {
+      const job = slot.job;
+      slot.job = null;
+      if (job) settle(job, false, new Error(event?.message || "Engine worker crashed"));
+      slot.worker.terminate();
+      slots.splice(slots.indexOf(slot), 1);
+      pump();
+    };
+    slots.push(slot);
+    return slot;
+  };
+
+  const runInline = (job) => {
+    setTimeout(() => {
+      if (job.done) return;
+      try { settle(job, true, runEngine(job.engine, job.args)); }
+      catch (err) { settle(job, false, err); }
+      pump();
+    }, 0);
+  };
+
+  let inlineBusy = false;
+
+  function pump() {
+    while (queue.length) {
+      if (!createWorker) {
+        if (inlineBusy) return;
+        const job = queue.shift();
+        inlineBusy = true;
+        const finish = () => { inlineBusy = false; pump(); };
+        job.promise.then(finish, finish);
+        runInline(job);
+        continue;
+      }
+      let slot = slots.find((s) => !s.job);
+      if (!slot && slots.length < size) slot = makeSlot();
+      if (!slot) return;
+      const job = queue.shift();
+      slot.job = job;
+      try {
+        slot.worker.postMessage({ id: job.id, engine: job.engine, args: job.args });
+      } catch (err) {
+        // e.g. DataCloneError for args holding a function — the worker never
+        // saw the job, so the slot is free for the next one.
+        slot.job = null;
+        settle(job, false, err);
+      }
+    }
+  }
+
+  function run(engine, args = [], { key = null, signal = null } = {}) {
+    const job = { id: nextId++, engine, args, key, done: false };
+    job.promise = new Promise((resolve, reject) => {
+      job.resolve = resolve;
+      job.reject  = reject;
+    });
+
+    if (signal?.aborted) {
+      settle(job, false, abortError("Engine request was cancelled"));
+      return job.promise;
+    }
+    if (signal) {
+      const onAbort = () => cancel(job, abortError("Engine request was cancelled"));
+      signal.addEventListener("abort", onAbort, { once: true });
+      job.cleanup = () => signal.removeEventListener("abort", onAbort);
+    }
+    if (key) {
+      const previous = latestByKey.get(key);
+      if (previous) cancel(previous);
+      latestByKey.set(key, job);
+    }
+
+    queue.push(job);
+    pump();
+    return job.promise;
+  }
+
+  function terminate() {
+    queue.splice(0).forEach((job) => settle(job, false, abortError("Engine pool terminated")));
+    slots.splice(0).forEach((slot) => {
+      if (slot.job) settle(slot.job, false, abortError("Engine pool terminated"));
+      slot.worker.terminate();
+    });
+  }
+
+  return { run, terminate, get pending() { return queue.length; } };
+}
+
+
+// ─── Shared Pool ─────────────────────────────────────────────
+let sharedPool = null;
+
+export function getEngineWorkerPool() {
+  sharedPool ??= createEngineWorkerPool();
+  return sharedPool;
+}
@@ -0,0 +1,89 @@
+/**
+ * ============================================================
+ * src/services/engineWorkerPool.test.js
+ * Engine Worker Pool — coalescing, cancellation, inline fallback
+ * ============================================================
+ */
+
+import { createEngineWorkerPool, isAbortError } from "./engineWorkerPool";
+
+const scenario = {
+  loanType:      "Conventional",
+  loanAmount:    485000,
+  propertyValue: 570000,
+  creditScore:   720,
+  dti:           38,
+  state:         "GA",
+};
+
+describe("engineWorkerPool (inline fallback)", () => {
+
+  test("Runs a registry engine and resolves with its result", async () => {
+    const pool   = createEngineWorkerPool({ createWorker: null });
+    const result = await pool.run("runLenderMatch", [scenario]);
+    expect(result.totalEligible).toBeGreaterThan(0);
+  });
+
+  test("A newer request with the same key supersedes the older one", async () => {
+    const pool  = createEngineWorkerPool({ createWorker: null });
+    const first = pool.run("runLenderMatch", [scenario], { key: "lm" });
+    const last  = pool.run("runLenderMatch", [{ ...scenario, creditScore: 700 }], { key: "lm" });
+    const [a, b] = await Promise.allSettled([first, last]);
+    expect(isAbortError(a.reason)).toBe(true);
+    expect(b.status).toBe("fulfilled");
+  });
+
+  test("Aborting the signal cancels a queued request", async () => {
+    const pool       = createEngineWorkerPool({ createWorker: null });
+    const controller = new AbortController();
+    const pending    = pool.run("evaluateHardMoneyPath", [scenario, 0, 0], { signal: controller.signal });
+    controller.abort();
+    const [outcome] = await Promise.allSettled([pending]);
+    expect(isAbortError(outcome.reason)).toBe(true);
+  });
+
+  test("Unknown engines reject with a real error", async () => {
+    const pool = createEngineWorkerPool({ createWorker: null });
+    const [outcome] = await Promise.allSettled([pool.run("noSuchEngine")]);
+    expect(outcome.status).toBe("rejected");
+    expect(isAbortError(outcome.reason)).toBe(false);
+  });
+
+});
+
+
+describe("engineWorkerPool (workers)", () => {
+
+  // Answers on a macrotask like a real worker; refuses what structured
+  // clone would refuse.
+  const fakeWorker = () => {
+    const worker = {
+      posted: 0,
+      postMessage(message) {
+        if (message.args.some((arg) => typeof arg === "function")) {
+          const err = new Error("could not be cloned");
+          err.name = "DataCloneError";
+          throw err;
+        }
+        worker.posted++;
+        setTimeout(() => worker.onmessage({ data: { id: message.id, ok: true, result: message.args[0] } }), 0);
+      },
+      terminate() {},
+    };
+    return worker;
+  };
+
+  test("A job that cannot be posted rejects and frees its slot", async () => {
+    const workers = [];
+    const pool    = createEngineWorkerPool({ size: 1, createWorker: () => workers[workers.push(fakeWorker()) - 1] });
+    const bad     = pool.run("runLenderMatch", [() => scenario]);
+    const good    = pool.run("runLenderMatch", ["ok"]);
+    const [a, b]  = await Promise.allSettled([bad, good]);
+    expect(a.status).toBe("rejected");
+    expect(a.reason.name).toBe("DataCloneError");
+    expect(b.value).toBe("ok");
+    expect(workers).toHaveLength(1);
+    expect(pool.pending).toBe(0);
+  });
+
+});
@@ -0,0 +1,102 @@
+// ============================================================
+// src/services/idbStore.js
+// Storage helpers shared by the engine result caches
+// (lenderMatchCache, ausRescueReasoningCache).
+//
+//   hashString(str)                   short content hash for cache keys
+//   createIndexedDBStorage(options)   { get, put, deleteOtherVersions,
+//                                       clear } over one IndexedDB store,
+//                                       or null where IndexedDB is missing
+//
+// Kept free of imports so a cache can use it without loading the
+// engines or lender matrices.
+// ============================================================
+
+const IDB_VERSION = 1;
+
+
+// ─── Hashing ─────────────────────────────────────────────────
+// cyrb53 — fast 53-bit string hash. Keys stay short; the full canonical
+// string is stored with each entry and compared on read, so a collision
+// is a miss, never a wrong result.
+export function hashString(str, seed = 0) {
+  let h1 = 0xdeadbeef ^ seed;
+  let h2 = 0x41c6ce57 ^ seed;
+  for (let i = 0; i < str.length; i++) {
+    const ch = str.charCodeAt(i);
+    h1 = Math.imul(h1 ^ ch, 2654435761);
+    h2 = Math.imul(h2 ^ ch, 1597334677);
+  }
+  h1  = Math.imul(h1 ^ (h1 >>> 16), 2246822507);
+  h1 ^= Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+  h2  = Math.imul(h2 ^ (h2 >>> 16), 2246822507);
+  h2 ^= Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+  return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(36);
+}
+
+
+// ─── IndexedDB Tier ──────────────────────────────────────────
+const requestToPromise = (req) => new Promise((resolve, reject) => {
+  req.onsuccess = () => resolve(req.result);
+  req.onerror   = () => reject(req.error);
+});
+
+// One object store per database, so caches for other services can use
+// their own database without a shared schema version.
+export function createIndexedDBStorage({ dbName, storeName, maxEntries }) {
+  if (typeof indexedDB === "undefined") return null;
+
+  let dbPromise = null;
+  const open = () => {
+    dbPromise ??= new Promise((resolve, reject) => {
+      const req = indexedDB.open(dbName, IDB_VERSION);
+      req.onupgradeneeded = () => {
+        const store = req.result.createObjectStore(storeName, { keyPath: "key" });
+        store.createIndex("storedAt", "storedAt");
+      };
+      req.onsuccess = () => resolve(req.result);
+      req.onerror   = () => reject(req.error);
+    });
+    return dbPromise;
+  };
+
+  const withStore = async (mode, fn) => {
+    const db = await open();
+    const tx = db.transaction(storeName, mode);
+    const done = new Promise((resolve, reject) => {
+      tx.oncomplete = resolve;
+      tx.onerror    = () => reject(tx.error);
+      tx.onabort    = () => reject(tx.error);
+    });
+    const result = await fn(tx.objectStore(storeName));
+    await done;
+    return result;
+  };
+
+  // Walk a cursor, deleting rows for which `shouldDelete(row, seen)` is true.
+  const sweep = (source, shouldDelete) => new Promise((resolve, reject) => {
+    let seen = 0;
+    const req = source.openCursor();
+    req.onsuccess = () => {
+      const cursor = req.result;
+      if (!cursor) return resolve();
+      if (shouldDelete(cursor.value, seen++)) cursor.delete();
+      cursor.continue();
+    };
+    req.onerror = () => reject(req.error);
+  });
+
+  return {
+    get: (key) => withStore("readonly", (store) => requestToPromise(store.get(key))),
+    put: (record) => withStore("readwrite", async (store) => {
+      store.put(record);
+      const count = await requestToPromise(store.count());
+      // Oldest first, so the first `excess` rows go.
+      const excess = count - maxEntries;
+      if (excess > 0) await sweep(store.index("storedAt"), (_row, i) => i < excess);
+    }),
+    deleteOtherVersions: (version) => withStore("readwrite", (store) =>
+      sweep(store, (row) => row.version !== version)),
+    clear: () => withStore("readwrite", (store) => requestToPromise(store.clear())),
+  };
+}
@@ -0,0 +1,163 @@
+// ============================================================
+// src/services/lenderMatchCache.js
+// Lender Match result cache — reopening a scenario whose inputs and
+// lender data haven't changed shows the last match without rerunning
+// the engine.
+//
+//   const cache  = getLenderMatchCache();
+//   const result = await cache.run(raw, options, () =>
+//     getEngineWorkerPool().run("runLenderMatch", [raw, options], { key: "lenderMatch" }));
+//   const hit    = await cache.get(raw, options);   // null on a miss, never computes
+//
+// Two tiers: an in-memory LRU (survives navigating between modules) and
+// IndexedDB (survives reloads). Entries are keyed by
+//
+//   matrix version  ENGINE_VERSION + static lender matrices + the override
+//                   arrays passed in options (what the engine actually used)
+//   scenario        the normalized scenario + the options that shape output
+//
+// so a guideline change can never serve an old result — the key simply
+// stops matching. useLenderOverrides() calls invalidate() whenever Firestore
+// reports new overrides, which also drops the now-unreachable entries.
+//
+// A hit is returned as a shallow copy with `timestamp` set to the time of
+// the hit, so it reads like a fresh run; the stored entry keeps the time it
+// was computed.
+//
+// The cache is best-effort: any IndexedDB failure degrades to a miss.
+// ============================================================
+
+import { getNormalizedScenario, ENGINE_VERSION } from "../engines/LenderMatchEngine";
+import { getActiveAgencyLenders } from "../data/agencyLenderMatrix";
+import { getActiveNonQMLenders }  from "../data/nonQMLenderMatrix";
+import { hashString, createIndexedDBStorage } from "./idbStore";
+
+const DEFAULT_MEMORY_SIZE = 50;
+const IDB_NAME            = "loanbeacons-engine-cache";
+const IDB_STORE           = "lenderMatch";
+const IDB_MAX_ENTRIES     = 200;
+
+
+// ─── Versions / Keys ─────────────────────────────────────────
+let staticMatrixHash = null;
+const overridesHashCache = new WeakMap();   // overrides array → hash
+
+function overridesHash(overrides = []) {
+  if (!overrides.length) return "0";
+  let hash = overridesHashCache.get(overrides);
+  if (!hash) {
+    hash = hashString(JSON.stringify(overrides));
+    overridesHashCache.set(overrides, hash);
+  }
+  return hash;
+}
+
+/** Version of the lender data + engine a result was computed with. */
+export function lenderMatrixVersion(agencyOverrides = [], nonQMOverrides = []) {
+  staticMatrixHash ??= hashString(
+    JSON.stringify([getActiveAgencyLenders(), getActiveNonQMLenders()])
+  );
+  return [
+    ENGINE_VERSION,
+    staticMatrixHash,
+    overridesHash(agencyOverrides),
+    overridesHash(nonQMOverrides),
+  ].join(".");
+}
+
+function cacheKey(raw, options = {}) {
+  const { agencyOverrides, nonQMOverrides, firestoreAvailable, mode, includeIneligible } = options;
+  const version   = lenderMatrixVersion(agencyOverrides, nonQMOverrides);
+  const canonical = JSON.stringify({
+    scenario: getNormalizedScenario(raw),
+    options:  { firestoreAvailable, mode, includeIneligible },
+  });
+  return { key: `${version}:${hashString(canonical)}`, canonical, version };
+}
+
+
+// ─── Cache ───────────────────────────────────────────────────
+export function createLenderMatchCache({
+  memorySize = DEFAULT_MEMORY_SIZE,
+  storage    = createIndexedDBStorage({
+    dbName:     IDB_NAME,
+    storeName:  IDB_STORE,
+    maxEntries: IDB_MAX_ENTRIES,
+  }),
+  now        = Date.now,
+} = {}) {
+  const memory = new Map();   // key → { canonical, version, result } (Map order = LRU)
+
+  const warn = (what, err) => {
+    if (process.env.NODE_ENV !== "production") {
+      console.warn(`[lenderMatchCache] ${what} failed:`, err?.message || err);
+    }
+  };
+
+  const remember = (key, entry) => {
+    memory.delete(key);
+    memory.set(key, entry);
+    if (memory.size > memorySize) memory.delete(memory.keys().next().value);
+  };
+
+  const restamp = (result) => ({ ...result, timestamp: new Date(now()).toISOString() });
+
+  async function get(raw, options = {}) {
+    const { key, canonical, version } = cacheKey(raw, options);
+    const hit = memory.get(key);
+    if (hit?.canonical === canonical) {
+      remember(key, hit);
+      return restamp(hit.result);
+    }
+    if (!storage) return null;
+    try {
+      const record = await storage.get(key);
+      if (record?.canonical !== canonical) return null;
+      remember(key, { canonical, version, result: record.result });
+      return restamp(record.result);
+    } catch (err) {
+      warn("read", err);
+      return null;
+    }
+  }
+
+  function set(raw, options, result) {
+    const { key, canonical, version } = cacheKey(raw, options);
+    remember(key, { canonical, version, result });
+    storage?.put({ key, canonical, version, result, storedAt: now() })
+      .catch((err) => warn("write", err));
+  }
+
+  /** Cached result, or `compute()` (sync or async) stored on success. */
+  async function run(raw, options = {}, compute) {
+    const cached = await get(raw, options);
+    if (cached) return cached;
+    const result = await compute();
+    set(raw, options, result);
+    return result;
+  }
+
+  /** Drop everything not computed against `version` (see lenderMatrixVersion). */
+  function invalidate(version) {
+    [...memory].forEach(([key, entry]) => {
+      if (entry.version !== version) memory.delete(key);
+    });
+    return storage?.deleteOtherVersions(version).catch((err) => warn("invalidate", err));
+  }
+
+  function clear() {
+    memory.clear();
+    return storage?.clear().catch((err) => warn("clear", err));
+  }
+
+  return { get, set, run, invalidate, clear, get size() { return memory.size; } };
+}
+
+
+// ─── Shared Cache ────────────────────────────────────────────
+let sharedCache = null;
+
+export function getLenderMatchCache() {
+  sharedCache ??= createLenderMatchCache();
+  return sharedCache;
+}
@@ -0,0 +1,76 @@
+/**
+ * ============================================================
+ * src/services/lenderMatchCache.test.js
+ * Lender Match result cache — memory + persistent tiers, versioning
+ * ============================================================
+ */
+
+import { createLenderMatchCache, lenderMatrixVersion } from "./lenderMatchCache";
+import { runLenderMatch } from "../engines/LenderMatchEngine";
+import { memoryStorage } from "../test-utils/memoryStorage";
+
+const scenario = {
+  loanType:      "Conventional",
+  loanAmount:    485000,
+  propertyValue: 570000,
+  creditScore:   720,
+  dti:           38,
+  state:         "GA",
+};
+
+const counted = () => {
+  const compute = (raw, options) => { compute.calls++; return runLenderMatch(raw, options); };
+  compute.calls = 0;
+  return compute;
+};
+
+describe("lenderMatchCache", () => {
+
+  test("Second run of the same scenario is served from memory, re-stamped", async () => {
+    let clock     = Date.parse("2026-03-01T12:00:00Z");
+    const cache   = createLenderMatchCache({ storage: null, now: () => clock });
+    const compute = counted();
+    const first   = await cache.run(scenario, {}, () => compute(scenario));
+    clock += 60_000;
+    const second  = await cache.run({ ...scenario }, {}, () => compute(scenario));
+    expect(compute.calls).toBe(1);
+    expect(second.timestamp).toBe("2026-03-01T12:01:00.000Z");
+    expect(second).toEqual({ ...first, timestamp: second.timestamp });
+    expect(second.agencySection).toBe(first.agencySection);
+  });
+
+  test("Inputs that normalize the same share an entry", async () => {
+    const cache   = createLenderMatchCache({ storage: null });
+    const compute = counted();
+    await cache.run(scenario, {}, () => compute(scenario));
+    await cache.run({ ...scenario, creditScore: "720", borrowerName: "A. Borrower" }, {},
+      () => compute(scenario));
+    expect(compute.calls).toBe(1);
+  });
+
+  test("A fresh cache (reload) reads the persistent tier", async () => {
+    const storage = memoryStorage();
+    const compute = counted();
+    await createLenderMatchCache({ storage }).run(scenario, {}, () => compute(scenario));
+    await Promise.resolve();
+    const reloaded = await createLenderMatchCache({ storage }).get(scenario, {});
+    expect(reloaded.totalEligible).toBe(runLenderMatch(scenario).totalEligible);
+    expect(compute.calls).toBe(1);
+  });
+
+  test("New overrides change the version, miss, and invalidate old entries", async () => {
+    const storage   = memoryStorage();
+    const cache     = createLenderMatchCache({ storage });
+    const overrides = [{ id: "agency_001", priorityWeight: 1 }];
+    await cache.run(scenario, {}, () => runLenderMatch(scenario));
+    await Promise.resolve();
+
+    expect(lenderMatrixVersion(overrides)).not.toBe(lenderMatrixVersion());
+    expect(await cache.get(scenario, { agencyOverrides: overrides })).toBeNull();
+
+    await cache.invalidate(lenderMatrixVersion(overrides));
+    expect(cache.size).toBe(0);
+    expect(storage.rows.size).toBe(0);
+  });
+
+});
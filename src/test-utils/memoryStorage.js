@@ -0,0 +1,21 @@
+/**
+ * ============================================================
+ * src/test-utils/memoryStorage.js
+ * In-memory stand-in for createIndexedDBStorage() in tests
+ * ============================================================
+ */
+
+// Same interface as the IndexedDB tier (lenderMatchCache,
+// ausRescueReasoningCache). `rows` is exposed for assertions.
+export function memoryStorage() {
+  const rows = new Map();
+  return {
+    rows,
+    get:   async (key) => rows.get(key),
+    put:   async (record) => { rows.set(record.key, record); },
+    deleteOtherVersions: async (version) => {
+      [...rows].forEach(([key, row]) => { if (row.version !== version) rows.delete(key); });
+    },
+    clear: async () => rows.clear(),
+  };
+}
@@ -1,22 +1,25 @@
 /**
  * parseURLA.js
- * LoanBeacons - MISMO 3.4 URLA XML Parser (browser-compatible)
- * v2 — namespace-safe, multi-borrower support
+ * LoanBeacons - MISMO 3.4 URLA XML Parser (browser, worker and Node)
+ * v3 — single-pass streaming parser, namespace-safe, multi-borrower support
+ *
+ * No DOM: the XML is read once, start to end, and only the MISMO elements
+ * listed in URLA_SCOPES are kept. Each scope captures the FIRST descendant
+ * (or ALL, for `all: true`) of its child containers and the first text of
+ * its leaf fields — the same answers the old getElementsByTagName lookups
+ * gave, without a subtree search per field. Elements match by local name,
+ * so prefixed (mismo:LOAN) and default-namespace files read the same.
+ *
+ *   parseURLA(xmlString)                      // one file, sync
+ *   var p = createURLAParser();               // streamed, e.g. Node
+ *   for await (var chunk of stream) p.write(chunk);
+ *   var parsed = p.end();
+ *   parseURLABatch(files)                     // back-office bulk imports
+ *
+ * parseURLA is also registered with the engine worker pool.
  */
 
-// Namespace-safe tag getter — handles both namespaced and non-namespaced XML
-function getTag(node, tagName) {
-  var el = node.getElementsByTagName(tagName)[0];
-  if (!el) el = node.getElementsByTagNameNS('*', tagName)[0];
-  return el ? (el.textContent || '').trim() : '';
-}
-
-// Namespace-safe getAll
-function getTags(node, tagName) {
-  var els = Array.from(node.getElementsByTagName(tagName));
-  if (els.length === 0) els = Array.from(node.getElementsByTagNameNS('*', tagName));
-  return els;
-}
+var INVALID_XML = 'Invalid XML file. Please upload a valid MISMO 3.4 URLA export.';
 
 function parseDollar(val) {
   var n = parseFloat(val);
@@ -62,23 +65,321 @@ function formatPhone(raw) {
   return d.length === 10 ? '(' + d.slice(0,3) + ') ' + d.slice(3,6) + '-' + d.slice(6) : raw;
 }
 
-// Extract name from an INDIVIDUAL element — tries <n>, <NAME>, then direct children
+// ── MISMO capture map ───────────────────────────────────────────────────────
+// scopes: child containers (first occurrence, or every one with `all`)
+// leaves: fields whose first text is kept     attrs: attributes kept
+// flags:  descendants whose presence is kept  links: enclosing scopes kept
+var NAME_SCOPE   = { leaves: ['FirstName', 'LastName'] };
+var HOLDER_SCOPE = { leaves: ['FullName'], scopes: { n: { leaves: ['FullName'] } } };
+
+var URLA_SCOPES = compileScope({ scopes: {
+  ORIGINATION_SYSTEM:         { leaves: ['LoanOriginationSystemName'] },
+  ABOUT_VERSION:              { leaves: ['CreatedDatetime'] },
+  LOAN_IDENTIFIER:            { leaves: ['LoanIdentifier'] },
+  SUBJECT_PROPERTY: { scopes: {
+    ADDRESS:               { leaves: ['AddressLineText', 'CityName', 'CountyName', 'StateCode', 'PostalCode'] },
+    FIPS_INFORMATION:      { leaves: ['FIPSStateNumericCode', 'FIPSCountyCode'] },
+    PROPERTY_DETAIL:       { leaves: ['PropertyUsageType', 'FinancedUnitCount', 'AttachmentType', 'ConstructionMethodType', 'PUDIndicator', 'PropertyEstimatedValueAmount'] },
+    SALES_CONTRACT_DETAIL: { leaves: ['SalesContractAmount'] },
+  } },
+  TERMS_OF_LOAN:              { leaves: ['BaseLoanAmount', 'LoanPurposeType', 'MortgageType', 'NoteRatePercent'] },
+  AMORTIZATION_RULE:          { leaves: ['LoanAmortizationPeriodCount', 'LoanAmortizationPeriodType'] },
+  URLA_DETAIL:                { leaves: ['MIAndFundingFeeFinancedAmount', 'MIAndFundingFeeTotalAmount', 'EstimatedClosingCostsAmount'] },
+  CLOSING_INFORMATION_DETAIL: { leaves: ['CashFromBorrowerAtClosingAmount'] },
+  HOUSING_EXPENSE:            { all: true, leaves: ['HousingExpenseTimingType', 'HousingExpensePaymentAmount', 'HousingExpenseType'] },
+  AUTOMATED_UNDERWRITING_SYSTEM: { leaves: ['AutomatedUnderwritingSystemType'] },
+  LOAN_PRODUCT_DATA:          { leaves: ['GseLoanType'] },
+  SALES_CONTRACT_DETAIL:      { leaves: ['DownPaymentAmount', 'SalesContractAmount'] },
+  SELLER_CONCESSION:          { leaves: ['SalesContractSellerConcessionAmount'] },
+  PARTY: { all: true, scopes: {
+    INDIVIDUAL: { leaves: ['FirstName', 'LastName'], scopes: {
+      n:    NAME_SCOPE,
+      NAME: NAME_SCOPE,
+      CONTACT_POINT: { all: true, scopes: {
+        CONTACT_POINT_TELEPHONE: { leaves: ['ContactPointTelephoneValue'] },
+        CONTACT_POINT_EMAIL:     { leaves: ['ContactPointEmailValue'] },
+      } },
+    } },
+    TAXPAYER_IDENTIFIER: { all: true, leaves: ['TaxpayerIdentifierType', 'TaxpayerIdentifierValue'] },
+    LEGAL_ENTITY_DETAIL: { leaves: ['FullName'] },
+    ROLE: { all: true, attrs: ['xlink:label'], scopes: {
+      ROLE_DETAIL: { leaves: ['PartyRoleType'] },
+      LICENSE:     { all: true, leaves: ['LicenseAuthorityLevelType', 'LicenseIdentifier'] },
+    } },
+  } },
+  // Borrowers in document order; each keeps its ROLE (label) and PARTY (name, SSN)
+  BORROWER: { all: true, links: ['ROLE', 'PARTY'], scopes: {
+    BORROWER_DETAIL:     { leaves: ['BorrowerBirthDate', 'MaritalStatusType', 'DependentCount'] },
+    DECLARATION_DETAIL:  { leaves: ['CitizenshipResidencyType'] },
+    CURRENT_INCOME_ITEM: { all: true, leaves: ['CurrentIncomeMonthlyTotalAmount'] },
+    EMPLOYER: { scopes: {
+      LEGAL_ENTITY_DETAIL: { leaves: ['FullName'] },
+      EMPLOYMENT:          { leaves: ['EmploymentBorrowerSelfEmployedIndicator', 'EmploymentPositionDescription'] },
+    } },
+  } },
+  RELATIONSHIP: { all: true, attrs: ['xlink:arcrole', 'xlink:from', 'xlink:to'] },
+  LIABILITY: { all: true, scopes: {
+    LIABILITY_DETAIL: { leaves: ['LiabilityMonthlyPaymentAmount', 'LiabilityUnpaidBalanceAmount', 'LiabilityExclusionIndicator', 'LiabilityPayoffStatusIndicator', 'LiabilityType', 'LiabilityRemainingTermMonthsCount'] },
+    LIABILITY_HOLDER: HOLDER_SCOPE,
+  } },
+  ASSET: { all: true, flags: ['OWNED_PROPERTY'], scopes: {
+    ASSET_DETAIL: { leaves: ['AssetCashOrMarketValueAmount', 'AssetType'] },
+    ASSET_HOLDER: HOLDER_SCOPE,
+  } },
+} });
+
+// Name lists → lookup tables, once
+function compileScope(spec) {
+  var toSet = function(names) {
+    var set = Object.create(null);
+    (names || []).forEach(function(n) { set[n] = true; });
+    return set;
+  };
+  var scopes = Object.create(null);
+  Object.keys(spec.scopes || {}).forEach(function(name) {
+    scopes[name] = spec.scopes[name].compiled ? spec.scopes[name] : compileScope(spec.scopes[name]);
+  });
+  return {
+    compiled: true,
+    all:    !!spec.all,
+    scopes: scopes,
+    leaves: toSet(spec.leaves),
+    flags:  toSet(spec.flags),
+    attrs:  spec.attrs || null,
+    links:  spec.links || null,
+  };
+}
+
+// Captured values for one scope
+function text(scope, name)  { return (scope && scope.leaves[name]) || ''; }
+function first(scope, name) { return (scope && scope.scopes[name]) || null; }
+function every(scope, name) { return (scope && scope.scopes[name]) || []; }
+function attr(scope, name)  { return (scope && scope.attrs && scope.attrs[name]) || ''; }
+
+
+// ── Streaming XML reader ────────────────────────────────────────────────────
+var XML_ENTITIES = { lt: '<', gt: '>', amp: '&', quot: '"', apos: "'" };
+
+// XML 1.0 Char production: what a character reference may name
+function isXmlChar(code) {
+  return code === 0x9 || code === 0xA || code === 0xD ||
+    (code >= 0x20 && code <= 0xD7FF) || (code >= 0xE000 && code <= 0xFFFD) ||
+    (code >= 0x10000 && code <= 0x10FFFF);
+}
+
+// Every `&` must start one of the five predefined entities or a character
+// reference to a legal XML character; anything else (an undeclared
+// entity, a bare `AT&T`) makes the file malformed.
+function decodeXml(str) {
+  if (str.indexOf('\r') !== -1) str = str.replace(/\r\n?/g, '\n');
+  if (str.indexOf('&') === -1) return str;
+  return str.replace(/&([^&;]*)(;?)/g, function(m, ent, semi) {
+    var code = NaN;
+    if (semi && /^#x[0-9a-fA-F]+$/.test(ent)) code = parseInt(ent.slice(2), 16);
+    else if (semi && /^#[0-9]+$/.test(ent)) code = parseInt(ent.slice(1), 10);
+    else if (semi && XML_ENTITIES.hasOwnProperty(ent)) return XML_ENTITIES[ent];
+    if (!isXmlChar(code)) throw new Error(INVALID_XML);
+    return String.fromCodePoint(code);
+  });
+}
+
+function parseAttrs(tag, names) {
+  var attrs = {};
+  var re = /([^\s=/>]+)\s*=\s*(?:"([^"]*)"|'([^']*)')/g;
+  var m;
+  while ((m = re.exec(tag))) {
+    if (names.indexOf(m[1]) !== -1) attrs[m[1]] = decodeXml(m[2] !== undefined ? m[2] : m[3]);
+  }
+  return attrs;
+}
+
+// Index of the `>` closing a start tag, skipping quoted attribute values
+function startTagEnd(buf, from) {
+  var quote = 0;
+  for (var i = from; i < buf.length; i++) {
+    var c = buf.charCodeAt(i);
+    if (quote) { if (c === quote) quote = 0; }
+    else if (c === 34 || c === 39) quote = c;
+    else if (c === 62) return i;
+  }
+  return -1;
+}
+
+function isNameEnd(c) {
+  return c === 32 || c === 9 || c === 10 || c === 13 || c === 47 || c === 62;
+}
+
+/**
+ * Streaming URLA parser: write() the XML in any number of chunks, then
+ * end() returns the same object as parseURLA(). Throws on malformed XML.
+ */
+export function createURLAParser() {
+  var root = { name: '#document', spec: URLA_SCOPES, leaves: {}, scopes: {}, flags: {}, attrs: null, links: null };
+  var open = [root];     // scopes whose element is open, outermost first
+  var stack = [];        // open elements: { qname, name, scopeCount, captures, text }
+  var capturing = [];    // open elements whose text some scope is keeping
+  var buf = '';
+  var seenRoot = false;
+
+  function fail() { throw new Error(INVALID_XML); }
+
+  function onText(str) {
+    if (!stack.length) {
+      if (/\S/.test(str)) fail();
+      return;
+    }
+    if (!capturing.length) return;
+    str = decodeXml(str);
+    for (var i = 0; i < capturing.length; i++) capturing[i].text += str;
+  }
+
+  function onOpen(qname, tag, selfClosing) {
+    if (!stack.length && seenRoot) fail();
+    seenRoot = true;
+    var colon = qname.indexOf(':');
+    var name  = colon === -1 ? qname : qname.slice(colon + 1);
+    var frame = { qname: qname, name: name, scopeCount: 0, captures: null, text: '' };
+
+    for (var i = 0, n = open.length; i < n; i++) {
+      var parent = open[i];
+      var spec   = parent.spec;
+      var child  = spec.scopes[name];
+      if (child && (child.all || !parent.scopes[name])) {
+        var scope = {
+          name: name, spec: child, leaves: {}, scopes: {}, flags: {},
+          attrs: child.attrs ? parseAttrs(tag, child.attrs) : null,
+          links: null,
+        };
+        if (child.links) {
+          scope.links = {};
+          child.links.forEach(function(link) {
+            for (var j = open.length - 1; j >= 0; j--) {
+              if (open[j].name === link) { scope.links[link] = open[j]; break; }
+            }
+          });
+        }
+        if (child.all) (parent.scopes[name] = parent.scopes[name] || []).push(scope);
+        else parent.scopes[name] = scope;
+        open.push(scope);
+        frame.scopeCount++;
+      }
+      if (spec.leaves[name] && !(name in parent.leaves)) {
+        parent.leaves[name] = '';
+        (frame.captures = frame.captures || []).push(parent);
+      }
+      if (spec.flags[name]) parent.flags[name] = true;
+    }
+
+    stack.push(frame);
+    if (frame.captures) capturing.push(frame);
+    if (selfClosing) onClose(qname);
+  }
+
+  function onClose(qname) {
+    var frame = stack.pop();
+    if (!frame || frame.qname !== qname) fail();
+    open.length -= frame.scopeCount;
+    if (frame.captures) {
+      capturing.splice(capturing.indexOf(frame), 1);
+      var value = frame.text.trim();
+      frame.captures.forEach(function(scope) { scope.leaves[frame.name] = value; });
+    }
+  }
+
+  // Consume every complete token in `buf`; keep an incomplete tail
+  function drain(final) {
+    var pos = 0, len = buf.length;
+    while (pos < len) {
+      var lt = buf.indexOf('<', pos);
+      if (lt === -1) {
+        // Trailing text: hold it (it may end mid-entity) unless nobody needs it
+        if (final || (stack.length && !capturing.length)) { onText(buf.slice(pos)); pos = len; }
+        break;
+      }
+      if (lt > pos) onText(buf.slice(pos, lt));
+      pos = lt;
+
+      var next = buf.charCodeAt(pos + 1);
+      var end;
+      if (next === 47) {                                              // </name>
+        end = buf.indexOf('>', pos);
+        if (end === -1) break;
+        onClose(buf.slice(pos + 2, end).trim());
+        pos = end + 1;
+      } else if (next === 63) {                                       // <?pi?>
+        end = buf.indexOf('?>', pos);
+        if (end === -1) break;
+        pos = end + 2;
+      } else if (next === 33) {                                       // <!…>
+        if (len - pos < 9 && !final) break;
+        if (buf.startsWith('<!--', pos)) {
+          end = buf.indexOf('-->', pos + 4);
+          if (end === -1) break;
+          pos = end + 3;
+        } else if (buf.startsWith('<![CDATA[', pos)) {
+          end = buf.indexOf(']]>', pos + 9);
+          if (end === -1) break;
+          if (!stack.length) fail();
+          var cdata = buf.slice(pos + 9, end);
+          for (var i = 0; i < capturing.length; i++) capturing[i].text += cdata;
+          pos = end + 3;
+        } else {                                                      // <!DOCTYPE …>
+          end = buf.indexOf('>', pos);
+          var subset = buf.indexOf('[', pos);
+          if (subset !== -1 && (end === -1 || subset < end)) {
+            end = buf.indexOf(']', subset);
+            end = end === -1 ? -1 : buf.indexOf('>', end);
+          }
+          if (end === -1) break;
+          pos = end + 1;
+        }
+      } else {                                                        // <name …>
+        end = startTagEnd(buf, pos + 1);
+        if (end === -1) break;
+        var nameEnd = pos + 1;
+        while (nameEnd < end && !isNameEnd(buf.charCodeAt(nameEnd))) nameEnd++;
+        if (nameEnd === pos + 1) fail();
+        onOpen(buf.slice(pos + 1, nameEnd), buf.slice(nameEnd, end), buf.charCodeAt(end - 1) === 47);
+        pos = end + 1;
+      }
+    }
+    if (final && pos < len) fail();
+    buf = buf.slice(pos);
+  }
+
+  return {
+    write: function(chunk) {
+      buf += chunk;
+      drain(false);
+      return this;
+    },
+    end: function(chunk) {
+      if (chunk) buf += chunk;
+      drain(true);
+      if (!seenRoot || stack.length) fail();
+      return buildURLAResult(root);
+    },
+  };
+}
+
+
+// ── Captured scopes → import fields ─────────────────────────────────────────
+// Name from an INDIVIDUAL scope — tries <n>, <NAME>, then direct children
 function extractName(individual) {
   if (!individual) return { first: '', last: '' };
-  var nEl = getTags(individual, 'n')[0] || getTags(individual, 'NAME')[0];
+  var nEl = first(individual, 'n') || first(individual, 'NAME');
   return {
-    first: nEl ? getTag(nEl, 'FirstName') : getTag(individual, 'FirstName'),
-    last:  nEl ? getTag(nEl, 'LastName')  : getTag(individual, 'LastName'),
+    first: text(nEl || individual, 'FirstName'),
+    last:  text(nEl || individual, 'LastName'),
   };
 }
 
-export function parseURLA(xmlString) {
-  var parser = new DOMParser();
-  var doc = parser.parseFromString(xmlString, 'application/xml');
-  if (doc.getElementsByTagName('parsererror').length > 0) {
-    throw new Error('Invalid XML file. Please upload a valid MISMO 3.4 URLA export.');
-  }
+function holderName(holder) {
+  var nEl = first(holder, 'n');
+  return nEl ? text(nEl, 'FullName') : text(holder, 'FullName');
+}
 
+function buildURLAResult(doc) {
   var result = {
     _importMeta: { losName: '', fileCreated: '', loanNumber: '' },
     firstName: '', lastName: '', borrowerPhone: '', borrowerEmail: '',
@@ -102,70 +403,70 @@ export function parseURLA(xmlString) {
     coBorrowers: [],    // full array of ALL co-borrowers
   };
 
-  var origSystem = getTags(doc, 'ORIGINATION_SYSTEM')[0];
-  if (origSystem) result._importMeta.losName = getTag(origSystem, 'LoanOriginationSystemName');
-  var aboutVersion = getTags(doc, 'ABOUT_VERSION')[0];
-  if (aboutVersion) result._importMeta.fileCreated = getTag(aboutVersion, 'CreatedDatetime').split('T')[0];
-  var loanIdEl = getTags(doc, 'LOAN_IDENTIFIER')[0];
-  if (loanIdEl) result._importMeta.loanNumber = getTag(loanIdEl, 'LoanIdentifier');
+  var origSystem = first(doc, 'ORIGINATION_SYSTEM');
+  if (origSystem) result._importMeta.losName = text(origSystem, 'LoanOriginationSystemName');
+  var aboutVersion = first(doc, 'ABOUT_VERSION');
+  if (aboutVersion) result._importMeta.fileCreated = text(aboutVersion, 'CreatedDatetime').split('T')[0];
+  var loanIdEl = first(doc, 'LOAN_IDENTIFIER');
+  if (loanIdEl) result._importMeta.loanNumber = text(loanIdEl, 'LoanIdentifier');
 
-  var subjectProp = getTags(doc, 'SUBJECT_PROPERTY')[0];
+  var subjectProp = first(doc, 'SUBJECT_PROPERTY');
   if (subjectProp) {
-    var addr = getTags(subjectProp, 'ADDRESS')[0];
+    var addr = first(subjectProp, 'ADDRESS');
     if (addr) {
-      result.streetAddress = getTag(addr, 'AddressLineText');
-      result.city = getTag(addr, 'CityName');
-      result.county = getTag(addr, 'CountyName');
-      result.state = getTag(addr, 'StateCode');
-      result.zipCode = getTag(addr, 'PostalCode');
+      result.streetAddress = text(addr, 'AddressLineText');
+      result.city = text(addr, 'CityName');
+      result.county = text(addr, 'CountyName');
+      result.state = text(addr, 'StateCode');
+      result.zipCode = text(addr, 'PostalCode');
     }
-    var fips = getTags(subjectProp, 'FIPS_INFORMATION')[0];
-    if (fips) { result.fipsState = getTag(fips, 'FIPSStateNumericCode'); result.fipsCounty = getTag(fips, 'FIPSCountyCode'); }
-    var propDetail = getTags(subjectProp, 'PROPERTY_DETAIL')[0];
+    var fips = first(subjectProp, 'FIPS_INFORMATION');
+    if (fips) { result.fipsState = text(fips, 'FIPSStateNumericCode'); result.fipsCounty = text(fips, 'FIPSCountyCode'); }
+    var propDetail = first(subjectProp, 'PROPERTY_DETAIL');
     if (propDetail) {
-      result.occupancy = mapOccupancy(getTag(propDetail, 'PropertyUsageType'));
-      var units = parseInt(getTag(propDetail, 'FinancedUnitCount')) || 1;
-      var attachment = getTag(propDetail, 'AttachmentType');
-      var conMethod = getTag(propDetail, 'ConstructionMethodType');
-      var isPUD = getTag(propDetail, 'PUDIndicator') === 'true';
+      result.occupancy = mapOccupancy(text(propDetail, 'PropertyUsageType'));
+      var units = parseInt(text(propDetail, 'FinancedUnitCount')) || 1;
+      var attachment = text(propDetail, 'AttachmentType');
+      var conMethod = text(propDetail, 'ConstructionMethodType');
+      var isPUD = text(propDetail, 'PUDIndicator') === 'true';
       result.propertyType = mapPropertyType(attachment, conMethod, units, isPUD);
-      result.propertyValue = parseDollar(getTag(propDetail, 'PropertyEstimatedValueAmount'));
+      result.propertyValue = parseDollar(text(propDetail, 'PropertyEstimatedValueAmount'));
     }
-    var salesContract = getTags(subjectProp, 'SALES_CONTRACT_DETAIL')[0];
-    if (salesContract) result.purchasePrice = parseDollar(getTag(salesContract, 'SalesContractAmount'));
+    var salesContract = first(subjectProp, 'SALES_CONTRACT_DETAIL');
+    if (salesContract) result.purchasePrice = parseDollar(text(salesContract, 'SalesContractAmount'));
     if (!result.purchasePrice && result.propertyValue) result.purchasePrice = result.propertyValue;
   }
 
-  var termsOfLoan = getTags(doc, 'TERMS_OF_LOAN')[0];
+  var termsOfLoan = first(doc, 'TERMS_OF_LOAN');
   if (termsOfLoan) {
-    result.loanAmount = parseDollar(getTag(termsOfLoan, 'BaseLoanAmount'));
-    result.loanPurpose = mapLoanPurpose(getTag(termsOfLoan, 'LoanPurposeType'));
-    result.loanType = mapLoanType(getTag(termsOfLoan, 'MortgageType'));
-    result.interestRate = parseRate(getTag(termsOfLoan, 'NoteRatePercent'));
+    result.loanAmount = parseDollar(text(termsOfLoan, 'BaseLoanAmount'));
+    result.loanPurpose = mapLoanPurpose(text(termsOfLoan, 'LoanPurposeType'));
+    result.loanType = mapLoanType(text(termsOfLoan, 'MortgageType'));
+    result.interestRate = parseRate(text(termsOfLoan, 'NoteRatePercent'));
   }
 
-  var amortRule = getTags(doc, 'AMORTIZATION_RULE')[0];
+  var amortRule = first(doc, 'AMORTIZATION_RULE');
   if (amortRule) {
-    var count = getTag(amortRule, 'LoanAmortizationPeriodCount');
-    var ptype = getTag(amortRule, 'LoanAmortizationPeriodType');
+    var count = text(amortRule, 'LoanAmortizationPeriodCount');
+    var ptype = text(amortRule, 'LoanAmortizationPeriodType');
     if (count && ptype === 'Month') result.term = count;
     else if (count && ptype === 'Year') result.term = String(parseInt(count) * 12);
   }
 
-  var urlaDetail = getTags(doc, 'URLA_DETAIL')[0];
+  var urlaDetail = first(doc, 'URLA_DETAIL');
   if (urlaDetail) {
-    result.ufmipFinanced = parseDollar(getTag(urlaDetail, 'MIAndFundingFeeFinancedAmount'));
-    result.ufmipTotal = parseDollar(getTag(urlaDetail, 'MIAndFundingFeeTotalAmount'));
-    result.estimatedClosingCosts = parseDollar(getTag(urlaDetail, 'EstimatedClosingCostsAmount'));
+    result.ufmipFinanced = parseDollar(text(urlaDetail, 'MIAndFundingFeeFinancedAmount'));
+    result.ufmipTotal = parseDollar(text(urlaDetail, 'MIAndFundingFeeTotalAmount'));
+    result.estimatedClosingCosts = parseDollar(text(urlaDetail, 'EstimatedClosingCostsAmount'));
   }
 
-  var closingDetail = getTags(doc, 'CLOSING_INFORMATION_DETAIL')[0];
-  if (closingDetail) result.cashToClose = parseDollar(getTag(closingDetail, 'CashFromBorrowerAtClosingAmount'));
+  var closingDetail = first(doc, 'CLOSING_INFORMATION_DETAIL');
+  if (closingDetail) result.cashToClose = parseDollar(text(closingDetail, 'CashFromBorrowerAtClosingAmount'));
 
-  getTags(doc, 'HOUSING_EXPENSE').forEach(function(exp) {
-    if (getTag(exp, 'HousingExpenseTimingType') !== 'Proposed') return;
-    var amt = getTag(exp, 'HousingExpensePaymentAmount');
-    var htype = getTag(exp, 'HousingExpenseType');
+  every(doc, 'HOUSING_EXPENSE').forEach(function(exp) {
+    if (text(exp, 'HousingExpenseTimingType') !== 'Proposed') return;
+    var amt = text(exp, 'HousingExpensePaymentAmount');
+    var htype = text(exp, 'HousingExpenseType');
     if (htype === 'FirstMortgagePrincipalAndInterest') result.proposedPI = amt;
     else if (htype === 'RealEstateTax') result.proposedTaxes = amt;
     else if (htype === 'HomeownersInsurance') result.proposedInsurance = amt;
@@ -175,117 +476,96 @@ export function parseURLA(xmlString) {
     else if (htype === 'SecondMortgagePrincipalAndInterest') result.proposedSecond = amt;
   });
 
-  var ausTracking = getTags(doc, 'AUTOMATED_UNDERWRITING_SYSTEM')[0];
+  var ausTracking = first(doc, 'AUTOMATED_UNDERWRITING_SYSTEM');
   if (ausTracking) {
-    var ausType = getTag(ausTracking, 'AutomatedUnderwritingSystemType');
+    var ausType = text(ausTracking, 'AutomatedUnderwritingSystemType');
     if (ausType === 'DU' || ausType === 'DesktopUnderwriter') result.gseInvestor = 'FANNIE';
     else if (ausType === 'LP' || ausType === 'LoanProspector' || ausType === 'LoanProductAdvisor') result.gseInvestor = 'FREDDIE';
   }
   if (!result.gseInvestor) {
-    var loanProductData = getTags(doc, 'LOAN_PRODUCT_DATA')[0];
+    var loanProductData = first(doc, 'LOAN_PRODUCT_DATA');
     if (loanProductData) {
-      var gseLoanType = getTag(loanProductData, 'GseLoanType');
+      var gseLoanType = text(loanProductData, 'GseLoanType');
       if (gseLoanType === 'FannieMae') result.gseInvestor = 'FANNIE';
       else if (gseLoanType === 'FreddieMac') result.gseInvestor = 'FREDDIE';
     }
   }
 
-  var salesContractDetail = getTags(doc, 'SALES_CONTRACT_DETAIL')[0];
+  var salesContractDetail = first(doc, 'SALES_CONTRACT_DETAIL');
   if (salesContractDetail) {
-    var dpAmt = parseDollar(getTag(salesContractDetail, 'DownPaymentAmount'));
+    var dpAmt = parseDollar(text(salesContractDetail, 'DownPaymentAmount'));
     if (dpAmt) result.downPayment = dpAmt;
-    var scAmt = parseDollar(getTag(salesContractDetail, 'SalesContractAmount'));
+    var scAmt = parseDollar(text(salesContractDetail, 'SalesContractAmount'));
     if (scAmt) result.purchasePrice = scAmt;
   }
-  var sellerConc = getTags(doc, 'SELLER_CONCESSION')[0];
+  var sellerConc = first(doc, 'SELLER_CONCESSION');
   if (sellerConc) {
-    var concAmt = parseDollar(getTag(sellerConc, 'SalesContractSellerConcessionAmount'));
+    var concAmt = parseDollar(text(sellerConc, 'SalesContractSellerConcessionAmount'));
     if (concAmt) result.sellerConcessions = concAmt;
   }
 
   // ── BORROWER EXTRACTION ─────────────────────────────────────────────────────
-  // Use PURCHASE_CREDITS as a sanity check — then find all BORROWER elements.
-  // Each <BORROWER> is the direct child of a Borrower <ROLE>.
-  // DOM path up: BORROWER.parentNode = ROLE, .parentNode = ROLES, .parentNode = PARTY
-  var allBorrowerEls = getTags(doc, 'BORROWER');
-  console.log('[parseURLA] Found', allBorrowerEls.length, 'BORROWER elements');
+  // Every <BORROWER> sits in a Borrower <ROLE> inside its <PARTY>; the first
+  // is the primary borrower, the rest are co-borrowers.
+  var allBorrowers = every(doc, 'BORROWER');
 
   var coBorrowersList = [];
 
-  allBorrowerEls.forEach(function(borrowerEl, idx) {
+  allBorrowers.forEach(function(borrower, idx) {
     var isCoBorrower = idx > 0;
+    var party = borrower.links.PARTY || null;
+    var roleLabel = attr(borrower.links.ROLE, 'xlink:label');
 
-    // Walk up DOM to find the containing PARTY
-    var roleEl  = borrowerEl.parentNode;
-    var rolesEl = roleEl  ? roleEl.parentNode  : null;
-    var partyEl = rolesEl ? rolesEl.parentNode : null;
-
-    var roleLabel = (roleEl && roleEl.getAttribute) ? (roleEl.getAttribute('xlink:label') || '') : '';
-    console.log('[parseURLA] Borrower', idx, '— roleLabel:', roleLabel, '— partyEl tag:', partyEl ? partyEl.localName : 'null');
-
-    // Get INDIVIDUAL from PARTY
-    var ind = partyEl ? getTags(partyEl, 'INDIVIDUAL')[0] : null;
+    var ind = first(party, 'INDIVIDUAL');
     var name = extractName(ind);
-    console.log('[parseURLA] Borrower', idx, '— name:', name.first, name.last);
 
     // Contact
     var parsedPhone = '', parsedEmail = '';
-    if (ind) {
-      getTags(ind, 'CONTACT_POINT').forEach(function(cp) {
-        var tel   = getTags(cp, 'CONTACT_POINT_TELEPHONE')[0];
-        var email = getTags(cp, 'CONTACT_POINT_EMAIL')[0];
-        if (tel && !parsedPhone)   parsedPhone = formatPhone(getTag(tel, 'ContactPointTelephoneValue'));
-        if (email && !parsedEmail) parsedEmail = getTag(email, 'ContactPointEmailValue');
-      });
-    }
+    every(ind, 'CONTACT_POINT').forEach(function(cp) {
+      var tel   = first(cp, 'CONTACT_POINT_TELEPHONE');
+      var email = first(cp, 'CONTACT_POINT_EMAIL');
+      if (tel && !parsedPhone)   parsedPhone = formatPhone(text(tel, 'ContactPointTelephoneValue'));
+      if (email && !parsedEmail) parsedEmail = text(email, 'ContactPointEmailValue');
+    });
 
     // BORROWER_DETAIL
-    var bd  = getTags(borrowerEl, 'BORROWER_DETAIL')[0];
-    var dob = bd ? getTag(bd, 'BorrowerBirthDate') : '';
+    var bd  = first(borrower, 'BORROWER_DETAIL');
+    var dob = text(bd, 'BorrowerBirthDate');
 
     // Citizenship
-    var decl = getTags(borrowerEl, 'DECLARATION_DETAIL')[0];
-    var citizenship = mapCitizenship(decl ? getTag(decl, 'CitizenshipResidencyType') : 'USCitizen');
+    var decl = first(borrower, 'DECLARATION_DETAIL');
+    var citizenship = mapCitizenship(decl ? text(decl, 'CitizenshipResidencyType') : 'USCitizen');
 
     // Income
     var totalIncome = 0;
-    getTags(borrowerEl, 'CURRENT_INCOME_ITEM').forEach(function(item) {
-      totalIncome += parseFloat(getTag(item, 'CurrentIncomeMonthlyTotalAmount')) || 0;
+    every(borrower, 'CURRENT_INCOME_ITEM').forEach(function(item) {
+      totalIncome += parseFloat(text(item, 'CurrentIncomeMonthlyTotalAmount')) || 0;
     });
-    console.log('[parseURLA] Borrower', idx, '— income:', totalIncome);
 
     // Employer
-    var employer = getTags(borrowerEl, 'EMPLOYER')[0];
-    var employerName = '';
-    if (employer) {
-      var leName = getTags(employer, 'LEGAL_ENTITY_DETAIL')[0];
-      if (leName) employerName = getTag(leName, 'FullName');
-    }
+    var employer = first(borrower, 'EMPLOYER');
+    var employerName = text(first(employer, 'LEGAL_ENTITY_DETAIL'), 'FullName');
 
     if (!isCoBorrower) {
       result.firstName     = name.first;
       result.lastName      = name.last;
       result.borrowerPhone = parsedPhone;
       result.borrowerEmail = parsedEmail;
-      result.maritalStatus  = bd ? getTag(bd, 'MaritalStatusType') : '';
-      result.dependentCount = bd ? getTag(bd, 'DependentCount')    : '';
+      result.maritalStatus  = text(bd, 'MaritalStatusType');
+      result.dependentCount = text(bd, 'DependentCount');
       result.employerName   = employerName;
-      if (employer) {
-        var empDetail = getTags(employer, 'EMPLOYMENT')[0];
-        if (empDetail) {
-          result.selfEmployed    = getTag(empDetail, 'EmploymentBorrowerSelfEmployedIndicator') === 'true';
-          result.employmentTitle = getTag(empDetail, 'EmploymentPositionDescription');
-        }
+      var empDetail = first(employer, 'EMPLOYMENT');
+      if (empDetail) {
+        result.selfEmployed    = text(empDetail, 'EmploymentBorrowerSelfEmployedIndicator') === 'true';
+        result.employmentTitle = text(empDetail, 'EmploymentPositionDescription');
       }
       if (totalIncome > 0) result.monthlyIncome = String(totalIncome.toFixed(2));
-      if (partyEl) {
-        getTags(partyEl, 'TAXPAYER_IDENTIFIER').forEach(function(ti) {
-          if (getTag(ti, 'TaxpayerIdentifierType') === 'SocialSecurityNumber') {
-            var ssn = getTag(ti, 'TaxpayerIdentifierValue');
-            result.ssnPresent = !!(ssn && ssn.replace(/\D/g, '').length >= 9);
-          }
-        });
-      }
+      every(party, 'TAXPAYER_IDENTIFIER').forEach(function(ti) {
+        if (text(ti, 'TaxpayerIdentifierType') === 'SocialSecurityNumber') {
+          var ssn = text(ti, 'TaxpayerIdentifierValue');
+          result.ssnPresent = !!(ssn && ssn.replace(/\D/g, '').length >= 9);
+        }
+      });
     } else {
       var cbRecord = {
         firstName:             name.first,
@@ -307,10 +587,10 @@ export function parseURLA(xmlString) {
   });
 
   // Joint credit relationships
-  getTags(doc, 'RELATIONSHIP').forEach(function(rel) {
-    var arc  = (rel.getAttribute && rel.getAttribute('xlink:arcrole')) || '';
-    var from = (rel.getAttribute && rel.getAttribute('xlink:from'))    || '';
-    var to   = (rel.getAttribute && rel.getAttribute('xlink:to'))      || '';
+  every(doc, 'RELATIONSHIP').forEach(function(rel) {
+    var arc  = attr(rel, 'xlink:arcrole');
+    var from = attr(rel, 'xlink:from');
+    var to   = attr(rel, 'xlink:to');
     if (arc.indexOf('SharesJointCreditReportWith') !== -1) {
       coBorrowersList.forEach(function(cb) {
         if (cb._roleLabel === from) cb.sharesJointCreditWith = to;
@@ -328,62 +608,88 @@ export function parseURLA(xmlString) {
       sharesJointCreditWith: cb.sharesJointCreditWith,
     };
   });
-  console.log('[parseURLA] coBorrowers extracted:', result.coBorrowers.length, result.coBorrowers.map(function(cb){ return cb.firstName + ' ' + cb.lastName; }));
 
   // LO and Company
-  getTags(doc, 'PARTY').forEach(function(party) {
-    getTags(party, 'ROLE').forEach(function(role) {
-      var rd = getTags(role, 'ROLE_DETAIL')[0];
-      var roleType = rd ? getTag(rd, 'PartyRoleType') : '';
+  every(doc, 'PARTY').forEach(function(party) {
+    every(party, 'ROLE').forEach(function(role) {
+      var roleType = text(first(role, 'ROLE_DETAIL'), 'PartyRoleType');
       if (roleType === 'LoanOriginator') {
-        var loInd = getTags(party, 'INDIVIDUAL')[0];
+        var loInd = first(party, 'INDIVIDUAL');
         if (loInd) { var n2 = extractName(loInd); result.loFirstName = n2.first; result.loLastName = n2.last; }
-        getTags(role, 'LICENSE').forEach(function(lic) {
-          if (getTag(lic, 'LicenseAuthorityLevelType') === 'Private') result.loNMLS = getTag(lic, 'LicenseIdentifier');
+        every(role, 'LICENSE').forEach(function(lic) {
+          if (text(lic, 'LicenseAuthorityLevelType') === 'Private') result.loNMLS = text(lic, 'LicenseIdentifier');
         });
       }
       if (roleType === 'LoanOriginationCompany') {
-        var le = getTags(party, 'LEGAL_ENTITY_DETAIL')[0];
-        if (le) result.companyName = getTag(le, 'FullName');
+        var le = first(party, 'LEGAL_ENTITY_DETAIL');
+        if (le) result.companyName = text(le, 'FullName');
       }
     });
   });
 
   // Liabilities
   var totalDebts = 0;
-  getTags(doc, 'LIABILITY').forEach(function(liab) {
-    var detail = getTags(liab, 'LIABILITY_DETAIL')[0];
+  every(doc, 'LIABILITY').forEach(function(liab) {
+    var detail = first(liab, 'LIABILITY_DETAIL');
     if (!detail) return;
-    var holderEl = getTags(liab, 'LIABILITY_HOLDER')[0];
-    var nEl = holderEl ? getTags(holderEl, 'n')[0] : null;
-    var holderName = nEl ? getTag(nEl, 'FullName') : (holderEl ? getTag(holderEl, 'FullName') : '');
-    var pmt = parseFloat(getTag(detail, 'LiabilityMonthlyPaymentAmount')) || 0;
-    var bal = parseFloat(getTag(detail, 'LiabilityUnpaidBalanceAmount')) || 0;
-    var excluded = getTag(detail, 'LiabilityExclusionIndicator') === 'true';
-    var payoff = getTag(detail, 'LiabilityPayoffStatusIndicator') === 'true';
-    result.liabilities.push({ creditor: holderName, type: getTag(detail, 'LiabilityType'), balance: Math.round(bal), monthlyPayment: pmt, remainingMonths: parseInt(getTag(detail, 'LiabilityRemainingTermMonthsCount')) || null, excluded: excluded, payoff: payoff });
+    var creditor = holderName(first(liab, 'LIABILITY_HOLDER'));
+    var pmt = parseFloat(text(detail, 'LiabilityMonthlyPaymentAmount')) || 0;
+    var bal = parseFloat(text(detail, 'LiabilityUnpaidBalanceAmount')) || 0;
+    var excluded = text(detail, 'LiabilityExclusionIndicator') === 'true';
+    var payoff = text(detail, 'LiabilityPayoffStatusIndicator') === 'true';
+    result.liabilities.push({ creditor: creditor, type: text(detail, 'LiabilityType'), balance: Math.round(bal), monthlyPayment: pmt, remainingMonths: parseInt(text(detail, 'LiabilityRemainingTermMonthsCount')) || null, excluded: excluded, payoff: payoff });
     if (!excluded && !payoff) totalDebts += pmt;
   });
   if (totalDebts > 0) result.monthlyDebts = String(totalDebts.toFixed(2));
 
-  // Assets
+  // Assets (owned real estate is REO, not a liquid asset)
   var totalAssets = 0;
-  getTags(doc, 'ASSET').forEach(function(asset) {
-    var detail = getTags(asset, 'ASSET_DETAIL')[0];
+  every(doc, 'ASSET').forEach(function(asset) {
+    var detail = first(asset, 'ASSET_DETAIL');
     if (!detail) return;
-    if (getTags(asset, 'OWNED_PROPERTY').length > 0) return;
-    var holderEl = getTags(asset, 'ASSET_HOLDER')[0];
-    var nEl = holderEl ? getTags(holderEl, 'n')[0] : null;
-    var holderName = nEl ? getTag(nEl, 'FullName') : (holderEl ? getTag(holderEl, 'FullName') : '');
-    var value = parseFloat(getTag(detail, 'AssetCashOrMarketValueAmount')) || 0;
+    if (asset.flags.OWNED_PROPERTY) return;
+    var value = parseFloat(text(detail, 'AssetCashOrMarketValueAmount')) || 0;
     totalAssets += value;
-    result.assets.push({ institution: holderName, type: getTag(detail, 'AssetType'), value: Math.round(value) });
+    result.assets.push({ institution: holderName(first(asset, 'ASSET_HOLDER')), type: text(detail, 'AssetType'), value: Math.round(value) });
   });
   if (totalAssets > 0) result.totalAssets = String(Math.round(totalAssets));
 
   return result;
 }
 
+export function parseURLA(xmlString) {
+  return createURLAParser().end(xmlString);
+}
+
+/**
+ * Parse many URLA files, one result per file. A bad file reports its error
+ * instead of stopping the batch.
+ *
+ * @param {Iterable<string|{id, xml}>} files
+ * @param {Object} [options]  { chunkSize } — files per yielded chunk
+ * @yields {{ items: Array<{id, result, error}>, processed: number }}
+ */
+export function* parseURLABatch(files, options) {
+  var chunkSize = (options && options.chunkSize) || 25;
+  var items = [];
+  var processed = 0;
+  for (var file of files) {
+    var xml = typeof file === 'string' ? file : file.xml;
+    var id  = typeof file === 'string' ? processed : file.id;
+    try {
+      items.push({ id: id, result: parseURLA(xml), error: null });
+    } catch (err) {
+      items.push({ id: id, result: null, error: err.message || String(err) });
+    }
+    processed += 1;
+    if (items.length >= chunkSize) {
+      yield { items: items, processed: processed };
+      items = [];
+    }
+  }
+  if (items.length) yield { items: items, processed: processed };
+}
+
 export function getImportSummary(parsed) {
   var fields = [];
   if (parsed.firstName || parsed.lastName) fields.push('Borrower name');
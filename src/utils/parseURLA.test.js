@@ -0,0 +1,110 @@
+/**
+ * parseURLA.test.js
+ * MISMO 3.4 URLA import — streaming parser
+ */
+
+import { parseURLA, createURLAParser, parseURLABatch } from './parseURLA';
+
+const borrowerParty = (label, first, last, income, extra = '') => `
+  <PARTY>
+    <INDIVIDUAL>
+      <NAME><FirstName>${first}</FirstName><LastName>${last}</LastName></NAME>
+      <CONTACT_POINTS>
+        <CONTACT_POINT><CONTACT_POINT_TELEPHONE><ContactPointTelephoneValue>4045551234</ContactPointTelephoneValue></CONTACT_POINT_TELEPHONE></CONTACT_POINT>
+      </CONTACT_POINTS>
+    </INDIVIDUAL>
+    <ROLES>
+      <ROLE xlink:label="${label}">
+        <BORROWER>
+          <BORROWER_DETAIL><MaritalStatusType>Married</MaritalStatusType></BORROWER_DETAIL>
+          <CURRENT_INCOME><CURRENT_INCOME_ITEMS>
+            <CURRENT_INCOME_ITEM><CurrentIncomeMonthlyTotalAmount>${income}</CurrentIncomeMonthlyTotalAmount></CURRENT_INCOME_ITEM>
+            <CURRENT_INCOME_ITEM><CurrentIncomeMonthlyTotalAmount>500</CurrentIncomeMonthlyTotalAmount></CURRENT_INCOME_ITEM>
+          </CURRENT_INCOME_ITEMS></CURRENT_INCOME>
+        </BORROWER>
+        <ROLE_DETAIL><PartyRoleType>Borrower</PartyRoleType></ROLE_DETAIL>
+      </ROLE>
+    </ROLES>
+    ${extra}
+  </PARTY>`;
+
+const URLA_XML = `<?xml version="1.0" encoding="UTF-8"?>
+<MESSAGE xmlns="http://www.mismo.org/residential/2009/schemas" xmlns:xlink="http://www.w3.org/1999/xlink">
+  <DEAL_SETS><DEAL_SET><DEALS><DEAL>
+    <ASSETS>
+      <ASSET><ASSET_DETAIL><AssetCashOrMarketValueAmount>25000.40</AssetCashOrMarketValueAmount><AssetType>CheckingAccount</AssetType></ASSET_DETAIL>
+        <ASSET_HOLDER><NAME><FullName>Bank &amp; Trust</FullName></NAME></ASSET_HOLDER></ASSET>
+      <ASSET><ASSET_DETAIL><AssetCashOrMarketValueAmount>310000</AssetCashOrMarketValueAmount></ASSET_DETAIL><OWNED_PROPERTY/></ASSET>
+    </ASSETS>
+    <COLLATERALS><COLLATERAL><SUBJECT_PROPERTY>
+      <ADDRESS><CityName>Atlanta</CityName><StateCode>GA</StateCode></ADDRESS>
+      <PROPERTY_DETAIL><PropertyUsageType>PrimaryResidence</PropertyUsageType><FinancedUnitCount>2</FinancedUnitCount></PROPERTY_DETAIL>
+    </SUBJECT_PROPERTY></COLLATERAL></COLLATERALS>
+    <LIABILITIES>
+      <LIABILITY><LIABILITY_DETAIL><LiabilityMonthlyPaymentAmount>250</LiabilityMonthlyPaymentAmount><LiabilityType>Revolving</LiabilityType></LIABILITY_DETAIL></LIABILITY>
+      <LIABILITY><LIABILITY_DETAIL><LiabilityMonthlyPaymentAmount>400</LiabilityMonthlyPaymentAmount><LiabilityPayoffStatusIndicator>true</LiabilityPayoffStatusIndicator></LIABILITY_DETAIL></LIABILITY>
+    </LIABILITIES>
+    <LOANS><LOAN>
+      <TERMS_OF_LOAN><BaseLoanAmount>312000</BaseLoanAmount><LoanPurposeType>Purchase</LoanPurposeType><MortgageType>FHA</MortgageType></TERMS_OF_LOAN>
+      <AMORTIZATION><AMORTIZATION_RULE><LoanAmortizationPeriodCount>30</LoanAmortizationPeriodCount><LoanAmortizationPeriodType>Year</LoanAmortizationPeriodType></AMORTIZATION_RULE></AMORTIZATION>
+    </LOAN></LOANS>
+    <PARTIES>
+      ${borrowerParty('BORROWER_1', 'Ana', 'Diaz', 6000, `
+      <TAXPAYER_IDENTIFIERS><TAXPAYER_IDENTIFIER>
+        <TaxpayerIdentifierType>SocialSecurityNumber</TaxpayerIdentifierType><TaxpayerIdentifierValue>123-45-6789</TaxpayerIdentifierValue>
+      </TAXPAYER_IDENTIFIER></TAXPAYER_IDENTIFIERS>`)}
+      ${borrowerParty('BORROWER_2', 'Ben', 'Diaz', 3000)}
+      ${borrowerParty('BORROWER_3', 'Cy', '<![CDATA[O\'Neil]]>', 0)}
+    </PARTIES>
+    <RELATIONSHIPS>
+      <RELATIONSHIP xlink:arcrole="urn:fdc:mismo.org:2009:residential/BORROWER_SharesJointCreditReportWith_BORROWER" xlink:from="BORROWER_2" xlink:to="BORROWER_1"/>
+    </RELATIONSHIPS>
+  </DEAL></DEALS></DEAL_SET></DEAL_SETS>
+</MESSAGE>`;
+
+// Same document with every element prefixed (mismo:LOAN …)
+const PREFIXED_XML = URLA_XML
+  .replace(/<(\/?)(?!\?|!)([A-Za-z_]+)/g, '<$1mismo:$2')
+  .replace('xmlns="', 'xmlns:mismo="');
+
+describe('parseURLA', () => {
+  test('Maps borrowers, co-borrowers, liabilities and assets in one pass', () => {
+    const parsed = parseURLA(URLA_XML);
+    expect([parsed.firstName, parsed.lastName, parsed.borrowerPhone]).toEqual(['Ana', 'Diaz', '(404) 555-1234']);
+    expect(parsed.monthlyIncome).toBe('6500.00');
+    expect(parsed.ssnPresent).toBe(true);
+    expect(parsed.coBorrowers.map(cb => [cb.firstName, cb.lastName, cb.monthlyIncome, cb.sharesJointCreditWith]))
+      .toEqual([['Ben', 'Diaz', '3500.00', 'BORROWER_1'], ['Cy', "O'Neil", '500.00', null]]);
+    expect(parsed.coBorrower.firstName).toBe('Ben');
+    expect([parsed.loanAmount, parsed.loanType, parsed.term, parsed.propertyType, parsed.occupancy])
+      .toEqual(['312000', 'FHA', '360', 'Multi-Family (2-4 units)', 'Primary Residence']);
+    expect(parsed.monthlyDebts).toBe('250.00');
+    expect(parsed.liabilities).toHaveLength(2);
+    expect(parsed.assets).toEqual([{ institution: 'Bank & Trust', type: 'CheckingAccount', value: 25000 }]);
+    expect(parseURLA(PREFIXED_XML)).toEqual(parsed);
+  });
+
+  test('Streamed chunks parse the same as the whole string', () => {
+    const whole = parseURLA(URLA_XML);
+    [1, 7, 64, 4096].forEach((size) => {
+      const parser = createURLAParser();
+      for (let i = 0; i < URLA_XML.length; i += size) parser.write(URLA_XML.slice(i, i + size));
+      expect(parser.end()).toEqual(whole);
+    });
+  });
+
+  test('Malformed files throw; batches report them per file', () => {
+    ['', 'not xml', '<MESSAGE><LOAN></MESSAGE>', URLA_XML.slice(0, 900), '<a/><b/>'].forEach((xml) => {
+      expect(() => parseURLA(xml)).toThrow();
+    });
+    // Undeclared entities, a bare `&` and references to non-characters
+    ['&foo;', 'AT&T', 'Ben &amp', '&#99999999;', '&#0;', '&#xD800;', '&#x;'].forEach((name) => {
+      expect(() => parseURLA(URLA_XML.replace('>Ben<', `>${name}<`))).toThrow('Invalid XML file');
+    });
+    expect(parseURLA(URLA_XML.replace('>Ben<', '>B&#233;n &#x1F3E0;<')).coBorrowers[0].firstName).toBe('Bén 🏠');
+    const chunks = [...parseURLABatch([{ id: 'a', xml: URLA_XML }, { id: 'b', xml: '<MESSAGE>' }, URLA_XML], { chunkSize: 2 })];
+    expect(chunks.map(c => c.processed)).toEqual([2, 3]);
+    const items = chunks.flatMap(c => c.items);
+    expect(items.map(i => [i.id, !!i.result, !!i.error])).toEqual([['a', true, false], ['b', false, true], [2, true, false]]);
+  });
+});
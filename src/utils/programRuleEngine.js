@@ -44,8 +44,21 @@
  *   primaryTrigger:  PrimaryTrigger,
  *   fixFeasibility:  'HIGH' | 'MEDIUM' | 'LOW',
  * }
+ *
+ * EVALUATION CORE:
+ *   Threshold and eligibility checks run through the shared rule core
+ *   (src/engines/programRuleCore.js), the same core behind rankPrograms().
+ *   evaluatePrograms() and detectPrimaryTrigger() read one memoized
+ *   evaluation per set of extracted fields, so each check runs once.
  */
 
+import {
+  RULE_OUTCOME,
+  isBlockerOutcome,
+  compileRuleTable,
+  evaluateRuleTable,
+} from '../engines/programRuleCore';
+
 // ─────────────────────────────────────────────
 // PROGRAM RULE MATRIX  (Section 4.2 of PRD)
 // ─────────────────────────────────────────────
@@ -321,6 +334,91 @@ export const PROGRAM_RULES = [
 ];
 
 
+// ─────────────────────────────────────────────
+// RULE SPECS
+// ─────────────────────────────────────────────
+// Numeric thresholds first, then each program's eligibilityChecks, in
+// order — failReasons keep that order. PROGRAM_RULES is compiled once at
+// load; edit a program by replacing its object, not by mutating it.
+
+const THRESHOLD_SPECS = [
+  // FICO minimum
+  {
+    rule: 'FICO',
+    applies: (p) => p.minFico !== null,
+    check: (f, p, out) => {
+      if (!(f.fico < p.minFico)) return RULE_OUTCOME.PASS;
+      out.gap = p.minFico - f.fico;
+      return RULE_OUTCOME.BLOCKER_HIGH;
+    },
+    failReason: (f, p) =>
+      `Credit score ${f.fico} is below the minimum ${p.minFico} required for ${p.name}.`,
+  },
+
+  // DTI maximum — skip if program has no DTI limit (DSCR)
+  {
+    rule: 'DTI',
+    applies: (p) => p.maxDti !== null,
+    check: (f, p, out) => {
+      if (!(f.backDti > p.maxDti)) return RULE_OUTCOME.PASS;
+      out.gap = f.backDti - p.maxDti;
+      return RULE_OUTCOME.BLOCKER_HIGH;
+    },
+    failReason: (f, p) =>
+      `Back-end DTI ${f.backDti}% exceeds the ${p.maxDti}% maximum for ${p.name}.`,
+  },
+
+  // LTV maximum
+  {
+    rule: 'LTV',
+    applies: (p) => p.maxLtv !== null,
+    check: (f, p, out) => {
+      if (!(f.ltv > p.maxLtv)) return RULE_OUTCOME.PASS;
+      out.gap = f.ltv - p.maxLtv;
+      return RULE_OUTCOME.BLOCKER_HIGH;
+    },
+    failReason: (f, p) =>
+      `LTV ${f.ltv}% exceeds the ${p.maxLtv}% maximum for ${p.name}.`,
+  },
+];
+
+const eligibilitySpec = (check) => ({
+  rule: check.id,
+  check: (f) => (check.test(f) ? RULE_OUTCOME.PASS : RULE_OUTCOME.BLOCKER_DISQUALIFYING),
+  failReason: () => check.failReason,
+});
+
+// Fail reasons are memoized with the codes (the memo key covers every field
+// they read); evaluatePrograms() hands out copies.
+const withFailReasons = ({ codes, gaps }, { program, specs }, f) => {
+  const failReasons = [];
+  specs.forEach((spec, j) => {
+    if (isBlockerOutcome(codes[j])) failReasons.push(spec.failReason(f, program));
+  });
+  return { codes, gaps, failReasons };
+};
+
+const RULE_TABLE = compileRuleTable(
+  'PROGRAM_RULES',
+  PROGRAM_RULES,
+  (program) => [
+    ...THRESHOLD_SPECS.filter((spec) => spec.applies(program)),
+    ...program.eligibilityChecks.map(eligibilitySpec),
+  ],
+  withFailReasons,
+);
+
+/** Programs (in PROGRAM_RULES order) whose `rule` check failed. */
+function blockedPrograms(evaluations, rule) {
+  const blocked = [];
+  RULE_TABLE.compiled.forEach(({ program, specs }, i) => {
+    const j = specs.findIndex((spec) => spec.rule === rule);
+    if (j !== -1 && isBlockerOutcome(evaluations[i].codes[j])) blocked.push(program);
+  });
+  return blocked;
+}
+
+
 // ─────────────────────────────────────────────
 // PRIMARY TRIGGER DETECTION
 // ─────────────────────────────────────────────
@@ -333,12 +431,15 @@ export const PROGRAM_RULES = [
  * @returns {PrimaryTrigger}
  */
 export function detectPrimaryTrigger(f) {
+  return primaryTriggerFrom(f, evaluateRuleTable(RULE_TABLE, f));
+}
+
+/** detectPrimaryTrigger() over an evaluation the caller already has. */
+function primaryTriggerFrom(f, evaluations) {
   const triggers = [];
 
   // DTI trigger — how many programs does DTI block?
-  const dtiBlockedPrograms = PROGRAM_RULES.filter(
-    (p) => p.maxDti !== null && f.backDti > p.maxDti
-  );
+  const dtiBlockedPrograms = blockedPrograms(evaluations, 'DTI');
   if (dtiBlockedPrograms.length > 0) {
     const closestProgram = dtiBlockedPrograms.reduce((prev, curr) =>
       f.backDti - curr.maxDti < f.backDti - prev.maxDti ? curr : prev
@@ -355,9 +456,7 @@ export function detectPrimaryTrigger(f) {
   }
 
   // FICO trigger
-  const ficoBlockedPrograms = PROGRAM_RULES.filter(
-    (p) => p.minFico !== null && f.fico < p.minFico
-  );
+  const ficoBlockedPrograms = blockedPrograms(evaluations, 'FICO');
   if (ficoBlockedPrograms.length > 0) {
     const hardestRequirement = ficoBlockedPrograms.reduce((prev, curr) =>
       curr.minFico > prev.minFico ? curr : prev
@@ -374,9 +473,7 @@ export function detectPrimaryTrigger(f) {
   }
 
   // LTV trigger
-  const ltvBlockedPrograms = PROGRAM_RULES.filter(
-    (p) => p.maxLtv !== null && f.ltv > p.maxLtv
-  );
+  const ltvBlockedPrograms = blockedPrograms(evaluations, 'LTV');
   if (ltvBlockedPrograms.length > 0) {
     const closestProgram = ltvBlockedPrograms.reduce((prev, curr) =>
       f.ltv - curr.maxLtv < f.ltv - prev.maxLtv ? curr : prev
@@ -476,40 +573,12 @@ export function evaluatePrograms(extractedFields) {
   const f = extractedFields;
   const eligible = [];
   const ineligible = [];
+  const evaluations = evaluateRuleTable(RULE_TABLE, f);
 
-  for (const program of PROGRAM_RULES) {
-    const failReasons = [];
-
-    // ── 1. Numeric threshold checks ──────────────────────────────────────
-
-    // FICO minimum
-    if (program.minFico !== null && f.fico < program.minFico) {
-      failReasons.push(
-        `Credit score ${f.fico} is below the minimum ${program.minFico} required for ${program.name}.`
-      );
-    }
-
-    // DTI maximum — skip if program has no DTI limit (DSCR)
-    if (program.maxDti !== null && f.backDti > program.maxDti) {
-      failReasons.push(
-        `Back-end DTI ${f.backDti}% exceeds the ${program.maxDti}% maximum for ${program.name}.`
-      );
-    }
-
-    // LTV maximum
-    if (program.maxLtv !== null && f.ltv > program.maxLtv) {
-      failReasons.push(
-        `LTV ${f.ltv}% exceeds the ${program.maxLtv}% maximum for ${program.name}.`
-      );
-    }
+  RULE_TABLE.compiled.forEach(({ program }, i) => {
+    // ── 1–2. Threshold + eligibility checks (shared rule core) ───────────
 
-    // ── 2. Eligibility condition checks ──────────────────────────────────
-
-    for (const check of program.eligibilityChecks) {
-      if (!check.test(f)) {
-        failReasons.push(check.failReason);
-      }
-    }
+    const failReasons = [...evaluations[i].failReasons];
 
     // ── 3. Classify ───────────────────────────────────────────────────────
 
@@ -533,11 +602,11 @@ export function evaluatePrograms(extractedFields) {
     } else {
       ineligible.push({ ...result, eligible: false, failReasons });
     }
-  }
+  });
 
   // ── 4. Primary trigger + feasibility ────────────────────────────────────
 
-  const primaryTrigger = detectPrimaryTrigger(f);
+  const primaryTrigger = primaryTriggerFrom(f, evaluations);
   const fixFeasibility = computeFixFeasibility(primaryTrigger, f);
 
   // ── 5. Sort eligible list by "strength of fit" ──────────────────────────
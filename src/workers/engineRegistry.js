@@ -0,0 +1,31 @@
+/**
+ * ============================================================
+ * LoanBeacons™ — Engine Registry
+ * src/workers/engineRegistry.js
+ * Engines that may run off the UI thread, by name.
+ * ============================================================
+ *
+ * Shared by engineWorker.js (inside the worker) and by the pool's inline
+ * fallback (tests / environments without Worker), so both run exactly the
+ * same functions. Arguments and results must be structured-cloneable —
+ * plain data only, no functions or class instances.
+ */
+
+import { runLenderMatch, runEligibilitySweep } from "../engines/LenderMatchEngine";
+import { evaluateHardMoneyPath } from "../engines/LenderMatchEngine_hardMoney";
+import { buildCandidateStacks }  from "../engines/dpa/dpaLayeringEngine";
+import { parseURLA }             from "../utils/parseURLA";
+
+export const ENGINE_REGISTRY = {
+  runLenderMatch,
+  runEligibilitySweep,
+  evaluateHardMoneyPath,
+  buildCandidateStacks,
+  parseURLA,
+};
+
+export function runEngine(engine, args = []) {
+  const fn = ENGINE_REGISTRY[engine];
+  if (!fn) throw new Error(`Unknown engine: ${engine}`);
+  return fn(...args);
+}
@@ -0,0 +1,21 @@
+/**
+ * ============================================================
+ * LoanBeacons™ — Engine Worker
+ * src/workers/engineWorker.js
+ * Module worker that runs registry engines for engineWorkerPool.
+ * ============================================================
+ *
+ * Message in:  { id, engine, args }
+ * Message out: { id, ok: true, result } | { id, ok: false, error }
+ */
+
+import { runEngine } from "./engineRegistry";
+
+self.onmessage = (event) => {
+  const { id, engine, args } = event.data || {};
+  try {
+    self.postMessage({ id, ok: true, result: runEngine(engine, args) });
+  } catch (err) {
+    self.postMessage({ id, ok: false, error: err?.message || String(err) });
+  }
+};